@@ -0,0 +1,98 @@
+"""
+Advisory database benchmark: OSV import and batch vulnerability checks.
+
+Writes a synthetic OSV dump (a zip archive, like the per-ecosystem dumps
+published by osv.dev) with several ranges per advisory, times importing
+it into a fresh advisory database, then times checking batches of pinned
+dependencies, half of which name packages that have advisories.
+
+Usage: python benchmarks/bench_advisories.py [--advisories 50000] [--pins 5000]
+"""
+
+import argparse
+import json
+import random
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+from typing import List, Tuple
+
+from repo_analyzer.storage.advisories import AdvisoryDatabase
+
+
+def _version(rng: random.Random) -> str:
+    return f"{rng.randrange(5)}.{rng.randrange(20)}.{rng.randrange(10)}"
+
+
+def write_dump(path: Path, advisories: int, packages: int, seed: int = 1) -> None:
+    """Write ``advisories`` OSV advisories over ``packages`` PyPI and npm packages."""
+    rng = random.Random(seed)
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for index in range(advisories):
+            ecosystem = "PyPI" if index % 2 else "npm"
+            events = [{"introduced": "0"}]
+            for bound in sorted({_version(rng) for _ in range(rng.randint(1, 4))}):
+                events.append({"fixed": bound})
+                events.append({"introduced": bound + ".1" if ecosystem == "PyPI" else bound + "-1"})
+            advisory = {
+                "id": f"BENCH-{index}",
+                "modified": "2024-01-01T00:00:00Z",
+                "summary": f"Synthetic advisory {index}",
+                "affected": [{
+                    "package": {"ecosystem": ecosystem, "name": f"package-{rng.randrange(packages)}"},
+                    "ranges": [{"type": "ECOSYSTEM" if ecosystem == "PyPI" else "SEMVER", "events": events}],
+                }],
+            }
+            archive.writestr(f"BENCH-{index}.json", json.dumps(advisory))
+
+
+def synthetic_pins(count: int, packages: int, seed: int = 2) -> List[Tuple[str, str, str]]:
+    """Pins where every other package name has no advisories at all."""
+    rng = random.Random(seed)
+    return [
+        (
+            "PyPI" if index % 2 else "npm",
+            f"package-{rng.randrange(packages)}" if index % 4 < 2 else f"unknown-{index}",
+            _version(rng)
+        )
+        for index in range(count)
+    ]
+
+
+def timed(label: str, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32}{elapsed * 1000:>10.1f}ms")
+    return result, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--advisories", type=int, default=50_000)
+    parser.add_argument("--packages", type=int, default=20_000)
+    parser.add_argument("--pins", type=int, default=5_000, help="Pins per check")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        dump = Path(tmp) / "all.zip"
+        write_dump(dump, args.advisories, args.packages)
+        print(f"{args.advisories:,} advisories over {args.packages:,} packages\n")
+        
+        with AdvisoryDatabase(Path(tmp) / "advisories.db") as db:
+            stats, elapsed = timed("load OSV dump", lambda: db.load([dump]))
+            print(f"{'':<32}{stats.advisories / elapsed:>10,.0f} advisories/s, {stats.ranges:,} ranges")
+            
+            pins = synthetic_pins(args.pins, args.packages)
+            timed("first check (cold)", lambda: db.check(pins))
+            findings, elapsed = timed(f"check {len(pins):,} pins", lambda: db.check(pins))
+            print(
+                f"{'':<32}{elapsed / len(pins) * 1e6:>10.1f}µs per pin, "
+                f"{len(findings):,} findings"
+            )
+            _, elapsed = timed("check 1 pin", lambda: db.check(pins[:1]))
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,86 @@
+"""
+Import graph benchmark: cycle detection and reverse queries on a large module graph.
+
+Builds a synthetic repository of packages whose modules import mostly
+within their package, with occasional cross-package imports that create
+a few large strongly connected components, then times building the graph
+from FileAnalysis results, finding components with one shortest cycle each,
+a single file update, and transitive "what imports X" queries.
+
+Usage: python benchmarks/bench_import_graph.py [--modules 50000] [--imports 6]
+"""
+
+import argparse
+import random
+import time
+from pathlib import Path
+from typing import List
+
+from repo_analyzer.analyzers.base import FileAnalysis
+from repo_analyzer.analyzers.import_graph import ImportGraph
+
+
+ROOT = Path("/bench")
+
+
+def synthetic_analyses(modules: int, imports: int, seed: int = 1) -> List[FileAnalysis]:
+    """One FileAnalysis per module of ``pkgN.modM`` packages, 100 modules each."""
+    rng = random.Random(seed)
+    names = [f"pkg{i // 100}.mod{i % 100}" for i in range(modules)]
+    analyses = [
+        FileAnalysis(ROOT / f"pkg{i}" / "__init__.py", "python", 1)
+        for i in range((modules + 99) // 100)
+    ]
+    for index, name in enumerate(names):
+        package = index - index % 100
+        targets = [
+            # Mostly earlier modules of the same package, sometimes any module
+            names[rng.randrange(modules)] if rng.random() < 0.02
+            else names[package + rng.randrange(max(index - package, 1))]
+            for _ in range(imports)
+        ]
+        analyses.append(FileAnalysis(
+            ROOT / (name.replace(".", "/") + ".py"),
+            "python",
+            1,
+            imports=targets + ["os", "typing"]
+        ))
+    return analyses
+
+
+def timed(label: str, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<32}{(time.perf_counter() - start) * 1000:>10.1f}ms")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--modules", type=int, default=50_000)
+    parser.add_argument("--imports", type=int, default=6, help="Imports per module")
+    args = parser.parse_args()
+    
+    analyses = synthetic_analyses(args.modules, args.imports)
+    print(f"{args.modules:,} modules, {args.imports} imports each\n")
+    
+    graph = timed("build from analyses", lambda: ImportGraph.from_analyses(ROOT, analyses))
+    cycles = timed("components + shortest cycles", graph.cycles)
+    largest = max((len(modules) for modules, _ in cycles), default=0)
+    print(
+        f"{'':<32}{len(cycles):,} components, largest {largest:,} modules, "
+        f"{graph.edge_count:,} edges"
+    )
+    
+    changed = analyses[-1]
+    timed("update one file", lambda: graph.set_file(
+        changed.file_path.relative_to(ROOT).as_posix(), "python", ["pkg0.mod0"]
+    ))
+    timed("cycles after update", graph.cycles)
+    importers = timed("importers_of (first query)", lambda: graph.importers_of("pkg0.mod0"))
+    timed("importers_of (cached index)", lambda: graph.importers_of("pkg1.mod0"))
+    print(f"{'':<32}{len(importers):,} modules transitively import pkg0.mod0")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
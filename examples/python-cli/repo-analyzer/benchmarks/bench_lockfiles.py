@@ -0,0 +1,90 @@
+"""
+Lockfile benchmark: streaming package-lock.json parsing and the graph cache.
+
+Writes a synthetic version 2 lockfile (npm 7-8 output, which repeats every
+package in a legacy ``dependencies`` section), then compares loading it with ``json.load``
+against the streaming parser, in time and in peak traced memory, and times
+``LockfileCache`` on a cold and a warm run.
+
+Usage: python benchmarks/bench_lockfiles.py [--packages 100000]
+"""
+
+import argparse
+import json
+import random
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from repo_analyzer.analyzers.lockfiles import parse_npm_lockfile
+from repo_analyzer.storage.cache import LockfileCache
+
+
+def write_lockfile(path: Path, packages: int, seed: int = 1) -> None:
+    """Write a lockfile of ``packages`` packages, a tenth of them nested."""
+    rng = random.Random(seed)
+    names = [f"pkg-{i}" for i in range(packages)]
+    entries = {"": {"name": "app", "dependencies": {name: "*" for name in names[:50]}}}
+    legacy = {}
+    for index, name in enumerate(names):
+        deps = {names[rng.randrange(packages)]: "*" for _ in range(rng.randint(0, 5))}
+        entry = {
+            "version": f"{rng.randrange(10)}.{rng.randrange(20)}.{rng.randrange(10)}",
+            "resolved": f"https://registry.npmjs.org/{name}/-/{name}.tgz",
+            "integrity": "sha512-" + "A" * 86 + "==",
+            "dependencies": deps,
+        }
+        key = f"node_modules/{name}"
+        if index % 10 == 9:
+            key = f"node_modules/{names[index - 1]}/node_modules/{name}"
+        entries[key] = entry
+        legacy[name] = {"version": entry["version"], "requires": deps}
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(
+            {"name": "app", "lockfileVersion": 2, "requires": True, "packages": entries, "dependencies": legacy},
+            handle,
+            indent=2
+        )
+
+
+def measure(label: str, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{label:<32}{elapsed * 1000:>10.1f}ms{peak / 2 ** 20:>10.1f} MB peak")
+    return result
+
+
+def timed(label: str, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<32}{(time.perf_counter() - start) * 1000:>10.1f}ms")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--packages", type=int, default=100_000)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        lockfile = Path(tmp) / "package-lock.json"
+        write_lockfile(lockfile, args.packages)
+        print(f"{args.packages:,} packages, {lockfile.stat().st_size / 2 ** 20:.1f} MB lockfile\n")
+        
+        measure("json.load (whole document)", lambda: json.loads(lockfile.read_text(encoding="utf-8")))
+        graph = measure("streaming parse", lambda: parse_npm_lockfile(lockfile))
+        print(f"{'':<32}{len(graph.direct()):,} direct, {len(graph.transitive()):,} total")
+        
+        with LockfileCache(Path(tmp) / "analysis.db") as cache:
+            timed("cache: cold (hash + parse)", lambda: cache.fetch(lockfile))
+            timed("cache: warm (unchanged file)", lambda: cache.fetch(lockfile))
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,94 @@
+"""
+Reader benchmark: prefetching reads vs. reading inline, on a cold cache.
+
+Generates a synthetic repository and times ``analyze_files`` with reads
+done inline (``--readers 0``, the old behaviour) and on reader threads.
+Before every run the files are evicted from the page cache with
+``posix_fadvise(DONTNEED)`` where the platform allows it; ``--latency-ms``
+adds a fixed delay to every read to model a network file system.
+
+Usage: python benchmarks/bench_reader.py [--files 2000] [--latency-ms 2] [--readers 0 4 8]
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from synthetic_repo import RepoSpec, generate_repository
+
+from repo_analyzer.analyzers.executor import analyze_files
+from repo_analyzer.analyzers.factory import AnalyzerFactory
+from repo_analyzer.analyzers.pipeline import ParsedFile
+from repo_analyzer.analyzers.reader import ReaderSettings, set_reader_settings
+
+
+def evict(files: List[Path]) -> bool:
+    """Drop the files from the page cache; False if the platform cannot."""
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    for path in files:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    return True
+
+
+def with_latency(seconds: float) -> None:
+    """Make every ``ParsedFile.read`` wait ``seconds`` first, like a remote read."""
+    read = ParsedFile.read.__func__
+    
+    def slow_read(cls, path):
+        time.sleep(seconds)
+        return read(cls, path)
+    
+    ParsedFile.read = classmethod(slow_read)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--analyzer", choices=("structure", "complexity", "quality"), default="complexity")
+    parser.add_argument("--jobs", type=int, default=1)
+    parser.add_argument("--readers", type=int, nargs="+", default=[0, 4, 8])
+    parser.add_argument("--read-ahead", type=int, default=32)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated per-read latency")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    
+    if args.latency_ms:
+        with_latency(args.latency_ms / 1000)
+    analyzer = getattr(AnalyzerFactory(), f"get_{args.analyzer}_analyzer")()
+    
+    with tempfile.TemporaryDirectory(prefix="repo-analyzer-bench-") as tmp:
+        files = generate_repository(Path(tmp), RepoSpec(file_count=args.files))
+        cold = evict(files)
+        print(
+            f"files: {len(files):,}  analyzer: {args.analyzer}  jobs: {args.jobs}  "
+            f"latency: {args.latency_ms:g}ms  page cache eviction: {'yes' if cold else 'no'}"
+        )
+        
+        baseline = None
+        for readers in args.readers:
+            set_reader_settings(ReaderSettings(readers=readers, read_ahead=args.read_ahead))
+            timings = []
+            for _ in range(args.repeat):
+                evict(files)
+                start = time.perf_counter()
+                analyze_files(analyzer, files, jobs=args.jobs)
+                timings.append(time.perf_counter() - start)
+            elapsed = statistics.median(timings)
+            baseline = baseline or elapsed
+            print(
+                f"readers={readers:<3}{elapsed:>9.3f}s{len(files) / elapsed:>10,.0f} files/s"
+                f"{baseline / elapsed:>8.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,78 @@
+"""
+Memory benchmark: FileAnalysis lists vs. the columnar ResultStore.
+
+Builds results for a synthetic repository (10,000 files by default) in both
+representations and reports the memory each one holds, measured with
+tracemalloc.
+
+Usage: python benchmarks/bench_result_memory.py [--files 10000] [--functions 50]
+"""
+
+import argparse
+import gc
+import random
+import tracemalloc
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+from repo_analyzer.analyzers.base import FileAnalysis
+from repo_analyzer.analyzers.results import ResultStore
+
+
+def synthetic_analyses(file_count: int, functions_per_file: int, seed: int = 42) -> List[FileAnalysis]:
+    """Generate deterministic FileAnalysis results for a fake repository."""
+    rng = random.Random(seed)
+    analyses = []
+    for file_index in range(file_count):
+        package = f"pkg{file_index % 200}"
+        functions = [
+            {
+                "name": f"handler_{rng.randrange(5000)}",
+                "line": 10 + i * 12,
+                "complexity": rng.randrange(1, 25),
+            }
+            for i in range(functions_per_file)
+        ]
+        analyses.append(FileAnalysis(
+            file_path=Path(f"src/{package}/module_{file_index}.py"),
+            language="python",
+            lines_of_code=functions_per_file * 12 + rng.randrange(50),
+            complexity_score=rng.random() * 10,
+            quality_score=rng.random() * 10,
+            functions=functions,
+            classes=[{"name": f"Model{file_index % 97}", "line": 1}],
+            imports=["os", "sys", f"{package}.models"]
+        ))
+    return analyses
+
+
+def measure(build: Callable[[], object]) -> Tuple[object, int]:
+    """Return the built object and the bytes it retains."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=10_000)
+    parser.add_argument("--functions", type=int, default=50)
+    args = parser.parse_args()
+    
+    analyses, list_bytes = measure(lambda: synthetic_analyses(args.files, args.functions))
+    store, store_bytes = measure(lambda: ResultStore.from_analyses(analyses))  # type: ignore[arg-type]
+    function_count = args.files * args.functions
+    
+    print(f"files: {args.files:,}  functions: {function_count:,}")
+    print(f"{'representation':<22}{'total MiB':>12}{'bytes/function':>16}")
+    for label, size in (("List[FileAnalysis]", list_bytes), ("ResultStore", store_bytes)):
+        print(f"{label:<22}{size / 2**20:>12.1f}{size / function_count:>16.1f}")
+    print(f"reduction: {list_bytes / store_bytes:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
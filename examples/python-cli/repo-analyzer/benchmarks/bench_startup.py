@@ -0,0 +1,87 @@
+"""
+Startup benchmark: CLI wall time and import cost.
+
+Runs ``--help``, ``--version`` and ``analyze --help`` in fresh interpreters
+and reports the median wall time of each, then lists the modules with the
+largest cumulative import time for ``import repo_analyzer.cli`` as
+reported by ``python -X importtime``. Exits with status 1 if that import
+takes longer than ``--budget-ms``; the budget is checked here rather than
+in the test suite, where machine load makes wall-clock limits flaky.
+
+Usage: python benchmarks/bench_startup.py [--repeat 10] [--top 15] [--budget-ms 150]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+
+COMMANDS = (["--help"], ["--version"], ["analyze", "--help"])
+
+ENTRY = "import sys; from repo_analyzer.cli import main; sys.argv = ['repo-analyzer', *sys.argv[1:]]; main()"
+
+
+def wall_time(args: List[str], repeat: int) -> float:
+    """Return the median wall time in seconds of running the CLI with ``args``."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", ENTRY, *args], capture_output=True, check=True)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def import_times() -> List[Tuple[int, int, str]]:
+    """Return ``(cumulative_us, self_us, module)`` for each module imported by the CLI."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import repo_analyzer.cli"],
+        capture_output=True, text=True, check=True
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        own, total, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if total.isdigit():
+            rows.append((int(total), int(own), name))
+    return rows
+
+
+def _interpreter_time() -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    return time.perf_counter() - start
+
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=150.0)
+    args = parser.parse_args()
+    
+    wall_time(["--version"], 1)  # warm the bytecode cache
+    interpreter = statistics.median(_interpreter_time() for _ in range(args.repeat))
+    print(f"{'python -c pass':<30}{interpreter * 1000:>9.1f}ms")
+    for command in COMMANDS:
+        elapsed = wall_time(command, args.repeat)
+        print(f"{'repo-analyzer ' + ' '.join(command):<30}{elapsed * 1000:>9.1f}ms")
+    
+    rows = import_times()
+    print(f"\nimport repo_analyzer.cli: {len(rows)} modules")
+    print(f"{'cumulative':>12}{'self':>10}  module")
+    for total, own, name in sorted(rows, reverse=True)[:args.top]:
+        print(f"{total / 1000:>10.1f}ms{own / 1000:>8.1f}ms  {name}")
+    
+    cli_import = next(total for total, _, name in rows if name == "repo_analyzer.cli") / 1000
+    if cli_import > args.budget_ms:
+        print(f"\nimport repo_analyzer.cli: {cli_import:.1f}ms (budget {args.budget_ms:g}ms)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,114 @@
+"""
+Storage benchmark: bulk history writes and run listing.
+
+Stores a synthetic 10,000-file run with DatabaseManager's bulk Core path and,
+for comparison, with one ORM object per row, then measures ``list_runs``
+, ``trend`` and ``find_run`` queries against a database holding many runs.
+
+Usage: python benchmarks/bench_storage.py [--files 10000] [--functions 20] [--runs 200]
+"""
+
+import argparse
+import hashlib
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from sqlalchemy.orm import Session
+
+from bench_result_memory import synthetic_analyses
+from repo_analyzer.analyzers.base import FileAnalysis
+from repo_analyzer.analyzers.results import ResultStore
+from repo_analyzer.storage.database import DatabaseManager
+from repo_analyzer.storage.models import AnalysisRun, FileAnalysisRecord, FunctionAnalysisRecord
+
+
+def save_with_orm(db: DatabaseManager, analyses: List[FileAnalysis]) -> None:
+    """Store a run one ORM object at a time (the naive baseline)."""
+    with Session(db.engine) as session:
+        run = AnalysisRun(repository_path="/bench")
+        session.add(run)
+        for analysis in analyses:
+            record = FileAnalysisRecord(
+                analysis_run=run,
+                file_path=str(analysis.file_path),
+                language=analysis.language,
+                lines_of_code=analysis.lines_of_code,
+                complexity_score=analysis.complexity_score,
+                quality_score=analysis.quality_score,
+                issue_count=len(analysis.issues)
+            )
+            session.add(record)
+            for function in analysis.functions:
+                session.add(FunctionAnalysisRecord(
+                    file_analysis=record,
+                    name=function["name"],
+                    line=function["line"],
+                    complexity=function["complexity"]
+                ))
+        session.commit()
+
+
+def timed(label: str, rows: int, func) -> float:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<30}{elapsed:>9.3f}s{rows / elapsed:>14,.0f} rows/s")
+    return elapsed
+
+
+def _commit(index: int) -> str:
+    return hashlib.sha1(str(index).encode()).hexdigest()
+
+
+def timed_query(label: str, runs: int, func, queries: int = 100) -> None:
+    start = time.perf_counter()
+    for _ in range(queries):
+        result = func()
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<30}{elapsed / queries * 1000:>8.2f}ms"
+        f"{queries / elapsed:>14,.0f} queries/s  ({runs:,} runs, {len(result)} returned)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=10_000)
+    parser.add_argument("--functions", type=int, default=20)
+    parser.add_argument("--runs", type=int, default=200, help="Runs stored for the query benchmark")
+    parser.add_argument("--skip-orm", action="store_true", help="Skip the slow ORM baseline")
+    args = parser.parse_args()
+    
+    analyses = synthetic_analyses(args.files, args.functions)
+    rows = args.files * (args.functions + 1)
+    print(f"files: {args.files:,}  functions: {args.files * args.functions:,}  rows: {rows:,}")
+    
+    with tempfile.TemporaryDirectory(prefix="repo-analyzer-bench-") as tmp:
+        store = ResultStore.from_analyses(analyses)
+        with DatabaseManager(Path(tmp) / "bulk.db") as db:
+            timed("bulk save_run (list)", rows, lambda: db.save_run(Path("/bench"), analyses))
+            timed("bulk save_run (ResultStore)", rows, lambda: db.save_run(Path("/bench"), store))
+        
+        if not args.skip_orm:
+            with DatabaseManager(Path(tmp) / "orm.db") as db:
+                timed("ORM object per row", rows, lambda: save_with_orm(db, analyses))
+        
+        small = synthetic_analyses(50, args.functions)
+        with DatabaseManager(Path(tmp) / "history.db") as db:
+            for index in range(args.runs):
+                db.save_run(Path("/bench"), small, commit_hash=_commit(index))
+            timed_query(
+                "list_runs (limit 20)", args.runs,
+                lambda: db.list_runs(repository_path=Path("/bench"), limit=20)
+            )
+            timed_query("trend (all runs)", args.runs, lambda: db.trend(Path("/bench")), queries=10)
+            timed_query(
+                "find_run (commit prefix)", args.runs,
+                lambda: [db.find_run(Path("/bench"), _commit(args.runs // 2)[:12])]
+            )
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
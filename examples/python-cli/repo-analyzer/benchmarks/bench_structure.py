@@ -0,0 +1,77 @@
+"""
+Structure engine benchmark: files per second on a warm page cache.
+
+Generates a synthetic repository and times the dedicated structure engine
+(``summarize_structure``) against the general analyzer path it replaces
+(``analyze_files`` with the structure analyzer, then a rollup tree), after
+one untimed pass to warm the page cache. Both must report the same
+totals. The design target is 10,000 files in well under a second.
+
+Usage: python benchmarks/bench_structure.py [--files 10000] [--jobs 4]
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from synthetic_repo import RepoSpec, generate_repository
+
+from repo_analyzer.analyzers.executor import analyze_files, default_jobs
+from repo_analyzer.analyzers.factory import AnalyzerFactory
+from repo_analyzer.analyzers.rollup import RollupTree
+from repo_analyzer.analyzers.structure_engine import summarize_structure
+from repo_analyzer.utils.file_utils import scan_repository
+
+
+TARGET_SECONDS = 1.0
+
+
+def median_time(func: Callable[[], object], repeat: int) -> float:
+    """Return the median wall time of ``func`` in seconds."""
+    samples: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=10_000)
+    parser.add_argument("--jobs", type=int, default=default_jobs())
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    
+    analyzer = AnalyzerFactory().get_structure_analyzer()
+    with tempfile.TemporaryDirectory(prefix="repo-analyzer-bench-") as tmp:
+        root = Path(tmp)
+        generate_repository(root, RepoSpec(file_count=args.files))
+        
+        def engine():
+            files = list(scan_repository(root))
+            return summarize_structure(root, files, jobs=args.jobs).to_directory_analysis(root)
+        
+        def general():
+            files = list(scan_repository(root))
+            analyses = analyze_files(analyzer, files, jobs=args.jobs)
+            return RollupTree.from_analyses(root, analyses).to_directory_analysis(root)
+        
+        expected = general()
+        if engine().to_dict() != expected.to_dict():
+            print("warning: engine and general path disagree")
+        
+        print(f"files: {expected.total_files:,}  jobs: {args.jobs}  (scan included, warm cache)")
+        for name, func in (("engine", engine), ("general", general)):
+            elapsed = median_time(func, args.repeat)
+            verdict = "" if name != "engine" else (
+                "  ok" if elapsed < TARGET_SECONDS else f"  over {TARGET_SECONDS:g}s target"
+            )
+            print(f"{name:<8}{elapsed:>9.3f}s{expected.total_files / elapsed:>12,.0f} files/s{verdict}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
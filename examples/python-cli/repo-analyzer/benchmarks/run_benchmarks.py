@@ -0,0 +1,289 @@
+"""
+Benchmark suite for the analyze subcommands.
+
+Generates a deterministic synthetic repository, then times ``structure``,
+``dependencies``, ``complexity`` and ``quality`` end to end (through the
+CLI) and per phase (scan, parse, aggregate, render). Each command runs in
+a fresh subprocess so peak RSS is measured per command. Results are
+written as JSON and can be compared between commits to catch regressions.
+
+Usage:
+    python benchmarks/run_benchmarks.py run --files 1000 --output base.json
+    python benchmarks/run_benchmarks.py compare base.json head.json --tolerance 0.10
+"""
+
+import argparse
+import io
+import json
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from synthetic_repo import RepoSpec, generate_repository, parse_language_mix
+
+
+COMMANDS = ("structure", "dependencies", "complexity", "quality")
+PHASES = ("scan", "parse", "aggregate", "render")
+
+#: Design targets in seconds, by maximum repository size in files.
+TARGETS = ((100, 5.0), (1_000, 15.0), (10_000, 30.0), (float("inf"), 60.0))
+
+
+def target_seconds(file_count: int) -> float:
+    """Return the design-doc time budget for a repository of this size."""
+    return next(seconds for limit, seconds in TARGETS if file_count <= limit)
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return peak / (2**20 if sys.platform == "darwin" else 2**10)
+
+
+def _timed(phases: Dict[str, float], name: str, func: Callable[[], Any]) -> Any:
+    start = time.perf_counter()
+    result = func()
+    phases[name] = time.perf_counter() - start
+    return result
+
+
+def measure_command(command: str, repo: Path, jobs: int) -> Dict[str, Any]:
+    """
+    Measure one analyze subcommand in the current process.
+    
+    Args:
+        command: Subcommand name
+        repo: Repository to analyze
+        jobs: Worker processes for file analysis
+        
+    Returns:
+        Timings in seconds per phase and end to end, plus peak RSS in MiB
+    """
+    from click.testing import CliRunner
+    
+    from repo_analyzer.analyzers.executor import analyze_files
+    from repo_analyzer.analyzers.factory import AnalyzerFactory
+    from repo_analyzer.analyzers.structure_engine import summarize_structure
+    from repo_analyzer.cli import cli
+    from repo_analyzer.commands import analyze as analyze_module
+    from repo_analyzer.utils.file_utils import scan_repository
+    
+    phases: Dict[str, float] = {}
+    analyzer = getattr(AnalyzerFactory(), f"get_{command}_analyzer")()
+    
+    files = _timed(phases, "scan", lambda: list(scan_repository(repo)))
+    
+    if command == "dependencies":
+        result = _timed(phases, "parse", lambda: analyzer.analyze_repository(repo, jobs=jobs))
+        phases["aggregate"] = 0.0
+    elif command == "structure":
+        # ``analyze structure`` counts files with the dedicated engine
+        summary = _timed(phases, "parse", lambda: summarize_structure(repo, files, jobs=jobs))
+        result = _timed(phases, "aggregate", lambda: summary.to_directory_analysis(repo))
+    else:
+        analyses = _timed(phases, "parse", lambda: analyze_files(analyzer, files, jobs=jobs))
+        # Summarize the timed results rather than analyzing the files again
+        result = _timed(
+            phases,
+            "aggregate",
+            lambda: analyzer.analyze_repository(repo, analyses=analyses, jobs=jobs)
+        )
+    
+    renderers = {
+        "structure": lambda: analyze_module._display_structure_analysis(result),
+        "dependencies": lambda: analyze_module._display_dependency_analysis(result),
+        "complexity": lambda: analyze_module._display_complexity_analysis(result, 10),
+        "quality": lambda: analyze_module._display_quality_analysis(result),
+    }
+    real_console = analyze_module.console
+    analyze_module.console = analyze_module.Console(file=io.StringIO(), width=120)
+    try:
+        _timed(phases, "render", renderers[command])
+    finally:
+        analyze_module.console = real_console
+    
+    args = ["--quiet", "--jobs", str(jobs), "analyze", command, str(repo)]
+    if command in ("dependencies", "complexity", "quality"):
+        args.append("--no-cache")
+    start = time.perf_counter()
+    outcome = CliRunner().invoke(cli, args)
+    end_to_end = time.perf_counter() - start
+    if outcome.exit_code != 0:
+        raise RuntimeError(f"{command} failed: {outcome.output}")
+    
+    return {
+        "end_to_end": end_to_end,
+        "phases": phases,
+        "files": len(files),
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def _run_in_subprocess(command: str, repo: Path, jobs: int) -> Dict[str, Any]:
+    completed = subprocess.run(
+        [sys.executable, __file__, "_single", command, str(repo), "--jobs", str(jobs)],
+        check=True,
+        capture_output=True,
+        text=True
+    )
+    return json.loads(completed.stdout)
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], check=True, capture_output=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(spec: RepoSpec, commands: List[str], repeat: int, jobs: int) -> Dict[str, Any]:
+    """
+    Generate the synthetic repository and benchmark each command.
+    
+    Timings are medians over ``repeat`` runs; peak RSS is the maximum.
+    """
+    with tempfile.TemporaryDirectory(prefix="repo-analyzer-bench-") as tmp:
+        repo = Path(tmp)
+        generate_repository(repo, spec)
+        
+        results = {}
+        for command in commands:
+            runs = [_run_in_subprocess(command, repo, jobs) for _ in range(repeat)]
+            end_to_end = statistics.median(r["end_to_end"] for r in runs)
+            results[command] = {
+                "end_to_end": end_to_end,
+                "phases": {
+                    phase: statistics.median(r["phases"][phase] for r in runs)
+                    for phase in PHASES
+                },
+                "peak_rss_mb": max(r["peak_rss_mb"] for r in runs),
+                "files": runs[0]["files"],
+                "target": target_seconds(spec.file_count),
+                "within_target": end_to_end <= target_seconds(spec.file_count),
+            }
+            print(
+                f"{command:<14}{end_to_end:>9.3f}s  "
+                + "  ".join(f"{p}={results[command]['phases'][p]:.3f}s" for p in PHASES)
+                + f"  rss={results[command]['peak_rss_mb']:.0f}MiB",
+                file=sys.stderr
+            )
+    
+    return {
+        "metadata": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "jobs": jobs,
+            "repeat": repeat,
+            "spec": spec.to_dict(),
+        },
+        "results": results,
+    }
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    tolerance: float,
+    min_delta: float
+) -> List[str]:
+    """
+    Compare two result files and describe any regressions.
+    
+    A metric regresses when it is slower than the baseline by more than
+    ``tolerance`` (relative) and by more than ``min_delta`` seconds.
+    
+    Returns:
+        Human-readable regression descriptions (empty if none)
+    """
+    regressions = []
+    for command, base in baseline["results"].items():
+        head = current["results"].get(command)
+        if head is None:
+            continue
+        metrics = [("end_to_end", base["end_to_end"], head["end_to_end"])]
+        metrics += [
+            (phase, base["phases"][phase], head["phases"][phase]) for phase in PHASES
+        ]
+        for name, old, new in metrics:
+            delta = new - old
+            marker = ""
+            if delta > min_delta and new > old * (1 + tolerance):
+                marker = "  REGRESSION"
+                regressions.append(f"{command}.{name}: {old:.3f}s -> {new:.3f}s")
+            print(f"{command + '.' + name:<26}{old:>9.3f}s{new:>9.3f}s{delta:>+9.3f}s{marker}")
+        rss_old, rss_new = base["peak_rss_mb"], head["peak_rss_mb"]
+        if rss_new > rss_old * (1 + tolerance):
+            regressions.append(f"{command}.peak_rss_mb: {rss_old:.0f} -> {rss_new:.0f}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="repo-analyzer benchmark suite")
+    subparsers = parser.add_subparsers(dest="action", required=True)
+    
+    run = subparsers.add_parser("run", help="Run the benchmark suite")
+    run.add_argument("--files", type=int, default=1000)
+    run.add_argument("--languages", type=parse_language_mix, help="e.g. python=0.6,javascript=0.4")
+    run.add_argument("--functions", type=int, default=RepoSpec.functions_per_file)
+    run.add_argument("--max-complexity", type=int, default=RepoSpec.max_complexity)
+    run.add_argument("--depth", type=int, default=RepoSpec.directory_depth)
+    run.add_argument("--seed", type=int, default=RepoSpec.seed)
+    run.add_argument("--commands", nargs="+", choices=COMMANDS, default=list(COMMANDS))
+    run.add_argument("--repeat", type=int, default=3)
+    run.add_argument("--jobs", type=int, default=1)
+    run.add_argument("--output", type=Path, default=Path("benchmark-results.json"))
+    
+    compare = subparsers.add_parser("compare", help="Compare two result files")
+    compare.add_argument("baseline", type=Path)
+    compare.add_argument("current", type=Path)
+    compare.add_argument("--tolerance", type=float, default=0.10)
+    compare.add_argument("--min-delta", type=float, default=0.05)
+    
+    single = subparsers.add_parser("_single")
+    single.add_argument("command", choices=COMMANDS)
+    single.add_argument("repo", type=Path)
+    single.add_argument("--jobs", type=int, default=1)
+    
+    args = parser.parse_args()
+    
+    if args.action == "_single":
+        print(json.dumps(measure_command(args.command, args.repo, args.jobs)))
+    elif args.action == "run":
+        spec = RepoSpec(
+            file_count=args.files,
+            language_mix=args.languages or RepoSpec().language_mix,
+            functions_per_file=args.functions,
+            max_complexity=args.max_complexity,
+            directory_depth=args.depth,
+            seed=args.seed
+        )
+        report = run_suite(spec, args.commands, args.repeat, args.jobs)
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"Results written to {args.output}", file=sys.stderr)
+    else:
+        regressions = compare_results(
+            json.loads(args.baseline.read_text()),
+            json.loads(args.current.read_text()),
+            args.tolerance,
+            args.min_delta
+        )
+        if regressions:
+            print("\nPerformance regressions:", file=sys.stderr)
+            for regression in regressions:
+                print(f"  {regression}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,185 @@
+"""
+Deterministic synthetic repository generator for benchmarks.
+
+Generates a source tree with a configurable number of files, language mix,
+function complexity and directory depth. The same parameters and seed
+always produce byte-identical repositories, so timings are comparable
+between commits.
+
+Usage: python benchmarks/synthetic_repo.py OUTPUT_DIR [--files 1000] [--seed 42]
+"""
+
+import argparse
+import json
+import random
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List
+
+
+@dataclass
+class RepoSpec:
+    """Parameters describing a synthetic repository."""
+    file_count: int = 1000
+    language_mix: Dict[str, float] = field(
+        default_factory=lambda: {"python": 0.6, "javascript": 0.3, "markdown": 0.1}
+    )
+    functions_per_file: int = 8
+    max_complexity: int = 12
+    directory_depth: int = 3
+    directory_fanout: int = 6
+    seed: int = 42
+    
+    def to_dict(self) -> Dict[str, object]:
+        """Convert to dictionary for JSON serialization."""
+        return asdict(self)
+
+
+def _python_function(rng: random.Random, name: str, complexity: int) -> str:
+    lines = [f"def {name}(items, limit={rng.randrange(1, 100)}):", "    total = 0"]
+    indent = "    "
+    for branch in range(complexity - 1):
+        kind = branch % 3
+        if kind == 0:
+            lines.append(f"{indent}for item in items:")
+            indent += "    "
+            lines.append(f"{indent}total += 1")
+        elif kind == 1:
+            lines.append(f"{indent}if item > limit and item % {branch + 2} == 0:")
+            lines.append(f"{indent}    total += item")
+            lines.append(f"{indent}elif item < 0:")
+            lines.append(f"{indent}    total -= item")
+        else:
+            lines.append(f"{indent}while total > limit * {branch + 1}:")
+            lines.append(f"{indent}    total //= 2")
+    lines.append("    return total")
+    return "\n".join(lines)
+
+
+def _python_file(rng: random.Random, spec: RepoSpec, modules: List[str]) -> str:
+    imports = sorted({rng.choice(modules) for _ in range(3)} | {"os", "json"})
+    body = [f"import {module}" for module in imports]
+    body.append("")
+    for index in range(spec.functions_per_file):
+        complexity = rng.randrange(1, spec.max_complexity + 1)
+        body.append("")
+        body.append(_python_function(rng, f"handler_{index}", complexity))
+    return "\n".join(body) + "\n"
+
+
+def _javascript_file(rng: random.Random, spec: RepoSpec, modules: List[str]) -> str:
+    body = [f"import {{ helper }} from './{rng.choice(modules).split('.')[-1]}';", ""]
+    for index in range(spec.functions_per_file):
+        complexity = rng.randrange(1, spec.max_complexity + 1)
+        body.append(f"export function handler{index}(items, limit = {rng.randrange(100)}) {{")
+        body.append("  let total = 0;")
+        for branch in range(complexity - 1):
+            if branch % 2 == 0:
+                body.append(f"  for (const item of items) {{ if (item > limit || item === {branch}) total += item; }}")
+            else:
+                body.append(f"  total = total > {branch} ? helper(total) : total;")
+        body.append("  return total;")
+        body.append("}")
+        body.append("")
+    return "\n".join(body)
+
+
+def _markdown_file(rng: random.Random, spec: RepoSpec, modules: List[str]) -> str:
+    paragraphs = [f"# Notes {rng.randrange(1000)}", ""]
+    for _ in range(spec.functions_per_file):
+        paragraphs.append(" ".join(rng.choice(modules) for _ in range(12)))
+        paragraphs.append("")
+    return "\n".join(paragraphs)
+
+
+_GENERATORS: Dict[str, Callable[[random.Random, RepoSpec, List[str]], str]] = {
+    "python": _python_file,
+    "javascript": _javascript_file,
+    "markdown": _markdown_file,
+}
+
+_EXTENSIONS = {"python": ".py", "javascript": ".js", "markdown": ".md"}
+
+
+def generate_repository(root: Path, spec: RepoSpec) -> List[Path]:
+    """
+    Write a synthetic repository below ``root``.
+    
+    Args:
+        root: Output directory (created if missing; existing files are
+            overwritten, other files are left alone)
+        spec: Repository parameters
+        
+    Returns:
+        Paths of the generated files in creation order
+    """
+    unknown = set(spec.language_mix) - set(_GENERATORS)
+    if unknown:
+        raise ValueError(f"Unsupported languages: {', '.join(sorted(unknown))}")
+    
+    rng = random.Random(spec.seed)
+    languages = sorted(spec.language_mix)
+    weights = [spec.language_mix[lang] for lang in languages]
+    
+    directories = [Path(".")]
+    frontier = [Path(".")]
+    for depth in range(spec.directory_depth):
+        frontier = [
+            parent / f"pkg_{depth}_{child}"
+            for parent in frontier
+            for child in range(spec.directory_fanout)
+        ]
+        directories.extend(frontier)
+    
+    modules = [".".join(d.parts) or "root" for d in directories]
+    files = []
+    for index in range(spec.file_count):
+        language = rng.choices(languages, weights)[0]
+        directory = directories[rng.randrange(len(directories))]
+        path = root / directory / f"module_{index}{_EXTENSIONS[language]}"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(_GENERATORS[language](rng, spec, modules))
+        files.append(path)
+    
+    (root / "requirements.txt").write_text("click>=8.0.0\nrich>=13.0.0\nrequests==2.31.0\n")
+    (root / "package.json").write_text(json.dumps(
+        {"name": "synthetic", "dependencies": {"react": "^18.2.0", "lodash": "4.17.21"}},
+        indent=2
+    ))
+    return files
+
+
+def parse_language_mix(value: str) -> Dict[str, float]:
+    """Parse ``python=0.6,javascript=0.4`` into a language weight mapping."""
+    mix = {}
+    for item in value.split(","):
+        language, _, weight = item.partition("=")
+        mix[language.strip()] = float(weight or 1)
+    return mix
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic repository")
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--files", type=int, default=RepoSpec.file_count)
+    parser.add_argument("--languages", type=parse_language_mix, help="e.g. python=0.6,javascript=0.4")
+    parser.add_argument("--functions", type=int, default=RepoSpec.functions_per_file)
+    parser.add_argument("--max-complexity", type=int, default=RepoSpec.max_complexity)
+    parser.add_argument("--depth", type=int, default=RepoSpec.directory_depth)
+    parser.add_argument("--seed", type=int, default=RepoSpec.seed)
+    args = parser.parse_args()
+    
+    spec = RepoSpec(
+        file_count=args.files,
+        language_mix=args.languages or RepoSpec().language_mix,
+        functions_per_file=args.functions,
+        max_complexity=args.max_complexity,
+        directory_depth=args.depth,
+        seed=args.seed
+    )
+    files = generate_repository(args.output, spec)
+    print(f"Generated {len(files):,} files in {args.output}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
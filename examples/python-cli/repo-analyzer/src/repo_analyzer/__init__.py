@@ -9,6 +9,13 @@ __version__ = "1.0.0"
 __author__ = "Context Engineering Framework"
 __email__ = "framework@example.com"
 
-from .cli import main
+__all__ = ["main"]
 
-__all__ = ["main"]
\ No newline at end of file
+
+def __getattr__(name):
+    # Imported on first use so that importing a submodule (e.g. in analysis
+    # worker processes) does not load the CLI
+    if name == "main":
+        from .cli import main
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
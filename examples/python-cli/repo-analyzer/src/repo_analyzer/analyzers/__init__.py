@@ -5,7 +5,14 @@ This package provides language-specific analyzers and analysis factories
 for comprehensive repository analysis.
 """
 
-from .factory import AnalyzerFactory
 from .base import BaseAnalyzer
 
-__all__ = ["AnalyzerFactory", "BaseAnalyzer"]
\ No newline at end of file
+__all__ = ["AnalyzerFactory", "BaseAnalyzer"]
+
+
+def __getattr__(name):
+    # The factory imports every language analyzer; load it on first use
+    if name == "AnalyzerFactory":
+        from .factory import AnalyzerFactory
+        return AnalyzerFactory
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1,210 @@
+"""
+Historical analysis of many commits.
+
+Walks a range of commits and stores one history run per commit. File
+contents are read straight from the git object database, and each blob is
+analyzed at most once: results are shared by every commit containing the
+blob and persisted in a BlobCache keyed by blob SHA. Analyzing N commits
+therefore costs roughly the number of distinct blobs in the range rather
+than N times the size of the repository.
+"""
+
+from dataclasses import dataclass, replace
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import git
+
+from ..storage.cache import BlobCache, BlobKey
+from ..storage.database import DatabaseManager
+from ..utils.file_utils import detect_language
+from ..utils.git_utils import GitReferenceError, iter_tree_files, open_repository
+from ..utils.profiling import get_profiler
+from .base import BaseAnalyzer, FileAnalysis
+from .pipeline import ParsedFile, analyze_sources
+from .results import ResultStore
+
+
+@dataclass
+class BackfillStats:
+    """Work done by one ``backfill`` call."""
+    commits: int = 0
+    skipped: int = 0
+    files: int = 0
+    distinct_blobs: int = 0
+    cached_blobs: int = 0
+    analyzed_blobs: int = 0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "commits": self.commits,
+            "skipped": self.skipped,
+            "files": self.files,
+            "distinct_blobs": self.distinct_blobs,
+            "cached_blobs": self.cached_blobs,
+            "analyzed_blobs": self.analyzed_blobs
+        }
+
+
+def list_commits(
+    repository_path: Path,
+    revision_range: str,
+    max_count: Optional[int] = None,
+    first_parent: bool = False
+) -> List[git.Commit]:
+    """
+    Resolve a revision range (e.g. ``v1.0..main``) to commits, oldest first.
+    
+    Args:
+        repository_path: Repository root or any directory inside it
+        revision_range: Anything ``git rev-list`` accepts
+        max_count: Keep only the newest commits of the range
+        first_parent: Follow only the first parent of merge commits
+        
+    Raises:
+        GitReferenceError: If the repository or range cannot be resolved
+    """
+    repo = open_repository(repository_path)
+    options: Dict[str, Any] = {"first_parent": first_parent}
+    if max_count is not None:
+        options["max_count"] = max_count
+    try:
+        commits = list(repo.iter_commits(revision_range, **options))
+    except git.GitCommandError as e:
+        raise GitReferenceError(f"Unknown revision range: {revision_range}") from e
+    commits.reverse()
+    return commits
+
+
+def _merge(results: Dict[str, FileAnalysis]) -> FileAnalysis:
+    # Same shape as ``analyze all --save-history``: complexity results with
+    # the quality analyzer's score
+    merged = results["complexity"]
+    if "quality" in results:
+        merged = replace(merged, quality_score=results["quality"].quality_score)
+    return merged
+
+
+def backfill(
+    repository_path: Path,
+    commits: Sequence[git.Commit],
+    analyzers: Dict[str, BaseAnalyzer],
+    db: DatabaseManager,
+    caches: Optional[Dict[str, BlobCache]] = None,
+    exclude_patterns: Sequence[str] = (),
+    complexity_threshold: int = 10,
+    jobs: Optional[int] = None,
+    force: bool = False,
+    on_commit: Optional[Callable[[git.Commit], None]] = None
+) -> BackfillStats:
+    """
+    Analyze commits from the object database and store one run per commit.
+    
+    Only the blobs not seen in an earlier commit are looked up in the blob
+    caches, and only cache misses are read and analyzed. Results are kept
+    in memory for the blobs of the previous commit, which covers almost all
+    of the next one.
+    
+    Args:
+        repository_path: Repository root, or a subdirectory to restrict to
+        commits: Commits to analyze, oldest first (see ``list_commits``)
+        analyzers: Analyzers keyed by name; needs ``"complexity"``, and
+            ``"quality"`` supplies the quality score
+        db: History database to store the runs in
+        caches: Optional blob caches keyed by analyzer name
+        exclude_patterns: Gitignore-style patterns to exclude
+        complexity_threshold: Threshold for the stored run summaries
+        jobs: Number of worker processes (default: CPU count)
+        force: Also re-store commits that already have a run
+        on_commit: Called after each commit is processed
+        
+    Returns:
+        BackfillStats for the call
+        
+    Raises:
+        GitReferenceError: If the path is not inside a git repository
+    """
+    root = Path(repository_path).resolve()
+    repo = open_repository(root)
+    scope = root.relative_to(Path(repo.working_tree_dir).resolve()).as_posix()
+    scope = "" if scope == "." else scope
+    caches = caches or {}
+    names = tuple(analyzers)
+    configuration = {"complexity_threshold": complexity_threshold, "backfill": True}
+    
+    stats = BackfillStats()
+    seen = set()
+    known: Dict[BlobKey, FileAnalysis] = {}
+    profiler = get_profiler()
+    
+    for commit in commits:
+        if not force and db.find_run(root, commit.hexsha) is not None:
+            stats.skipped += 1
+            if on_commit is not None:
+                on_commit(commit)
+            continue
+        
+        with profiler.phase("backfill-walk"):
+            entries: List[Tuple[str, BlobKey, git.Blob]] = [
+                (relative_path, (blob.hexsha, detect_language(Path(relative_path))), blob)
+                for relative_path, blob in iter_tree_files(commit, scope, exclude_patterns)
+            ]
+        
+        previous, known = known, {}
+        unknown: Dict[BlobKey, Tuple[str, git.Blob]] = {}
+        for relative_path, key, blob in entries:
+            if key in previous:
+                known[key] = previous[key]
+            elif key not in known:
+                unknown[key] = (relative_path, blob)
+        seen.update(unknown)
+        
+        if unknown:
+            with profiler.phase("backfill-cache"):
+                cached = {name: cache.get_many(unknown) for name, cache in caches.items()}
+            for key in list(unknown):
+                if all(key in cached.get(name, {}) for name in names):
+                    known[key] = _merge({name: cached[name][key] for name in names})
+                    stats.cached_blobs += 1
+                    del unknown[key]
+        
+        if unknown:
+            keys = list(unknown)
+            with profiler.phase("backfill-read"):
+                sources = [
+                    ParsedFile.from_bytes(root / unknown[key][0], unknown[key][1].data_stream.read())
+                    for key in keys
+                ]
+            with profiler.phase("analyze"):
+                results = analyze_sources(analyzers, sources, jobs=jobs)
+            for index, key in enumerate(keys):
+                per_analyzer = {name: results[name][index] for name in names}
+                for name, cache in caches.items():
+                    cache.put(key, per_analyzer[name])
+                known[key] = _merge(per_analyzer)
+            stats.analyzed_blobs += len(keys)
+        
+        with profiler.phase("save-history"):
+            store = ResultStore()
+            for relative_path, key, _ in entries:
+                store.add(known[key], file_path=str(root / relative_path))
+            db.save_run(
+                root,
+                store,
+                commit_hash=commit.hexsha,
+                configuration=configuration,
+                timestamp=datetime.utcfromtimestamp(commit.committed_date),
+                complexity_threshold=complexity_threshold
+            )
+            for cache in caches.values():
+                cache.flush()
+        
+        stats.commits += 1
+        stats.files += len(entries)
+        if on_commit is not None:
+            on_commit(commit)
+    
+    stats.distinct_blobs = len(seen)
+    return stats
\ No newline at end of file
@@ -7,7 +7,10 @@ Provides abstract base classes and data models for all analyzer implementations.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence, Any
+
+if TYPE_CHECKING:
+    from .pipeline import ParsedFile
 
 
 @dataclass
@@ -22,6 +25,35 @@ class FileAnalysis:
     classes: List[Dict[str, Any]] = field(default_factory=list)
     imports: List[str] = field(default_factory=list)
     issues: List[Dict[str, Any]] = field(default_factory=list)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "file_path": str(self.file_path),
+            "language": self.language,
+            "lines_of_code": self.lines_of_code,
+            "complexity_score": self.complexity_score,
+            "quality_score": self.quality_score,
+            "functions": self.functions,
+            "classes": self.classes,
+            "imports": self.imports,
+            "issues": self.issues
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FileAnalysis":
+        """Rebuild a FileAnalysis from the output of ``to_dict``."""
+        return cls(
+            file_path=Path(data["file_path"]),
+            language=data["language"],
+            lines_of_code=data["lines_of_code"],
+            complexity_score=data.get("complexity_score", 0.0),
+            quality_score=data.get("quality_score", 0.0),
+            functions=data.get("functions", []),
+            classes=data.get("classes", []),
+            imports=data.get("imports", []),
+            issues=data.get("issues", [])
+        )
 
 
 @dataclass
@@ -61,6 +93,9 @@ class MetricsResult:
 class BaseAnalyzer(ABC):
     """Abstract base class for all code analyzers."""
     
+    #: Bump whenever analysis output changes; part of the result cache key.
+    version: str = "1"
+    
     @abstractmethod
     def analyze_file(self, file_path: Path) -> FileAnalysis:
         """
@@ -74,6 +109,52 @@ class BaseAnalyzer(ABC):
         """
         pass
     
+    def analyze_source(self, parsed: "ParsedFile") -> FileAnalysis:
+        """
+        Analyze a file that has already been read and parsed.
+        
+        Used by the combined analysis pipeline, which reads and parses each
+        file once for all analyzers. Override to work from ``parsed.source``,
+        ``parsed.lines`` or ``parsed.tree`` (``parsed.lines_of_code`` is
+        counted from the raw bytes); the default falls back to
+        ``analyze_file``, which reads the file again. Binary and oversized
+        files never reach this method.
+        
+        Args:
+            parsed: Shared source and parse of the file
+            
+        Returns:
+            FileAnalysis object containing analysis results
+        """
+        return self.analyze_file(parsed.path)
+    
+    def analyze_batch(self, files: Sequence["ParsedFile"]) -> Iterator[FileAnalysis]:
+        """
+        Analyze a batch of already read files of one language, in order.
+        
+        The executor and the combined pipeline split each work batch by
+        language (see ``dispatch.analyze_grouped``) and call this once per
+        group on the language's routed analyzer or the run's own. Override
+        to pay per-call overhead once per batch instead of once per file;
+        setup stored on the instance (e.g. rules compiled per language on
+        first use) lasts the whole run, since every worker keeps its
+        analyzers. The default calls ``analyze_source`` for each file, so
+        single-file analyzers work unchanged.
+        
+        Files arrive already read rather than as paths, so the result
+        cache, read-ahead and skipping of binary and oversized files (which
+        never reach this method) apply before any analyzer runs. To analyze
+        paths, call ``executor.analyze_files``.
+        
+        Args:
+            files: Files to analyze, all with the same ``language``
+            
+        Yields:
+            FileAnalysis for each file, in the order given
+        """
+        for parsed in files:
+            yield self.analyze_source(parsed)
+    
     @abstractmethod
     def analyze_directory(self, dir_path: Path, files: List[Path]) -> DirectoryAnalysis:
         """
@@ -88,18 +169,21 @@ class BaseAnalyzer(ABC):
         """
         pass
     
-    @abstractmethod
     def calculate_metrics(self, analyses: List[FileAnalysis]) -> MetricsResult:
         """
         Calculate aggregate metrics from file analyses.
         
+        The default implementation aggregates in bulk over NumPy arrays (see
+        ``utils.metrics``); ``analyses`` may also be a ResultStore.
+        
         Args:
             analyses: List of file analysis results
             
         Returns:
             MetricsResult object containing calculated metrics
         """
-        pass
+        from ..utils.metrics import calculate_metrics
+        return calculate_metrics(analyses)
     
     def supports_language(self, language: str) -> bool:
         """
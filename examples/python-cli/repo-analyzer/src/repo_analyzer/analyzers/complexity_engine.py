@@ -0,0 +1,655 @@
+"""
+Cyclomatic complexity from token scans, with an AST reference path.
+
+Cyclomatic complexity only needs each function's extent and its decision
+points, so building a full AST (the dominant cost of ``analyze
+complexity``) is unnecessary for it. ``scan_python_complexity`` blanks
+out strings and comments in one regular expression pass, then walks the
+code line by line, counting decision keywords and balancing brackets to
+tell logical lines apart; a function body ends at the first logical line
+indented no deeper than its ``def``. ``scan_js_complexity`` does the same
+for JavaScript and TypeScript with a small lexer.
+
+``ast_complexity`` is the reference the Python scanner must agree with,
+and the only source of nesting depth and cognitive complexity.
+``function_complexity`` picks the scan unless those detailed metrics are
+requested or the scanner declines the file: it returns None for source it
+cannot count with certainty (``match`` statements, f-string fields with
+decision keywords, unbalanced brackets, unterminated strings), and those
+files go through the AST. For source that parses, both paths report the
+same functions; source with other syntax errors still gets scanned
+counts, where the AST path reports nothing.
+
+``ScanComplexityAnalyzer`` runs the scan as an analyzer; ``analyze
+complexity`` routes the scanned languages to it, in front of the full
+complexity analyzer, unless ``--detailed`` asks for nesting depth and
+cognitive complexity.
+"""
+
+import ast
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Tuple
+
+from .base import BaseAnalyzer, DirectoryAnalysis, FileAnalysis, MetricsResult
+
+if TYPE_CHECKING:
+    from .pipeline import ParsedFile
+
+
+class FunctionComplexity(NamedTuple):
+    """Complexity of one function; detailed metrics come from the AST path only."""
+    name: str
+    line: int
+    complexity: int
+    nesting_depth: Optional[int] = None
+    cognitive_complexity: Optional[int] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the ``FileAnalysis.functions`` entry format."""
+        data: Dict[str, Any] = {"name": self.name, "line": self.line, "complexity": self.complexity}
+        if self.nesting_depth is not None:
+            data["nesting_depth"] = self.nesting_depth
+            data["cognitive_complexity"] = self.cognitive_complexity
+        return data
+
+
+def function_complexity(parsed: "ParsedFile", detailed: bool = False) -> List[FunctionComplexity]:
+    """
+    Compute per-function complexity of a file, scanning tokens where possible.
+    
+    Args:
+        parsed: Shared source and parse of the file
+        detailed: Also compute nesting depth and cognitive complexity, which
+            needs the AST (Python only; other languages report cyclomatic
+            complexity alone)
+            
+    Returns:
+        Functions in source order; empty for unsupported languages and for
+        Python files that neither scan nor parse
+    """
+    if parsed.language == "python":
+        if not detailed:
+            scanned = scan_python_complexity(parsed.source)
+            if scanned is not None:
+                return scanned
+        tree = parsed.tree
+        return [] if tree is None else ast_complexity(tree, detailed)
+    if parsed.language in ("javascript", "typescript"):
+        return scan_js_complexity(parsed.source)
+    return []
+
+
+#: Languages ``function_complexity`` counts.
+SCANNED_LANGUAGES = ("python", "javascript", "typescript")
+
+
+class ScanComplexityAnalyzer(BaseAnalyzer):
+    """
+    Complexity analyzer that scans Python, JavaScript and TypeScript files.
+    
+    Files in ``SCANNED_LANGUAGES`` get per-function cyclomatic complexity
+    from ``function_complexity`` and, as their file score, the total over
+    their functions; nesting depth and cognitive complexity are left out.
+    Files in other languages, repository summaries and metrics go to
+    ``fallback``, the full complexity analyzer, so per-file results must be
+    passed to ``analyze_repository`` as ``analyses``. It supports only the
+    scanned languages, so ``dispatch.analyzers_by_language`` routes just
+    those to it.
+    
+    Args:
+        fallback: Full complexity analyzer; must be picklable for parallel runs
+    """
+    
+    def __init__(self, fallback: BaseAnalyzer):
+        self.fallback = fallback
+    
+    @property
+    def version(self) -> str:
+        # Results of unscanned languages come from the fallback
+        return f"scan-1/{self.fallback.version}"
+    
+    def analyze_file(self, file_path: Path) -> FileAnalysis:
+        from .pipeline import ParsedFile
+        return self.analyze_source(ParsedFile.read(file_path))
+    
+    def analyze_source(self, parsed: "ParsedFile") -> FileAnalysis:
+        if parsed.language not in SCANNED_LANGUAGES:
+            return self.fallback.analyze_source(parsed)
+        functions = function_complexity(parsed)
+        return FileAnalysis(
+            file_path=parsed.path,
+            language=parsed.language,
+            lines_of_code=parsed.lines_of_code,
+            complexity_score=float(sum(function.complexity for function in functions)),
+            functions=[function.to_dict() for function in functions]
+        )
+    
+    def analyze_repository(self, repository_path: Path, **options: Any) -> Any:
+        """Summarize a repository with the fallback analyzer."""
+        return self.fallback.analyze_repository(repository_path, **options)
+    
+    def analyze_directory(self, dir_path: Path, files: List[Path]) -> DirectoryAnalysis:
+        return self.fallback.analyze_directory(dir_path, files)
+    
+    def calculate_metrics(self, analyses: List[FileAnalysis]) -> MetricsResult:
+        return self.fallback.calculate_metrics(analyses)
+    
+    def get_supported_languages(self) -> List[str]:
+        return list(SCANNED_LANGUAGES)
+
+
+_FUNCTIONS = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+_BRANCHES = (ast.If, ast.For, ast.AsyncFor, ast.While, ast.IfExp, ast.ExceptHandler)
+
+
+def _decision_points(node: ast.AST) -> int:
+    if isinstance(node, _BRANCHES):
+        return 1
+    if isinstance(node, ast.BoolOp):
+        return len(node.values) - 1
+    if isinstance(node, ast.comprehension):
+        return 1 + len(node.ifs)
+    if isinstance(node, ast.match_case):
+        return 1 + (node.guard is not None)
+    return 0
+
+
+def ast_complexity(tree: ast.AST, detailed: bool = False) -> List[FunctionComplexity]:
+    """
+    Compute per-function complexity from a Python AST.
+    
+    Cyclomatic complexity is 1 plus one per ``if``/``elif``, loop,
+    ``except`` clause, conditional expression, comprehension ``for`` and
+    ``if``, ``case`` clause and guard, and per ``and``/``or`` operator.
+    Nested functions are reported on their own; decorators, defaults and
+    annotations count toward the enclosing function, as do lambdas and the
+    bodies of nested classes. Code outside functions is not reported.
+    
+    Args:
+        tree: Parsed module
+        detailed: Also compute nesting depth and cognitive complexity
+        
+    Returns:
+        Functions in source order
+    """
+    found: List[Tuple[ast.AST, List[Any]]] = []
+    
+    def walk(node: ast.AST, entry: Optional[List[Any]]) -> None:
+        if isinstance(node, _FUNCTIONS):
+            for name, value in ast.iter_fields(node):
+                if name != "body":
+                    for child in value if isinstance(value, list) else [value]:
+                        if isinstance(child, ast.AST):
+                            walk(child, entry)
+            record = [node.name, node.lineno, 1]
+            found.append((node, record))
+            for statement in node.body:
+                walk(statement, record)
+            return
+        if entry is not None:
+            entry[2] += _decision_points(node)
+        for child in ast.iter_child_nodes(node):
+            walk(child, entry)
+    
+    walk(tree, None)
+    if not detailed:
+        return [FunctionComplexity(*record) for _, record in found]
+    return [FunctionComplexity(*record, *_cognitive_metrics(node)) for node, record in found]
+
+
+def _cognitive_metrics(function: ast.AST) -> Tuple[int, int]:
+    """
+    Return ``(nesting_depth, cognitive_complexity)`` of one function.
+    
+    Cognitive complexity follows the SonarSource rules: branches, loops,
+    ``except`` clauses, ``match`` and conditional expressions cost 1 plus
+    their nesting level; ``elif``, ``else`` and each run of ``and``/``or``
+    cost 1. Nesting depth counts nested compound statement blocks.
+    """
+    depth = 0
+    score = 0
+    
+    def block(statements: List[ast.stmt], nesting: int, level: int) -> None:
+        nonlocal depth
+        depth = max(depth, level)
+        for statement in statements:
+            visit(statement, nesting, level)
+    
+    def expression(node: Optional[ast.AST], nesting: int, level: int) -> None:
+        if node is not None:
+            visit(node, nesting, level)
+    
+    def visit(node: ast.AST, nesting: int, level: int) -> None:
+        nonlocal score
+        if isinstance(node, (*_FUNCTIONS, ast.ClassDef)):
+            return
+        if isinstance(node, ast.If):
+            score += 1 + nesting
+            expression(node.test, nesting, level)
+            block(node.body, nesting + 1, level + 1)
+            orelse = node.orelse
+            while len(orelse) == 1 and isinstance(orelse[0], ast.If):
+                score += 1
+                expression(orelse[0].test, nesting, level)
+                block(orelse[0].body, nesting + 1, level + 1)
+                orelse = orelse[0].orelse
+            if orelse:
+                score += 1
+                block(orelse, nesting + 1, level + 1)
+        elif isinstance(node, (ast.For, ast.AsyncFor, ast.While)):
+            score += 1 + nesting
+            for child in ast.iter_child_nodes(node):
+                if isinstance(child, ast.expr):
+                    visit(child, nesting, level)
+            block(node.body, nesting + 1, level + 1)
+            if node.orelse:
+                score += 1
+                block(node.orelse, nesting + 1, level + 1)
+        elif isinstance(node, (ast.Try, getattr(ast, "TryStar", ast.Try))):
+            block(node.body, nesting, level + 1)
+            for handler in node.handlers:
+                score += 1 + nesting
+                expression(handler.type, nesting, level)
+                block(handler.body, nesting + 1, level + 1)
+            if node.orelse:
+                block(node.orelse, nesting, level + 1)
+            if node.finalbody:
+                block(node.finalbody, nesting, level + 1)
+        elif isinstance(node, (ast.With, ast.AsyncWith)):
+            for item in node.items:
+                visit(item, nesting, level)
+            block(node.body, nesting, level + 1)
+        elif isinstance(node, ast.Match):
+            score += 1 + nesting
+            expression(node.subject, nesting, level)
+            for case in node.cases:
+                expression(case.guard, nesting, level)
+                block(case.body, nesting + 1, level + 1)
+        elif isinstance(node, ast.IfExp):
+            score += 1 + nesting
+            for child in (node.test, node.body, node.orelse):
+                visit(child, nesting + 1, level)
+        elif isinstance(node, ast.Lambda):
+            visit(node.body, nesting + 1, level)
+        else:
+            if isinstance(node, ast.BoolOp):
+                score += 1
+            for child in ast.iter_child_nodes(node):
+                visit(child, nesting, level)
+    
+    for statement in function.body:
+        visit(statement, 0, 0)
+    return depth, score
+
+
+# Comments and complete strings, as flat alternatives so the regex engine
+# can skip ahead to the next "#" or quote; string prefixes are left in place
+_PY_SKIPPED = re.compile(
+    r"#[^\n]*"
+    r"|'''[^'\\]*(?:(?:\\[\s\S]|'(?!''))[^'\\]*)*'''"
+    r'|"""[^"\\]*(?:(?:\\[\s\S]|"(?!""))[^"\\]*)*"""'
+    r"|'[^'\\\n]*(?:\\[\s\S][^'\\\n]*)*'"
+    r'|"[^"\\\n]*(?:\\[\s\S][^"\\\n]*)*"'
+)
+
+_STRING_PREFIX = re.compile(r"(?<!\w)[rRbBuUfF]{1,2}\Z")
+
+_PY_DECISIONS = re.compile(r"\b(?:if|elif|for|while|except|and|or)\b")
+
+# Tokens of lines that hold a function header
+_PY_HEADER_TOKENS = re.compile(
+    r"\b(?:def[ \t\f]+(?P<name>[^\W\d]\w*)|(?P<decision>if|elif|for|while|except|and|or)|(?P<split>def))\b"
+    r"|(?P<open>[(\[{])|(?P<close>[)\]}])|(?P<colon>:)"
+)
+
+# A keyword glued to a number ("1if x else y") hides from \b
+_PY_GLUED = re.compile(r"\d(?:if|elif|for|and|or)\b")
+
+# "match" starting a logical line is a match statement unless an
+# assignment, attribute access or the end of the statement follows
+_MATCH_NAME = re.compile(r"match\b(?![ \t\f]*(?:[=.,:;)\]}]|[-+*/%&|^@<>!]=|<<=|>>=|\*\*=|//=|$))")
+
+
+def _fstring_is_plain(text: str) -> bool:
+    """True if no replacement field of an f-string holds a decision keyword."""
+    body = text.replace("{{", "").replace("}}", "")
+    if "{" not in body and "}" not in body:
+        return True
+    depth = 0
+    field_start = 0
+    for match in re.finditer(r"[{}]", body):
+        if match.group() == "{":
+            if depth == 0:
+                field_start = match.end()
+            depth += 1
+        else:
+            depth -= 1
+            if depth < 0:
+                return False
+            if depth == 0 and _PY_DECISIONS.search(body, field_start, match.start()):
+                return False
+    return depth == 0
+
+
+def _strip_python(source: str) -> Optional[str]:
+    """
+    Replace comments with nothing and strings with ``...``, keeping line breaks.
+    
+    Returns None if a quote is left over (a string the scan cannot
+    delimit) or an f-string field holds a decision keyword.
+    """
+    declined = False
+    
+    def blank(match: "re.Match[str]") -> str:
+        nonlocal declined
+        text = match.group()
+        if text[0] == "#":
+            return ""
+        start = match.start()
+        prefix = _STRING_PREFIX.search(source, max(start - 2, 0), start)
+        if prefix is not None and "f" in prefix.group().lower() and not _fstring_is_plain(text):
+            declined = True
+        # Lines inside a string continue the line the string started on
+        return "..." + "\\\n" * text.count("\n") if "\n" in text else "..."
+    
+    code = _PY_SKIPPED.sub(blank, source)
+    if declined or "'" in code or '"' in code or _PY_GLUED.search(code):
+        return None
+    return code
+
+
+def scan_python_complexity(source: str) -> Optional[List[FunctionComplexity]]:
+    """
+    Compute per-function cyclomatic complexity of Python source without parsing it.
+    
+    Counts the same decision points as ``ast_complexity`` with the same
+    scoping, from the keywords ``if``, ``elif``, ``for``, ``while``,
+    ``except``, ``and`` and ``or``. Lines are handled whole (a keyword
+    count and bracket balance) except those holding a function header,
+    which are walked token by token.
+    
+    Args:
+        source: Python source code
+        
+    Returns:
+        Functions in source order, or None when the source needs the AST
+        path (see the module docstring)
+    """
+    if "\r" in source:
+        source = source.replace("\r\n", "\n").replace("\r", "\n")
+    code = _strip_python(source)
+    if code is None:
+        return None
+    count_decisions = _PY_DECISIONS.findall
+    results: List[List[Any]] = []
+    # Open functions as (record, def indentation, one-line body)
+    scopes: List[Tuple[List[Any], int, bool]] = []
+    depth = 0
+    indent = 0
+    continued = False
+    header: Optional[List[Any]] = None
+    for number, line in enumerate(code.split("\n"), 1):
+        if not depth and not continued:
+            statement = line.lstrip(" \t\f")
+            if statement:
+                indent = len(line) - len(statement)
+                if "\t" in line[:indent]:
+                    indent = len(line[:indent].expandtabs(8))
+                while scopes and scopes[-1][1] >= indent:
+                    scopes.pop()
+                if statement.startswith("match") and _MATCH_NAME.match(statement):
+                    return None
+        if header is None and "def" not in line:
+            if scopes:
+                scopes[-1][0][2] += len(count_decisions(line))
+            # Most lines hold no square brackets or braces; skip counting them
+            if "(" in line or ")" in line:
+                depth += line.count("(") - line.count(")")
+            if "[" in line or "]" in line:
+                depth += line.count("[") - line.count("]")
+            if "{" in line or "}" in line:
+                depth += line.count("{") - line.count("}")
+            if depth < 0:
+                return None
+        else:
+            for match in _PY_HEADER_TOKENS.finditer(line):
+                kind = match.lastgroup
+                if kind == "decision":
+                    if scopes:
+                        scopes[-1][0][2] += 1
+                elif kind == "name":
+                    header = [match.group(kind), number, 1]
+                elif kind == "split":
+                    # "def" with its name on a continuation line
+                    return None
+                elif kind == "open":
+                    depth += 1
+                elif kind == "close":
+                    depth -= 1
+                    if depth < 0:
+                        return None
+                elif header is not None and not depth:
+                    results.append(header)
+                    scopes.append((header, indent, bool(line[match.end():].strip())))
+                    header = None
+        continued = line.endswith("\\")
+        if not depth and not continued and scopes and scopes[-1][2]:
+            # A one-line body ends with its logical line
+            scopes.pop()
+    if depth or header is not None:
+        return None
+    return [FunctionComplexity(*record) for record in results]
+
+
+_JS_TOKENS = re.compile(
+    r"(?P<comment>//[^\n]*|/\*[\s\S]*?\*/)"
+    r"|(?P<string>'(?:\\[\s\S]|[^'\\\n])*'|\"(?:\\[\s\S]|[^\"\\\n])*\")"
+    r"|(?P<template>`)"
+    r"|(?P<name>#?(?:[^\W\d]|\$)(?:\w|\$)*)"
+    r"|(?P<number>\.?\d[\w.]*)"
+    r"|(?P<punct>=>|\?\?=?|\?\.(?!\d)|&&=?|\|\|=?|\.\.\.|[(){}\[\];,?:/.]|[^\s\w$'\"`/(){}\[\];,?:.]+)"
+)
+
+# The rest of a template literal up to its end or its next substitution
+_JS_TEMPLATE = re.compile(r"(?:\\[\s\S]|[^`\\$]|\$(?!\{))*(`|\$\{)?")
+
+_JS_REGEX = re.compile(r"/(?:\\.|\[(?:\\.|[^\]\\\n])*\]|[^/\\\n\[])+/[\w$]*")
+
+_JS_FUNCTION_NAME = re.compile(r"\s*\*?\s*(#?(?:[^\W\d]|\$)(?:\w|\$)*)")
+
+# "?" followed by these is a TypeScript optional marker, not a conditional
+_JS_OPTIONAL = re.compile(r"\s*[:),]")
+
+_JS_OBJECT_KEY = re.compile(r"\s*:")
+
+_JS_CALL = re.compile(r"\s*\(")
+
+#: Tokens that add a decision point.
+_JS_DECISIONS = frozenset(("if", "for", "while", "case", "catch", "&&", "||", "??", "&&=", "||=", "??="))
+
+# Names after which "/" starts a regular expression rather than a division
+_JS_REGEX_AFTER = frozenset((
+    "return", "typeof", "case", "do", "else", "in", "of", "new", "delete", "void",
+    "throw", "instanceof", "yield", "await",
+))
+
+# Statements whose parenthesized head is followed by a block, like a method
+_JS_NOT_METHODS = frozenset(("if", "for", "while", "switch", "catch", "with", "function"))
+
+
+# Tokens a class member or object method can follow
+_JS_MEMBER_START = frozenset((
+    "{", "}", ";", ",", "*", "async", "static", "get", "set", "public", "private",
+    "protected", "readonly", "override", "abstract",
+))
+
+
+def _js_assigned_name(before: List[Tuple[str, str, int]]) -> Optional[Tuple[str, int]]:
+    """Name and offset a function is bound to, from the tokens before it."""
+    if before and before[-1][1] == "async":
+        before = before[:-1]
+    if len(before) >= 2 and before[-1][1] in ("=", ":") and before[-2][0] == "name":
+        return before[-2][1], before[-2][2]
+    return None
+
+
+def scan_js_complexity(source: str) -> List[FunctionComplexity]:
+    """
+    Compute per-function cyclomatic complexity of JavaScript or TypeScript.
+    
+    Functions are ``function`` declarations and expressions, class and
+    object methods, and arrow functions with block bodies; arrow functions
+    with expression bodies count toward the enclosing function, like Python
+    lambdas. Decision points are ``if``, loops, ``case``, ``catch``, the
+    conditional operator and the logical operators ``&&``, ``||`` and ``??``
+    (with their assignment forms). Unnamed functions take the name they
+    are assigned to, else ``<anonymous>``.
+    
+    The lexer does not parse JSX text or TypeScript types, so words in JSX
+    text and conditional types count as code.
+    
+    Args:
+        source: Source code
+        
+    Returns:
+        Functions in source order
+    """
+    search = _JS_TOKENS.search
+    results: List[List[Any]] = []
+    functions: List[List[Any]] = []
+    # Per open brace: the function record whose body it opened, None for
+    # other braces and "`" for a template literal substitution
+    braces: List[Any] = []
+    # Per open parenthesis or bracket: the tokens before it and its offset
+    parens: List[Tuple[List[Tuple[str, str, int]], int]] = []
+    # Last significant tokens as (kind, text, offset)
+    recent: List[Tuple[str, str, int]] = []
+    closed: List[Tuple[str, str, int]] = []
+    # A function or method whose body brace is still ahead: [record, paren
+    # depth, state, open angle brackets, brace depth], state being
+    # "params", "body" (right after the parameters) or "type" (in a return
+    # type)
+    pending: Optional[List[Any]] = None
+    arrow: Optional[Tuple[str, int]] = None
+    line = 1
+    counted = 0
+    
+    def line_at(offset: int) -> int:
+        nonlocal line, counted
+        if offset < counted:
+            return line - source.count("\n", offset, counted)
+        line += source.count("\n", counted, offset)
+        counted = offset
+        return line
+    
+    def open_function(name: str, offset: int) -> None:
+        record = [name, line_at(offset), 1]
+        results.append(record)
+        functions.append(record)
+        braces.append(record)
+    
+    position = 0
+    while True:
+        match = search(source, position)
+        if match is None:
+            break
+        start, position = match.span()
+        kind = match.lastgroup
+        if kind == "comment":
+            continue
+        text = match.group(kind)
+        previous = recent[-1] if recent else ("", "", 0)
+        
+        if pending is not None and pending[2] != "params" and len(parens) == pending[1]:
+            if text == "{" and not pending[3] and len(braces) == pending[4]:
+                open_function(*pending[0])
+                pending = None
+                # The body brace is recorded; skip the plain brace handling below
+                recent.append((kind, text, start))
+                del recent[:-4]
+                continue
+            if text == ":" and pending[2] == "body":
+                pending[2] = "type"
+            elif pending[2] == "body" or text == ";" or text == "}" and len(braces) == pending[4]:
+                pending = None
+            elif kind == "punct" and not text.strip("<>"):
+                # Braces inside a generic return type are object types
+                pending[3] += text.count("<") - text.count(">")
+        
+        if kind == "template":
+            part = _JS_TEMPLATE.match(source, position)
+            position = part.end()
+            if part.group(1) == "${":
+                braces.append("`")
+            kind = "string"
+        elif kind == "name":
+            if previous[1] in (".", "?."):
+                pass
+            elif text in _JS_DECISIONS:
+                if functions and not _JS_OBJECT_KEY.match(source, position):
+                    functions[-1][2] += 1
+            elif text == "function" and (pending is None or pending[2] == "params"):
+                # Inside the parentheses of a method candidate, "function"
+                # shows the candidate is a call taking a callback
+                declared = _JS_FUNCTION_NAME.match(source, position)
+                if declared is not None and declared.group(1) not in _JS_NOT_METHODS:
+                    name = declared.group(1)
+                else:
+                    name = (_js_assigned_name(recent) or ("<anonymous>", start))[0]
+                pending = [(name, start), len(parens), "params", 0, len(braces)]
+            elif (
+                pending is None and previous[1] in _JS_MEMBER_START and text not in _JS_NOT_METHODS
+                and _JS_CALL.match(source, position)
+            ):
+                pending = [(text, start), len(parens), "params", 0, len(braces)]
+        elif kind == "punct":
+            if text == "/" and not (
+                previous[0] in ("name", "number", "string") and previous[1] not in _JS_REGEX_AFTER
+                or previous[1] in (")", "]", "}")
+            ):
+                regex = _JS_REGEX.match(source, start)
+                if regex is not None:
+                    position = regex.end()
+                    kind = "string"
+            elif text in _JS_DECISIONS or text == "?" and not _JS_OPTIONAL.match(source, position):
+                if functions:
+                    functions[-1][2] += 1
+            elif text == "(" or text == "[":
+                parens.append((recent[-3:], start))
+            elif text == ")" or text == "]":
+                closed, opened_at = parens.pop() if parens else ([], start)
+                if text == "]":
+                    # A computed method name: "[Symbol.iterator]() {"
+                    if (
+                        pending is None and closed and closed[-1][1] in _JS_MEMBER_START
+                        and _JS_CALL.match(source, position)
+                    ):
+                        pending = [(source[opened_at:position], opened_at), len(parens), "params", 0, len(braces)]
+                elif pending is not None and pending[2] == "params" and len(parens) == pending[1]:
+                    pending[2] = "body"
+            elif text == "=>":
+                if previous[1] == ")":
+                    arrow = _js_assigned_name(closed)
+                else:
+                    arrow = _js_assigned_name(recent[:-1])
+                arrow = arrow or ("<anonymous>", start)
+            elif text == "{":
+                if previous[1] == "=>" and arrow is not None:
+                    open_function(*arrow)
+                else:
+                    braces.append(None)
+            elif text == "}":
+                opened = braces.pop() if braces else None
+                if opened == "`":
+                    part = _JS_TEMPLATE.match(source, position)
+                    position = part.end()
+                    if part.group(1) == "${":
+                        braces.append("`")
+                    kind = "string"
+                elif opened is not None:
+                    functions.pop()
+        recent.append((kind, text, start))
+        del recent[:-4]
+    return [FunctionComplexity(*record) for record in results]
\ No newline at end of file
@@ -0,0 +1,103 @@
+"""
+Language-grouped batch dispatch.
+
+Splits each work batch of already read files by language and sends every
+group through ``BaseAnalyzer.analyze_batch`` to its language's analyzer
+(``routes``) or, for unrouted languages, to the default analyzer. The
+executor and the combined pipeline run every batch through here,
+in-process and in workers alike.
+
+A batch call pays per-call overhead once per group instead of once per
+file. Each worker process keeps the same analyzer instances for the whole
+run, so setup an analyzer stores on itself (e.g. rules compiled per
+language on first use) is paid once per worker, not once per batch.
+"""
+
+import time
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .base import BaseAnalyzer, FileAnalysis
+
+if TYPE_CHECKING:
+    from .pipeline import ParsedFile
+
+
+def group_by_language(
+    items: Sequence[Tuple[int, "ParsedFile"]]
+) -> Dict[str, List[Tuple[int, "ParsedFile"]]]:
+    """
+    Group indexed files by ``ParsedFile.language``, keeping their order.
+    
+    Args:
+        items: ``(index, parsed)`` pairs
+        
+    Returns:
+        Pairs per language, languages in order of first appearance
+    """
+    groups: Dict[str, List[Tuple[int, "ParsedFile"]]] = {}
+    for index, parsed in items:
+        groups.setdefault(parsed.language, []).append((index, parsed))
+    return groups
+
+
+def analyzers_by_language(analyzers: Iterable[BaseAnalyzer]) -> Dict[str, BaseAnalyzer]:
+    """
+    Build ``routes`` from analyzers' supported languages.
+    
+    Args:
+        analyzers: Analyzers in priority order
+        
+    Returns:
+        Each supported language mapped to the first analyzer supporting it
+    """
+    routes: Dict[str, BaseAnalyzer] = {}
+    for analyzer in analyzers:
+        for language in analyzer.get_supported_languages():
+            routes.setdefault(language.lower(), analyzer)
+    return routes
+
+
+def analyze_grouped(
+    analyzer: BaseAnalyzer,
+    items: Sequence[Tuple[int, "ParsedFile"]],
+    routes: Optional[Mapping[str, BaseAnalyzer]] = None
+) -> List[Tuple[int, FileAnalysis, float]]:
+    """
+    Analyze a batch of read files, one ``analyze_batch`` call per language.
+    
+    Skipped (binary or oversized) files are reported without reaching any
+    analyzer. Each file's time is how long its result took to come out of
+    the batch, so per-batch setup shows up on the first file of a group.
+    
+    Args:
+        analyzer: Analyzer for languages without a route
+        items: ``(index, parsed)`` pairs
+        routes: Analyzers by language (see ``analyzers_by_language``)
+        
+    Returns:
+        ``(index, FileAnalysis, seconds)`` per item, grouped by language
+        
+    Raises:
+        RuntimeError: If ``analyze_batch`` yields fewer results than files
+    """
+    rows = []
+    analyzable = []
+    for index, parsed in items:
+        if parsed.skipped:
+            start = time.perf_counter()
+            rows.append((index, parsed.skipped_analysis(), time.perf_counter() - start))
+        else:
+            analyzable.append((index, parsed))
+    
+    for language, group in group_by_language(analyzable).items():
+        target = routes.get(language, analyzer) if routes else analyzer
+        analyses = iter(target.analyze_batch([parsed for _, parsed in group]))
+        for index, _ in group:
+            start = time.perf_counter()
+            analysis = next(analyses, None)
+            if analysis is None:
+                raise RuntimeError(
+                    f"{type(target).__name__}.analyze_batch returned fewer results than files"
+                )
+            rows.append((index, analysis, time.perf_counter() - start))
+    return rows
\ No newline at end of file
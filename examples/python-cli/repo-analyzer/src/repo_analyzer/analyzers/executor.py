@@ -0,0 +1,321 @@
+"""
+Parallel execution engine for per-file analysis.
+
+Fans per-file analyzer calls out across a process pool in
+chunked batches and merges the results back in input order, so parallel
+runs produce exactly the same output as serial runs. Files are read ahead
+on reader threads (see ``reader.prefetch``) and handed to the analyzer
+already decoded, so analysis does not stall on file I/O.
+"""
+
+import itertools
+import math
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, as_completed, wait
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from ..utils.profiling import get_profiler
+from .base import BaseAnalyzer, FileAnalysis
+from .dispatch import analyze_grouped
+from .reader import prefetch
+
+if TYPE_CHECKING:
+    from .pipeline import ParsedFile
+    from ..storage.cache import AnalysisCache
+    from ..utils.file_access import FileStamp
+    from ..utils.git_utils import ChangeSet
+
+
+#: Below this many files to analyze, worker startup costs more than it saves.
+PARALLEL_THRESHOLD = 64
+
+#: Upper bound on files per work batch sent to a worker.
+MAX_CHUNK_SIZE = 64
+
+_worker_analyzer: Optional[BaseAnalyzer] = None
+_worker_routes: Optional[Mapping[str, BaseAnalyzer]] = None
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def default_jobs() -> int:
+    """Return the default worker count (number of CPUs)."""
+    return os.cpu_count() or 1
+
+
+def _init_worker(analyzer: BaseAnalyzer, routes: Optional[Mapping[str, BaseAnalyzer]]) -> None:
+    """Receive the analyzers once per worker process instead of per batch."""
+    global _worker_analyzer, _worker_routes
+    _worker_analyzer = analyzer
+    _worker_routes = routes
+
+
+def _analyze_chunk(
+    chunk: Sequence[Tuple[int, "ParsedFile"]]
+) -> List[Tuple[int, FileAnalysis, float]]:
+    """Analyze one batch of already read files inside a worker process."""
+    assert _worker_analyzer is not None
+    return analyze_grouped(_worker_analyzer, chunk, _worker_routes)
+
+
+def _read_item(item: Tuple[int, Path]) -> Tuple[int, "ParsedFile"]:
+    """Read and decode one pending file (reader stage)."""
+    from .pipeline import ParsedFile
+    
+    index, path = item
+    return index, ParsedFile.read(path)
+
+
+def _chunk_size(file_count: int, jobs: int) -> int:
+    """Aim for about four batches per worker to balance uneven file costs."""
+    return max(1, min(MAX_CHUNK_SIZE, math.ceil(file_count / (jobs * 4))))
+
+
+def batched(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Split an iterable into lists of ``size`` items (the last may be shorter)."""
+    iterator = iter(items)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def run_chunks(
+    items: Iterable[T],
+    count: int,
+    run_local: Callable[[List[T]], List[R]],
+    run_worker: Callable[[List[T]], List[R]],
+    initializer: Callable[..., None],
+    initargs: Tuple[Any, ...],
+    jobs: int,
+    chunk_size: Optional[int] = None
+) -> Iterator[R]:
+    """
+    Run work items in batches, in-process or on a process pool.
+    
+    Small workloads and ``jobs=1`` run ``run_local`` on each batch in this
+    process. Otherwise batches go to ``run_worker`` on a pool whose workers
+    are set up once with ``initializer(*initargs)``; at most two batches
+    per worker are in flight, so a lazy ``items`` iterator (e.g. a reader
+    stage) is consumed only as fast as the workers keep up. Rows are
+    yielded as batches complete, not necessarily in input order.
+    
+    Args:
+        items: Work items, consumed lazily
+        count: Number of items, for the serial/parallel decision and sizing
+        run_local: Processes one batch in this process
+        run_worker: Picklable function processing one batch in a worker
+        initializer: Worker setup function (picklable)
+        initargs: Arguments for ``initializer``
+        jobs: Number of worker processes
+        chunk_size: Items per batch (default: derived from ``count``)
+        
+    Yields:
+        The rows returned for each batch
+    """
+    size = chunk_size or _chunk_size(count, jobs)
+    if jobs <= 1 or count < max(PARALLEL_THRESHOLD, 2):
+        for chunk in batched(items, size):
+            yield from run_local(chunk)
+        return
+    
+    workers = min(jobs, math.ceil(count / size))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=initializer,
+        initargs=initargs
+    ) as pool:
+        in_flight: Set["Future[List[R]]"] = set()
+        for chunk in batched(items, size):
+            if len(in_flight) >= 2 * workers:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+            in_flight.add(pool.submit(run_worker, chunk))
+        for future in as_completed(in_flight):
+            yield from future.result()
+
+
+def lookup_cached(
+    cache: Optional["AnalysisCache"],
+    paths: Sequence[Path],
+    change_set: Optional["ChangeSet"] = None
+) -> Dict[int, FileAnalysis]:
+    """
+    Resolve cached results for files, keyed by their index in ``paths``.
+    
+    Without a change set every file is looked up on its own. With one,
+    files in the change set are not looked up at all (they are analyzed
+    anyway) and the rest are loaded with ``AnalysisCache.load_baseline``
+    in batched queries.
+    
+    Args:
+        cache: Result cache, or None
+        paths: Files about to be analyzed
+        change_set: Files changed since the base reference, if any
+        
+    Returns:
+        Cached FileAnalysis per index of ``paths``
+    """
+    if cache is None:
+        return {}
+    if change_set is None:
+        found = ((index, cache.get(path)) for index, path in enumerate(paths))
+        return {index: analysis for index, analysis in found if analysis is not None}
+    
+    unchanged = {path: index for index, path in enumerate(paths) if not change_set.contains(path)}
+    baseline = cache.load_baseline(unchanged)
+    return {unchanged[path]: analysis for path, analysis in baseline.items()}
+
+
+def analyze_files(
+    analyzer: BaseAnalyzer,
+    files: Iterable[Path],
+    jobs: Optional[int] = None,
+    cache: Optional["AnalysisCache"] = None,
+    chunk_size: Optional[int] = None,
+    change_set: Optional["ChangeSet"] = None,
+    routes: Optional[Mapping[str, BaseAnalyzer]] = None
+) -> List[FileAnalysis]:
+    """
+    Analyze files, in parallel when worthwhile, preserving input order.
+    
+    Cached results are resolved in the parent process first so that only
+    cache misses are read and shipped to workers. Files are read on reader
+    threads ahead of analysis and analyzed in batches through
+    ``run_chunks``, which also bounds the read-ahead; each batch is split
+    by language into ``analyze_batch`` calls on the language's analyzer
+    (see ``dispatch.analyze_grouped``).
+    
+    Args:
+        analyzer: Analyzer applied to each file whose language has no
+            route (through ``analyze_batch``, which defaults to
+            ``analyze_source`` and ``analyze_file``); must be picklable for
+            parallel runs
+        files: Files to analyze
+        jobs: Number of worker processes (default: CPU count)
+        cache: Optional result cache consulted before analysis; with
+            ``routes`` it must be opened with the same routes
+        chunk_size: Files per work batch (default: derived from file count)
+        change_set: Files changed since a base reference; they bypass the
+            cache lookup and the rest come from its baseline (see
+            ``lookup_cached``)
+        routes: Analyzers by language (see ``dispatch.analyzers_by_language``);
+            must be picklable for parallel runs
+        
+    Returns:
+        FileAnalysis results in the same order as ``files``
+    """
+    paths = [f if isinstance(f, Path) else Path(f) for f in files]
+    jobs = jobs or default_jobs()
+    results: List[Optional[FileAnalysis]] = [None] * len(paths)
+    profiler = get_profiler()
+    routes = routes or {}
+    
+    def record(index: int, analysis: FileAnalysis, seconds: float) -> None:
+        results[index] = analysis
+        profiler.record_file(
+            type(routes.get(analysis.language, analyzer)).__name__,
+            analysis.language,
+            paths[index],
+            analysis.lines_of_code,
+            seconds
+        )
+    
+    for index, cached in lookup_cached(cache, paths, change_set).items():
+        results[index] = cached
+    pending = [(index, path) for index, path in enumerate(paths) if results[index] is None]
+    
+    # Stamps of the bytes each file was analyzed from, recorded with its result
+    stamps: Dict[int, Optional["FileStamp"]] = {}
+    
+    def loaded_items() -> Iterator[Tuple[int, "ParsedFile"]]:
+        for _, (index, parsed) in prefetch(pending, _read_item):
+            if cache is not None:
+                stamps[index] = parsed.stamp
+            yield index, parsed
+    
+    rows = run_chunks(
+        loaded_items(),
+        len(pending),
+        partial(analyze_grouped, analyzer, routes=routes),
+        _analyze_chunk,
+        _init_worker,
+        (analyzer, routes),
+        jobs,
+        chunk_size
+    )
+    for index, analysis, seconds in rows:
+        record(index, analysis, seconds)
+    
+    if cache is not None:
+        for index, _ in pending:
+            cache.put(paths[index], results[index], stamps.get(index))
+    
+    return [analysis for analysis in results if analysis is not None]
+
+
+@dataclass
+class IncrementalResult:
+    """Results of a changed-files-only analysis run."""
+    changed: List[FileAnalysis] = field(default_factory=list)
+    combined: List[FileAnalysis] = field(default_factory=list)
+    baseline_hits: int = 0
+
+
+def analyze_changes(
+    analyzer: BaseAnalyzer,
+    files: Iterable[Path],
+    change_set: "ChangeSet",
+    jobs: Optional[int] = None,
+    cache: Optional["AnalysisCache"] = None
+) -> IncrementalResult:
+    """
+    Analyze only the files in a change set, merging in baseline results.
+    
+    Changed files are analyzed without a cache lookup. Files git reports as
+    unchanged are taken from the cache's baseline (still validated against
+    the files on disk) so that repository-level aggregates (e.g.
+    maintainability index) still cover the whole tree; unchanged files
+    missing from the cache, or whose entry is stale, are analyzed once to
+    seed it.
+    
+    Args:
+        analyzer: Analyzer to run
+        files: All files in scope for the repository
+        change_set: Files changed since the base reference
+        jobs: Number of worker processes (default: CPU count)
+        cache: Result cache holding the baseline run
+        
+    Returns:
+        IncrementalResult with the changed files' results and the combined
+        results for all files, in scan order
+    """
+    paths = [f if isinstance(f, Path) else Path(f) for f in files]
+    hits_before = cache.stats.hits if cache is not None else 0
+    combined = analyze_files(analyzer, paths, jobs, cache, change_set=change_set)
+    
+    return IncrementalResult(
+        changed=[analysis for path, analysis in zip(paths, combined) if change_set.contains(path)],
+        combined=combined,
+        baseline_hits=cache.stats.hits - hits_before if cache is not None else 0
+    )
\ No newline at end of file
@@ -0,0 +1,404 @@
+"""
+Module-level import graph for circular dependency detection.
+
+Enumerating every cycle of an import graph grows exponentially with its
+size. ``ImportGraph`` instead reports each strongly connected component
+(found with an iterative Tarjan pass, so deep graphs never hit the
+recursion limit) together with one shortest cycle through it, which is
+linear in the size of the graph.
+
+Module names are interned as integer node ids and each module's imports
+are kept as an ``array`` of target ids; the reverse adjacency used by
+"what imports X" queries is packed into two arrays on first use. Changing
+one file's imports replaces only that module's edges.
+
+Node names:
+    Python files are named by module (``pkg.sub.mod``), found from the
+    ``__init__.py`` files present; other files by their path without
+    extension (``web/src/app``). Imports that do not resolve to a file
+    in the repository become external nodes named by their top-level
+    package (``requests``, ``@babel/core``).
+"""
+
+import os
+import posixpath
+from array import array
+from collections import deque
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from .base import FileAnalysis
+from .results import StringTable
+
+
+_PYTHON_SUFFIXES = (".py", ".pyi")
+
+_SCRIPT_LANGUAGES = ("javascript", "typescript")
+
+_SCRIPT_SUFFIXES = (".js", ".jsx", ".mjs", ".cjs", ".ts", ".tsx")
+
+
+class ModuleResolver:
+    """
+    Maps repository files to module names and import strings to modules.
+    
+    Resolution uses the set of files known when the resolver is created;
+    files added later resolve only after the graph is rebuilt.
+    """
+    
+    def __init__(self, relative_paths: Iterable[str]):
+        """
+        Create a resolver for a repository's files.
+        
+        Args:
+            relative_paths: Repository-relative POSIX paths of all files
+        """
+        paths = list(relative_paths)
+        self._packages = {
+            posixpath.dirname(path) for path in paths
+            if posixpath.basename(path) == "__init__.py"
+        }
+        self._modules: Set[str] = set()
+        self._package_modules: Set[str] = set()
+        self._names: Dict[str, str] = {}
+        # Absolute imports resolve the same from every file
+        self._absolute: Dict[str, Optional[str]] = {}
+        for path in paths:
+            module = self._names[path] = self.module_for(path)
+            self._modules.add(module)
+            if posixpath.basename(path) == "__init__.py":
+                self._package_modules.add(module)
+    
+    def module_for(self, relative_path: str) -> str:
+        """Return the node name of a repository file."""
+        known = self._names.get(relative_path)
+        if known is not None:
+            return known
+        stem, suffix = posixpath.splitext(relative_path)
+        if suffix not in _PYTHON_SUFFIXES:
+            return stem
+        parts = stem.split("/")
+        if parts[-1] == "__init__":
+            parts.pop()
+        # The module path starts below the outermost package directory
+        root = len(relative_path.split("/")) - 1
+        while root > 0 and "/".join(parts[:root]) in self._packages:
+            root -= 1
+        return ".".join(parts[root:]) or stem
+    
+    def is_module(self, name: str) -> bool:
+        """Return whether a node name belongs to a repository file."""
+        return name in self._modules
+    
+    def resolve(self, relative_path: str, language: str, name: str) -> Optional[str]:
+        """
+        Resolve one import of a file to a node name.
+        
+        Args:
+            relative_path: Importing file
+            language: Language of the importing file
+            name: Import string as recorded in ``FileAnalysis.imports``
+            
+        Returns:
+            Node name, or None for relative imports that lead nowhere
+        """
+        if language == "python" or relative_path.endswith(_PYTHON_SUFFIXES):
+            return self._resolve_python(relative_path, name)
+        if language in _SCRIPT_LANGUAGES or relative_path.endswith(_SCRIPT_SUFFIXES):
+            return self._resolve_script(relative_path, name)
+        return name
+    
+    def _resolve_python(self, relative_path: str, name: str) -> Optional[str]:
+        if not name.startswith("."):
+            try:
+                return self._absolute[name]
+            except KeyError:
+                parts = [part for part in name.split(".") if part]
+                resolved = self._longest_module(parts) or (parts[0] if parts else None)
+                self._absolute[name] = resolved
+                return resolved
+        level = len(name) - len(name.lstrip("."))
+        module = self.module_for(relative_path)
+        package = module.split(".")
+        if module not in self._package_modules:
+            package.pop()
+        if level - 1 > len(package):
+            return None
+        parts = package[:len(package) - (level - 1)] + [part for part in name[level:].split(".") if part]
+        return self._longest_module(parts)
+    
+    def _longest_module(self, parts: List[str]) -> Optional[str]:
+        # "from a.b import c" may be recorded as "a.b.c"; the longest known prefix wins
+        for end in range(len(parts), 0, -1):
+            candidate = ".".join(parts[:end])
+            if candidate in self._modules:
+                return candidate
+        return None
+    
+    def _resolve_script(self, relative_path: str, name: str) -> Optional[str]:
+        if not name.startswith("."):
+            parts = name.split("/")
+            return "/".join(parts[:2]) if name.startswith("@") else parts[0]
+        target = posixpath.normpath(posixpath.join(posixpath.dirname(relative_path), name))
+        stem, suffix = posixpath.splitext(target)
+        for candidate in (target, stem if suffix in _SCRIPT_SUFFIXES else None, f"{target}/index"):
+            if candidate in self._modules:
+                return candidate
+        return None
+
+
+class ImportGraph:
+    """
+    Directed graph of imports between modules, with cycle and reachability queries.
+    
+    Edges run from the importing module to the imported one. Self-imports
+    are ignored. Results of ``components`` and the reverse adjacency are
+    cached until the graph changes.
+    
+    Example:
+        graph = ImportGraph.from_analyses(repo, analyses)
+        for component, cycle in graph.cycles():
+            print(len(component), " -> ".join(cycle))
+        graph.importers_of("pkg.models")
+    """
+    
+    def __init__(self, resolver: Optional[ModuleResolver] = None):
+        """
+        Create an empty graph.
+        
+        Args:
+            resolver: Name resolver for ``set_file`` (default: no known files)
+        """
+        self.resolver = resolver if resolver is not None else ModuleResolver(())
+        self._names = StringTable()
+        self._edges: List[array] = []
+        self._reverse: Optional[Tuple[array, array]] = None
+        self._components: Optional[List[List[int]]] = None
+    
+    @classmethod
+    def from_analyses(cls, repository_path: Path, analyses: Iterable[FileAnalysis]) -> "ImportGraph":
+        """
+        Build the graph of a repository from per-file analysis results.
+        
+        Args:
+            repository_path: Repository root the analyzed paths are under
+            analyses: Per-file results with ``imports``
+        """
+        root = os.fspath(repository_path).rstrip(os.sep) + os.sep
+        entries = [(_relative(root, a.file_path), a.language, a.imports) for a in analyses]
+        graph = cls(ModuleResolver(path for path, _, _ in entries))
+        for path, language, imports in entries:
+            graph.set_file(path, language, imports)
+        return graph
+    
+    def __len__(self) -> int:
+        return len(self._edges)
+    
+    @property
+    def edge_count(self) -> int:
+        """Number of import edges."""
+        return sum(len(edges) for edges in self._edges)
+    
+    def node(self, name: str) -> int:
+        """Return the id of a node, adding it if needed."""
+        node_id = self._names.intern(name)
+        if node_id == len(self._edges):
+            self._edges.append(array("i"))
+        return node_id
+    
+    def name(self, node_id: int) -> str:
+        """Return the name of a node id."""
+        return self._names[node_id]
+    
+    def set_imports(self, module: str, targets: Iterable[str]) -> None:
+        """Replace the edges of one module."""
+        source = self.node(module)
+        ids = {self.node(target) for target in targets}
+        ids.discard(source)
+        self._edges[source] = array("i", sorted(ids))
+        self._invalidate()
+    
+    def set_file(self, relative_path: str, language: str, imports: Iterable[str]) -> None:
+        """
+        Replace the edges of one file's module from its recorded imports.
+        
+        Args:
+            relative_path: Repository-relative POSIX path of the file
+            language: Language of the file
+            imports: Import strings from ``FileAnalysis.imports``
+        """
+        resolve = self.resolver.resolve
+        targets = (resolve(relative_path, language, name) for name in imports)
+        self.set_imports(
+            self.resolver.module_for(relative_path), (t for t in targets if t is not None)
+        )
+    
+    def remove_file(self, relative_path: str) -> None:
+        """Drop the edges of a deleted file's module."""
+        self.set_imports(self.resolver.module_for(relative_path), ())
+    
+    def imports_of(self, module: str, transitive: bool = True) -> List[str]:
+        """Modules a module imports, directly or transitively, sorted by name."""
+        return self._reachable(module, self._edges.__getitem__, transitive)
+    
+    def importers_of(self, module: str, transitive: bool = True) -> List[str]:
+        """Modules importing a module, directly or transitively, sorted by name."""
+        offsets, targets = self._reverse_edges()
+        return self._reachable(
+            module, lambda node: targets[offsets[node]:offsets[node + 1]], transitive
+        )
+    
+    def components(self) -> List[List[int]]:
+        """
+        Strongly connected components with more than one module.
+        
+        Every import cycle lies within one component. Each component is
+        a list of node ids; components come in reverse topological order.
+        """
+        if self._components is None:
+            self._components = [c for c in _strongly_connected(self._edges) if len(c) > 1]
+        return self._components
+    
+    def cycles(self) -> List[Tuple[List[str], List[str]]]:
+        """
+        Import cycles, one entry per strongly connected component.
+        
+        Returns:
+            ``(modules, cycle)`` pairs, largest component first: the sorted
+            module names of the component and a shortest cycle through its
+            first module, closed by repeating that module at the end
+        """
+        found = []
+        for component in self.components():
+            modules = sorted(self.name(node) for node in component)
+            cycle = self._shortest_cycle(self.node(modules[0]), set(component))
+            found.append((modules, [self.name(node) for node in cycle]))
+        found.sort(key=lambda item: (-len(item[0]), item[0]))
+        return found
+    
+    def to_dict(self) -> Dict[str, object]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "modules": len(self),
+            "imports": self.edge_count,
+            "cycles": [{"modules": modules, "cycle": cycle} for modules, cycle in self.cycles()],
+        }
+    
+    def _invalidate(self) -> None:
+        self._reverse = None
+        self._components = None
+    
+    def _reverse_edges(self) -> Tuple[array, array]:
+        """Reverse adjacency in compressed form: importers of node ``i`` are ``targets[offsets[i]:offsets[i + 1]]``."""
+        if self._reverse is None:
+            counts = array("i", bytes(4 * (len(self._edges) + 1)))
+            for edges in self._edges:
+                for target in edges:
+                    counts[target + 1] += 1
+            for i in range(len(self._edges)):
+                counts[i + 1] += counts[i]
+            offsets = array("i", counts)
+            targets = array("i", bytes(4 * counts[-1]))
+            for source, edges in enumerate(self._edges):
+                for target in edges:
+                    targets[counts[target]] = source
+                    counts[target] += 1
+            self._reverse = (offsets, targets)
+        return self._reverse
+    
+    def _reachable(
+        self,
+        module: str,
+        neighbors: Callable[[int], Sequence[int]],
+        transitive: bool
+    ) -> List[str]:
+        start = self._names.find(module)
+        if start is None:
+            return []
+        seen = {start}
+        queue = deque([start])
+        while queue:
+            for target in neighbors(queue.popleft()):
+                if target not in seen:
+                    seen.add(target)
+                    if transitive:
+                        queue.append(target)
+        seen.discard(start)
+        return sorted(self.name(node) for node in seen)
+    
+    def _shortest_cycle(self, start: int, members: Set[int]) -> List[int]:
+        """Breadth-first search within a component for the shortest path back to ``start``."""
+        parents = {start: -1}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for target in self._edges[node]:
+                if target == start:
+                    path = [start]
+                    while node != -1:
+                        path.append(node)
+                        node = parents[node]
+                    return path[::-1]
+                if target in members and target not in parents:
+                    parents[target] = node
+                    queue.append(target)
+        return [start]
+
+
+def _strongly_connected(edges: Sequence[Sequence[int]]) -> List[List[int]]:
+    """Tarjan's algorithm with an explicit stack instead of recursion."""
+    count = len(edges)
+    index = array("i", [-1]) * count
+    low = array("i", bytes(4 * count))
+    on_stack = bytearray(count)
+    stack: List[int] = []
+    components: List[List[int]] = []
+    counter = 0
+    
+    for root in range(count):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        # Each frame is (node, position of the next edge to follow)
+        work = [(root, 0)]
+        while work:
+            node, position = work[-1]
+            successors = edges[node]
+            if position < len(successors):
+                work[-1] = (node, position + 1)
+                target = successors[position]
+                if index[target] == -1:
+                    index[target] = low[target] = counter
+                    counter += 1
+                    stack.append(target)
+                    on_stack[target] = 1
+                    work.append((target, 0))
+                elif on_stack[target] and index[target] < low[node]:
+                    low[node] = index[target]
+                continue
+            
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if low[node] < low[parent]:
+                    low[parent] = low[node]
+            if low[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = 0
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+    return components
+
+
+def _relative(root: str, file_path: Path) -> str:
+    path = os.fspath(file_path)
+    if path.startswith(root):
+        path = path[len(root):]
+    return path.replace(os.sep, "/")
\ No newline at end of file
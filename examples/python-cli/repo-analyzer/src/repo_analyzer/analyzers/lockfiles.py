@@ -0,0 +1,615 @@
+"""
+Streaming lockfile parsers and transitive dependency graphs.
+
+Lockfiles record every installed package, so they answer "how many
+dependencies does this project really have" without a resolver. They can
+also be very large (a monorepo ``package-lock.json`` runs to tens of MB),
+so each parser streams its file and keeps only the graph: package names,
+versions and dependency edges.
+
+- ``package-lock.json`` / ``npm-shrinkwrap.json``: decoded one entry at a
+  time with ``json.JSONDecoder.raw_decode`` over a sliding buffer, never as
+  a whole document
+- ``poetry.lock`` and ``Cargo.lock``: read line by line
+- ``go.sum``: read line by line; it lists the modules of the build but not
+  who requires whom, so Go totals count every module
+
+Direct dependencies are those of the project's own packages: the manifest
+next to the lockfile (``package.json``, ``pyproject.toml``, ``go.mod``),
+npm workspaces and Cargo workspace members.
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+#: Lockfile names mapped to the package manager that writes them.
+LOCKFILES = {
+    "package-lock.json": "npm",
+    "npm-shrinkwrap.json": "npm",
+    "poetry.lock": "poetry",
+    "Cargo.lock": "cargo",
+    "go.sum": "go",
+}
+
+#: Manifest read next to each lockfile for the project's direct dependencies.
+MANIFESTS = {
+    "npm": "package.json",
+    "poetry": "pyproject.toml",
+    "go": "go.mod",
+}
+
+#: Advisory ecosystem of each package manager's packages.
+ECOSYSTEMS = {"npm": "npm", "poetry": "PyPI", "cargo": "crates.io", "go": "Go"}
+
+_WHITESPACE = re.compile(r"[ \t\r\n]*")
+_NUMBER_CHARS = frozenset("0123456789+-.eE")
+# What ``_JsonStream.skip`` stops at, and the rest of a string after its opening quote
+_STRUCTURAL = re.compile(r'[{}\[\]"]')
+_STRING_TAIL = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_TOML_KEY = re.compile(r'\s*("(?:[^"\\]|\\.)*"|[A-Za-z0-9_.-]+)\s*=\s*(.*)')
+_REQUIREMENT_NAME = re.compile(r"\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+
+
+@dataclass
+class LockfileGraph:
+    """
+    Packages of one lockfile and the dependencies between them.
+    
+    Packages are numbered; ``dependencies[i]`` lists the packages that
+    package ``i`` depends on. ``local`` packages are the project itself
+    (and its workspace members): their dependencies are the direct ones,
+    and they are not counted as dependencies themselves.
+    """
+    manager: str
+    names: List[str] = field(default_factory=list)
+    versions: List[str] = field(default_factory=list)
+    dependencies: List[List[int]] = field(default_factory=list)
+    local: List[int] = field(default_factory=list)
+    #: False when the lockfile has no edges (``go.sum``): totals count every package.
+    edges_known: bool = True
+    
+    @property
+    def ecosystem(self) -> str:
+        """Advisory ecosystem of the packages, e.g. ``"PyPI"`` for poetry."""
+        return ECOSYSTEMS.get(self.manager, self.manager)
+    
+    def add(self, name: str, version: str, local: bool = False) -> int:
+        """Add a package and return its number."""
+        self.names.append(name)
+        self.versions.append(version)
+        self.dependencies.append([])
+        if local:
+            self.local.append(len(self.names) - 1)
+        return len(self.names) - 1
+    
+    def direct(self) -> Set[int]:
+        """
+        Packages the project depends on directly.
+        
+        Without local packages (no manifest next to the lockfile), packages
+        that nothing else depends on are taken as the direct ones.
+        """
+        local = set(self.local)
+        if local:
+            return {dep for index in local for dep in self.dependencies[index]} - local
+        depended_on = {dep for deps in self.dependencies for dep in deps}
+        return set(range(len(self.names))) - depended_on
+    
+    def transitive(self) -> Set[int]:
+        """Packages reachable from the direct dependencies, local packages excluded."""
+        local = set(self.local)
+        if not self.edges_known:
+            return set(range(len(self.names))) - local
+        seen = self.direct()
+        stack = list(seen)
+        while stack:
+            for dep in self.dependencies[stack.pop()]:
+                if dep not in seen and dep not in local:
+                    seen.add(dep)
+                    stack.append(dep)
+        return seen
+    
+    def packages(self) -> Iterator[Tuple[str, str]]:
+        """Yield ``(name, version)`` of every package that is not local."""
+        local = set(self.local)
+        for index, (name, version) in enumerate(zip(self.names, self.versions)):
+            if index not in local and version:
+                yield name, version
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a compact dictionary for caching."""
+        return {
+            "manager": self.manager,
+            "names": self.names,
+            "versions": self.versions,
+            "dependencies": self.dependencies,
+            "local": self.local,
+            "edges_known": self.edges_known
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LockfileGraph":
+        """Create a graph from ``to_dict`` output."""
+        return cls(**data)
+
+
+class _JsonStream:
+    """
+    Incremental reader of one JSON document.
+    
+    Objects are walked member by member with ``members``; each member value
+    is then decoded whole with ``value`` (by the C decoder), walked further,
+    or passed over with ``skip``. Only the unread rest of the current chunk
+    is kept in memory.
+    """
+    
+    def __init__(self, handle: IO[str], chunk_size: int = 1 << 16):
+        self._handle = handle
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+    
+    def _fill(self, size: int) -> bool:
+        data = "" if self._eof else self._handle.read(size)
+        if not data:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + data
+        self._pos = 0
+        return True
+    
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ("" at the end)."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill(self._chunk_size):
+                return ""
+    
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at offset {self._pos} of the JSON stream")
+        self._pos += 1
+    
+    def value(self) -> Any:
+        """Decode the next value, reading more input until it is complete."""
+        self.peek()
+        size = self._chunk_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                # A number cut by the end of the buffer ("1.5e" of "1.5e10")
+                # decodes as a shorter one; only a delimiter proves it complete
+                if self._eof or (
+                    end < len(self._buffer) and self._buffer[end] not in _NUMBER_CHARS
+                ):
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._fill(size)
+            size *= 2
+    
+    def skip(self) -> None:
+        """
+        Pass over the next value without decoding it.
+        
+        Objects and arrays are walked by bracket depth, and each string is
+        matched to its closing quote in one step, a chunk at a time; so
+        skipping a large section builds nothing and holds little more than
+        one chunk. Skipped content is not validated beyond that.
+        """
+        if self.peek() not in '{["':
+            self.value()
+            return
+        depth = 0
+        size = self._chunk_size
+        while True:
+            match = _STRUCTURAL.search(self._buffer, self._pos)
+            if match is not None and match.group() == '"':
+                string_end = _STRING_TAIL.match(self._buffer, match.end())
+                if string_end is not None:
+                    self._pos = string_end.end()
+                    size = self._chunk_size
+                else:
+                    # The string continues in the next chunk
+                    self._pos = match.start()
+                    match = None
+            elif match is not None:
+                self._pos = match.end()
+                depth += 1 if match.group() in "{[" else -1
+            if match is None:
+                if not self._fill(size):
+                    raise ValueError("Unexpected end of the JSON stream")
+                size *= 2
+            elif not depth:
+                return
+    
+    def members(self) -> Iterator[str]:
+        """
+        Yield the keys of the next object.
+        
+        The caller must consume each member's value (``value``, ``skip``,
+        or ``members`` for a nested object) before asking for the next key.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            char = self.peek()
+            self._pos += 1
+            if char == "}":
+                return
+            if char != ",":
+                raise ValueError(f"Expected ',' or '}}' at offset {self._pos - 1} of the JSON stream")
+
+
+def _npm_local(path: str) -> bool:
+    return not path.startswith("node_modules/") and "/node_modules/" not in path
+
+
+def _npm_dependencies(entry: Dict[str, Any], keys: Tuple[str, ...]) -> List[str]:
+    names = []
+    for key in keys:
+        names.extend(entry.get(key) or ())
+    return names
+
+
+_NPM_DEPENDENCY_KEYS = ("dependencies", "devDependencies", "optionalDependencies", "peerDependencies")
+
+
+def _flatten_npm_v1(
+    path: str,
+    name: str,
+    entry: Dict[str, Any],
+    nodes: Dict[str, Tuple[str, str, List[str], Optional[str]]]
+) -> None:
+    """Add a lockfile v1 entry and its nested ``dependencies`` as v2-style paths."""
+    stack = [(path, name, entry)]
+    while stack:
+        path, name, entry = stack.pop()
+        nodes[path] = (name, str(entry.get("version", "")), list(entry.get("requires") or ()), None)
+        for child, child_entry in (entry.get("dependencies") or {}).items():
+            stack.append((f"{path}/node_modules/{child}", child, child_entry))
+
+
+def parse_npm_lockfile(path: Path) -> LockfileGraph:
+    """
+    Parse ``package-lock.json`` (lockfile versions 1 to 3) as a stream.
+    
+    Version 2 and 3 lockfiles are read from their ``packages`` section.
+    The legacy ``dependencies`` section of version 2 and every other member
+    that is not needed are passed over with ``_JsonStream.skip`` without
+    being decoded.
+    Dependencies resolve like Node's module lookup: from the package's own
+    ``node_modules`` up to the root one.
+    """
+    path = Path(path)
+    # path -> (name, version, dependency names, link target)
+    nodes: Dict[str, Tuple[str, str, List[str], Optional[str]]] = {}
+    lockfile_version = None
+    has_packages = False
+    with open(path, encoding="utf-8") as handle:
+        stream = _JsonStream(handle)
+        for key in stream.members():
+            if key == "lockfileVersion":
+                lockfile_version = stream.value()
+            elif key == "packages":
+                nodes = {}
+                has_packages = True
+                for package_path in stream.members():
+                    entry = stream.value()
+                    name = entry.get("name") or package_path.rpartition("node_modules/")[2]
+                    link = entry.get("resolved") if entry.get("link") else None
+                    nodes[package_path] = (
+                        name,
+                        str(entry.get("version", "")),
+                        _npm_dependencies(
+                            entry, _NPM_DEPENDENCY_KEYS if _npm_local(package_path) else
+                            ("dependencies", "optionalDependencies", "peerDependencies")
+                        ),
+                        link
+                    )
+            elif key == "dependencies" and not has_packages and (lockfile_version or 1) < 2:
+                for name in stream.members():
+                    _flatten_npm_v1(f"node_modules/{name}", name, stream.value(), nodes)
+            else:
+                stream.skip()
+    
+    if not has_packages:
+        # Version 1 lockfiles do not record the project; take it from package.json
+        manifest = path.with_name("package.json")
+        try:
+            project = json.loads(manifest.read_text(encoding="utf-8"))
+            nodes[""] = (project.get("name", ""), "", _npm_dependencies(project, _NPM_DEPENDENCY_KEYS), None)
+        except (OSError, ValueError):
+            pass
+    
+    graph = LockfileGraph("npm")
+    ids: Dict[str, int] = {}
+    for package_path, (name, version, _, link) in nodes.items():
+        if link is None:
+            ids[package_path] = graph.add(name, version, local=_npm_local(package_path))
+    for package_path, (_, _, _, link) in nodes.items():
+        if link is not None and link in ids:
+            ids[package_path] = ids[link]
+    
+    for package_path, (_, _, names, link) in nodes.items():
+        if link is not None:
+            continue
+        deps = graph.dependencies[ids[package_path]]
+        for name in names:
+            base = package_path
+            while True:
+                candidate = f"{base}/node_modules/{name}" if base else f"node_modules/{name}"
+                if candidate in ids:
+                    deps.append(ids[candidate])
+                    break
+                if not base:
+                    break
+                cut = base.rfind("/node_modules/")
+                base = base[:cut] if cut >= 0 else ""
+    return graph
+
+
+def _toml_string(value: str) -> str:
+    value = value.strip()
+    if value[:1] in "\"'":
+        return value[1:value.find(value[0], 1)]
+    return value
+
+
+def _normalize_python_name(name: str) -> str:
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def _pyproject_dependencies(path: Path) -> Optional[List[str]]:
+    """Direct dependency names declared by ``pyproject.toml`` (None if unreadable)."""
+    import toml
+    
+    try:
+        project = toml.load(path)
+    except (OSError, ValueError, toml.TomlDecodeError):
+        return None
+    poetry = project.get("tool", {}).get("poetry", {})
+    names = list(poetry.get("dependencies", {})) + list(poetry.get("dev-dependencies", {}))
+    for group in poetry.get("group", {}).values():
+        names.extend(group.get("dependencies", {}))
+    requirements = list(project.get("project", {}).get("dependencies", []))
+    for extra in project.get("project", {}).get("optional-dependencies", {}).values():
+        requirements.extend(extra)
+    for requirement in requirements:
+        match = _REQUIREMENT_NAME.match(requirement)
+        if match:
+            names.append(match.group(1))
+    return [name for name in names if name.lower() != "python"]
+
+
+def parse_poetry_lockfile(path: Path) -> LockfileGraph:
+    """Parse ``poetry.lock`` line by line."""
+    path = Path(path)
+    packages: List[Tuple[str, str, List[str]]] = []
+    section = None
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            stripped = line.strip()
+            if stripped.startswith("["):
+                section = stripped
+                if stripped == "[[package]]":
+                    packages.append(("", "", []))
+                continue
+            match = _TOML_KEY.match(line)
+            if match is None or not packages:
+                continue
+            key = _toml_string(match.group(1))
+            name, version, deps = packages[-1]
+            if section == "[[package]]" and key == "name":
+                packages[-1] = (_toml_string(match.group(2)), version, deps)
+            elif section == "[[package]]" and key == "version":
+                packages[-1] = (name, _toml_string(match.group(2)), deps)
+            elif section == "[package.dependencies]":
+                deps.append(key)
+    
+    graph = LockfileGraph("poetry")
+    by_name: Dict[str, List[int]] = {}
+    for name, version, _ in packages:
+        by_name.setdefault(_normalize_python_name(name), []).append(graph.add(name, version))
+    for index, (_, _, deps) in enumerate(packages):
+        for dep in deps:
+            graph.dependencies[index].extend(by_name.get(_normalize_python_name(dep), ()))
+    
+    direct = _pyproject_dependencies(path.with_name("pyproject.toml"))
+    if direct is not None:
+        project = graph.add("", "", local=True)
+        for dep in direct:
+            graph.dependencies[project].extend(by_name.get(_normalize_python_name(dep), ()))
+    return graph
+
+
+def parse_cargo_lockfile(path: Path) -> LockfileGraph:
+    """
+    Parse ``Cargo.lock`` line by line.
+    
+    Packages without a ``source`` are the workspace's own crates.
+    """
+    path = Path(path)
+    packages: List[Dict[str, Any]] = []
+    in_dependencies = False
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            stripped = line.strip()
+            if in_dependencies:
+                if stripped.startswith("]"):
+                    in_dependencies = False
+                elif stripped:
+                    packages[-1]["dependencies"].append(_toml_string(stripped.rstrip(",")))
+                continue
+            if stripped == "[[package]]":
+                packages.append({"name": "", "version": "", "source": None, "dependencies": []})
+                continue
+            if stripped.startswith("["):
+                continue
+            match = _TOML_KEY.match(line)
+            if match is None or not packages:
+                continue
+            key, value = match.group(1), match.group(2).strip()
+            if key in ("name", "version", "source"):
+                packages[-1][key] = _toml_string(value)
+            elif key == "dependencies":
+                if value.endswith("]"):
+                    packages[-1]["dependencies"].extend(
+                        _toml_string(item) for item in value.strip("[]").split(",") if item.strip()
+                    )
+                else:
+                    in_dependencies = True
+    
+    graph = LockfileGraph("cargo")
+    by_name: Dict[str, List[int]] = {}
+    for package in packages:
+        index = graph.add(package["name"], package["version"], local=package["source"] is None)
+        by_name.setdefault(package["name"], []).append(index)
+    for index, package in enumerate(packages):
+        for dep in package["dependencies"]:
+            # "name", "name version" or "name version (source)"
+            name, _, rest = dep.partition(" ")
+            candidates = by_name.get(name, [])
+            version = rest.partition(" ")[0]
+            if version:
+                candidates = [c for c in candidates if graph.versions[c] == version] or candidates
+            graph.dependencies[index].extend(candidates[:1])
+    return graph
+
+
+def _go_requirements(path: Path) -> Optional[Tuple[str, List[Tuple[str, str]]]]:
+    """Module path and direct ``require`` entries of ``go.mod`` (None if unreadable)."""
+    try:
+        handle = open(path, encoding="utf-8")
+    except OSError:
+        return None
+    module = ""
+    requires = []
+    in_block = False
+    with handle:
+        for line in handle:
+            code, _, comment = line.partition("//")
+            words = code.split()
+            if not words:
+                continue
+            if in_block:
+                if words[0] == ")":
+                    in_block = False
+                elif "indirect" not in comment and len(words) >= 2:
+                    requires.append((words[0], words[1]))
+            elif words[0] == "module" and len(words) > 1:
+                module = words[1].strip('"')
+            elif words[0] == "require":
+                if words[1:] == ["("]:
+                    in_block = True
+                elif len(words) >= 3 and "indirect" not in comment:
+                    requires.append((words[1], words[2]))
+    return module, requires
+
+
+def parse_go_sum(path: Path) -> LockfileGraph:
+    """
+    Parse ``go.sum`` line by line.
+    
+    Modules listed only with a ``/go.mod`` hash were consulted during
+    version selection but are not part of the build, so they are left out.
+    """
+    path = Path(path)
+    graph = LockfileGraph("go", edges_known=False)
+    ids: Dict[Tuple[str, str], int] = {}
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            words = line.split()
+            if len(words) >= 2 and not words[1].endswith("/go.mod") and (words[0], words[1]) not in ids:
+                ids[words[0], words[1]] = graph.add(words[0], words[1])
+    
+    requirements = _go_requirements(path.with_name("go.mod"))
+    if requirements is not None:
+        module, requires = requirements
+        project = graph.add(module, "", local=True)
+        by_module = {name: index for (name, _), index in ids.items()}
+        for name, version in requires:
+            dep = ids.get((name, version), by_module.get(name))
+            if dep is not None:
+                graph.dependencies[project].append(dep)
+    return graph
+
+
+_PARSERS: Dict[str, Callable[[Path], LockfileGraph]] = {
+    "npm": parse_npm_lockfile,
+    "poetry": parse_poetry_lockfile,
+    "cargo": parse_cargo_lockfile,
+    "go": parse_go_sum,
+}
+
+
+def is_lockfile(path: Path) -> bool:
+    """Return True for lockfiles with a parser."""
+    return Path(path).name in LOCKFILES
+
+
+def lockfile_inputs(path: Path) -> List[Path]:
+    """The lockfile plus the manifest its direct dependencies are read from."""
+    path = Path(path)
+    manifest = MANIFESTS.get(LOCKFILES.get(path.name, ""))
+    return [path, path.with_name(manifest)] if manifest else [path]
+
+
+def parse_lockfile(path: Path) -> Optional[LockfileGraph]:
+    """
+    Parse a lockfile with the parser for its name.
+    
+    Returns:
+        LockfileGraph, or None if the file is unreadable or malformed
+    """
+    manager = LOCKFILES.get(Path(path).name)
+    if manager is None:
+        return None
+    try:
+        return _PARSERS[manager](Path(path))
+    except (OSError, UnicodeDecodeError, ValueError, KeyError, AttributeError, TypeError):
+        return None
+
+
+def summarize_lockfiles(graphs: Iterable[LockfileGraph]) -> Dict[str, Dict[str, int]]:
+    """
+    Direct and total dependency counts per package manager.
+    
+    Packages are counted once per manager even when several lockfiles (e.g.
+    the projects of a monorepo) contain them.
+    
+    Returns:
+        ``{manager: {"direct": ..., "total": ..., "lockfiles": ...}}``
+    """
+    direct: Dict[str, Set[str]] = {}
+    total: Dict[str, Set[Tuple[str, str]]] = {}
+    lockfiles: Dict[str, int] = {}
+    for graph in graphs:
+        lockfiles[graph.manager] = lockfiles.get(graph.manager, 0) + 1
+        direct.setdefault(graph.manager, set()).update(graph.names[i] for i in graph.direct())
+        total.setdefault(graph.manager, set()).update(
+            (graph.names[i], graph.versions[i]) for i in graph.transitive()
+        )
+    return {
+        manager: {
+            "direct": len(direct[manager]),
+            "total": len(total[manager]),
+            "lockfiles": count
+        }
+        for manager, count in sorted(lockfiles.items())
+    }
\ No newline at end of file
@@ -0,0 +1,88 @@
+"""
+Pinned dependency versions for vulnerability checks.
+
+Advisories apply to exact versions, so only dependencies pinned to one
+version can be checked: every package of a parsed lockfile, and
+``name==1.2.3`` lines of pip requirements and constraints files. Ranges,
+URLs, editable installs and ``-r`` includes are left out (included files
+are read on their own when scanned).
+"""
+
+import re
+from pathlib import Path
+from typing import Iterable, List, Mapping, NamedTuple, Optional
+
+from .lockfiles import LockfileGraph
+
+
+_PIN = re.compile(
+    r"(?P<name>[A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[[^\]]*\])?\s*===?\s*(?P<version>[^\s;,#\\]+)\s*(?:[;#\\].*)?"
+)
+
+
+class Pin(NamedTuple):
+    """A dependency pinned to one version by a manifest."""
+    ecosystem: str
+    name: str
+    version: str
+    source: str
+
+
+def is_requirements_file(path: Path) -> bool:
+    """Return True for pip requirements and constraints files."""
+    name = Path(path).name.lower()
+    return name.endswith(".txt") and name.startswith(("requirements", "constraints"))
+
+
+def parse_requirements(text: str, source: str = "") -> List[Pin]:
+    """
+    Return the exact pins of a pip requirements file.
+    
+    Args:
+        text: File contents
+        source: Path recorded on each pin, relative to the repository
+        
+    Returns:
+        Pins in file order
+    """
+    pins = []
+    for line in text.splitlines():
+        match = _PIN.fullmatch(line.strip())
+        if match and "*" not in match["version"]:
+            pins.append(Pin("PyPI", match["name"], match["version"], source))
+    return pins
+
+
+def read_pins(
+    repository_path: Path,
+    files: Iterable[Path],
+    lockfiles: Optional[Mapping[str, LockfileGraph]] = None
+) -> List[Pin]:
+    """
+    Collect the pinned dependencies declared by scanned files.
+    
+    Args:
+        repository_path: Repository root, for the pins' ``source`` paths
+        files: Scanned files; files that are not manifests are ignored
+        lockfiles: Parsed lockfiles keyed by their path relative to the
+            repository, e.g. from ``LockfileCache``
+            
+    Returns:
+        Pins of every requirements file, then of every lockfile, each
+        ordered by path
+    """
+    root = Path(repository_path)
+    pins = []
+    for path in sorted(Path(f) for f in files if is_requirements_file(f)):
+        try:
+            text = path.read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            continue
+        try:
+            source = path.relative_to(root).as_posix()
+        except ValueError:
+            source = path.as_posix()
+        pins.extend(parse_requirements(text, source))
+    for source, graph in sorted((lockfiles or {}).items()):
+        pins.extend(Pin(graph.ecosystem, name, version, source) for name, version in graph.packages())
+    return pins
\ No newline at end of file
@@ -0,0 +1,397 @@
+"""
+Single-pass combined analysis pipeline.
+
+Runs several analyzers over the same files while reading and decoding each
+file once and parsing it at most once. Every analyzer receives the shared
+ParsedFile through ``BaseAnalyzer.analyze_batch``, or the analyzer routed
+for the file's language does; per-analyzer results come back in input
+order, as with ``executor.analyze_files``.
+"""
+
+import ast
+import io
+import tokenize
+from dataclasses import dataclass, field
+from functools import cached_property, partial
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from ..utils.file_access import SKIPPED_BINARY, FileContent, FileStamp, read_file
+from ..utils.file_utils import detect_language
+from ..utils.profiling import get_profiler
+from . import executor
+from .base import BaseAnalyzer, FileAnalysis
+from .dispatch import analyze_grouped
+from .reader import prefetch
+
+if TYPE_CHECKING:
+    from ..storage.cache import AnalysisCache
+    from ..utils.git_utils import ChangeSet
+
+
+@dataclass
+class ParsedFile:
+    """
+    A file read and decoded once, with lazily built shared parses.
+    
+    ``tree`` and ``tokens`` are computed on first access and then reused by
+    every analyzer that asks for them. Both are None for non-Python files
+    and for Python files that fail to parse (see ``syntax_error``).
+    
+    Binary and oversized files are read as ``skipped`` with an empty
+    ``source``; the pipeline reports them without running analyzers.
+    ``line_count`` is counted from the raw bytes when the file is read, and
+    ``stamp`` identifies those bytes for the result cache.
+    """
+    path: Path
+    language: str
+    source: str
+    syntax_error: Optional[str] = field(default=None, compare=False)
+    skipped: Optional[str] = field(default=None, compare=False)
+    line_count: Optional[int] = field(default=None, compare=False)
+    stamp: Optional[FileStamp] = field(default=None, compare=False)
+    
+    @classmethod
+    def read(cls, path: Path) -> "ParsedFile":
+        """Read and decode a file (undecodable bytes are replaced)."""
+        return cls._from_content(path, read_file(path))
+    
+    @classmethod
+    def from_bytes(cls, path: Path, data: bytes) -> "ParsedFile":
+        """Decode contents read elsewhere (e.g. a git blob) with the same checks as ``read``."""
+        return cls._from_content(path, FileContent.from_bytes(data))
+    
+    @classmethod
+    def _from_content(cls, path: Path, content: FileContent) -> "ParsedFile":
+        return cls(
+            path=path,
+            language=detect_language(path, content.head),
+            source=content.text,
+            skipped=content.skipped,
+            line_count=content.line_count,
+            stamp=content.stamp
+        )
+    
+    @property
+    def lines_of_code(self) -> int:
+        """Number of lines, without splitting the source if it was counted on read."""
+        return self.line_count if self.line_count is not None else len(self.lines)
+    
+    def skipped_analysis(self) -> FileAnalysis:
+        """Result reported for a skipped file: its line count and a ``skipped`` issue."""
+        if self.skipped == SKIPPED_BINARY:
+            message = "Binary file not analyzed"
+        else:
+            message = "File exceeds the maximum analyzed size"
+        return FileAnalysis(
+            file_path=self.path,
+            language=self.language,
+            lines_of_code=self.line_count or 0,
+            issues=[{"type": "skipped", "reason": self.skipped, "message": message}]
+        )
+    
+    @cached_property
+    def lines(self) -> List[str]:
+        """Source lines without line endings."""
+        return self.source.splitlines()
+    
+    @cached_property
+    def tree(self) -> Optional[ast.Module]:
+        """Python AST of the file, parsed on first access."""
+        if self.language != "python":
+            return None
+        try:
+            return ast.parse(self.source, filename=str(self.path))
+        except (SyntaxError, ValueError) as e:
+            self.syntax_error = str(e)
+            return None
+    
+    @cached_property
+    def tokens(self) -> Optional[List[tokenize.TokenInfo]]:
+        """Python token stream of the file, tokenized on first access."""
+        if self.language != "python":
+            return None
+        try:
+            return list(tokenize.generate_tokens(io.StringIO(self.source).readline))
+        except (tokenize.TokenError, SyntaxError) as e:
+            self.syntax_error = str(e)
+            return None
+
+
+#: One unit of pipeline work: file index, path (or an already decoded
+#: ParsedFile) and the analyzers it still needs.
+_WorkItem = Tuple[int, Union[Path, ParsedFile], Tuple[str, ...]]
+
+#: One analyzer result: file index, analyzer name, result and seconds taken.
+_Row = Tuple[int, str, FileAnalysis, float]
+
+#: Per analyzer name, analyzers by language (see ``dispatch.analyzers_by_language``).
+_Routes = Mapping[str, Mapping[str, BaseAnalyzer]]
+
+_worker_analyzers: Optional[Dict[str, BaseAnalyzer]] = None
+_worker_routes: Optional[_Routes] = None
+
+
+def _init_worker(analyzers: Dict[str, BaseAnalyzer], routes: Optional[_Routes]) -> None:
+    """Receive the analyzers once per worker process instead of per batch."""
+    global _worker_analyzers, _worker_routes
+    _worker_analyzers = analyzers
+    _worker_routes = routes
+
+
+def _handled_by(
+    analyzers: Dict[str, BaseAnalyzer],
+    routes: Optional[_Routes],
+    name: str,
+    language: str
+) -> str:
+    """Class name of the analyzer that produced a result, for the profiler."""
+    routed = (routes or {}).get(name, {})
+    return type(routed.get(language, analyzers[name])).__name__
+
+
+def _run_items(
+    analyzers: Dict[str, BaseAnalyzer],
+    chunk: Sequence[_WorkItem],
+    routes: Optional[_Routes] = None
+) -> List[_Row]:
+    """
+    Run one batch of work items.
+    
+    Each analyzer gets the files in the batch that still need it, split by
+    language into ``analyze_batch`` calls on the analyzer routed for the
+    language, if any (see ``dispatch.analyze_grouped``).
+    """
+    routes = routes or {}
+    per_analyzer: Dict[str, List[Tuple[int, ParsedFile]]] = {name: [] for name in analyzers}
+    for index, source, names in chunk:
+        parsed = source if isinstance(source, ParsedFile) else ParsedFile.read(source)
+        for name in names:
+            per_analyzer[name].append((index, parsed))
+    return [
+        (index, name, analysis, seconds)
+        for name, items in per_analyzer.items() if items
+        for index, analysis, seconds in analyze_grouped(analyzers[name], items, routes.get(name))
+    ]
+
+
+def _run_chunk(chunk: Sequence[_WorkItem]) -> List[_Row]:
+    """Run one batch of work items inside a worker process."""
+    assert _worker_analyzers is not None
+    return _run_items(_worker_analyzers, chunk, _worker_routes)
+
+
+def _load_item(item: _WorkItem) -> _WorkItem:
+    """Read and decode a work item's file (reader stage)."""
+    index, source, names = item
+    return item if isinstance(source, ParsedFile) else (index, ParsedFile.read(source), names)
+
+
+def _iter_rows(
+    analyzers: Dict[str, BaseAnalyzer],
+    pending: Sequence[_WorkItem],
+    jobs: int,
+    chunk_size: Optional[int],
+    stamps: Optional[Dict[int, Optional[FileStamp]]] = None,
+    routes: Optional[_Routes] = None
+) -> Iterator[_Row]:
+    """
+    Run work items through ``executor.run_chunks``.
+    
+    Files are read ahead by the ``reader.prefetch`` stage, so workers only
+    parse and analyze; the reader stage stops reading ahead when all
+    workers are busy. Rows are yielded as batches complete, not
+    necessarily in input order. With ``stamps``, each file's
+    ``ParsedFile.stamp`` is stored there by index.
+    """
+    def loaded_items() -> Iterator[_WorkItem]:
+        for _, item in prefetch(pending, _load_item):
+            if stamps is not None:
+                stamps[item[0]] = item[1].stamp
+            yield item
+    
+    return executor.run_chunks(
+        loaded_items(),
+        len(pending),
+        partial(_run_items, analyzers, routes=routes),
+        _run_chunk,
+        _init_worker,
+        (analyzers, routes),
+        jobs,
+        chunk_size
+    )
+
+
+def iter_all(
+    analyzers: Dict[str, BaseAnalyzer],
+    files: Iterable[Path],
+    jobs: Optional[int] = None,
+    caches: Optional[Dict[str, "AnalysisCache"]] = None,
+    chunk_size: Optional[int] = None,
+    change_set: Optional["ChangeSet"] = None,
+    routes: Optional[_Routes] = None
+) -> Iterator[Tuple[Path, Dict[str, FileAnalysis]]]:
+    """
+    Stream the results of several analyzers over the same files.
+    
+    Like ``analyze_all``, but each file's results are yielded as soon as
+    they and those of every earlier file are complete, so consumers can
+    write them out while later files are still being analyzed. Results
+    are stored in the caches as each file completes.
+    
+    Args:
+        analyzers: Analyzers keyed by name; must be picklable for parallel runs
+        files: Files to analyze
+        jobs: Number of worker processes (default: CPU count)
+        caches: Optional result caches keyed by analyzer name
+        chunk_size: Files per work batch (default: derived from file count)
+        change_set: Files changed since a base reference; cache lookups
+            follow ``executor.lookup_cached``
+        routes: Analyzers by language per analyzer name, as for
+            ``executor.analyze_files``; a routed analyzer's cache must be
+            opened with its routes
+        
+    Yields:
+        ``(path, {analyzer name: FileAnalysis})`` in the same order as ``files``
+    """
+    paths = [f if isinstance(f, Path) else Path(f) for f in files]
+    jobs = jobs or executor.default_jobs()
+    caches = caches or {}
+    profiler = get_profiler()
+    
+    results: Dict[int, Dict[str, FileAnalysis]] = {index: {} for index in range(len(paths))}
+    for name in analyzers:
+        for index, cached in executor.lookup_cached(caches.get(name), paths, change_set).items():
+            results[index][name] = cached
+    missing: Dict[int, int] = {}
+    pending: List[_WorkItem] = []
+    for index, path in enumerate(paths):
+        names = [name for name in analyzers if name not in results[index]]
+        if names:
+            missing[index] = len(names)
+            pending.append((index, path, tuple(names)))
+    
+    def ready(start: int) -> Iterator[Tuple[Path, Dict[str, FileAnalysis]]]:
+        for index in range(start, len(paths)):
+            if index in missing:
+                return
+            yield paths[index], {name: results[index][name] for name in analyzers}
+            del results[index]
+    
+    stamps: Dict[int, Optional[FileStamp]] = {}
+    next_index = 0
+    for next_index, item in enumerate(ready(0), start=1):
+        yield item
+    rows = _iter_rows(analyzers, pending, jobs, chunk_size, stamps, routes)
+    for index, name, analysis, seconds in rows:
+        results[index][name] = analysis
+        profiler.record_file(
+            _handled_by(analyzers, routes, name, analysis.language),
+            analysis.language,
+            paths[index],
+            analysis.lines_of_code,
+            seconds
+        )
+        cache = caches.get(name)
+        if cache is not None:
+            cache.put(paths[index], analysis, stamps.get(index))
+        missing[index] -= 1
+        if not missing[index]:
+            del missing[index]
+            stamps.pop(index, None)
+            for next_index, item in enumerate(ready(next_index), start=next_index + 1):
+                yield item
+
+
+def analyze_all(
+    analyzers: Dict[str, BaseAnalyzer],
+    files: Iterable[Path],
+    jobs: Optional[int] = None,
+    caches: Optional[Dict[str, "AnalysisCache"]] = None,
+    chunk_size: Optional[int] = None,
+    change_set: Optional["ChangeSet"] = None,
+    routes: Optional[_Routes] = None
+) -> Dict[str, List[FileAnalysis]]:
+    """
+    Run several analyzers over the same files in a single pass.
+    
+    Each file is read once and shared between all analyzers that need it;
+    a file whose results are cached for every analyzer is not read at all.
+    Parallelism and batching follow ``executor.analyze_files``.
+    
+    Args:
+        analyzers: Analyzers keyed by name (e.g. ``"complexity"``); must be
+            picklable for parallel runs
+        files: Files to analyze
+        jobs: Number of worker processes (default: CPU count)
+        caches: Optional result caches keyed by analyzer name
+        chunk_size: Files per work batch (default: derived from file count)
+        change_set: Files changed since a base reference; cache lookups
+            follow ``executor.lookup_cached``
+        routes: Analyzers by language per analyzer name (see ``iter_all``)
+        
+    Returns:
+        FileAnalysis results per analyzer name, in the same order as ``files``
+    """
+    results: Dict[str, List[FileAnalysis]] = {name: [] for name in analyzers}
+    for _, per_analyzer in iter_all(analyzers, files, jobs, caches, chunk_size, change_set, routes):
+        for name, analysis in per_analyzer.items():
+            results[name].append(analysis)
+    return results
+
+
+def analyze_sources(
+    analyzers: Dict[str, BaseAnalyzer],
+    sources: Sequence[ParsedFile],
+    jobs: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    routes: Optional[_Routes] = None
+) -> Dict[str, List[FileAnalysis]]:
+    """
+    Run several analyzers over already decoded sources.
+    
+    Like ``analyze_all``, but for content that does not come from the
+    working tree, such as blobs read from git history.
+    
+    Args:
+        analyzers: Analyzers keyed by name; must be picklable for parallel runs
+        sources: Decoded files to analyze
+        jobs: Number of worker processes (default: CPU count)
+        chunk_size: Files per work batch (default: derived from file count)
+        routes: Analyzers by language per analyzer name (see ``iter_all``)
+        
+    Returns:
+        FileAnalysis results per analyzer name, in the same order as ``sources``
+    """
+    jobs = jobs or executor.default_jobs()
+    results: Dict[str, List[Optional[FileAnalysis]]] = {
+        name: [None] * len(sources) for name in analyzers
+    }
+    profiler = get_profiler()
+    
+    def record(index: int, name: str, analysis: FileAnalysis, seconds: float) -> None:
+        results[name][index] = analysis
+        profiler.record_file(
+            _handled_by(analyzers, routes, name, analysis.language),
+            analysis.language,
+            sources[index].path,
+            analysis.lines_of_code,
+            seconds
+        )
+    
+    names = tuple(analyzers)
+    pending = [(index, parsed, names) for index, parsed in enumerate(sources)]
+    for row in _iter_rows(analyzers, pending, jobs, chunk_size, routes=routes):
+        record(*row)
+    return results  # type: ignore[return-value]
\ No newline at end of file
@@ -0,0 +1,127 @@
+"""
+Bounded selection of function rows for complexity reports.
+
+Rendering every function of a large repository costs more than analyzing
+it. ``rank_functions`` makes one pass over the results, counting functions
+and keeping only the rows that will be shown: with a limit, a heap of at
+most ``limit`` rows (``heapq.nlargest``/``nsmallest``), so memory and sort
+cost depend on the limit rather than on the repository.
+"""
+
+import heapq
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from .results import ResultStore, _field
+
+
+class FunctionRow(NamedTuple):
+    """One function as shown in the complexity table."""
+    file_path: str
+    name: str
+    line: int
+    complexity: int
+
+
+_SORT_KEYS: Dict[str, Callable[[FunctionRow], Any]] = {
+    "complexity": attrgetter("complexity"),
+    "name": lambda row: (row.name, row.file_path, row.line),
+    "file": lambda row: (row.file_path, row.line),
+}
+
+#: Orders accepted by ``rank_functions``; ``complexity`` sorts highest first.
+SORT_KEYS = tuple(_SORT_KEYS)
+
+
+@dataclass
+class FunctionRanking:
+    """Selected rows plus counts over every function."""
+    rows: List[FunctionRow] = field(default_factory=list)
+    total: int = 0
+    over_threshold: int = 0
+    matched: int = 0
+    
+    @property
+    def hidden(self) -> int:
+        """Number of matching functions left out by the limit."""
+        return self.matched - len(self.rows)
+
+
+def iter_function_rows(files: Iterable[Any]) -> Iterator[FunctionRow]:
+    """
+    Yield a FunctionRow per function of repository-level complexity results.
+    
+    Args:
+        files: A ResultStore, or file results whose ``functions`` are dicts
+            or objects with ``name``, ``line`` and ``complexity``
+    """
+    if isinstance(files, ResultStore):
+        paths = files.paths
+        for index, name, line, complexity in files.iter_function_rows():
+            yield FunctionRow(paths[index], name, line, complexity)
+        return
+    for file_result in files:
+        file_path = str(file_result.file_path)
+        for function in file_result.functions:
+            yield FunctionRow(
+                file_path,
+                str(_field(function, "name", "")),
+                int(_field(function, "line", 0) or 0),
+                int(_field(function, "complexity", 0) or 0)
+            )
+
+
+def rank_functions(
+    rows: Iterable[FunctionRow],
+    threshold: int,
+    limit: Optional[int] = None,
+    sort: str = "complexity",
+    only_over_threshold: bool = False
+) -> FunctionRanking:
+    """
+    Select the functions to show in a complexity report.
+    
+    Ties keep their input order, so results are stable across runs.
+    
+    Args:
+        rows: Function rows, e.g. from ``iter_function_rows``
+        threshold: Complexity above which a function counts as high
+        limit: Maximum rows to keep (None keeps every matching row)
+        sort: ``"complexity"`` (highest first), ``"name"`` or ``"file"``
+        only_over_threshold: Keep only functions above the threshold
+        
+    Returns:
+        FunctionRanking with the selected rows in display order
+        
+    Raises:
+        ValueError: If ``sort`` is unknown or ``limit`` is negative
+    """
+    if sort not in SORT_KEYS:
+        raise ValueError(f"Unknown sort order: {sort!r}")
+    if limit is not None and limit < 0:
+        raise ValueError("limit must not be negative")
+    
+    ranking = FunctionRanking()
+    
+    def matching() -> Iterator[FunctionRow]:
+        for row in rows:
+            ranking.total += 1
+            over = row.complexity > threshold
+            ranking.over_threshold += over
+            if over or not only_over_threshold:
+                ranking.matched += 1
+                yield row
+    
+    key = _SORT_KEYS[sort]
+    descending = sort == "complexity"
+    if limit is None:
+        ranking.rows = sorted(matching(), key=key, reverse=descending)
+    elif limit == 0:
+        # heapq returns early for n == 0; the counts still need a full pass
+        for _ in matching():
+            pass
+    else:
+        select = heapq.nlargest if descending else heapq.nsmallest
+        ranking.rows = select(limit, matching(), key=key)
+    return ranking
\ No newline at end of file
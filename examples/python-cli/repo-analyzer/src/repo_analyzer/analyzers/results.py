@@ -0,0 +1,494 @@
+"""
+Compact columnar storage for analysis results.
+
+FileAnalysis keeps per-function data as free-form dicts, which costs
+hundreds of bytes per function. ResultStore keeps the same information in
+typed ``array`` columns with interned strings, and exposes lightweight
+``__slots__`` views so existing consumers (metric calculation, terminal
+renderers, JSON export) can iterate results without materializing dicts.
+"""
+
+import json
+from array import array
+from itertools import chain, repeat
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from .base import FileAnalysis
+
+#: Function keys stored in typed columns; any other keys are kept per row.
+_FUNCTION_COLUMNS = ("name", "line", "complexity", "nesting_depth", "cognitive_complexity")
+
+#: Class keys stored in typed columns.
+_CLASS_COLUMNS = ("name", "line")
+
+#: Column value for a detailed metric the analyzer did not report.
+_ABSENT = -1
+
+
+class StringTable:
+    """Interns repeated strings (names, languages, imports) as integer ids."""
+    
+    __slots__ = ("_ids", "_strings")
+    
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._strings: List[str] = []
+    
+    def intern(self, value: str) -> int:
+        """Return the id for a string, adding it if needed."""
+        string_id = self._ids.get(value)
+        if string_id is None:
+            string_id = len(self._strings)
+            self._ids[value] = string_id
+            self._strings.append(value)
+        return string_id
+    
+    def find(self, value: str) -> Optional[int]:
+        """Return the id of a string, or None if it was never interned."""
+        return self._ids.get(value)
+    
+    def __getitem__(self, string_id: int) -> str:
+        return self._strings[string_id]
+    
+    def __len__(self) -> int:
+        return len(self._strings)
+
+
+class FunctionRecord:
+    """
+    Read-only view of one function row.
+    
+    ``nesting_depth`` and ``cognitive_complexity`` are None when the
+    analyzer did not report them; ``extra`` holds any other keys.
+    """
+    
+    __slots__ = (
+        "file_path", "name", "line", "complexity", "nesting_depth", "cognitive_complexity", "extra"
+    )
+    
+    def __init__(
+        self,
+        file_path: Path,
+        name: str,
+        line: int,
+        complexity: int,
+        nesting_depth: Optional[int] = None,
+        cognitive_complexity: Optional[int] = None,
+        extra: Optional[Dict[str, Any]] = None
+    ):
+        self.file_path = file_path
+        self.name = name
+        self.line = line
+        self.complexity = complexity
+        self.nesting_depth = nesting_depth
+        self.cognitive_complexity = cognitive_complexity
+        self.extra = extra
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        data: Dict[str, Any] = {"name": self.name, "line": self.line, "complexity": self.complexity}
+        if self.nesting_depth is not None:
+            data["nesting_depth"] = self.nesting_depth
+        if self.cognitive_complexity is not None:
+            data["cognitive_complexity"] = self.cognitive_complexity
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+
+class FileRecord:
+    """
+    Read-only view of one file row.
+    
+    Mirrors the FileAnalysis attributes used by renderers, with
+    ``functions`` yielding FunctionRecord views on demand.
+    """
+    
+    __slots__ = ("_store", "_index")
+    
+    def __init__(self, store: "ResultStore", index: int):
+        self._store = store
+        self._index = index
+    
+    @property
+    def file_path(self) -> Path:
+        return Path(self._store._paths[self._index])
+    
+    @property
+    def language(self) -> str:
+        return self._store._strings[self._store._language[self._index]]
+    
+    @property
+    def lines_of_code(self) -> int:
+        return self._store._lines_of_code[self._index]
+    
+    @property
+    def complexity_score(self) -> float:
+        return self._store._complexity_score[self._index]
+    
+    @property
+    def quality_score(self) -> float:
+        return self._store._quality_score[self._index]
+    
+    @property
+    def functions(self) -> List[FunctionRecord]:
+        return list(self._store.iter_functions(self._index))
+    
+    @property
+    def imports(self) -> List[str]:
+        store = self._store
+        start, end = store._import_offsets[self._index], store._import_offsets[self._index + 1]
+        return [store._strings[i] for i in store._import_ids[start:end]]
+    
+    @property
+    def issues(self) -> List[Dict[str, Any]]:
+        return self._store._issues.get(self._index, [])
+    
+    def to_analysis(self) -> FileAnalysis:
+        """Materialize a full FileAnalysis (dict-based) for this file."""
+        store = self._store
+        start, end = store._class_offsets[self._index], store._class_offsets[self._index + 1]
+        return FileAnalysis(
+            file_path=self.file_path,
+            language=self.language,
+            lines_of_code=self.lines_of_code,
+            complexity_score=self.complexity_score,
+            quality_score=self.quality_score,
+            functions=[f.to_dict() for f in self.functions],
+            classes=[
+                {
+                    "name": store._strings[store._class_name[i]],
+                    "line": store._class_line[i],
+                    **store._class_extra.get(i, {})
+                }
+                for i in range(start, end)
+            ],
+            imports=self.imports,
+            issues=self.issues
+        )
+
+
+def _field(item: Any, key: str, default: Any) -> Any:
+    """Read a field from a dict-style or attribute-style record."""
+    if isinstance(item, dict):
+        return item.get(key, default)
+    return getattr(item, key, default)
+
+
+def _extra_fields(item: Any, columns: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+    """Return the keys of a dict-style record that have no column, if any."""
+    if not isinstance(item, dict):
+        return None
+    return {key: value for key, value in item.items() if key not in columns} or None
+
+
+def _optional_int(value: Any) -> int:
+    """Encode an optional metric for an int column."""
+    return _ABSENT if value is None else int(value)
+
+
+class ResultStore:
+    """
+    Columnar, append-only store of FileAnalysis results.
+    
+    File rows and function rows live in parallel typed arrays (int32 for
+    ids, lines and complexity; float64 for scores); names, languages and
+    imports are interned. Function rows for file ``i`` occupy the range
+    ``function_offsets[i]:function_offsets[i + 1]``.
+    
+    Function ``name``, ``line``, ``complexity``, ``nesting_depth`` and
+    ``cognitive_complexity`` and class ``name`` and ``line`` are stored in
+    columns. Any other keys of a function or class dict are kept as a
+    small dict for that row only, so storing results is lossless and
+    costs extra memory only for analyzers that report unusual keys.
+    
+    Example:
+        store = ResultStore.from_analyses(analyses)
+        worst = max(store.iter_functions(), key=lambda f: f.complexity)
+    """
+    
+    def __init__(self):
+        self._strings = StringTable()
+        self._paths: List[str] = []
+        self._language = array("i")
+        self._lines_of_code = array("i")
+        self._complexity_score = array("d")
+        self._quality_score = array("d")
+        self._issues: Dict[int, List[Dict[str, Any]]] = {}
+        
+        self._function_offsets = array("i", [0])
+        self._function_name = array("i")
+        self._function_line = array("i")
+        self._function_complexity = array("i")
+        self._function_nesting_depth = array("i")
+        self._function_cognitive = array("i")
+        self._function_extra: Dict[int, Dict[str, Any]] = {}
+        
+        self._class_offsets = array("i", [0])
+        self._class_name = array("i")
+        self._class_line = array("i")
+        self._class_extra: Dict[int, Dict[str, Any]] = {}
+        
+        self._import_offsets = array("i", [0])
+        self._import_ids = array("i")
+    
+    @classmethod
+    def from_analyses(cls, analyses: Iterable[FileAnalysis]) -> "ResultStore":
+        """Build a store from FileAnalysis objects (consumed one at a time)."""
+        store = cls()
+        for analysis in analyses:
+            store.add(analysis)
+        return store
+    
+    def add(self, analysis: FileAnalysis, file_path: Optional[str] = None) -> int:
+        """
+        Append one file's results.
+        
+        Args:
+            analysis: Result to store; may be discarded afterwards
+            file_path: Path to record instead of ``analysis.file_path``, for
+                results shared by several files with identical content
+                
+        Returns:
+            Index of the new file row
+        """
+        intern = self._strings.intern
+        index = len(self._paths)
+        
+        self._paths.append(file_path if file_path is not None else str(analysis.file_path))
+        self._language.append(intern(analysis.language))
+        self._lines_of_code.append(analysis.lines_of_code)
+        self._complexity_score.append(analysis.complexity_score)
+        self._quality_score.append(analysis.quality_score)
+        if analysis.issues:
+            self._issues[index] = list(analysis.issues)
+        
+        for function in analysis.functions:
+            extra = _extra_fields(function, _FUNCTION_COLUMNS)
+            if extra:
+                self._function_extra[len(self._function_name)] = extra
+            self._function_name.append(intern(str(_field(function, "name", ""))))
+            self._function_line.append(int(_field(function, "line", 0) or 0))
+            self._function_complexity.append(int(_field(function, "complexity", 0) or 0))
+            self._function_nesting_depth.append(
+                _optional_int(_field(function, "nesting_depth", None))
+            )
+            self._function_cognitive.append(
+                _optional_int(_field(function, "cognitive_complexity", None))
+            )
+        self._function_offsets.append(len(self._function_name))
+        
+        for klass in analysis.classes:
+            extra = _extra_fields(klass, _CLASS_COLUMNS)
+            if extra:
+                self._class_extra[len(self._class_name)] = extra
+            self._class_name.append(intern(str(_field(klass, "name", ""))))
+            self._class_line.append(int(_field(klass, "line", 0) or 0))
+        self._class_offsets.append(len(self._class_name))
+        
+        self._import_ids.extend(intern(name) for name in analysis.imports)
+        self._import_offsets.append(len(self._import_ids))
+        
+        return index
+    
+    def __len__(self) -> int:
+        return len(self._paths)
+    
+    @property
+    def paths(self) -> List[str]:
+        """File paths as strings, one per file row (do not modify)."""
+        return self._paths
+    
+    @property
+    def function_count(self) -> int:
+        """Total number of function rows."""
+        return len(self._function_name)
+    
+    def __iter__(self) -> Iterator[FileRecord]:
+        return self.iter_files()
+    
+    def iter_files(self) -> Iterator[FileRecord]:
+        """
+        Yield file views without building a list.
+        
+        Iterating the store directly does the same, so a ResultStore can
+        stand in wherever a list of FileAnalysis is iterated.
+        """
+        for index in range(len(self._paths)):
+            yield FileRecord(self, index)
+    
+    def iter_functions(self, file_index: Optional[int] = None) -> Iterator[FunctionRecord]:
+        """
+        Yield function views, for one file or for the whole store.
+        
+        Args:
+            file_index: Restrict to the functions of this file row
+        """
+        if file_index is None:
+            file_indices: Iterable[int] = range(len(self._paths))
+        else:
+            file_indices = (file_index,)
+        
+        for index in file_indices:
+            start, end = self._function_offsets[index], self._function_offsets[index + 1]
+            if start == end:
+                continue
+            file_path = Path(self._paths[index])
+            for row in range(start, end):
+                nesting_depth = self._function_nesting_depth[row]
+                cognitive = self._function_cognitive[row]
+                yield FunctionRecord(
+                    file_path,
+                    self._strings[self._function_name[row]],
+                    self._function_line[row],
+                    self._function_complexity[row],
+                    None if nesting_depth == _ABSENT else nesting_depth,
+                    None if cognitive == _ABSENT else cognitive,
+                    self._function_extra.get(row)
+                )
+    
+    def iter_file_rows(self) -> Iterator[Tuple[str, str, int, float, float, int]]:
+        """
+        Yield plain tuples for bulk export, one per file row.
+        
+        Yields:
+            ``(file_path, language, lines_of_code, complexity_score,
+            quality_score, issue_count)``
+        """
+        return zip(
+            self._paths,
+            map(self._strings.__getitem__, self._language),
+            self._lines_of_code,
+            self._complexity_score,
+            self._quality_score,
+            self.issue_counts()
+        )
+    
+    def iter_function_rows(self) -> Iterator[Tuple[int, str, int, int]]:
+        """
+        Yield plain tuples for bulk export, one per function row.
+        
+        Yields:
+            ``(file_index, name, line, complexity)``
+        """
+        offsets = self._function_offsets
+        file_indices = chain.from_iterable(
+            repeat(index, offsets[index + 1] - offsets[index])
+            for index in range(len(self._paths))
+        )
+        return zip(
+            file_indices,
+            map(self._strings.__getitem__, self._function_name),
+            self._function_line,
+            self._function_complexity
+        )
+    
+    def column(self, name: str) -> array:
+        """
+        Return a raw column for bulk aggregation.
+        
+        Args:
+            name: One of ``lines_of_code``, ``complexity_score``,
+                ``quality_score``, ``function_complexity``,
+                ``function_nesting_depth``, ``function_cognitive_complexity``
+                (-1 where not reported) or ``function_offsets``
+                
+        Returns:
+            The underlying array (do not modify)
+        """
+        columns = {
+            "lines_of_code": self._lines_of_code,
+            "complexity_score": self._complexity_score,
+            "quality_score": self._quality_score,
+            "function_complexity": self._function_complexity,
+            "function_nesting_depth": self._function_nesting_depth,
+            "function_cognitive_complexity": self._function_cognitive,
+            "function_offsets": self._function_offsets,
+        }
+        return columns[name]
+    
+    def issue_counts(self) -> array:
+        """Return the number of issues per file row."""
+        counts = array("i", bytes(4 * len(self._paths)))
+        for index, issues in self._issues.items():
+            counts[index] = len(issues)
+        return counts
+    
+    def language_totals(self) -> Dict[str, Dict[str, int]]:
+        """Return ``{language: {"files": n, "lines": n}}`` over all file rows."""
+        totals: Dict[str, Dict[str, int]] = {}
+        for language_id, lines in zip(self._language, self._lines_of_code):
+            stats = totals.setdefault(self._strings[language_id], {"files": 0, "lines": 0})
+            stats["files"] += 1
+            stats["lines"] += lines
+        return totals
+    
+    def iter_analyses(self) -> Iterator[FileAnalysis]:
+        """Yield FileAnalysis objects one at a time (for legacy consumers)."""
+        for record in self.iter_files():
+            yield record.to_analysis()
+    
+    def write_json(self, stream: TextIO, end: str = "\n") -> None:
+        """
+        Write all results as a JSON array, one file object at a time.
+        
+        Args:
+            stream: Text stream to write to
+            end: Text written after the array (empty when the array is
+                embedded in a larger document)
+        """
+        stream.write("[")
+        for index, record in enumerate(self.iter_files()):
+            if index:
+                stream.write(",")
+            stream.write("\n")
+            json.dump(record.to_analysis().to_dict(), stream, default=str)
+        stream.write("\n]" + end if len(self) else "]" + end)
+    
+    def nbytes(self) -> int:
+        """Approximate memory held by the column arrays (excluding strings)."""
+        arrays = [
+            self._language, self._lines_of_code, self._complexity_score,
+            self._quality_score, self._function_offsets, self._function_name,
+            self._function_line, self._function_complexity, self._function_nesting_depth,
+            self._function_cognitive, self._class_offsets,
+            self._class_name, self._class_line, self._import_offsets, self._import_ids,
+        ]
+        return sum(a.itemsize * len(a) for a in arrays)
+
+
+def write_json_document(data: Any, stream: TextIO) -> None:
+    """
+    Write a JSON document, streaming any ResultStore values it contains.
+    
+    ResultStore values, at any depth of nested dicts, are written one file
+    at a time with ``ResultStore.write_json`` instead of being turned into
+    lists of dicts first. Other values that JSON cannot represent are
+    written as strings. The document ends with a newline.
+    
+    Args:
+        data: Document to write
+        stream: Text stream to write to
+    """
+    def has_store(value: Any) -> bool:
+        if isinstance(value, ResultStore):
+            return True
+        return isinstance(value, dict) and any(map(has_store, value.values()))
+    
+    def write(value: Any, level: int) -> None:
+        if isinstance(value, ResultStore):
+            value.write_json(stream, end="")
+        elif has_store(value):
+            stream.write("{")
+            for index, (key, item) in enumerate(value.items()):
+                indent = "  " * (level + 1)
+                stream.write(f"{',' if index else ''}\n{indent}{json.dumps(str(key))}: ")
+                write(item, level + 1)
+            stream.write("\n" + "  " * level + "}")
+        else:
+            text = json.dumps(value, indent=2, default=str)
+            stream.write(text.replace("\n", "\n" + "  " * level))
+    
+    write(data, 0)
+    stream.write("\n")
\ No newline at end of file
@@ -0,0 +1,344 @@
+"""
+Hierarchical per-directory rollups for structure analysis.
+
+A RollupTree keeps file, line and language totals for every directory of a
+repository. Updating one file only touches the nodes on its path to the
+root, so the tree can be saved after a full ``analyze structure`` run and
+refreshed from git afterwards by re-analyzing only the changed files.
+Depth-limited and subtree queries are then answered from the stored tree.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from ..utils.file_utils import ALWAYS_EXCLUDED, IgnoreRules
+from ..utils.git_utils import ChangeSet, changed_files
+from .base import DirectoryAnalysis, FileAnalysis
+
+
+#: Format version of saved rollup files; older files are rebuilt.
+ROLLUP_VERSION = 1
+
+
+class DirectoryNode:
+    """Aggregated totals for one directory and everything below it."""
+    
+    __slots__ = ("path", "files", "lines", "languages", "children")
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.files = 0
+        self.lines = 0
+        self.languages: Dict[str, Dict[str, int]] = {}
+        self.children: Dict[str, "DirectoryNode"] = {}
+    
+    @property
+    def name(self) -> str:
+        """Last path component ("." for the repository root)."""
+        return self.path.rsplit("/", 1)[-1] if self.path else "."
+    
+    def _apply(self, language: str, files: int, lines: int) -> None:
+        self.files += files
+        self.lines += lines
+        stats = self.languages.setdefault(language, {"files": 0, "lines": 0})
+        stats["files"] += files
+        stats["lines"] += lines
+        if not stats["files"]:
+            del self.languages[language]
+    
+    def directory_count(self) -> int:
+        """Number of directories below this one."""
+        return sum(1 + child.directory_count() for child in self.children.values())
+    
+    def primary_language(self) -> str:
+        """Language with the most lines, or an empty string."""
+        if not self.languages:
+            return ""
+        return max(self.languages.items(), key=lambda item: (item[1]["lines"], item[0]))[0]
+    
+    def to_dict(self, depth: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Convert to dictionary for JSON serialization.
+        
+        Args:
+            depth: Levels of children to include (None for all)
+        """
+        data: Dict[str, Any] = {
+            "path": self.path,
+            "files": self.files,
+            "lines": self.lines,
+            "languages": self.languages,
+        }
+        if depth is None or depth > 0:
+            data["children"] = [
+                child.to_dict(None if depth is None else depth - 1)
+                for _, child in sorted(self.children.items())
+            ]
+        return data
+
+
+class RollupTree:
+    """
+    Directory rollup index for one repository.
+    
+    Files are keyed by their repository-relative POSIX path. The tree also
+    records the git commit it reflects and which files differed from that
+    commit when it was built, so it can be brought up to date by
+    ``refresh_from_git``.
+    
+    Example:
+        tree = RollupTree.from_analyses(repo, analyses)
+        src = tree.to_directory_analysis(repo, "src")
+    """
+    
+    def __init__(self, exclude_patterns: Sequence[str] = ()):
+        self.root = DirectoryNode("")
+        self.exclude_patterns = list(exclude_patterns)
+        self.base_commit: Optional[str] = None
+        self.dirty: Set[str] = set()
+        self._files: Dict[str, Tuple[int, str]] = {}
+    
+    @classmethod
+    def from_analyses(
+        cls,
+        repository_path: Path,
+        analyses: Iterable[FileAnalysis],
+        exclude_patterns: Sequence[str] = ()
+    ) -> "RollupTree":
+        """Build a tree from per-file analysis results."""
+        tree = cls(exclude_patterns)
+        root = Path(repository_path).resolve()
+        for analysis in analyses:
+            relative_path = _relative(root, analysis.file_path)
+            tree.set_file(relative_path, analysis.lines_of_code, analysis.language)
+        return tree
+    
+    def __len__(self) -> int:
+        return len(self._files)
+    
+    def __contains__(self, relative_path: str) -> bool:
+        return relative_path in self._files
+    
+    def _ancestors(self, relative_path: str, create: bool) -> List[DirectoryNode]:
+        nodes = [self.root]
+        parts = relative_path.split("/")[:-1]
+        for index, part in enumerate(parts):
+            child = nodes[-1].children.get(part)
+            if child is None:
+                if not create:
+                    break
+                child = DirectoryNode("/".join(parts[:index + 1]))
+                nodes[-1].children[part] = child
+            nodes.append(child)
+        return nodes
+    
+    def set_file(self, relative_path: str, lines: int, language: str) -> None:
+        """
+        Add or update one file, adjusting only its ancestors.
+        
+        Args:
+            relative_path: Repository-relative POSIX path
+            lines: Lines of code in the file
+            language: Detected language of the file
+        """
+        if relative_path in self._files:
+            self.remove_file(relative_path)
+        for node in self._ancestors(relative_path, create=True):
+            node._apply(language, 1, lines)
+        self._files[relative_path] = (lines, language)
+    
+    def remove_file(self, relative_path: str) -> bool:
+        """
+        Remove one file, pruning directories left empty.
+        
+        Returns:
+            True if the file was in the tree
+        """
+        entry = self._files.pop(relative_path, None)
+        if entry is None:
+            return False
+        lines, language = entry
+        nodes = self._ancestors(relative_path, create=False)
+        for node in nodes:
+            node._apply(language, -1, -lines)
+        for parent, node in zip(reversed(nodes[:-1]), reversed(nodes[1:])):
+            if node.files:
+                break
+            del parent.children[node.name]
+        return True
+    
+    def node(self, relative_dir: str = "") -> Optional[DirectoryNode]:
+        """Return the node for a repository-relative directory, if present."""
+        current = self.root
+        for part in filter(None, relative_dir.strip("/").split("/")):
+            current = current.children.get(part)
+            if current is None:
+                return None
+        return current
+    
+    def walk(
+        self,
+        relative_dir: str = "",
+        depth: Optional[int] = None
+    ) -> Iterator[Tuple[int, DirectoryNode]]:
+        """
+        Yield ``(level, node)`` pairs below a directory in sorted order.
+        
+        Args:
+            relative_dir: Directory to start from (the repository root by default)
+            depth: Deepest level to yield, relative to the start (None for all)
+        """
+        start = self.node(relative_dir)
+        if start is None:
+            return
+        stack = [(0, start)]
+        while stack:
+            level, node = stack.pop()
+            yield level, node
+            if depth is None or level < depth:
+                children = sorted(node.children.items(), reverse=True)
+                stack.extend((level + 1, child) for _, child in children)
+    
+    def to_directory_analysis(
+        self,
+        repository_path: Path,
+        relative_dir: str = ""
+    ) -> Optional[DirectoryAnalysis]:
+        """Summarize a subtree as a DirectoryAnalysis, or None if it is unknown."""
+        node = self.node(relative_dir)
+        if node is None:
+            return None
+        return DirectoryAnalysis(
+            directory_path=Path(repository_path) / node.path,
+            total_files=node.files,
+            total_directories=node.directory_count(),
+            total_lines=node.lines,
+            languages={lang: dict(stats) for lang, stats in node.languages.items()},
+            primary_language=node.primary_language()
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization (per-file form)."""
+        return {
+            "version": ROLLUP_VERSION,
+            "base_commit": self.base_commit,
+            "exclude_patterns": self.exclude_patterns,
+            "dirty": sorted(self.dirty),
+            "files": {path: list(entry) for path, entry in sorted(self._files.items())},
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RollupTree":
+        """Rebuild a tree from the output of ``to_dict``."""
+        tree = cls(data.get("exclude_patterns", []))
+        tree.base_commit = data.get("base_commit")
+        tree.dirty = set(data.get("dirty", []))
+        for path, (lines, language) in data["files"].items():
+            tree.set_file(path, lines, language)
+        return tree
+    
+    def save(self, output: Path) -> None:
+        """Write the tree to a JSON file (atomically replacing it)."""
+        output.parent.mkdir(parents=True, exist_ok=True)
+        temporary = output.with_suffix(".tmp")
+        temporary.write_text(json.dumps(self.to_dict(), separators=(",", ":")))
+        temporary.replace(output)
+    
+    @classmethod
+    def load(cls, source: Path) -> Optional["RollupTree"]:
+        """Load a saved tree, or None if it is missing, unreadable or outdated."""
+        try:
+            data = json.loads(source.read_text())
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != ROLLUP_VERSION:
+            return None
+        return cls.from_dict(data)
+
+
+def _relative(root: Path, file_path: Path) -> str:
+    return Path(file_path).resolve().relative_to(root).as_posix()
+
+
+def rollup_path(database_path: Path, repository_path: Path) -> Path:
+    """Return where the rollup tree of a repository is stored, next to the database."""
+    key = hashlib.blake2b(str(Path(repository_path).resolve()).encode(), digest_size=8).hexdigest()
+    return Path(database_path).parent / "rollups" / f"{key}.json"
+
+
+def refresh_from_git(
+    tree: RollupTree,
+    repository_path: Path,
+    analyze: Callable[[Path], FileAnalysis]
+) -> int:
+    """
+    Bring a saved tree up to date by re-analyzing only changed files.
+    
+    Files changed since the tree's base commit, and files that were dirty
+    when it was saved, are re-analyzed (or removed if gone); then the base
+    moves to ``HEAD``.
+    
+    Args:
+        tree: Tree with a ``base_commit``
+        repository_path: Repository the tree describes
+        analyze: Per-file analysis function (e.g. ``analyzer.analyze_file``)
+        
+    Returns:
+        Number of files updated or removed
+        
+    Raises:
+        GitReferenceError: If the repository or base commit cannot be resolved
+    """
+    if tree.base_commit is None:
+        raise ValueError("Rollup tree has no base commit to refresh from")
+    
+    root = Path(repository_path).resolve()
+    rules = IgnoreRules("", ALWAYS_EXCLUDED + tree.exclude_patterns)
+    since = changed_files(root, tree.base_commit)
+    
+    stale = {_relative(root, p) for p in since.changed + since.removed} | tree.dirty
+    updated = 0
+    for relative_path in sorted(stale):
+        path = root / relative_path
+        if path.is_file() and not rules.decide(relative_path):
+            analysis = analyze(path)
+            tree.set_file(relative_path, analysis.lines_of_code, analysis.language)
+            updated += 1
+        elif tree.remove_file(relative_path):
+            updated += 1
+    
+    attach_git_base(tree, root)
+    return updated
+
+
+def attach_git_base(tree: RollupTree, repository_path: Path) -> ChangeSet:
+    """
+    Record ``HEAD`` and the files differing from it as the tree's base.
+    
+    Call after building a tree from a full scan so it can later be
+    refreshed with ``refresh_from_git``.
+    
+    Returns:
+        The working tree changes relative to ``HEAD``
+        
+    Raises:
+        GitReferenceError: If the path is not inside a git repository
+    """
+    root = Path(repository_path).resolve()
+    current = changed_files(root, "HEAD")
+    tree.base_commit = current.base_commit
+    tree.dirty = {_relative(root, p) for p in current.changed + current.removed}
+    return current
\ No newline at end of file
@@ -0,0 +1,245 @@
+"""
+High-throughput engine for ``analyze structure``.
+
+Structure analysis only needs each file's language and line counts, so
+this engine bypasses the general analyzer path: no ParsedFile, no
+decoding and no FileAnalysis objects. Languages come from the lookup
+tables in ``utils.file_utils`` (extension, file name, then shebang);
+lines are counted over the raw bytes with ``count_lines``, and blank and
+comment lines are classified per language with byte-level regular
+expressions, falling back to a line scan only for files that contain
+block comments. Files are counted in parallel batches.
+
+Results match the general path: ``StructureSummary.to_directory_analysis``
+equals the DirectoryAnalysis built from ``FileAnalysis.lines_of_code``.
+"""
+
+import math
+import mmap
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from ..utils.file_access import SNIFF_BYTES, count_lines, get_max_file_size, looks_binary
+from ..utils.file_utils import language_for_name
+from .base import DirectoryAnalysis
+from .executor import PARALLEL_THRESHOLD, default_jobs
+from .rollup import RollupTree
+
+
+#: Line comment prefixes and block comment delimiters per language.
+COMMENT_SYNTAX: Dict[str, Tuple[Tuple[bytes, ...], Optional[Tuple[bytes, bytes]]]] = {
+    "python": ((b"#",), None),
+    "javascript": ((b"//",), (b"/*", b"*/")),
+    "typescript": ((b"//",), (b"/*", b"*/")),
+    "java": ((b"//",), (b"/*", b"*/")),
+    "go": ((b"//",), (b"/*", b"*/")),
+    "rust": ((b"//",), (b"/*", b"*/")),
+    "c": ((b"//",), (b"/*", b"*/")),
+    "cpp": ((b"//",), (b"/*", b"*/")),
+    "markdown": ((), (b"<!--", b"-->")),
+}
+
+_NO_COMMENTS: Tuple[Tuple[bytes, ...], Optional[Tuple[bytes, bytes]]] = ((), None)
+
+# Patterns start at the preceding "\n" rather than "^" so the regex engine
+# can jump between newlines instead of trying every position
+_BLANK_LINES = re.compile(rb"\n[ \t\x0b\x0c]*(?=\n)")
+
+_COMMENT_LINES = {
+    prefixes: re.compile(
+        rb"\n[ \t\x0b\x0c]*(?:" + b"|".join(re.escape(p) for p in prefixes) + rb")"
+    )
+    for prefixes, _ in COMMENT_SYNTAX.values() if prefixes
+}
+
+
+class FileCounts(NamedTuple):
+    """Language and line counts of one file."""
+    language: str
+    lines: int
+    blank: int = 0
+    comment: int = 0
+
+
+@dataclass
+class LineBreakdown:
+    """Code, comment and blank line totals for one language."""
+    code: int = 0
+    comment: int = 0
+    blank: int = 0
+    
+    def add(self, counts: FileCounts) -> None:
+        self.code += counts.lines - counts.blank - counts.comment
+        self.comment += counts.comment
+        self.blank += counts.blank
+    
+    def to_dict(self) -> Dict[str, int]:
+        """Convert to dictionary for JSON serialization."""
+        return {"code": self.code, "comment": self.comment, "blank": self.blank}
+
+
+@dataclass
+class StructureSummary:
+    """Directory rollups of a repository plus per-language line breakdowns."""
+    tree: RollupTree
+    breakdown: Dict[str, LineBreakdown] = field(default_factory=dict)
+    
+    def to_directory_analysis(self, repository_path: Path) -> DirectoryAnalysis:
+        """Summarize the whole repository as a DirectoryAnalysis."""
+        analysis = self.tree.to_directory_analysis(repository_path)
+        assert analysis is not None
+        return analysis
+
+
+def classify_lines(data: bytes, language: str) -> Tuple[int, int]:
+    """
+    Count the blank and comment lines of a file.
+    
+    Line boundaries follow ``count_lines``. A line is blank if it holds
+    only whitespace, and a comment line if its first non-blank text is a
+    line comment or it lies in a block comment. Python docstrings count
+    as code.
+    
+    Args:
+        data: Raw file contents
+        language: Language name from ``detect_language``
+        
+    Returns:
+        ``(blank, comment)`` line counts
+    """
+    if b"\r" in data:
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    prefixes, block = COMMENT_SYNTAX.get(language, _NO_COMMENTS)
+    if block is not None and block[0] in data:
+        return _scan_lines(data, prefixes, block)
+    lines = b"\n" + data
+    blank = len(_BLANK_LINES.findall(lines))
+    tail = data[data.rfind(b"\n") + 1:]
+    if tail and not tail.strip():
+        blank += 1
+    comment = len(_COMMENT_LINES[prefixes].findall(lines)) if prefixes else 0
+    return blank, comment
+
+
+def _scan_lines(data: bytes, prefixes: Tuple[bytes, ...], block: Tuple[bytes, bytes]) -> Tuple[int, int]:
+    opener, closer = block
+    blank = comment = 0
+    in_block = False
+    lines = data.split(b"\n")
+    if not lines[-1]:
+        lines.pop()
+    for line in lines:
+        text = line.strip()
+        if not text:
+            blank += 1
+        elif in_block:
+            comment += 1
+            in_block = text.rfind(closer) < text.rfind(opener) or closer not in text
+        elif prefixes and text.startswith(prefixes):
+            comment += 1
+        elif text.startswith(opener):
+            comment += 1
+            in_block = closer not in text[len(opener):]
+        else:
+            # Code line; a block comment opened at its end continues below
+            start = text.rfind(opener)
+            in_block = start >= 0 and closer not in text[start + len(opener):]
+    return blank, comment
+
+
+def count_file(path: str, max_file_size: Optional[int] = None) -> FileCounts:
+    """
+    Detect a file's language and count its lines from the raw bytes.
+    
+    Binary files count zero lines and oversized files only their total,
+    as in the general analysis path (see ``utils.file_access``).
+    
+    Args:
+        path: File to count
+        max_file_size: Largest file to classify (default: ``get_max_file_size()``)
+    """
+    limit = get_max_file_size() if max_file_size is None else max_file_size
+    name = os.path.basename(path)
+    try:
+        with open(path, "rb") as handle:
+            head = handle.read(SNIFF_BYTES)
+            language = language_for_name(name, head)
+            if looks_binary(head):
+                return FileCounts(language, 0)
+            if os.fstat(handle.fileno()).st_size > limit:
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return FileCounts(language, count_lines(mapped))
+            data = head + handle.read()
+    except OSError:
+        return FileCounts(language_for_name(name), 0)
+    return FileCounts(language, count_lines(data), *classify_lines(data, language))
+
+
+def _count_chunk(paths: Sequence[str], max_file_size: int) -> List[FileCounts]:
+    return [count_file(path, max_file_size) for path in paths]
+
+
+def iter_counts(files: Sequence[str], jobs: Optional[int] = None) -> Iterator[FileCounts]:
+    """
+    Count many files, on a process pool when there are enough of them.
+    
+    Args:
+        files: File paths
+        jobs: Number of worker processes (default: CPU count)
+        
+    Yields:
+        FileCounts in the same order as ``files``, as batches complete
+    """
+    jobs = jobs or default_jobs()
+    limit = get_max_file_size()
+    if jobs <= 1 or len(files) < PARALLEL_THRESHOLD:
+        for path in files:
+            yield count_file(path, limit)
+        return
+    # Counting is cheap per file, so send few large batches
+    size = math.ceil(len(files) / (jobs * 4))
+    chunks = [files[i:i + size] for i in range(0, len(files), size)]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(chunks))) as pool:
+        for counts in pool.map(_count_chunk, chunks, [limit] * len(chunks)):
+            yield from counts
+
+
+def summarize_structure(
+    repository_path: Path,
+    files: Iterable[Path],
+    jobs: Optional[int] = None,
+    exclude_patterns: Sequence[str] = (),
+    on_file: Optional[Callable[[str, FileCounts], None]] = None
+) -> StructureSummary:
+    """
+    Count a repository's files and build its structure summary.
+    
+    Args:
+        repository_path: Repository root the files were scanned from
+        files: Files to count, e.g. from ``scan_repository``
+        jobs: Number of worker processes (default: CPU count)
+        exclude_patterns: Patterns the files were scanned with, recorded in
+            the rollup tree
+        on_file: Called with each file's repository-relative path and
+            counts as soon as it is counted, in input order
+            
+    Returns:
+        StructureSummary with the rollup tree and line breakdowns
+    """
+    root = os.path.abspath(repository_path)
+    prefix = root.rstrip(os.sep) + os.sep
+    paths = [os.path.abspath(f) for f in files]
+    tree = RollupTree(exclude_patterns)
+    breakdown: Dict[str, LineBreakdown] = {}
+    for path, counts in zip(paths, iter_counts(paths, jobs)):
+        relative_path = path[len(prefix):] if path.startswith(prefix) else os.path.relpath(path, root)
+        relative_path = relative_path.replace(os.sep, "/")
+        tree.set_file(relative_path, counts.lines, counts.language)
+        breakdown.setdefault(counts.language, LineBreakdown()).add(counts)
+        if on_file is not None:
+            on_file(relative_path, counts)
+    return StructureSummary(tree, breakdown)
\ No newline at end of file
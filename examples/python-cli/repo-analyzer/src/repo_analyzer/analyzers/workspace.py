@@ -0,0 +1,269 @@
+"""
+Resident analysis state for one repository.
+
+Used by the analysis daemon: per-file results of every analyzer are kept
+in memory and updated from file system changes, so answering a request
+only re-analyzes the files modified since the previous one and then
+aggregates. Repository-level results are memoized until the next change.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from ..utils.file_utils import scan_repository
+from ..utils.profiling import get_profiler
+from .base import BaseAnalyzer, FileAnalysis
+from .pipeline import analyze_all
+
+if TYPE_CHECKING:
+    from ..storage.cache import AnalysisCache
+    from .import_graph import ImportGraph
+    from ..utils.watcher import FileChanges
+
+
+logger = logging.getLogger(__name__)
+
+#: ``(mtime_ns, size)`` recorded for each file when it was analyzed.
+_Signature = Tuple[int, int]
+
+#: Analyzer whose per-file imports feed ``Workspace.import_graph``.
+IMPORT_GRAPH_ANALYZER = "dependencies"
+
+
+@dataclass
+class WorkspaceUpdate:
+    """Outcome of applying one batch of file changes."""
+    analyzed: int = 0
+    removed: int = 0
+    rescanned: bool = False
+    seconds: float = 0.0
+    
+    def __bool__(self) -> bool:
+        return bool(self.analyzed or self.removed)
+
+
+class Workspace:
+    """
+    In-memory per-file results of several analyzers over one repository.
+    
+    Files are identified by the paths ``scan_repository`` yields. Changes
+    to known files are re-analyzed directly; anything else (new files,
+    directories, ``.gitignore`` edits, polling) triggers a rescan that
+    compares each file's modification time and size with the ones
+    recorded at analysis time.
+    """
+    
+    def __init__(
+        self,
+        repository_path: Path,
+        analyzers: Dict[str, BaseAnalyzer],
+        exclude_patterns: Sequence[str] = (),
+        caches: Optional[Dict[str, "AnalysisCache"]] = None,
+        jobs: Optional[int] = None
+    ):
+        """
+        Create an empty workspace; call ``load`` to analyze the repository.
+        
+        Args:
+            repository_path: Repository root
+            analyzers: Analyzers keyed by name, as for ``analyze_all``
+            exclude_patterns: Gitignore-style patterns to exclude
+            caches: Optional persistent result caches keyed by analyzer name,
+                used for the initial load and updated with every change
+            jobs: Number of worker processes (default: CPU count)
+        """
+        self.root = Path(repository_path).resolve()
+        self.analyzers = analyzers
+        self.exclude_patterns = list(exclude_patterns)
+        self.caches = caches or {}
+        self.jobs = jobs
+        self.generation = 0
+        self.updated_at = 0.0
+        self._signatures: Dict[Path, _Signature] = {}
+        self._results: Dict[str, Dict[Path, FileAnalysis]] = {name: {} for name in analyzers}
+        self._memo: Dict[Tuple[Any, ...], Any] = {}
+        self._graph: Optional["ImportGraph"] = None
+    
+    @property
+    def files(self) -> List[Path]:
+        """Analyzed files in scan order."""
+        return list(self._signatures)
+    
+    def directories(self) -> Set[Path]:
+        """Directories containing analyzed files, plus the root."""
+        return {self.root} | {path.parent for path in self._signatures}
+    
+    def analyses(self, name: str) -> List[FileAnalysis]:
+        """Per-file results of one analyzer, in scan order."""
+        results = self._results[name]
+        return [results[path] for path in self._signatures if path in results]
+    
+    def load(self) -> WorkspaceUpdate:
+        """Scan and analyze the whole repository (cached results are reused)."""
+        self._signatures.clear()
+        for results in self._results.values():
+            results.clear()
+        return self._rescan(set())
+    
+    def apply(self, changes: "FileChanges") -> WorkspaceUpdate:
+        """
+        Bring the results up to date with a batch of file changes.
+        
+        Args:
+            changes: Paths reported by a watcher, or a rescan request
+            
+        Returns:
+            WorkspaceUpdate describing the work done
+        """
+        paths = {Path(path) for path in changes.paths}
+        if changes.rescan or any(
+            path not in self._signatures or path.name == ".gitignore" for path in paths
+        ):
+            return self._rescan(paths)
+        
+        start = time.perf_counter()
+        modified: Dict[Path, _Signature] = {}
+        removed = []
+        for path in paths:
+            signature = _signature(path)
+            if signature is None:
+                removed.append(path)
+            elif signature != self._signatures[path]:
+                modified[path] = signature
+        return self._update(modified, removed, None, start)
+    
+    def _rescan(self, paths: Set[Path]) -> WorkspaceUpdate:
+        """Rescan the repository and re-analyze new and modified files."""
+        start = time.perf_counter()
+        with get_profiler().phase("scan"):
+            scanned = {
+                file: (file.mtime_ns, file.size)
+                for file in scan_repository(self.root, exclude_patterns=self.exclude_patterns)
+            }
+        modified = {
+            path: signature for path, signature in scanned.items()
+            if self._signatures.get(path) != signature
+            or (path in paths and path in self._signatures)
+        }
+        removed = [path for path in self._signatures if path not in scanned]
+        update = self._update(modified, removed, scanned, start)
+        update.rescanned = True
+        return update
+    
+    def _update(
+        self,
+        modified: Dict[Path, _Signature],
+        removed: List[Path],
+        scanned: Optional[Dict[Path, _Signature]],
+        start: float
+    ) -> WorkspaceUpdate:
+        if removed or any(path not in self._signatures for path in modified):
+            # Module names and import resolution depend on the set of files
+            self._graph = None
+        for path in removed:
+            del self._signatures[path]
+            for results in self._results.values():
+                results.pop(path, None)
+        
+        if modified:
+            with get_profiler().phase("analyze"):
+                per_file = analyze_all(
+                    self.analyzers, list(modified), jobs=self.jobs, caches=self.caches
+                )
+            for name, analyses in per_file.items():
+                self._results[name].update(zip(modified, analyses))
+            if self._graph is not None and IMPORT_GRAPH_ANALYZER in per_file:
+                for path, analysis in zip(modified, per_file[IMPORT_GRAPH_ANALYZER]):
+                    self._graph.set_file(
+                        path.relative_to(self.root).as_posix(), analysis.language, analysis.imports
+                    )
+            for cache in self.caches.values():
+                cache.flush()
+        
+        if scanned is not None:
+            # Keep scan order so aggregate results match a fresh CLI run
+            self._signatures = scanned
+        else:
+            self._signatures.update(modified)
+        
+        update = WorkspaceUpdate(
+            analyzed=len(modified),
+            removed=len(removed),
+            seconds=time.perf_counter() - start
+        )
+        if update or not self.generation:
+            self.generation += 1
+            self.updated_at = time.time()
+            self._memo.clear()
+        if update:
+            logger.info(
+                "Re-analyzed %d files, removed %d (%.0f ms)",
+                update.analyzed, update.removed, update.seconds * 1000
+            )
+        return update
+    
+    def result(self, name: str, **options: Any) -> Any:
+        """
+        Return the repository-level result of one analyzer.
+        
+        Built with the analyzer's ``analyze_repository`` from the resident
+        per-file results, as ``analyze all`` does, and memoized until the
+        next change.
+        
+        Args:
+            name: Analyzer name
+            **options: Extra ``analyze_repository`` arguments, such as
+                ``complexity_threshold``
+        """
+        key = (name, *sorted(options.items()))
+        if key not in self._memo:
+            analyzer = self.analyzers[name]
+            extra: Dict[str, Any] = {"jobs": self.jobs, "changed_files": None, **options}
+            with get_profiler().phase("aggregate"):
+                if name == "structure":
+                    self._memo[key] = analyzer.analyze_repository(
+                        self.root, iter(self.files), analyses=self.analyses(name), **extra
+                    )
+                else:
+                    self._memo[key] = analyzer.analyze_repository(
+                        self.root, analyses=self.analyses(name), **extra
+                    )
+        return self._memo[key]
+    
+    def import_graph(self) -> "ImportGraph":
+        """
+        Return the import graph of the resident dependency results.
+        
+        Built on first use; afterwards, edits to existing files only
+        replace the edges of the modules they changed, while added or
+        removed files cause a rebuild on the next call.
+        """
+        from .import_graph import ImportGraph
+        
+        if self._graph is None:
+            with get_profiler().phase("import-graph"):
+                self._graph = ImportGraph.from_analyses(
+                    self.root, self.analyses(IMPORT_GRAPH_ANALYZER)
+                )
+        return self._graph
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "repository_path": str(self.root),
+            "files": len(self._signatures),
+            "analyzers": list(self.analyzers),
+            "generation": self.generation,
+            "updated_at": self.updated_at
+        }
+
+
+def _signature(path: Path) -> Optional[_Signature]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
\ No newline at end of file
@@ -3,26 +3,96 @@ Main CLI interface for repo-analyzer using Click framework.
 
 This module defines the primary command-line interface structure and
 coordinates with command modules for specific functionality.
+
+Startup is kept light because the tool is often run from hooks: command
+modules (and through them SQLAlchemy, GitPython, NumPy and the analyzers)
+are only imported when their command is invoked, and ``--help`` is
+answered without importing any of them.
 """
 
+import importlib
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import click
-from rich.console import Console
-from rich.table import Table
 
 from . import __version__
-from .commands import analyze, config, history, report
-from .config.manager import ConfigManager
-from .utils.output import setup_logging
+
+if TYPE_CHECKING:
+    from .utils.profiling import Profiler
 
 
-console = Console()
+#: Command groups loaded on first use: name -> (``module:attribute``, short help).
+LAZY_COMMANDS: Dict[str, Tuple[str, str]] = {
+    "analyze": ("repo_analyzer.commands.analyze:analyze", "🔍 Repository analysis commands."),
+    "report": ("repo_analyzer.commands.report:report", "📄 Report generation commands."),
+    "config": ("repo_analyzer.commands.config:config", "⚙️ Configuration management commands."),
+    "history": ("repo_analyzer.commands.history:history", "🕒 Analysis history management."),
+    "serve": ("repo_analyzer.commands.serve:serve", "Run an analysis daemon for a repository."),
+    "daemon": ("repo_analyzer.commands.serve:daemon", "📡 Query a running analysis daemon."),
+    "advisories": (
+        "repo_analyzer.commands.advisories:advisories",
+        "🛡️ Offline vulnerability advisory database."
+    ),
+}
 
 
-@click.group()
+class LazyGroup(click.Group):
+    """
+    Click group whose subcommands are imported when first invoked.
+    
+    Lazy commands are listed in ``--help`` with their registered short
+    help, so listing them does not import their modules either.
+    """
+    
+    def __init__(self, *args, lazy_commands: Optional[Dict[str, Tuple[str, str]]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+    
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+    
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_commands and cmd_name not in self.commands:
+            self.add_command(self._load(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+    
+    def _load(self, cmd_name: str) -> click.Command:
+        import_path, _ = self.lazy_commands[cmd_name]
+        module_name, attribute = import_path.split(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"{import_path} is not a click command")
+        return command
+    
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        names = self.list_commands(ctx)
+        if not names:
+            return
+        limit = formatter.width - 6 - max(len(name) for name in names)
+        rows = []
+        for name in names:
+            command = self.commands.get(name)
+            if command is None:
+                short_help = click.utils.make_default_short_help(self.lazy_commands[name][1], limit)
+            elif command.hidden:
+                continue
+            else:
+                short_help = command.get_short_help_str(limit)
+            rows.append((name, short_help))
+        
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
+
+
+def _console(stderr: bool = False):
+    """Create a Rich console (imported on first use)."""
+    from rich.console import Console
+    return Console(stderr=stderr)
+
+
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS)
 @click.option(
     "--config",
     type=click.Path(exists=True, path_type=Path),
@@ -38,9 +108,57 @@ console = Console()
     is_flag=True, 
     help="Suppress non-essential output"
 )
+@click.option(
+    "--jobs", "-j",
+    type=click.IntRange(min=1),
+    help="Number of worker processes for file analysis [default: CPU count]"
+)
+@click.option(
+    "--readers",
+    type=click.IntRange(min=0),
+    help="Threads reading files ahead of analysis; 0 reads inline [default: 4]"
+)
+@click.option(
+    "--read-ahead",
+    type=click.IntRange(min=1),
+    help="Maximum number of files read ahead of analysis [default: 32]"
+)
+@click.option(
+    "--max-file-size",
+    metavar="SIZE",
+    help="Skip files larger than this, e.g. 512K or 20M [default: 10M]"
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Report phase timings, throughput, slowest files and cache statistics"
+)
+@click.option(
+    "--profile-format",
+    type=click.Choice(["table", "json"], case_sensitive=False),
+    default="table",
+    help="Format of the profiling report (written to stderr)"
+)
+@click.option(
+    "--profile-dump",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Also run cProfile and write pstats data to this file"
+)
 @click.version_option(version=__version__)
 @click.pass_context
-def cli(ctx: click.Context, config: Optional[Path], verbose: bool, quiet: bool):
+def cli(
+    ctx: click.Context,
+    config: Optional[Path],
+    verbose: bool,
+    quiet: bool,
+    jobs: Optional[int],
+    readers: Optional[int],
+    read_ahead: Optional[int],
+    max_file_size: Optional[str],
+    profile: bool,
+    profile_format: str,
+    profile_dump: Optional[Path]
+):
     """
     🔍 Repo Analyzer - Comprehensive repository analysis tool
     
@@ -52,6 +170,10 @@ def cli(ctx: click.Context, config: Optional[Path], verbose: bool, quiet: bool):
         repo-analyzer report summary --format html
         repo-analyzer config init --preset python
     """
+    from .analyzers.executor import default_jobs
+    from .config.manager import ConfigManager
+    from .utils.output import setup_logging
+    
     # Ensure context object exists
     ctx.ensure_object(dict)
     
@@ -68,12 +190,39 @@ def cli(ctx: click.Context, config: Optional[Path], verbose: bool, quiet: bool):
     
     ctx.obj["verbose"] = verbose
     ctx.obj["quiet"] = quiet
+    ctx.obj["jobs"] = jobs or default_jobs()
+    
+    if readers is not None or read_ahead is not None:
+        from .analyzers.reader import ReaderSettings, get_reader_settings, set_reader_settings
+        defaults = get_reader_settings()
+        set_reader_settings(ReaderSettings(
+            readers=defaults.readers if readers is None else readers,
+            read_ahead=defaults.read_ahead if read_ahead is None else read_ahead
+        ))
+    
+    max_file_size = max_file_size or ctx.obj["config"].get("analysis", {}).get("max_file_size")
+    if max_file_size is not None:
+        from .utils.file_access import parse_size, set_max_file_size
+        try:
+            set_max_file_size(parse_size(str(max_file_size)))
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint="--max-file-size")
+    
+    if profile or profile_dump:
+        from .utils.profiling import Profiler, set_profiler
+        profiler = set_profiler(Profiler(cprofile=profile_dump is not None))
+        profiler.start()
+        ctx.call_on_close(
+            lambda: _emit_profile(profiler, profile_format, profile_dump)
+        )
 
 
 @cli.command()
 @click.pass_context
 def info(ctx: click.Context):
     """Display system information and configuration status."""
+    from rich.table import Table
+    
     config = ctx.obj["config"]
     
     # Create information table
@@ -86,14 +235,25 @@ def info(ctx: click.Context):
     table.add_row("Config Source", str(config.get("config_source", "default")))
     table.add_row("Supported Languages", ", ".join(config.get("supported_languages", [])))
     
-    console.print(table)
+    _console().print(table)
 
 
-# Register command groups
-cli.add_command(analyze.analyze)
-cli.add_command(report.report)
-cli.add_command(config.config)
-cli.add_command(history.history)
+def _emit_profile(profiler: "Profiler", output_format: str, dump_path: Optional[Path]):
+    """Write the profiling report to stderr once the command has finished."""
+    from .utils.profiling import set_profiler
+    
+    profiler.stop()
+    if dump_path is not None:
+        profiler.dump_stats(dump_path)
+    
+    err_console = _console(stderr=True)
+    if output_format == "json":
+        import json
+        err_console.print_json(json.dumps(profiler.to_dict()))
+    else:
+        profiler.render(err_console)
+    
+    set_profiler(None)
 
 
 def main():
@@ -101,10 +261,10 @@ def main():
     try:
         cli()
     except KeyboardInterrupt:
-        console.print("\n[yellow]Operation cancelled by user[/yellow]")
+        _console().print("\n[yellow]Operation cancelled by user[/yellow]")
         sys.exit(1)
     except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
+        _console().print(f"[red]Error: {e}[/red]")
         sys.exit(1)
 
 
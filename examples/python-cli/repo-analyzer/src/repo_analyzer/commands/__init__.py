@@ -6,6 +6,8 @@ This package contains all command group implementations:
 - report: Report generation and export commands  
 - config: Configuration management commands
 - history: Analysis history management commands
+- serve: Analysis daemon and its clients
+- advisories: Offline vulnerability advisory database
 """
 
-__all__ = ["analyze", "report", "config", "history"]
\ No newline at end of file
+__all__ = ["analyze", "report", "config", "history", "serve", "advisories"]
\ No newline at end of file
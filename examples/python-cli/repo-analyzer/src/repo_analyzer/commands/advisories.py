@@ -0,0 +1,117 @@
+"""
+Advisories command group implementation.
+
+Provides commands for importing OSV vulnerability advisories into the
+local advisory database used by ``analyze dependencies
+--check-vulnerabilities``, so vulnerability checks work without network
+access.
+"""
+
+import json
+from pathlib import Path
+from typing import Tuple
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from ..storage.advisories import AdvisoryDatabase, advisory_path
+from ..storage.cache import DEFAULT_DATABASE_PATH
+
+
+console = Console()
+status_console = Console(stderr=True)
+
+
+@click.group()
+def advisories():
+    """🛡️ Offline vulnerability advisory database."""
+    pass
+
+
+@advisories.command()
+@click.argument(
+    "sources",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, path_type=Path)
+)
+@click.option(
+    "--replace",
+    is_flag=True,
+    help="Remove every stored advisory before loading"
+)
+@click.pass_context
+def load(ctx: click.Context, sources: Tuple[Path, ...], replace: bool):
+    """
+    Import OSV advisories from JSON files, directories or zip archives.
+    
+    Download the dumps once, e.g. https://osv-vulnerabilities.storage.googleapis.com/PyPI/all.zip,
+    and load them on machines without network access. Advisories already
+    stored are replaced by newer copies with the same id.
+    
+    Example:
+        repo-analyzer advisories load PyPI.zip npm.zip
+    """
+    with _open_advisories(ctx) as db:
+        if replace:
+            db.clear()
+        with status_console.status("Loading advisories..."):
+            stats = db.load(sources)
+    
+    for error in stats.errors:
+        status_console.print(f"[yellow]Skipped {error}[/yellow]")
+    console.print(
+        f"[green]Loaded {stats.advisories:,} advisories[/green] "
+        f"({stats.ranges:,} version ranges, {stats.versions:,} listed versions"
+        + (f", {stats.withdrawn:,} withdrawn" if stats.withdrawn else "")
+        + ")"
+    )
+
+
+@advisories.command()
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["terminal", "json"], case_sensitive=False),
+    default="terminal",
+    help="Output format"
+)
+@click.pass_context
+def info(ctx: click.Context, output_format: str):
+    """
+    Show what the advisory database contains.
+    
+    Example:
+        repo-analyzer advisories info
+    """
+    with _open_advisories(ctx) as db:
+        details = db.info()
+    
+    if output_format == "json":
+        # Plain echo: Rich would wrap long lines and highlight the payload
+        click.echo(json.dumps(details, indent=2, default=str))
+        return
+    
+    table = Table(title="🛡️ Advisory Database", show_header=True)
+    table.add_column("Ecosystem", style="cyan")
+    table.add_column("Advisories", justify="right")
+    for ecosystem, count in details["ecosystems"].items():
+        table.add_row(ecosystem, f"{count:,}")
+    console.print(table)
+    console.print(
+        f"{details['advisories']:,} advisories in {details['path']}"
+        + (f", loaded {details['loaded_at']}" if details["loaded_at"] else "")
+    )
+
+
+def _open_advisories(ctx: click.Context) -> AdvisoryDatabase:
+    """Open the advisory database configured for this invocation."""
+    return AdvisoryDatabase(advisory_database_path(ctx.obj["config"]))
+
+
+def advisory_database_path(config: dict) -> Path:
+    """Return ``advisory_database_path`` from the config, or the default next to the analysis database."""
+    if config.get("advisory_database_path"):
+        return Path(config["advisory_database_path"])
+    return advisory_path(Path(config.get("database_path", DEFAULT_DATABASE_PATH)))
\ No newline at end of file
@@ -3,22 +3,72 @@ Analysis command group implementation.
 
 Provides commands for analyzing repository structure, dependencies,
 complexity, quality, patterns, and security.
+
+GitPython and SQLAlchemy are imported by the functions that use them, so
+commands that touch neither git nor the history database start quickly.
 """
 
+from dataclasses import replace
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import click
 from rich.console import Console
+from rich.markup import escape
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
+from rich.text import Text
 
+from ..analyzers.executor import analyze_changes, analyze_files
 from ..analyzers.factory import AnalyzerFactory
-from ..storage.database import DatabaseManager
+from ..analyzers.import_graph import ImportGraph
+from ..analyzers.pipeline import iter_all
+from ..analyzers.results import ResultStore, write_json_document
+from ..storage.cache import DEFAULT_DATABASE_PATH, AnalysisCache, analysis_cache_options
 from ..utils.file_utils import scan_repository
+from ..utils.profiling import get_profiler
+
+if TYPE_CHECKING:
+    from ..analyzers.base import BaseAnalyzer
+    from ..analyzers.lockfiles import LockfileGraph
+    from ..analyzers.rollup import RollupTree
+    from ..storage.advisories import Vulnerability
+    from ..utils.git_utils import ChangeSet
 
 
 console = Console()
+status_console = Console(stderr=True)
+
+#: Functions listed by the complexity table unless ``--limit`` says otherwise.
+DEFAULT_FUNCTION_LIMIT = 50
+
+#: Rows per printed complexity table page.
+TABLE_PAGE_SIZE = 500
+
+#: Import cycles listed by the dependency report.
+MAX_CYCLES_SHOWN = 20
+
+
+def changed_since_option(command):
+    """Add the shared ``--changed-since`` option to an analyze subcommand."""
+    return click.option(
+        "--changed-since",
+        metavar="REF",
+        help="Only analyze files changed since this git commit/branch"
+    )(command)
+
+
+def format_option(*formats: str):
+    """Add the shared ``--format`` option with the given output formats."""
+    def decorator(command):
+        return click.option(
+            "--format",
+            "output_format",
+            type=click.Choice(list(formats), case_sensitive=False),
+            default="terminal",
+            help="Output format (ndjson streams one JSON record per line as files are analyzed)"
+        )(command)
+    return decorator
 
 
 @click.group()
@@ -34,19 +84,27 @@ def analyze():
     multiple=True, 
     help="Patterns to exclude (can be used multiple times)"
 )
+@format_option("terminal", "json", "ndjson")
+@click.option(
+    "--depth",
+    type=click.IntRange(min=0),
+    help="Show per-directory rollups down to this many levels"
+)
 @click.option(
-    "--format", 
-    "output_format",
-    type=click.Choice(["terminal", "json"], case_sensitive=False),
-    default="terminal",
-    help="Output format"
+    "--subtree",
+    metavar="DIR",
+    help="Report only on this directory (relative to the repository)"
 )
+@changed_since_option
 @click.pass_context
 def structure(
     ctx: click.Context, 
     repository_path: Path, 
     exclude: tuple, 
-    output_format: str
+    output_format: str,
+    depth: Optional[int],
+    subtree: Optional[str],
+    changed_since: Optional[str]
 ):
     """
     Analyze repository structure and file organization.
@@ -54,10 +112,84 @@ def structure(
     Examines directory structure, file types, language distribution,
     and organization patterns to provide insights into project layout.
     
+    Every run saves a per-directory rollup tree. With ``--depth`` or
+    ``--subtree`` the saved tree is refreshed from git (re-analyzing only
+    changed files) and queried instead of rescanning the repository.
+    With ``--changed-since`` only the changed files are counted and
+    reported, and the saved tree is left as it is.
+    
     Example:
         repo-analyzer analyze structure ./my-project --exclude "*.pyc" --exclude "__pycache__"
+        repo-analyzer analyze structure ./my-project --subtree src --depth 2
     """
+    if output_format == "ndjson" and (depth is not None or subtree):
+        raise click.UsageError("--format ndjson cannot be combined with --depth or --subtree")
+    
     config = ctx.obj["config"]
+    change_set = _resolve_changes(ctx, repository_path, changed_since)
+    exclude_patterns = list(exclude) + config.get("exclude_patterns", [])
+    db_path = Path(config.get("database_path", DEFAULT_DATABASE_PATH))
+    
+    if output_format == "ndjson":
+        tree = _stream_structure(ctx, repository_path, exclude_patterns, change_set)
+        if change_set is None:
+            _save_rollup(tree, repository_path, db_path)
+        return
+    
+    relative_dir = (subtree or "").strip("/")
+    
+    # Depth and subtree queries are answered from the saved rollup tree
+    analysis_result = tree = breakdown = None
+    if (depth is not None or subtree) and change_set is None:
+        with get_profiler().phase("rollup-refresh"):
+            structure_analyzer = AnalyzerFactory().get_structure_analyzer()
+            tree = _refresh_rollup(ctx, repository_path, structure_analyzer, exclude_patterns)
+    
+    if tree is None:
+        analysis_result, tree, breakdown = _scan_structure(
+            ctx, repository_path, exclude_patterns, change_set
+        )
+        # A changed-files tree covers part of the repository; keep the saved one
+        if change_set is None:
+            _save_rollup(tree, repository_path, db_path)
+    
+    if analysis_result is None or relative_dir:
+        analysis_result = tree.to_directory_analysis(repository_path, relative_dir)
+        if analysis_result is None:
+            raise click.BadParameter(
+                f"No analyzed files below {relative_dir}", param_hint="--subtree"
+            )
+    
+    with get_profiler().phase("render"):
+        if output_format == "json":
+            data = analysis_result.to_dict()
+            if depth is not None:
+                data["directories"] = tree.node(relative_dir).to_dict(depth)
+            _echo_json(data)
+        else:
+            # Display terminal formatted results
+            _display_structure_analysis(analysis_result, None if relative_dir else breakdown)
+            if depth is not None:
+                _display_directory_rollup(tree, relative_dir, depth)
+
+
+def _scan_structure(
+    ctx: click.Context,
+    repository_path: Path,
+    exclude_patterns: list,
+    change_set: Optional["ChangeSet"] = None
+) -> Tuple[Any, "RollupTree", Dict[str, Any]]:
+    """
+    Scan and count the repository with the structure engine.
+    
+    With a change set only the changed files are counted, so the result
+    describes the files a ``--changed-since`` run touched.
+    
+    Returns:
+        The structure result, the rollup tree and the per-language line
+        breakdown
+    """
+    from ..analyzers.structure_engine import summarize_structure
     
     with Progress(
         SpinnerColumn(),
@@ -66,30 +198,112 @@ def structure(
     ) as progress:
         task = progress.add_task("Scanning repository structure...", total=None)
         
-        # Scan repository files
-        files = scan_repository(
-            repository_path, 
-            exclude_patterns=list(exclude) + config.get("exclude_patterns", [])
+        # Stream repository files; excluded directories are pruned up front
+        files = _changed_files(
+            scan_repository(repository_path, exclude_patterns=exclude_patterns), change_set
         )
         
         progress.update(task, description="Analyzing file types...")
         
-        # Analyze file structure
-        analyzer_factory = AnalyzerFactory()
-        structure_analyzer = analyzer_factory.get_structure_analyzer()
+        with get_profiler().phase("analyze"):
+            summary = summarize_structure(
+                repository_path, files, jobs=ctx.obj["jobs"], exclude_patterns=exclude_patterns
+            )
+    
+    return summary.to_directory_analysis(repository_path), summary.tree, summary.breakdown
+
+
+def _stream_structure(
+    ctx: click.Context,
+    repository_path: Path,
+    exclude_patterns: list,
+    change_set: Optional["ChangeSet"] = None
+) -> "RollupTree":
+    """
+    Write ``analyze structure`` as NDJSON and return the rollup tree.
+    
+    With a change set only the changed files are counted and written.
+    """
+    from ..analyzers.structure_engine import FileCounts, summarize_structure
+    from ..utils.ndjson import NdjsonWriter, summary_record
+    
+    files = _changed_files(
+        scan_repository(repository_path, exclude_patterns=exclude_patterns), change_set
+    )
+    with NdjsonWriter() as writer:
+        def write_file(relative_path: str, counts: FileCounts) -> None:
+            writer.write({
+                "type": "file",
+                "analysis": "structure",
+                "file_path": str(repository_path / relative_path),
+                "language": counts.language,
+                "lines_of_code": counts.lines,
+                "blank_lines": counts.blank,
+                "comment_lines": counts.comment,
+            })
         
-        analysis_result = structure_analyzer.analyze_repository(
-            repository_path, files
+        with get_profiler().phase("analyze"):
+            summary = summarize_structure(
+                repository_path,
+                files,
+                jobs=ctx.obj["jobs"],
+                exclude_patterns=exclude_patterns,
+                on_file=write_file
+            )
+        writer.write(
+            summary_record("structure", len(files), summary.to_directory_analysis(repository_path))
         )
-        
-        progress.update(task, description="Generating report...")
+    return summary.tree
+
+
+def _changed_files(files: Iterable[Path], change_set: Optional["ChangeSet"]) -> List[Path]:
+    """Keep only the files in the change set (all files without one)."""
+    if change_set is None:
+        return list(files)
+    return [path for path in files if change_set.contains(path)]
+
+
+def _save_rollup(tree: "RollupTree", repository_path: Path, db_path: Path):
+    """Record the tree's git base and save it for later ``--depth``/``--subtree`` queries."""
+    from ..analyzers.rollup import attach_git_base, rollup_path
+    from ..utils.git_utils import GitReferenceError
     
-    if output_format == "json":
-        import json
-        console.print(json.dumps(analysis_result.to_dict(), indent=2))
-    else:
-        # Display terminal formatted results
-        _display_structure_analysis(analysis_result)
+    with get_profiler().phase("rollup-save"):
+        try:
+            attach_git_base(tree, repository_path)
+        except GitReferenceError:
+            pass
+        tree.save(rollup_path(db_path, repository_path))
+
+
+def _refresh_rollup(
+    ctx: click.Context,
+    repository_path: Path,
+    structure_analyzer,
+    exclude_patterns: list
+) -> Optional["RollupTree"]:
+    """Load the saved rollup tree and update it from git, if possible."""
+    from ..analyzers.rollup import RollupTree, refresh_from_git, rollup_path
+    from ..utils.git_utils import GitReferenceError
+    
+    db_path = Path(ctx.obj["config"].get("database_path", DEFAULT_DATABASE_PATH))
+    rollup_file = rollup_path(db_path, repository_path)
+    tree = RollupTree.load(rollup_file)
+    if tree is None or tree.base_commit is None or tree.exclude_patterns != exclude_patterns:
+        return None
+    
+    try:
+        updated = refresh_from_git(tree, repository_path, structure_analyzer.analyze_file)
+    except GitReferenceError:
+        return None
+    
+    if updated:
+        tree.save(rollup_file)
+    if not ctx.obj.get("quiet"):
+        status_console.print(
+            f"[dim]Using saved directory rollups ({updated:,} files updated)[/dim]"
+        )
+    return tree
 
 
 @analyze.command()
@@ -101,25 +315,93 @@ def structure(
 @click.option(
     "--check-vulnerabilities",
     is_flag=True,
-    help="Check for known vulnerable dependencies"
+    help="Check pinned dependencies against the offline advisory database"
+)
+@click.option(
+    "--importers-of",
+    "importers_of",
+    multiple=True,
+    metavar="MODULE",
+    help="List modules that import MODULE, directly or transitively (can be used multiple times)"
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Re-analyze every file instead of reusing cached results"
 )
+@format_option("terminal", "json", "ndjson")
+@changed_since_option
 @click.pass_context
 def dependencies(
     ctx: click.Context,
     repository_path: Path,
     language: Optional[str],
-    check_vulnerabilities: bool
+    check_vulnerabilities: bool,
+    importers_of: Tuple[str, ...],
+    no_cache: bool,
+    output_format: str,
+    changed_since: Optional[str]
 ):
     """
     Analyze package dependencies and imports.
     
     Examines dependency files (package.json, requirements.txt, etc.),
     analyzes import statements, and detects circular dependencies.
+    Total dependency counts come from lockfiles (package-lock.json,
+    poetry.lock, Cargo.lock, go.sum), whose parsed graphs are cached.
+    
+    With --check-vulnerabilities, pinned versions are looked up in the
+    local advisory database (see `repo-analyzer advisories load`).
     
     Example:
         repo-analyzer analyze dependencies ./my-project --language python --check-vulnerabilities
+        repo-analyzer analyze dependencies ./my-project --importers-of mypackage.models
     """
     config = ctx.obj["config"]
+    change_set = _resolve_changes(ctx, repository_path, changed_since)
+    
+    if output_format == "ndjson":
+        from ..utils.ndjson import NdjsonWriter
+        
+        dep_analyzer = AnalyzerFactory().get_dependency_analyzer()
+        cache = None if no_cache else _open_cache(ctx, dep_analyzer, {})
+        lockfiles = {}
+        
+        def summarize(name: str, files: List[Path], analyses: ResultStore):
+            result = dep_analyzer.analyze_repository(
+                repository_path,
+                language_filter=language,
+                check_vulnerabilities=check_vulnerabilities,
+                analyses=analyses,
+                jobs=ctx.obj["jobs"],
+                changed_files=change_set
+            )
+            lockfiles.update(_resolve_lockfiles(ctx, repository_path, files))
+            _apply_lockfiles(result, lockfiles)
+            return result
+        
+        try:
+            _stream_ndjson(
+                ctx,
+                repository_path,
+                {"dependencies": dep_analyzer},
+                summarize,
+                caches={} if cache is None else {"dependencies": cache},
+                exclude_patterns=config.get("exclude_patterns", []),
+                change_set=change_set
+            )
+        finally:
+            if cache is not None:
+                cache.close()
+        _display_cache_stats(ctx, cache)
+        if check_vulnerabilities:
+            vulnerabilities = _check_vulnerabilities(ctx, repository_path, lockfiles=lockfiles)
+            with NdjsonWriter() as writer:
+                writer.write_all(
+                    {"type": "vulnerability", "analysis": "dependencies", **vulnerability.to_dict()}
+                    for vulnerability in vulnerabilities or []
+                )
+        return
     
     with Progress(
         SpinnerColumn(),
@@ -130,16 +412,58 @@ def dependencies(
         
         analyzer_factory = AnalyzerFactory()
         dep_analyzer = analyzer_factory.get_dependency_analyzer()
+        files = list(scan_repository(
+            repository_path, exclude_patterns=config.get("exclude_patterns", [])
+        ))
         
-        analysis_result = dep_analyzer.analyze_repository(
-            repository_path, 
-            language_filter=language,
-            check_vulnerabilities=check_vulnerabilities
-        )
+        cache = None if no_cache else _open_cache(ctx, dep_analyzer, {})
+        try:
+            with get_profiler().phase("analyze"):
+                analyses = analyze_files(
+                    dep_analyzer, files, jobs=ctx.obj["jobs"], cache=cache, change_set=change_set
+                )
+                analysis_result = dep_analyzer.analyze_repository(
+                    repository_path,
+                    language_filter=language,
+                    check_vulnerabilities=check_vulnerabilities,
+                    analyses=analyses,
+                    jobs=ctx.obj["jobs"],
+                    changed_files=change_set
+                )
+        finally:
+            if cache is not None:
+                cache.close()
+        
+        progress.update(task, description="Reading lockfiles...")
+        lockfiles = _resolve_lockfiles(ctx, repository_path, files)
+        _apply_lockfiles(analysis_result, lockfiles)
+        
+        with get_profiler().phase("import-graph"):
+            graph = ImportGraph.from_analyses(
+                repository_path, [a for a in analyses if not language or a.language == language]
+            )
+            importers = {module: graph.importers_of(module) for module in importers_of}
+        
+        vulnerabilities = None
+        if check_vulnerabilities:
+            progress.update(task, description="Checking pinned dependencies...")
+            vulnerabilities = _check_vulnerabilities(ctx, repository_path, files, lockfiles)
         
         progress.update(task, description="Generating dependency report...")
     
-    _display_dependency_analysis(analysis_result)
+    with get_profiler().phase("render"):
+        if output_format == "json":
+            data = _dependency_dict(analysis_result, graph)
+            if importers:
+                data["importers"] = importers
+            if vulnerabilities is not None:
+                data["vulnerabilities"] = [v.to_dict() for v in vulnerabilities]
+            _echo_json(data)
+        else:
+            _display_dependency_analysis(analysis_result, graph, importers)
+            if vulnerabilities is not None:
+                _display_vulnerabilities(vulnerabilities)
+    _display_cache_stats(ctx, cache)
 
 
 @analyze.command()
@@ -153,24 +477,103 @@ def dependencies(
 @click.option(
     "--include-tests",
     is_flag=True,
-    help="Include test files in analysis"
+    help="Include test files in analysis [default: analysis.complexity.include_tests]"
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Re-analyze every file instead of reusing cached results"
 )
+@click.option(
+    "--limit",
+    type=click.IntRange(min=0),
+    default=DEFAULT_FUNCTION_LIMIT,
+    show_default=True,
+    help="Functions to list in the table (0 lists all)"
+)
+@click.option(
+    "--sort",
+    type=click.Choice(["complexity", "name", "file"], case_sensitive=False),
+    default="complexity",
+    show_default=True,
+    help="Table order (complexity is highest first)"
+)
+@click.option(
+    "--only-over-threshold",
+    is_flag=True,
+    help="List only functions above the threshold"
+)
+@click.option(
+    "--detailed",
+    is_flag=True,
+    help="Also compute nesting depth and cognitive complexity (slower)"
+)
+@format_option("terminal", "json", "ndjson")
+@changed_since_option
 @click.pass_context
 def complexity(
     ctx: click.Context,
     repository_path: Path,
     threshold: int,
-    include_tests: bool
+    include_tests: bool,
+    no_cache: bool,
+    limit: int,
+    sort: str,
+    only_over_threshold: bool,
+    detailed: bool,
+    output_format: str,
+    changed_since: Optional[str]
 ):
     """
     Analyze code complexity metrics.
     
-    Calculates cyclomatic complexity, cognitive complexity, and nesting
-    depth for functions and methods across supported languages.
+    Calculates cyclomatic complexity for functions and methods across
+    supported languages; Python, JavaScript and TypeScript are counted from
+    a token scan. With ``--detailed`` every file goes through the full
+    analyzer, which adds cognitive complexity and nesting depth.
     
     Example:
         repo-analyzer analyze complexity ./my-project --threshold 15 --include-tests
+        repo-analyzer analyze complexity ./my-project --only-over-threshold --limit 0
     """
+    change_set = _resolve_changes(ctx, repository_path, changed_since)
+    cache_options = analysis_cache_options(ctx.obj["config"], threshold)["complexity"]
+    include_tests = include_tests or cache_options["include_tests"]
+    cache_options["include_tests"] = include_tests
+    
+    if output_format == "ndjson":
+        complexity_analyzer = AnalyzerFactory().get_complexity_analyzer()
+        routes = _complexity_routes(complexity_analyzer, detailed)
+        cache = None if no_cache else _open_cache(
+            ctx,
+            complexity_analyzer,
+            cache_options,
+            routes
+        )
+        try:
+            _stream_ndjson(
+                ctx,
+                repository_path,
+                {"complexity": complexity_analyzer},
+                lambda name, files, analyses: complexity_analyzer.analyze_repository(
+                    repository_path,
+                    complexity_threshold=threshold,
+                    include_tests=include_tests,
+                    analyses=analyses,
+                    jobs=ctx.obj["jobs"],
+                    changed_files=change_set
+                ),
+                caches={} if cache is None else {"complexity": cache},
+                exclude_patterns=ctx.obj["config"].get("exclude_patterns", []),
+                change_set=change_set,
+                routes={"complexity": routes}
+            )
+        finally:
+            if cache is not None:
+                cache.close()
+        _display_cache_stats(ctx, cache)
+        return
+    
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -180,16 +583,62 @@ def complexity(
         
         analyzer_factory = AnalyzerFactory()
         complexity_analyzer = analyzer_factory.get_complexity_analyzer()
+        routes = _complexity_routes(complexity_analyzer, detailed)
         
-        analysis_result = complexity_analyzer.analyze_repository(
-            repository_path,
-            complexity_threshold=threshold,
-            include_tests=include_tests
+        cache = None if no_cache else _open_cache(
+            ctx,
+            complexity_analyzer,
+            cache_options,
+            routes
         )
+        try:
+            with get_profiler().phase("analyze"):
+                if not routes:
+                    inputs = _changed_since_inputs(
+                        ctx, repository_path, complexity_analyzer, change_set, cache
+                    )
+                else:
+                    # Routed results are computed here; the analyzer only summarizes them
+                    files = scan_repository(
+                        repository_path,
+                        exclude_patterns=ctx.obj["config"].get("exclude_patterns", [])
+                    )
+                    inputs = {
+                        "analyses": analyze_files(
+                            complexity_analyzer,
+                            files,
+                            jobs=ctx.obj["jobs"],
+                            cache=cache,
+                            change_set=change_set,
+                            routes=routes
+                        ),
+                        "jobs": ctx.obj["jobs"],
+                        "changed_files": change_set,
+                    }
+                analysis_result = complexity_analyzer.analyze_repository(
+                    repository_path,
+                    complexity_threshold=threshold,
+                    include_tests=include_tests,
+                    **inputs
+                )
+        finally:
+            if cache is not None:
+                cache.close()
         
         progress.update(task, description="Generating complexity report...")
     
-    _display_complexity_analysis(analysis_result, threshold)
+    with get_profiler().phase("render"):
+        if output_format == "json":
+            _echo_json(analysis_result.to_dict())
+        else:
+            _display_complexity_analysis(
+                analysis_result,
+                threshold,
+                limit=limit or None,
+                sort=sort,
+                only_over_threshold=only_over_threshold
+            )
+    _display_cache_stats(ctx, cache)
 
 
 @analyze.command()
@@ -203,12 +652,22 @@ def complexity(
     "--compare-with",
     help="Git commit/branch to compare against"
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Re-analyze every file instead of reusing cached results"
+)
+@format_option("terminal", "json", "ndjson")
+@changed_since_option
 @click.pass_context
 def quality(
     ctx: click.Context,
     repository_path: Path,
     fail_on_regression: bool,
-    compare_with: Optional[str]
+    compare_with: Optional[str],
+    no_cache: bool,
+    output_format: str,
+    changed_since: Optional[str]
 ):
     """
     Analyze overall code quality metrics.
@@ -218,7 +677,43 @@ def quality(
     
     Example:
         repo-analyzer analyze quality ./my-project --compare-with HEAD~10 --fail-on-regression
+        repo-analyzer analyze quality ./my-project --changed-since origin/main
     """
+    change_set = _resolve_changes(ctx, repository_path, changed_since)
+    
+    if output_format == "ndjson":
+        quality_analyzer = AnalyzerFactory().get_quality_analyzer()
+        cache = None if no_cache else _open_cache(
+            ctx,
+            quality_analyzer,
+            ctx.obj["config"].get("analysis", {}).get("quality", {})
+        )
+        try:
+            results, _ = _stream_ndjson(
+                ctx,
+                repository_path,
+                {"quality": quality_analyzer},
+                lambda name, files, analyses: quality_analyzer.analyze_repository(
+                    repository_path,
+                    compare_commit=compare_with,
+                    analyses=analyses,
+                    jobs=ctx.obj["jobs"],
+                    changed_files=change_set
+                ),
+                caches={} if cache is None else {"quality": cache},
+                exclude_patterns=ctx.obj["config"].get("exclude_patterns", []),
+                change_set=change_set
+            )
+        finally:
+            if cache is not None:
+                cache.close()
+        _display_cache_stats(ctx, cache)
+        if fail_on_regression and results["quality"].has_regression:
+            # stdout carries only NDJSON records
+            status_console.print("[red]Quality regression detected! Failing build.[/red]")
+            raise click.Abort()
+        return
+    
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -229,14 +724,32 @@ def quality(
         analyzer_factory = AnalyzerFactory()
         quality_analyzer = analyzer_factory.get_quality_analyzer()
         
-        analysis_result = quality_analyzer.analyze_repository(
-            repository_path,
-            compare_commit=compare_with
+        cache = None if no_cache else _open_cache(
+            ctx,
+            quality_analyzer,
+            ctx.obj["config"].get("analysis", {}).get("quality", {})
         )
+        try:
+            with get_profiler().phase("analyze"):
+                analysis_result = quality_analyzer.analyze_repository(
+                    repository_path,
+                    compare_commit=compare_with,
+                    **_changed_since_inputs(
+                        ctx, repository_path, quality_analyzer, change_set, cache
+                    )
+                )
+        finally:
+            if cache is not None:
+                cache.close()
         
         progress.update(task, description="Generating quality report...")
     
-    _display_quality_analysis(analysis_result)
+    with get_profiler().phase("render"):
+        if output_format == "json":
+            _echo_json(analysis_result.to_dict())
+        else:
+            _display_quality_analysis(analysis_result)
+    _display_cache_stats(ctx, cache)
     
     # Check for regression if requested
     if fail_on_regression and analysis_result.has_regression:
@@ -244,8 +757,330 @@ def quality(
         raise click.Abort()
 
 
-def _display_structure_analysis(analysis_result):
-    """Display structure analysis results in terminal format."""
+@analyze.command(name="all")
+@click.argument("repository_path", type=click.Path(exists=True, path_type=Path))
+@click.option(
+    "--exclude",
+    multiple=True,
+    help="Patterns to exclude (can be used multiple times)"
+)
+@click.option(
+    "--threshold",
+    type=int,
+    default=10,
+    help="Complexity threshold for warnings"
+)
+@format_option("terminal", "json", "ndjson")
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Re-analyze every file instead of reusing cached results"
+)
+@click.option(
+    "--save-history/--no-save-history",
+    default=None,
+    help="Store this run in the analysis history [default: output.include_history]"
+)
+@changed_since_option
+@click.pass_context
+def analyze_everything(
+    ctx: click.Context,
+    repository_path: Path,
+    exclude: tuple,
+    threshold: int,
+    output_format: str,
+    no_cache: bool,
+    save_history: Optional[bool],
+    changed_since: Optional[str]
+):
+    """
+    Run structure, dependency, complexity and quality analysis in one pass.
+    
+    Each file is read and parsed once and the result is shared by all four
+    analyzers, which is considerably faster than running the commands one
+    after another.
+    
+    Example:
+        repo-analyzer analyze all ./my-project --format json > analysis.json
+        repo-analyzer analyze all ./my-project --format ndjson | jq -c 'select(.type == "summary")'
+    """
+    config = ctx.obj["config"]
+    change_set = _resolve_changes(ctx, repository_path, changed_since)
+    exclude_patterns = list(exclude) + config.get("exclude_patterns", [])
+    
+    analyzer_factory = AnalyzerFactory()
+    analyzers = {
+        "structure": analyzer_factory.get_structure_analyzer(),
+        "dependencies": analyzer_factory.get_dependency_analyzer(),
+        "complexity": analyzer_factory.get_complexity_analyzer(),
+        "quality": analyzer_factory.get_quality_analyzer(),
+    }
+    shared = {"jobs": ctx.obj["jobs"], "changed_files": change_set}
+    cache_options = {
+        "structure": {},
+        "dependencies": {},
+        **analysis_cache_options(config, threshold),
+    }
+    
+    def summarize(name: str, files: List[Path], analyses: ResultStore):
+        if name == "structure":
+            return analyzers[name].analyze_repository(
+                repository_path, iter(files), analyses=analyses, **shared
+            )
+        if name == "complexity":
+            return analyzers[name].analyze_repository(
+                repository_path, analyses=analyses, **cache_options[name], **shared
+            )
+        result = analyzers[name].analyze_repository(repository_path, analyses=analyses, **shared)
+        if name == "dependencies":
+            _apply_lockfiles(result, _resolve_lockfiles(ctx, repository_path, files))
+        return result
+    
+    caches = {} if no_cache else {
+        name: _open_cache(ctx, analyzers[name], options)
+        for name, options in cache_options.items()
+    }
+    try:
+        if output_format == "ndjson":
+            results, per_file = _stream_ndjson(
+                ctx, repository_path, analyzers, summarize, caches, exclude_patterns, change_set
+            )
+        else:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console,
+            ) as progress:
+                task = progress.add_task("Scanning repository...", total=None)
+                
+                files = list(scan_repository(repository_path, exclude_patterns=exclude_patterns))
+                
+                progress.update(task, description=f"Analyzing {len(files):,} files...")
+                
+                with get_profiler().phase("analyze"):
+                    # Per-file results are kept in compact columns, not FileAnalysis lists
+                    per_file = {name: ResultStore() for name in analyzers}
+                    for _, analyses in iter_all(
+                        analyzers, files, jobs=ctx.obj["jobs"], caches=caches, change_set=change_set
+                    ):
+                        for name, analysis in analyses.items():
+                            per_file[name].add(analysis)
+                    results = {name: summarize(name, files, per_file[name]) for name in analyzers}
+                
+                progress.update(task, description="Generating report...")
+    finally:
+        for cache in caches.values():
+            cache.close()
+    
+    if output_format != "ndjson":
+        with get_profiler().phase("import-graph"):
+            graph = ImportGraph.from_analyses(repository_path, per_file["dependencies"])
+    
+    with get_profiler().phase("render"):
+        if output_format == "json":
+            data = {name: result.to_dict() for name, result in results.items()}
+            data["dependencies"] = _dependency_dict(results["dependencies"], graph)
+            _echo_json(data)
+        elif output_format == "terminal":
+            _display_structure_analysis(results["structure"])
+            _display_dependency_analysis(results["dependencies"], graph)
+            _display_complexity_analysis(results["complexity"], threshold)
+            _display_quality_analysis(results["quality"])
+    for cache in caches.values():
+        _display_cache_stats(ctx, cache)
+    
+    if save_history is None:
+        save_history = config.get("output", {}).get("include_history", False)
+    if save_history:
+        with get_profiler().phase("save-history"):
+            _save_history(ctx, repository_path, per_file, {"complexity_threshold": threshold})
+
+
+def _save_history(
+    ctx: click.Context,
+    repository_path: Path,
+    per_file: Dict[str, ResultStore],
+    options: dict
+):
+    """Store per-file complexity and quality results as one history run."""
+    from ..storage.database import DatabaseManager
+    from ..utils.git_utils import GitReferenceError, open_repository
+    
+    quality = per_file["quality"]
+    quality_scores = dict(zip(quality.paths, quality.column("quality_score")))
+    analyses = ResultStore.from_analyses(
+        replace(a, quality_score=quality_scores.get(str(a.file_path), a.quality_score))
+        for a in per_file["complexity"].iter_analyses()
+    )
+    try:
+        commit_hash = open_repository(repository_path).head.commit.hexsha
+    except (GitReferenceError, ValueError):
+        commit_hash = None
+    
+    db_path = Path(ctx.obj["config"].get("database_path", DEFAULT_DATABASE_PATH))
+    with DatabaseManager(db_path) as db:
+        run_id = db.save_run(
+            Path(repository_path).resolve(),
+            analyses,
+            commit_hash=commit_hash,
+            configuration=options,
+            complexity_threshold=options["complexity_threshold"]
+        )
+    if not ctx.obj.get("quiet"):
+        status_console.print(f"[dim]Saved analysis run #{run_id} to history[/dim]")
+
+
+def _stream_ndjson(
+    ctx: click.Context,
+    repository_path: Path,
+    analyzers: Dict[str, Any],
+    summarize: Callable[[str, List[Path], ResultStore], Any],
+    caches: Optional[Dict[str, AnalysisCache]] = None,
+    exclude_patterns: List[str] = (),
+    change_set: Optional["ChangeSet"] = None,
+    routes: Optional[Dict[str, Dict[str, Any]]] = None
+) -> Tuple[Dict[str, Any], Dict[str, ResultStore]]:
+    """
+    Analyze a repository file by file, writing NDJSON records to stdout.
+    
+    File and function records are written as each file completes, in scan
+    order, and the result is then added to a compact ResultStore per
+    analyzer, so no FileAnalysis outlives its records. Repository-level
+    results are built from the stores with ``summarize(name, files,
+    store)`` and written as one summary record per analyzer. With a change
+    set, unchanged files come from the caches' baselines (see
+    ``executor.lookup_cached``); ``routes`` are passed on to ``iter_all``.
+    
+    Returns:
+        Repository-level and per-file results, keyed by analyzer name
+    """
+    from ..utils.ndjson import NdjsonWriter, analysis_records, summary_record
+    
+    files = list(scan_repository(repository_path, exclude_patterns=list(exclude_patterns)))
+    per_file = {name: ResultStore() for name in analyzers}
+    with NdjsonWriter() as writer:
+        with get_profiler().phase("analyze"):
+            for _, analyses in iter_all(
+                analyzers,
+                files,
+                jobs=ctx.obj["jobs"],
+                caches=caches,
+                change_set=change_set,
+                routes=routes
+            ):
+                for name, analysis in analyses.items():
+                    writer.write_all(analysis_records(name, analysis))
+                    per_file[name].add(analysis)
+            results = {name: summarize(name, files, per_file[name]) for name in analyzers}
+        for name, result in results.items():
+            writer.write(summary_record(name, len(files), result))
+    return results, per_file
+
+
+def _echo_json(data: Any):
+    """
+    Print a JSON document to stdout, bypassing Rich markup and wrapping.
+    
+    ResultStore values are streamed one file at a time (see
+    ``results.write_json_document``).
+    """
+    write_json_document(data, click.get_text_stream("stdout"))
+
+
+def _resolve_changes(
+    ctx: click.Context,
+    repository_path: Path,
+    changed_since: Optional[str]
+) -> Optional["ChangeSet"]:
+    """Compute the change set for ``--changed-since``, if given."""
+    if not changed_since:
+        return None
+    
+    from ..utils.git_utils import GitReferenceError, changed_files
+    
+    try:
+        with get_profiler().phase("git-diff"):
+            change_set = changed_files(repository_path, changed_since)
+    except GitReferenceError as e:
+        raise click.BadParameter(str(e), param_hint="--changed-since")
+    
+    if not ctx.obj.get("quiet"):
+        status_console.print(
+            f"[dim]{len(change_set.changed):,} changed and "
+            f"{len(change_set.removed):,} removed files since {changed_since}[/dim]"
+        )
+    return change_set
+
+
+def _complexity_routes(complexity_analyzer, detailed: bool) -> Dict[str, "BaseAnalyzer"]:
+    """Route the token-scanned languages past the full analyzer unless ``detailed``."""
+    if detailed:
+        return {}
+    
+    from ..analyzers.complexity_engine import ScanComplexityAnalyzer
+    from ..analyzers.dispatch import analyzers_by_language
+    
+    return analyzers_by_language([ScanComplexityAnalyzer(complexity_analyzer)])
+
+
+def _changed_since_inputs(
+    ctx: click.Context,
+    repository_path: Path,
+    analyzer,
+    change_set: Optional["ChangeSet"],
+    cache: Optional[AnalysisCache]
+) -> Dict[str, Any]:
+    """
+    Build the ``analyze_repository`` keyword arguments for a cached run.
+    
+    Full runs hand the cache to the analyzer. ``--changed-since`` runs
+    analyze only the changed files through ``analyze_changes`` and take
+    every other file from the cache's baseline, so the analyzer receives
+    complete per-file results without walking the tree itself.
+    """
+    if change_set is None:
+        return {"cache": cache, "jobs": ctx.obj["jobs"], "changed_files": None}
+    
+    files = scan_repository(
+        repository_path, exclude_patterns=ctx.obj["config"].get("exclude_patterns", [])
+    )
+    incremental = analyze_changes(analyzer, files, change_set, ctx.obj["jobs"], cache)
+    return {"analyses": incremental.combined, "jobs": ctx.obj["jobs"], "changed_files": change_set}
+
+
+def _open_cache(
+    ctx: click.Context,
+    analyzer,
+    options: dict,
+    routes: Optional[Dict[str, "BaseAnalyzer"]] = None
+) -> AnalysisCache:
+    """Open the per-file result cache for an analyzer, its options and routes."""
+    db_path = Path(ctx.obj["config"].get("database_path", DEFAULT_DATABASE_PATH))
+    cache = AnalysisCache.for_analyzer(db_path, analyzer, options, routes)
+    get_profiler().register(f"cache:{type(analyzer).__name__}", cache.stats.to_dict)
+    return cache
+
+
+def _display_cache_stats(ctx: click.Context, cache: Optional[AnalysisCache]):
+    """Display cache hit/miss statistics unless running quietly."""
+    if cache is None or ctx.obj.get("quiet") or not cache.stats.lookups:
+        return
+    
+    stats = cache.stats
+    status_console.print(
+        f"[dim]Cache: {stats.hits:,} hits, {stats.misses:,} misses "
+        f"({stats.hit_rate:.0%} hit rate"
+        + (f", {stats.invalidated:,} invalidated" if stats.invalidated else "")
+        + ")[/dim]"
+    )
+
+
+def _display_structure_analysis(
+    analysis_result,
+    breakdown: Optional[Dict[str, Any]] = None,
+    out: Console = console
+):
+    """Display structure analysis results (and code/comment/blank lines, if counted)."""
     table = Table(title="📁 Repository Structure Analysis", show_header=True)
     table.add_column("Metric", style="cyan", width=20)
     table.add_column("Value", style="green")
@@ -256,7 +1091,7 @@ def _display_structure_analysis(analysis_result):
     table.add_row("Primary Language", analysis_result.primary_language)
     table.add_row("Language Count", str(len(analysis_result.languages)))
     
-    console.print(table)
+    out.print(table)
     
     # Language distribution
     if analysis_result.languages:
@@ -264,20 +1099,135 @@ def _display_structure_analysis(analysis_result):
         lang_table.add_column("Language", style="cyan")
         lang_table.add_column("Files", style="yellow")
         lang_table.add_column("Percentage", style="green")
+        if breakdown:
+            for column in ("Code", "Comment", "Blank"):
+                lang_table.add_column(column, justify="right")
         
         for lang, stats in analysis_result.languages.items():
             percentage = (stats["files"] / analysis_result.total_files) * 100
-            lang_table.add_row(
-                lang,
-                str(stats["files"]),
-                f"{percentage:.1f}%"
-            )
+            row = [lang, str(stats["files"]), f"{percentage:.1f}%"]
+            if breakdown and lang in breakdown:
+                lines = breakdown[lang]
+                row += [f"{lines.code:,}", f"{lines.comment:,}", f"{lines.blank:,}"]
+            lang_table.add_row(*row)
         
-        console.print(lang_table)
+        out.print(lang_table)
+
+
+def _display_directory_rollup(
+    tree: "RollupTree",
+    relative_dir: str,
+    depth: int,
+    out: Console = console
+):
+    """Display per-directory rollups down to a depth in terminal format."""
+    table = Table(title="📂 Directory Rollups", show_header=True)
+    table.add_column("Directory", style="cyan")
+    table.add_column("Files", style="yellow", justify="right")
+    table.add_column("Lines", style="green", justify="right")
+    table.add_column("Primary Language")
+    
+    for level, node in tree.walk(relative_dir, depth):
+        table.add_row(
+            "  " * level + (node.name if level else node.path or ".") + "/",
+            f"{node.files:,}",
+            f"{node.lines:,}",
+            node.primary_language()
+        )
+    
+    out.print(table)
+
+
+def _resolve_lockfiles(
+    ctx: click.Context,
+    repository_path: Path,
+    files: Iterable[Path]
+) -> Dict[str, "LockfileGraph"]:
+    """
+    Parse the repository's lockfiles, reusing cached graphs of unchanged ones.
+    
+    Returns:
+        Dependency graphs keyed by lockfile path relative to the repository
+    """
+    from ..analyzers.lockfiles import is_lockfile
+    from ..storage.cache import LockfileCache
+    
+    root = Path(repository_path)
+    db_path = Path(ctx.obj["config"].get("database_path", DEFAULT_DATABASE_PATH))
+    graphs = {}
+    with get_profiler().phase("lockfiles"), LockfileCache(db_path) as cache:
+        for path in sorted(Path(f) for f in files if is_lockfile(f)):
+            graph = cache.fetch(path)
+            if graph is not None:
+                graphs[path.relative_to(root).as_posix()] = graph
+    return graphs
+
+
+def _apply_lockfiles(analysis_result, lockfiles: Dict[str, "LockfileGraph"]):
+    """Set direct and total dependency counts per package manager from lockfiles."""
+    from ..analyzers.lockfiles import summarize_lockfiles
+    
+    for manager, counts in summarize_lockfiles(lockfiles.values()).items():
+        analysis_result.package_managers.setdefault(manager, {}).update(counts)
+
+
+def _check_vulnerabilities(
+    ctx: click.Context,
+    repository_path: Path,
+    files: Optional[List[Path]] = None,
+    lockfiles: Optional[Dict[str, "LockfileGraph"]] = None
+) -> Optional[List["Vulnerability"]]:
+    """
+    Look up the repository's pinned dependencies in the advisory database.
+    
+    Pins come from requirements files and from every package of the given
+    lockfiles. Returns None (after a warning) when no advisory database has
+    been loaded, so a missing database is not reported as "no
+    vulnerabilities".
+    """
+    from ..analyzers.pins import read_pins
+    from ..storage.advisories import AdvisoryDatabase
+    from .advisories import advisory_database_path
+    
+    db_path = advisory_database_path(ctx.obj["config"])
+    if not db_path.exists():
+        status_console.print(
+            f"[yellow]No advisory database at {escape(str(db_path))}; "
+            "import OSV advisories with `repo-analyzer advisories load`[/yellow]"
+        )
+        return None
+    if files is None:
+        files = scan_repository(
+            repository_path, exclude_patterns=ctx.obj["config"].get("exclude_patterns", [])
+        )
+    
+    with get_profiler().phase("vulnerabilities"), AdvisoryDatabase(db_path) as db:
+        pins = read_pins(repository_path, files, lockfiles)
+        # A package locked by several lockfiles is checked (and reported) once
+        return db.check(dict.fromkeys((pin.ecosystem, pin.name, pin.version) for pin in pins))
+
 
+def _dependency_dict(analysis_result, graph: Optional[ImportGraph] = None) -> Dict[str, Any]:
+    """Dependency results for JSON output, with the import graph's cycles if given."""
+    data = analysis_result.to_dict()
+    if graph is not None:
+        data["import_graph"] = graph.to_dict()
+    return data
 
-def _display_dependency_analysis(analysis_result):
-    """Display dependency analysis results."""
+
+def _display_dependency_analysis(
+    analysis_result,
+    graph: Optional[ImportGraph] = None,
+    importers: Optional[Dict[str, List[str]]] = None,
+    out: Console = console
+):
+    """
+    Display dependency analysis results.
+    
+    With an import graph, circular dependencies are listed per strongly
+    connected component, each with one shortest cycle, instead of the
+    analyzer's ``circular_dependencies``.
+    """
     table = Table(title="📦 Dependency Analysis", show_header=True)
     table.add_column("Package Manager", style="cyan")
     table.add_column("Direct Dependencies", style="yellow")
@@ -292,38 +1242,107 @@ def _display_dependency_analysis(analysis_result):
             str(stats.get("vulnerabilities", 0))
         )
     
-    console.print(table)
+    out.print(table)
     
-    if analysis_result.circular_dependencies:
-        console.print("\n[yellow]⚠️  Circular Dependencies Detected:[/yellow]")
+    if graph is not None:
+        cycles = graph.cycles()
+        if cycles:
+            out.print(
+                f"\n[yellow]⚠️  Circular Dependencies Detected: {len(cycles):,} import cycles[/yellow]"
+            )
+            for modules, cycle in cycles[:MAX_CYCLES_SHOWN]:
+                involved = len(modules)
+                out.print(
+                    f"  • {escape(' → '.join(cycle))}"
+                    + (f" [dim]({involved:,} modules involved)[/dim]" if involved > len(cycle) - 1 else "")
+                )
+            if len(cycles) > MAX_CYCLES_SHOWN:
+                out.print(f"  [dim]… and {len(cycles) - MAX_CYCLES_SHOWN:,} more[/dim]")
+    elif analysis_result.circular_dependencies:
+        out.print("\n[yellow]⚠️  Circular Dependencies Detected:[/yellow]")
         for cycle in analysis_result.circular_dependencies:
-            console.print(f"  • {' → '.join(cycle)}")
+            out.print(f"  • {' → '.join(cycle)}")
+    
+    for module, names in (importers or {}).items():
+        out.print(f"\n[bold]Modules importing {escape(module)}:[/bold] {len(names):,}")
+        for name in names:
+            out.print(f"  • {escape(name)}")
 
 
-def _display_complexity_analysis(analysis_result, threshold):
-    """Display complexity analysis results."""
-    table = Table(title="📊 Complexity Analysis", show_header=True)
-    table.add_column("File", style="cyan")
-    table.add_column("Function", style="yellow")
-    table.add_column("Complexity", style="green")
-    table.add_column("Status", style="magenta")
+def _display_vulnerabilities(vulnerabilities: List["Vulnerability"], out: Console = console):
+    """Display vulnerable pinned dependencies, one row per advisory."""
+    if not vulnerabilities:
+        out.print("\n[green]✅ No known vulnerabilities in pinned dependencies[/green]")
+        return
+    
+    table = Table(title="🛡️ Vulnerable Dependencies", show_header=True)
+    table.add_column("Package", style="cyan")
+    table.add_column("Version", style="yellow")
+    table.add_column("Advisory", style="red")
+    table.add_column("Severity", style="magenta")
+    table.add_column("Fixed In", style="green")
+    table.add_column("Summary")
     
-    high_complexity_count = 0
+    for vulnerability in vulnerabilities:
+        table.add_row(
+            Text(f"{vulnerability.package} ({vulnerability.ecosystem})"),
+            Text(vulnerability.version),
+            Text(vulnerability.advisory_id),
+            Text(vulnerability.severity or "-"),
+            Text(vulnerability.fixed_version or "-"),
+            Text(vulnerability.summary)
+        )
     
-    for file_result in analysis_result.files:
-        for func in file_result.functions:
-            status = "✅ Good" if func.complexity <= threshold else "⚠️  High"
-            if func.complexity > threshold:
-                high_complexity_count += 1
-            
+    out.print(table)
+
+
+def _display_complexity_analysis(
+    analysis_result,
+    threshold,
+    limit: Optional[int] = DEFAULT_FUNCTION_LIMIT,
+    sort: str = "complexity",
+    only_over_threshold: bool = False,
+    out: Console = console
+):
+    """
+    Display complexity analysis results.
+    
+    Only the ``limit`` functions shown are kept in memory, and the table
+    is printed in pages of ``TABLE_PAGE_SIZE`` rows, so rendering cost does
+    not grow with the repository (None lists every function).
+    """
+    from ..analyzers.ranking import iter_function_rows, rank_functions
+    
+    ranking = rank_functions(
+        iter_function_rows(analysis_result.files),
+        threshold,
+        limit=limit,
+        sort=sort,
+        only_over_threshold=only_over_threshold
+    )
+    
+    for start in range(0, max(len(ranking.rows), 1), TABLE_PAGE_SIZE):
+        table = Table(title="📊 Complexity Analysis" if not start else None, show_header=True)
+        table.add_column("File", style="cyan")
+        table.add_column("Function", style="yellow")
+        table.add_column("Complexity", style="green")
+        table.add_column("Status", style="magenta")
+        
+        for row in ranking.rows[start:start + TABLE_PAGE_SIZE]:
+            # Text cells skip markup parsing (and keep names like "f[i]" literal)
             table.add_row(
-                str(file_result.file_path.name),
-                func.name,
-                str(func.complexity),
-                status
+                Text(Path(row.file_path).name),
+                Text(row.name),
+                Text(str(row.complexity)),
+                Text("✅ Good" if row.complexity <= threshold else "⚠️  High")
             )
+        out.print(table)
     
-    console.print(table)
+    if ranking.hidden:
+        out.print(
+            f"[dim]Showing {len(ranking.rows):,} of {ranking.matched:,} functions "
+            f"(--limit 0 lists all)[/dim]"
+        )
     
     # Summary
     summary_table = Table(title="Complexity Summary", show_header=True)
@@ -332,13 +1351,13 @@ def _display_complexity_analysis(analysis_result, threshold):
     
     summary_table.add_row("Average Complexity", f"{analysis_result.average_complexity:.1f}")
     summary_table.add_row("Max Complexity", str(analysis_result.max_complexity))
-    summary_table.add_row("High Complexity Functions", str(high_complexity_count))
+    summary_table.add_row("High Complexity Functions", str(ranking.over_threshold))
     summary_table.add_row("Complexity Threshold", str(threshold))
     
-    console.print(summary_table)
+    out.print(summary_table)
 
 
-def _display_quality_analysis(analysis_result):
+def _display_quality_analysis(analysis_result, out: Console = console):
     """Display quality analysis results."""
     table = Table(title="🔍 Quality Analysis", show_header=True)
     table.add_column("Metric", style="cyan", width=25)
@@ -361,12 +1380,12 @@ def _display_quality_analysis(analysis_result):
         "✅ Good" if analysis_result.technical_debt_ratio <= 0.05 else "⚠️  High"
     )
     
-    console.print(table)
+    out.print(table)
     
     if analysis_result.recommendations:
-        console.print("\n[yellow]💡 Recommendations:[/yellow]")
+        out.print("\n[yellow]💡 Recommendations:[/yellow]")
         for rec in analysis_result.recommendations:
-            console.print(f"  • {rec}")
+            out.print(f"  • {rec}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,306 @@
+"""
+History command group implementation.
+
+Provides commands for listing stored analysis runs, compacting old
+history and backfilling history from past commits. Listing and compaction
+read the per-run summary rows only, so they stay fast for long histories.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+import click
+from rich.console import Console
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn
+from rich.table import Table
+
+from ..storage.cache import DEFAULT_DATABASE_PATH, BlobCache, analysis_cache_options
+from ..storage.database import RETENTION_PERIODS, DatabaseManager, RetentionPolicy, RunInfo
+from ..utils.profiling import get_profiler
+
+
+console = Console()
+status_console = Console(stderr=True)
+
+
+@click.group()
+def history():
+    """🕒 Analysis history management."""
+    pass
+
+
+@history.command(name="list")
+@click.argument(
+    "repository_path",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    required=False
+)
+@click.option(
+    "--limit",
+    type=click.IntRange(min=1),
+    default=20,
+    help="Maximum number of runs to show"
+)
+@click.option(
+    "--since",
+    type=click.DateTime(),
+    help="Only show runs at or after this date"
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["terminal", "json"], case_sensitive=False),
+    default="terminal",
+    help="Output format"
+)
+@click.pass_context
+def list_runs(
+    ctx: click.Context,
+    repository_path: Optional[Path],
+    limit: int,
+    since: Optional[datetime],
+    output_format: str
+):
+    """
+    Show stored analysis runs, newest first.
+    
+    Runs are stored by `analyze all --save-history`. Without a repository,
+    runs of every repository are listed.
+    
+    Example:
+        repo-analyzer history list ./my-project --since 2024-01-01
+    """
+    if repository_path is not None:
+        repository_path = repository_path.resolve()
+    
+    with _open_database(ctx) as db:
+        runs = db.list_runs(repository_path, limit=limit, since=since)
+    
+    if output_format == "json":
+        import json
+        # Plain echo: Rich would wrap long lines and highlight the payload
+        click.echo(json.dumps([run.to_dict() for run in runs], indent=2, default=str))
+    elif not runs:
+        console.print("[yellow]No analysis history found[/yellow]")
+    else:
+        _display_runs(runs, show_repository=repository_path is None)
+
+
+@history.command()
+@click.argument(
+    "repository_path",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    required=False
+)
+@click.option(
+    "--keep-days",
+    type=click.IntRange(min=0),
+    default=30,
+    help="Leave runs newer than this many days untouched"
+)
+@click.option(
+    "--period",
+    type=click.Choice(RETENTION_PERIODS, case_sensitive=False),
+    default="week",
+    help="Keep one run per period of older history"
+)
+@click.option(
+    "--keep-details",
+    is_flag=True,
+    help="Keep per-file results of the runs kept (only summaries by default)"
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Show what would be removed without changing the database"
+)
+@click.pass_context
+def clean(
+    ctx: click.Context,
+    repository_path: Optional[Path],
+    keep_days: int,
+    period: str,
+    keep_details: bool,
+    dry_run: bool
+):
+    """
+    Downsample old analysis history.
+    
+    Runs older than --keep-days are reduced to the newest run of each
+    period; the kept run's summary records how many runs it stands for, so
+    trends keep covering the full history. Per-file results of the kept
+    runs are dropped unless --keep-details is given.
+    
+    Example:
+        repo-analyzer history clean ./my-project --keep-days 90 --period month
+    """
+    if repository_path is not None:
+        repository_path = repository_path.resolve()
+    policy = RetentionPolicy(keep_days=keep_days, period=period, drop_details=not keep_details)
+    
+    with _open_database(ctx) as db:
+        result = db.compact(policy, repository_path=repository_path, dry_run=dry_run)
+    
+    prefix = "Would remove" if dry_run else "Removed"
+    console.print(
+        f"{prefix} {result.runs_deleted:,} of {result.runs_examined:,} runs older than "
+        f"{keep_days} days and per-file results of {result.details_dropped:,} more"
+    )
+
+
+@history.command()
+@click.argument("repository_path", type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.option(
+    "--range",
+    "revision_range",
+    default="HEAD",
+    show_default=True,
+    help="Commits to analyze, as for git rev-list (e.g. v1.0..main)"
+)
+@click.option(
+    "--max-count", "-n",
+    type=click.IntRange(min=1),
+    help="Only analyze the newest N commits of the range"
+)
+@click.option(
+    "--first-parent",
+    is_flag=True,
+    help="Follow only the first parent of merge commits"
+)
+@click.option(
+    "--exclude",
+    multiple=True,
+    help="Patterns to exclude (can be used multiple times)"
+)
+@click.option(
+    "--threshold",
+    type=int,
+    default=10,
+    help="Complexity threshold for the stored summaries"
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Re-analyze commits that already have a stored run"
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Analyze every blob instead of reusing cached results"
+)
+@click.pass_context
+def backfill(
+    ctx: click.Context,
+    repository_path: Path,
+    revision_range: str,
+    max_count: Optional[int],
+    first_parent: bool,
+    exclude: tuple,
+    threshold: int,
+    force: bool,
+    no_cache: bool
+):
+    """
+    Store analysis runs for past commits without checking them out.
+    
+    Files are read from the git object database, and each distinct file
+    version (blob) is analyzed once: unchanged blobs reuse earlier results,
+    also across invocations, so many commits cost little more than one.
+    Commits that already have a run are skipped unless --force is given.
+    
+    Example:
+        repo-analyzer history backfill ./my-project --range HEAD -n 1000
+    """
+    from ..analyzers.backfill import backfill as backfill_commits
+    from ..analyzers.backfill import list_commits
+    from ..analyzers.factory import AnalyzerFactory
+    from ..utils.git_utils import GitReferenceError
+    
+    config = ctx.obj["config"]
+    try:
+        commits = list_commits(repository_path, revision_range, max_count, first_parent)
+    except GitReferenceError as e:
+        raise click.BadParameter(str(e), param_hint="--range")
+    
+    analyzer_factory = AnalyzerFactory()
+    analyzers = {
+        "complexity": analyzer_factory.get_complexity_analyzer(),
+        "quality": analyzer_factory.get_quality_analyzer(),
+    }
+    db_path = Path(config.get("database_path", DEFAULT_DATABASE_PATH))
+    caches = {} if no_cache else {
+        name: BlobCache.for_analyzer(db_path, analyzers[name], options)
+        for name, options in analysis_cache_options(config, threshold).items()
+    }
+    for name, cache in caches.items():
+        get_profiler().register(f"blob-cache:{name}", cache.stats.to_dict)
+    
+    try:
+        with _open_database(ctx) as db, Progress(
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            console=status_console,
+            disable=ctx.obj.get("quiet", False),
+        ) as progress:
+            task = progress.add_task("Analyzing commits...", total=len(commits))
+            stats = backfill_commits(
+                repository_path,
+                commits,
+                analyzers,
+                db,
+                caches=caches,
+                exclude_patterns=list(exclude) + config.get("exclude_patterns", []),
+                complexity_threshold=threshold,
+                jobs=ctx.obj["jobs"],
+                force=force,
+                on_commit=lambda commit: progress.advance(task)
+            )
+    finally:
+        for cache in caches.values():
+            cache.close()
+    
+    console.print(
+        f"Stored {stats.commits:,} runs ({stats.skipped:,} commits already stored): "
+        f"{stats.files:,} files, {stats.distinct_blobs:,} distinct blobs, "
+        f"{stats.analyzed_blobs:,} analyzed, {stats.cached_blobs:,} from cache"
+    )
+
+
+def _open_database(ctx: click.Context) -> DatabaseManager:
+    """Open the history database configured for this invocation."""
+    db_path = Path(ctx.obj["config"].get("database_path", DEFAULT_DATABASE_PATH))
+    return DatabaseManager(db_path)
+
+
+def _display_runs(runs: List[RunInfo], show_repository: bool):
+    """Display run summaries in terminal format."""
+    table = Table(title="🕒 Analysis History", show_header=True)
+    table.add_column("Run", style="cyan", justify="right")
+    if show_repository:
+        table.add_column("Repository")
+    table.add_column("Date", style="cyan")
+    table.add_column("Commit", style="yellow")
+    table.add_column("Files", justify="right")
+    table.add_column("Lines", justify="right")
+    table.add_column("Score", style="green", justify="right")
+    table.add_column("MI", style="green", justify="right")
+    table.add_column("Debt", style="magenta", justify="right")
+    
+    for run in runs:
+        row = [f"{run.id}" + (f" (×{run.runs})" if run.runs > 1 else "")]
+        if show_repository:
+            row.append(run.repository_path)
+        row += [
+            run.timestamp.strftime("%Y-%m-%d %H:%M"),
+            (run.commit_hash or "-")[:8],
+            f"{run.file_count:,}",
+            f"{run.total_lines:,}",
+            f"{run.overall_score:.1f}",
+            f"{run.maintainability_index:.1f}",
+            f"{run.technical_debt_ratio:.1%}",
+        ]
+        table.add_row(*row)
+    
+    console.print(table)
\ No newline at end of file
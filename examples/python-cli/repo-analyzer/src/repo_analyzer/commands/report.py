@@ -0,0 +1,165 @@
+"""
+Report command group implementation.
+
+Provides commands for building reports from stored analysis history.
+"""
+
+from pathlib import Path
+from typing import Any, Dict
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from ..storage.cache import DEFAULT_DATABASE_PATH
+from ..storage.database import DatabaseManager, RunInfo
+
+
+console = Console()
+
+#: Summary metrics compared by ``report compare``, with their display format.
+COMPARED_METRICS = {
+    "file_count": "{:,}",
+    "total_lines": "{:,}",
+    "function_count": "{:,}",
+    "total_issues": "{:,}",
+    "average_complexity": "{:.2f}",
+    "max_complexity": "{:,}",
+    "maintainability_index": "{:.1f}",
+    "technical_debt_ratio": "{:.1%}",
+    "overall_score": "{:.1f}",
+}
+
+
+@click.group()
+def report():
+    """📄 Report generation commands."""
+    pass
+
+
+@report.command()
+@click.argument("repository_path", type=click.Path(exists=True, path_type=Path))
+@click.argument("base")
+@click.argument("head", default="HEAD")
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["terminal", "json"], case_sensitive=False),
+    default="terminal",
+    help="Output format"
+)
+@click.pass_context
+def compare(
+    ctx: click.Context,
+    repository_path: Path,
+    base: str,
+    head: str,
+    output_format: str
+):
+    """
+    Compare stored analysis metrics between two commits or branches.
+    
+    BASE and HEAD are git references (HEAD by default) or commit hashes of
+    stored runs. Both commits must have been analyzed with
+    `analyze all --save-history`; only the runs' summaries are read.
+    
+    Example:
+        repo-analyzer report compare ./my-project main feature-branch
+    """
+    repository_path = repository_path.resolve()
+    db_path = Path(ctx.obj["config"].get("database_path", DEFAULT_DATABASE_PATH))
+    with DatabaseManager(db_path) as db:
+        base_run = _find_run(db, repository_path, base)
+        head_run = _find_run(db, repository_path, head)
+    
+    comparison = compare_runs(base_run, head_run)
+    if output_format == "json":
+        import json
+        # Plain echo: Rich would wrap long lines and highlight the payload
+        click.echo(json.dumps(comparison, indent=2, default=str))
+    else:
+        _display_comparison(comparison, base, head)
+
+
+def compare_runs(base: RunInfo, head: RunInfo) -> Dict[str, Any]:
+    """
+    Compute metric and language deltas between two stored runs.
+    
+    Returns:
+        Dictionary with both runs, ``metrics`` as ``{name: {base, head,
+        change}}`` and ``languages`` as per-language line counts
+    """
+    metrics = {}
+    for name in COMPARED_METRICS:
+        before, after = getattr(base, name), getattr(head, name)
+        metrics[name] = {"base": before, "head": after, "change": after - before}
+    
+    languages = {}
+    for language in sorted(set(base.languages) | set(head.languages)):
+        before = base.languages.get(language, {}).get("lines", 0)
+        after = head.languages.get(language, {}).get("lines", 0)
+        languages[language] = {"base": before, "head": after, "change": after - before}
+    
+    return {
+        "base": base.to_dict(),
+        "head": head.to_dict(),
+        "metrics": metrics,
+        "languages": languages,
+    }
+
+
+def _find_run(db: DatabaseManager, repository_path: Path, ref: str) -> RunInfo:
+    """Find the stored run for a git reference or (abbreviated) commit hash."""
+    from ..utils.git_utils import GitReferenceError, resolve_commit
+    
+    try:
+        commit = resolve_commit(repository_path, ref)
+    except GitReferenceError:
+        commit = ref
+    
+    run = db.find_run(repository_path, commit)
+    if run is None:
+        raise click.ClickException(
+            f"No stored analysis for {ref} ({commit[:12]}); "
+            "run `analyze all --save-history` at that commit first"
+        )
+    return run
+
+
+def _display_comparison(comparison: Dict[str, Any], base: str, head: str):
+    """Display a run comparison in terminal format."""
+    table = Table(title=f"📈 {base} → {head}", show_header=True)
+    table.add_column("Metric", style="cyan")
+    table.add_column(base, justify="right")
+    table.add_column(head, justify="right")
+    table.add_column("Change", style="magenta", justify="right")
+    
+    for name, values in comparison["metrics"].items():
+        fmt = COMPARED_METRICS[name]
+        change = values["change"]
+        table.add_row(
+            name.replace("_", " ").title(),
+            fmt.format(values["base"]),
+            fmt.format(values["head"]),
+            ("+" if change > 0 else "") + fmt.format(change) if change else "-"
+        )
+    
+    console.print(table)
+    
+    if comparison["languages"]:
+        lang_table = Table(title="Lines by Language", show_header=True)
+        lang_table.add_column("Language", style="cyan")
+        lang_table.add_column(base, justify="right")
+        lang_table.add_column(head, justify="right")
+        lang_table.add_column("Change", style="magenta", justify="right")
+        
+        for language, values in comparison["languages"].items():
+            change = values["change"]
+            lang_table.add_row(
+                language,
+                f"{values['base']:,}",
+                f"{values['head']:,}",
+                f"{change:+,}" if change else "-"
+            )
+        
+        console.print(lang_table)
\ No newline at end of file
@@ -0,0 +1,233 @@
+"""
+Daemon command implementations.
+
+``serve`` runs the analysis daemon for one repository in the foreground;
+the ``daemon`` group holds the thin clients that query it. The clients
+only import Click and the socket helpers from ``repo_analyzer.daemon``,
+so a request costs little more than interpreter startup plus the
+daemon's answer.
+"""
+
+import shutil
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+import click
+
+from ..daemon import DAEMON_ANALYSES, DaemonError, send_request, socket_path
+
+
+@click.command()
+@click.argument("repository_path", type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.option(
+    "--exclude",
+    multiple=True,
+    help="Patterns to exclude (can be used multiple times)"
+)
+@click.option(
+    "--threshold",
+    type=int,
+    default=10,
+    help="Complexity threshold the per-file results are cached for"
+)
+@click.option(
+    "--watcher",
+    "watcher_kind",
+    type=click.Choice(["auto", "inotify", "poll"], case_sensitive=False),
+    default="auto",
+    show_default=True,
+    help="How to detect file changes"
+)
+@click.option(
+    "--poll-interval",
+    type=click.FloatRange(min=0.1),
+    default=1.0,
+    show_default=True,
+    help="Seconds between rescans of the polling watcher"
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Analyze every file at startup instead of reusing cached results"
+)
+@click.pass_context
+def serve(
+    ctx: click.Context,
+    repository_path: Path,
+    exclude: tuple,
+    threshold: int,
+    watcher_kind: str,
+    poll_interval: float,
+    no_cache: bool
+):
+    """
+    Run an analysis daemon for a repository.
+    
+    Analyzes the repository once, keeps every analyzer's per-file results
+    in memory and re-analyzes files as they change. Query it with
+    `repo-analyzer daemon analyze`; stop it with Ctrl+C or `daemon stop`.
+    
+    Example:
+        repo-analyzer serve ./my-project &
+        repo-analyzer daemon analyze complexity ./my-project
+    """
+    import signal
+    
+    from rich.console import Console
+    
+    from ..analyzers.factory import AnalyzerFactory
+    from ..analyzers.workspace import Workspace
+    from ..daemon import AnalysisServer
+    from ..storage.cache import DEFAULT_DATABASE_PATH, AnalysisCache, analysis_cache_options
+    from ..utils.watcher import WatcherError, create_watcher
+    
+    config = ctx.obj["config"]
+    status_console = Console(stderr=True)
+    repository_path = repository_path.resolve()
+    db_path = Path(config.get("database_path", DEFAULT_DATABASE_PATH))
+    
+    try:
+        watcher = create_watcher(watcher_kind, poll_interval)
+    except WatcherError as e:
+        raise click.BadParameter(str(e), param_hint="--watcher")
+    
+    analyzer_factory = AnalyzerFactory()
+    analyzers = {
+        "structure": analyzer_factory.get_structure_analyzer(),
+        "dependencies": analyzer_factory.get_dependency_analyzer(),
+        "complexity": analyzer_factory.get_complexity_analyzer(),
+        "quality": analyzer_factory.get_quality_analyzer(),
+    }
+    caches = {} if no_cache else {
+        name: AnalysisCache.for_analyzer(db_path, analyzers[name], options)
+        for name, options in analysis_cache_options(config, threshold).items()
+    }
+    workspace = Workspace(
+        repository_path,
+        analyzers,
+        exclude_patterns=list(exclude) + config.get("exclude_patterns", []),
+        caches=caches,
+        jobs=ctx.obj["jobs"]
+    )
+    server = AnalysisServer(workspace, watcher, socket_path(repository_path, db_path))
+    
+    try:
+        server.bind()
+    except DaemonError as e:
+        server.close()
+        raise click.ClickException(str(e))
+    # Stop cleanly (removing the socket) on SIGTERM as well as Ctrl+C
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        with status_console.status("Analyzing repository..."):
+            update = workspace.load()
+        if not ctx.obj.get("quiet"):
+            status_console.print(
+                f"Serving {len(workspace.files):,} files ({update.seconds:.1f}s to load) "
+                f"on {server.path} with the {watcher.kind} watcher"
+            )
+        server.serve_forever()
+    except KeyboardInterrupt:
+        if not ctx.obj.get("quiet"):
+            status_console.print("Daemon stopped")
+    finally:
+        server.close()
+
+
+@click.group()
+def daemon():
+    """📡 Query a running analysis daemon."""
+    pass
+
+
+@daemon.command(name="analyze")
+@click.argument("analysis", type=click.Choice(DAEMON_ANALYSES, case_sensitive=False))
+@click.argument("repository_path", type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.option(
+    "--threshold",
+    type=int,
+    default=10,
+    help="Complexity threshold for warnings"
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["terminal", "json"], case_sensitive=False),
+    default="terminal",
+    help="Output format"
+)
+@click.option(
+    "--fail-on-regression",
+    is_flag=True,
+    help="Exit with error code if quality has regressed"
+)
+@click.pass_context
+def daemon_analyze(
+    ctx: click.Context,
+    analysis: str,
+    repository_path: Path,
+    threshold: int,
+    output_format: str,
+    fail_on_regression: bool
+):
+    """
+    Get analysis results from the daemon serving a repository.
+    
+    Prints the same output as the corresponding `analyze` command, computed
+    from the daemon's resident results.
+    
+    Example:
+        repo-analyzer daemon analyze quality ./my-project --format json
+    """
+    response = _request(ctx, repository_path, {
+        "action": "analyze",
+        "analysis": analysis,
+        "threshold": threshold,
+        "format": output_format,
+        "fail_on_regression": fail_on_regression,
+        "width": shutil.get_terminal_size().columns,
+        "color": sys.stdout.isatty(),
+    })
+    click.echo(response["output"], nl=False)
+    ctx.exit(response.get("exit_code", 0))
+
+
+@daemon.command()
+@click.argument("repository_path", type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.pass_context
+def status(ctx: click.Context, repository_path: Path):
+    """Show whether a daemon is serving a repository, and its state."""
+    response = _request(ctx, repository_path, {"action": "status"})
+    workspace = response["workspace"]
+    click.echo(
+        f"Daemon {response['pid']} serving {workspace['repository_path']}: "
+        f"{workspace['files']:,} files, {response['requests']:,} requests, "
+        f"{response['watcher']} watcher"
+    )
+
+
+@daemon.command()
+@click.argument("repository_path", type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.pass_context
+def stop(ctx: click.Context, repository_path: Path):
+    """Stop the daemon serving a repository."""
+    response = _request(ctx, repository_path, {"action": "stop"})
+    click.echo(response["output"], nl=False)
+
+
+def _request(ctx: click.Context, repository_path: Path, request: Dict[str, Any]) -> Dict[str, Any]:
+    """Send a request to the repository's daemon, failing with a hint if none runs."""
+    from ..storage.cache import DEFAULT_DATABASE_PATH
+    
+    db_path = Path(ctx.obj["config"].get("database_path", DEFAULT_DATABASE_PATH))
+    try:
+        response = send_request(socket_path(repository_path, db_path), request)
+    except DaemonError:
+        raise click.ClickException(
+            f"No daemon is serving {repository_path}; "
+            f"start one with `repo-analyzer serve {repository_path}`"
+        )
+    if not response.get("ok"):
+        raise click.ClickException(response.get("error", "Daemon request failed"))
+    return response
\ No newline at end of file
@@ -0,0 +1,387 @@
+"""
+Analysis daemon: a resident Workspace served over a Unix socket.
+
+``repo-analyzer serve`` keeps the analyzers and their per-file results in
+memory, applies file system changes as a watcher reports them, and answers
+requests from ``repo-analyzer daemon ...`` clients. Each request is one
+JSON line and is answered with one JSON line; output is rendered by the
+server, so clients import nothing but the standard library and Click.
+
+Only the client half (``socket_path``, ``send_request``) is meant to be
+imported on the CLI's hot path; everything else is imported lazily.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import selectors
+import socket
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+if TYPE_CHECKING:
+    from .analyzers.workspace import Workspace
+
+
+logger = logging.getLogger(__name__)
+
+#: Analyses a daemon can answer; ``all`` runs every analyzer.
+DAEMON_ANALYSES = ("structure", "dependencies", "complexity", "quality", "all")
+
+#: Quiet period after the last file event before changes are applied.
+DEFAULT_DEBOUNCE = 0.05
+
+_MAX_REQUEST_BYTES = 1 << 20
+
+
+class DaemonError(Exception):
+    """Raised when the daemon cannot be reached or cannot start."""
+
+
+def socket_path(repository_path: Path, database_path: Path) -> Path:
+    """
+    Return the socket a daemon for this repository listens on.
+    
+    Sockets live next to the analysis database, named after a hash of the
+    resolved repository path, so clients and the daemon agree on the path
+    without any registry.
+    
+    Args:
+        repository_path: Repository root
+        database_path: Configured analysis database path
+    """
+    digest = hashlib.sha1(str(Path(repository_path).resolve()).encode()).hexdigest()[:16]
+    return Path(database_path).parent / "daemon" / f"{digest}.sock"
+
+
+def send_request(path: Path, request: Dict[str, Any], timeout: float = 60.0) -> Dict[str, Any]:
+    """
+    Send one request to a daemon and return its response.
+    
+    Args:
+        path: Daemon socket (see ``socket_path``)
+        request: Request object, at least ``{"action": ...}``
+        timeout: Seconds to wait for the response
+        
+    Raises:
+        DaemonError: If no daemon is listening or the connection fails
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        try:
+            client.connect(str(path))
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            raise DaemonError(f"No daemon is listening on {path}") from e
+        try:
+            client.sendall(json.dumps(request).encode() + b"\n")
+            reply = _read_line(client)
+        except OSError as e:
+            raise DaemonError(f"Daemon connection failed: {e}") from e
+    if not reply:
+        raise DaemonError("Daemon closed the connection without replying")
+    return json.loads(reply)
+
+
+def _read_line(connection: socket.socket) -> bytes:
+    chunks = []
+    received = 0
+    while True:
+        chunk = connection.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        received += len(chunk)
+        if b"\n" in chunk or received > _MAX_REQUEST_BYTES:
+            break
+    return b"".join(chunks).split(b"\n", 1)[0]
+
+
+class AnalysisServer:
+    """
+    Serves a Workspace on a Unix socket and keeps it current.
+    
+    Runs a single-threaded ``selectors`` loop over the listening socket and
+    the watcher's file descriptor (polling watchers are read on timeout).
+    File events are batched until ``debounce`` seconds pass without new
+    ones, and any pending batch is applied before a request is answered,
+    so responses never reflect a stale tree. With a polling watcher that
+    means a rescan (file stats only) per request.
+    
+    Actions:
+        ``analyze``: ``{"analysis", "threshold", "format", "width", "color"}``
+        returns ``{"output", "exit_code"}``; ``status`` returns workspace
+        and server counters; ``stop`` shuts the server down.
+    """
+    
+    def __init__(
+        self,
+        workspace: "Workspace",
+        watcher: Any,
+        path: Path,
+        debounce: float = DEFAULT_DEBOUNCE
+    ):
+        """
+        Create a server for a workspace (loaded before ``serve_forever``).
+        
+        Args:
+            workspace: Resident analysis state to serve
+            watcher: InotifyWatcher or PollingWatcher (see ``utils.watcher``)
+            path: Socket path to listen on
+            debounce: Seconds without file events before changes are applied
+        """
+        from .utils.watcher import FileChanges
+        
+        self.workspace = workspace
+        self.watcher = watcher
+        self.path = Path(path)
+        self.debounce = debounce
+        self.started_at = time.time()
+        self.requests = 0
+        self._pending = FileChanges()
+        self._last_event = 0.0
+        self._running = False
+        self._closed = False
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._listener: Optional[socket.socket] = None
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            "analyze": self._handle_analyze,
+            "status": self._handle_status,
+            "stop": self._handle_stop,
+        }
+    
+    def bind(self) -> None:
+        """
+        Create the listening socket, replacing a stale one.
+        
+        Binding before the workspace is loaded makes clients that connect
+        during the load wait for it instead of failing.
+        
+        Raises:
+            DaemonError: If another daemon is already serving this socket
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists():
+            try:
+                send_request(self.path, {"action": "status"}, timeout=2.0)
+            except DaemonError:
+                self.path.unlink()
+            else:
+                raise DaemonError(f"A daemon is already serving {self.workspace.root}")
+        
+        self._listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._listener.bind(str(self.path))
+        os.chmod(self.path, 0o600)
+        self._listener.listen()
+        self._listener.setblocking(False)
+    
+    def serve_forever(self) -> None:
+        """Answer requests until ``stop`` is requested or ``shutdown`` is called."""
+        if self._listener is None:
+            self.bind()
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._listener, selectors.EVENT_READ, "listener")
+        if self.watcher.fileno() is not None:
+            self._selector.register(self.watcher.fileno(), selectors.EVENT_READ, "watcher")
+        self.watcher.watch(self.workspace.directories())
+        # Catch changes made while the workspace was loading
+        self._pending.rescan = True
+        
+        self._running = True
+        try:
+            while self._running:
+                for key, _ in self._selector.select(self._timeout()):
+                    if key.data == "listener":
+                        self._accept()
+                    else:
+                        self._collect()
+                if self.watcher.fileno() is None:
+                    self._collect()
+                if self._pending and time.monotonic() - self._last_event >= self.debounce:
+                    self._apply_pending()
+        finally:
+            self.close()
+    
+    def shutdown(self) -> None:
+        """Stop the loop after the current iteration."""
+        self._running = False
+    
+    def close(self) -> None:
+        """Close the socket, the watcher and the workspace caches (idempotent)."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+        if self._listener is not None:
+            # Unlink first so clients see "no daemon" rather than a refused connection
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
+            self._listener.close()
+            self._listener = None
+        self.watcher.close()
+        for cache in self.workspace.caches.values():
+            cache.close()
+    
+    def _timeout(self) -> Optional[float]:
+        timeouts = [self.watcher.timeout]
+        if self._pending:
+            timeouts.append(max(0.0, self._last_event + self.debounce - time.monotonic()))
+        timeouts = [t for t in timeouts if t is not None]
+        return min(timeouts) if timeouts else None
+    
+    def _collect(self) -> None:
+        changes = self.watcher.read()
+        if changes:
+            self._pending.update(changes)
+            self._last_event = time.monotonic()
+    
+    def _apply_pending(self) -> None:
+        from .utils.watcher import FileChanges
+        
+        changes, self._pending = self._pending, FileChanges()
+        update = self.workspace.apply(changes)
+        if update.rescanned:
+            self.watcher.watch(self.workspace.directories())
+    
+    def _accept(self) -> None:
+        connection, _ = self._listener.accept()
+        with connection:
+            connection.setblocking(True)
+            connection.settimeout(5.0)
+            try:
+                request = json.loads(_read_line(connection) or b"{}")
+            except (OSError, ValueError) as e:
+                logger.debug("Dropping malformed request: %s", e)
+                return
+            response = self.handle(request)
+            try:
+                connection.sendall(json.dumps(response).encode() + b"\n")
+            except OSError as e:
+                logger.debug("Client went away: %s", e)
+    
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Answer one decoded request.
+        
+        Args:
+            request: Request object with an ``action`` key
+            
+        Returns:
+            Response object with ``ok`` and, on failure, ``error``
+        """
+        handler = self._handlers.get(request.get("action"))
+        if handler is None:
+            return {"ok": False, "error": f"Unknown action: {request.get('action')!r}"}
+        
+        self.requests += 1
+        start = time.perf_counter()
+        self._collect()
+        if self.watcher.fileno() is None:
+            # Polling watchers only notice changes on a rescan
+            self._pending.rescan = True
+        if self._pending:
+            self._apply_pending()
+        try:
+            response = handler(request)
+        except Exception as e:
+            logger.exception("Request failed: %s", request)
+            return {"ok": False, "error": str(e)}
+        response.update(ok=True, elapsed=time.perf_counter() - start)
+        return response
+    
+    def _handle_analyze(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        analysis = request.get("analysis", "all")
+        if analysis not in DAEMON_ANALYSES:
+            raise ValueError(f"Unknown analysis: {analysis}")
+        threshold = int(request.get("threshold", 10))
+        names = list(self.workspace.analyzers) if analysis == "all" else [analysis]
+        results = {
+            name: self.workspace.result(
+                name, **({"complexity_threshold": threshold} if name == "complexity" else {})
+            )
+            for name in names
+        }
+        output = render(
+            results,
+            threshold,
+            request.get("format", "terminal"),
+            width=int(request.get("width", 100)),
+            color=bool(request.get("color", False)),
+            import_graph=self.workspace.import_graph() if "dependencies" in results else None
+        )
+        exit_code = 0
+        if request.get("fail_on_regression") and getattr(results.get("quality"), "has_regression", False):
+            output += "Quality regression detected! Failing build.\n"
+            exit_code = 1
+        return {"output": output, "exit_code": exit_code}
+    
+    def _handle_status(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "workspace": self.workspace.to_dict(),
+            "watcher": self.watcher.kind,
+            "pid": os.getpid(),
+            "started_at": self.started_at,
+            "requests": self.requests,
+        }
+    
+    def _handle_stop(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        self.shutdown()
+        return {"output": f"Stopped daemon for {self.workspace.root}\n"}
+
+
+def render(
+    results: Dict[str, Any],
+    threshold: int,
+    output_format: str,
+    width: int = 100,
+    color: bool = False,
+    import_graph: Any = None
+) -> str:
+    """
+    Render repository results the way the ``analyze`` commands print them.
+    
+    Args:
+        results: Repository-level results keyed by analyzer name
+        threshold: Complexity threshold for the complexity table
+        output_format: ``"terminal"`` or ``"json"``
+        width: Terminal width of the client
+        color: Whether the client's terminal supports color
+        import_graph: ImportGraph reported with the dependency results
+    """
+    if output_format == "json":
+        data = {name: result.to_dict() for name, result in results.items()}
+        if import_graph is not None and "dependencies" in data:
+            data["dependencies"]["import_graph"] = import_graph.to_dict()
+        payload = next(iter(data.values())) if len(data) == 1 else data
+        # Same serializer as the analyze commands' JSON output
+        from .analyzers.results import write_json_document
+        
+        buffer = io.StringIO()
+        write_json_document(payload, buffer)
+        return buffer.getvalue()
+    
+    from rich.console import Console
+    
+    from .commands import analyze as commands
+    
+    buffer = io.StringIO()
+    out = Console(file=buffer, width=width, force_terminal=color, no_color=not color)
+    displays = {
+        "structure": lambda result: commands._display_structure_analysis(result, out=out),
+        "dependencies": lambda result: commands._display_dependency_analysis(
+            result, import_graph, out=out
+        ),
+        "complexity": lambda result: commands._display_complexity_analysis(
+            result, threshold, out=out
+        ),
+        "quality": lambda result: commands._display_quality_analysis(result, out=out),
+    }
+    for name, result in results.items():
+        displays[name](result)
+    return buffer.getvalue()
\ No newline at end of file
@@ -0,0 +1,530 @@
+"""
+Offline vulnerability advisory database.
+
+Imports OSV-format advisories (https://ossf.github.io/osv-schema/) once
+into a local SQLite database indexed by ecosystem and package name, so
+checking pinned dependencies needs no network and no JSON parsing.
+
+Version ranges are stored pre-parsed: every version is encoded as a key
+whose plain string order is the version order of its ecosystem, so
+"is 2.4.1 inside [2.0, 2.4.3)" is an indexed lookup plus two string
+comparisons inside SQLite. PyPI versions follow PEP 440; other
+ecosystems follow SemVer, with a PEP 440-style fallback for versions that
+are not SemVer. Versions that parse under neither are matched exactly.
+
+Example:
+    with AdvisoryDatabase(advisory_path(db_path)) as advisories:
+        advisories.load([Path("pypi-osv.zip")])
+        findings = advisories.check([("PyPI", "requests", "2.19.0")])
+"""
+
+import json
+import re
+import sqlite3
+import zipfile
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS advisories (
+        id TEXT PRIMARY KEY,
+        summary TEXT NOT NULL,
+        severity TEXT,
+        aliases TEXT NOT NULL,
+        modified TEXT
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS affected_ranges (
+        advisory_id TEXT NOT NULL,
+        ecosystem TEXT NOT NULL,
+        package TEXT NOT NULL,
+        introduced TEXT NOT NULL,
+        fixed TEXT,
+        last_affected TEXT,
+        fixed_version TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS affected_ranges_package ON affected_ranges (ecosystem, package)",
+    "CREATE INDEX IF NOT EXISTS affected_ranges_advisory ON affected_ranges (advisory_id)",
+    """
+    CREATE TABLE IF NOT EXISTS affected_versions (
+        advisory_id TEXT NOT NULL,
+        ecosystem TEXT NOT NULL,
+        package TEXT NOT NULL,
+        version TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS affected_versions_package
+    ON affected_versions (ecosystem, package, version)
+    """,
+    "CREATE INDEX IF NOT EXISTS affected_versions_advisory ON affected_versions (advisory_id)",
+    """
+    CREATE TABLE IF NOT EXISTS advisory_meta (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    ) WITHOUT ROWID
+    """,
+)
+
+#: Advisories written per transaction while loading.
+LOAD_BATCH_SIZE = 1000
+
+_ECOSYSTEMS = {
+    name.lower(): name
+    for name in ("PyPI", "npm", "crates.io", "Go", "RubyGems", "Maven", "NuGet", "Packagist", "Pub", "Hex")
+}
+
+_PEP440 = re.compile(
+    r"""
+    v?(?:(?P<epoch>\d+)!)?
+    (?P<release>\d+(?:\.\d+)*)
+    (?:[-_.]?(?P<pre>alpha|beta|preview|pre|rc|a|b|c)[-_.]?(?P<pre_n>\d*))?
+    (?:-(?P<post_implicit>\d+)|[-_.]?(?:post|rev|r)[-_.]?(?P<post_n>\d*))?
+    (?:[-_.]?dev[-_.]?(?P<dev_n>\d*))?
+    (?:\+[a-z0-9]+(?:[-_.][a-z0-9]+)*)?
+    """,
+    re.VERBOSE | re.IGNORECASE
+)
+
+_SEMVER = re.compile(
+    r"v?(?P<release>\d+\.\d+\.\d+)(?:-(?P<pre>[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?(?:\+[0-9A-Za-z.-]+)?"
+)
+
+# Suffix markers sort below "." (the release separator) and in PEP 440
+# order: dev < a < b < rc < final < post. "(" also starts a SemVer
+# prerelease, which sorts before the final ")".
+_PHASES = {
+    "dev": "%", "a": "&", "alpha": "&", "b": "'", "beta": "'",
+    "c": "(", "rc": "(", "pre": "(", "preview": "(", "post": "*",
+}
+_FINAL = ")"
+
+
+class Vulnerability(NamedTuple):
+    """One advisory affecting one pinned dependency."""
+    ecosystem: str
+    package: str
+    version: str
+    advisory_id: str
+    summary: str
+    severity: Optional[str]
+    aliases: Tuple[str, ...]
+    fixed_version: Optional[str]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        data = self._asdict()
+        data["aliases"] = list(self.aliases)
+        return data
+
+
+@dataclass
+class LoadStats:
+    """Counters for one ``AdvisoryDatabase.load`` call."""
+    advisories: int = 0
+    ranges: int = 0
+    versions: int = 0
+    withdrawn: int = 0
+    skipped: int = 0
+    errors: List[str] = field(default_factory=list)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "advisories": self.advisories,
+            "ranges": self.ranges,
+            "versions": self.versions,
+            "withdrawn": self.withdrawn,
+            "skipped": self.skipped,
+            "errors": self.errors
+        }
+
+
+def advisory_path(database_path: Path) -> Path:
+    """Return the advisory database stored next to the analysis database."""
+    return Path(database_path).parent / "advisories.db"
+
+
+def normalize_ecosystem(ecosystem: str) -> str:
+    """Return the canonical OSV spelling of an ecosystem name (``pypi`` -> ``PyPI``)."""
+    return _ECOSYSTEMS.get(ecosystem.lower(), ecosystem)
+
+
+def normalize_package(ecosystem: str, name: str) -> str:
+    """Normalize a package name the way its ecosystem compares names."""
+    if ecosystem == "PyPI":
+        # PEP 503: case-insensitive, runs of "-", "_" and "." are equivalent
+        return re.sub(r"[-_.]+", "-", name).lower()
+    if ecosystem in ("npm", "crates.io", "Packagist", "Pub", "Hex"):
+        return name.lower()
+    return name
+
+
+def _number(digits: str) -> str:
+    """Encode a non-negative integer so longer numbers sort after shorter ones."""
+    digits = digits.lstrip("0") or "0"
+    return f"{len(digits):02d}{digits}"
+
+
+def _release(release: str) -> str:
+    parts = release.split(".")
+    # Trailing zeros do not count: 1.0 == 1.0.0
+    while len(parts) > 1 and not parts[-1].strip("0"):
+        parts.pop()
+    return ".".join(map(_number, parts))
+
+
+def _pep440_key(version: str) -> Optional[str]:
+    match = _PEP440.fullmatch(version.strip())
+    if match is None:
+        return None
+    key = _number(match["epoch"] or "0") + "!" + _release(match["release"])
+    if match["pre"]:
+        key += _PHASES[match["pre"].lower()] + _number(match["pre_n"] or "0")
+    post = match["post_implicit"] if match["post_implicit"] is not None else match["post_n"]
+    if post is not None:
+        key += _PHASES["post"] + _number(post or "0")
+    if match["dev_n"] is not None:
+        key += _PHASES["dev"] + _number(match["dev_n"] or "0")
+    return key + _FINAL
+
+
+def _semver_key(version: str) -> Optional[str]:
+    match = _SEMVER.fullmatch(version.strip())
+    if match is None:
+        return None
+    key = _number("0") + "!" + _release(match["release"])
+    if match["pre"]:
+        # Numeric identifiers ("+") sort below alphanumeric ones (","), and
+        # a shorter list of equal identifiers sorts first (")" ends the list)
+        key += "("
+        for identifier in match["pre"].split("."):
+            if identifier.isdigit():
+                key += "+" + _number(identifier)
+            else:
+                key += "," + identifier + "!"
+    return key + _FINAL
+
+
+@lru_cache(maxsize=65536)
+def version_key(ecosystem: str, version: str) -> Optional[str]:
+    """
+    Encode a version so that string order is version order.
+    
+    Args:
+        ecosystem: Canonical ecosystem name, e.g. ``"PyPI"`` or ``"npm"``
+        version: Version string as published
+        
+    Returns:
+        Sortable key, or None if the version cannot be ordered
+    """
+    if ecosystem == "PyPI":
+        return _pep440_key(version)
+    return _semver_key(version) or _pep440_key(version)
+
+
+def _exact_key(ecosystem: str, version: str) -> str:
+    """Key used for exact matches; unorderable versions compare as plain text."""
+    return version_key(ecosystem, version) or "=" + version.strip()
+
+
+def _intervals(
+    ecosystem: str,
+    events: Sequence[Dict[str, str]]
+) -> Optional[List[Tuple[str, Optional[str], Optional[str], Optional[str]]]]:
+    """
+    Turn OSV range events into ``(introduced, fixed, last_affected, fixed_version)`` rows.
+    
+    Events are replayed in version order; an interval left open by the
+    last event affects every later version (``fixed`` is None). Returns
+    None when a bound cannot be ordered.
+    """
+    keyed = []
+    for event in events:
+        for kind in ("introduced", "fixed", "last_affected"):
+            if kind in event:
+                version = str(event[kind])
+                key = "" if kind == "introduced" and version == "0" else version_key(ecosystem, version)
+                if key is None:
+                    return None
+                keyed.append((key, kind != "introduced", kind, version))
+    
+    intervals = []
+    start = None
+    for key, _, kind, version in sorted(keyed):
+        if kind == "introduced":
+            if start is None:
+                start = key
+        elif start is not None:
+            if kind == "fixed":
+                intervals.append((start, key, None, version))
+            else:
+                intervals.append((start, None, key, None))
+            start = None
+    if start is not None:
+        intervals.append((start, None, None, None))
+    return intervals
+
+
+def _iter_documents(paths: Iterable[Path], stats: LoadStats) -> Iterator[Dict[str, Any]]:
+    """Yield advisory documents from JSON files, directories and zip archives."""
+    for path in paths:
+        path = Path(path)
+        try:
+            if path.is_dir():
+                yield from _iter_documents(sorted(path.rglob("*.json")), stats)
+            elif zipfile.is_zipfile(path):
+                with zipfile.ZipFile(path) as archive:
+                    for name in archive.namelist():
+                        if name.endswith(".json"):
+                            yield from _parse_json(archive.read(name), f"{path}:{name}", stats)
+            else:
+                yield from _parse_json(path.read_bytes(), str(path), stats)
+        except (OSError, zipfile.BadZipFile) as e:
+            stats.errors.append(f"{path}: {e}")
+
+
+def _parse_json(data: bytes, source: str, stats: LoadStats) -> Iterator[Dict[str, Any]]:
+    try:
+        document = json.loads(data)
+    except ValueError as e:
+        stats.errors.append(f"{source}: {e}")
+        return
+    # A file holds one advisory or a list of them
+    for advisory in document if isinstance(document, list) else [document]:
+        if isinstance(advisory, dict) and advisory.get("id"):
+            yield advisory
+        else:
+            stats.skipped += 1
+
+
+class AdvisoryDatabase:
+    """
+    SQLite-backed store of OSV advisories for offline vulnerability checks.
+    
+    Example:
+        with AdvisoryDatabase(path) as advisories:
+            for finding in advisories.check(pins):
+                print(finding.package, finding.advisory_id)
+    """
+    
+    def __init__(self, db_path: Path):
+        """
+        Open (and create if needed) the advisory database.
+        
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+    
+    def load(self, paths: Iterable[Path]) -> LoadStats:
+        """
+        Import OSV advisories, replacing stored advisories with the same id.
+        
+        Withdrawn advisories are removed. Affected ranges of type ``GIT``
+        (commit hashes) cannot be matched against versions and are skipped.
+        
+        Args:
+            paths: OSV JSON files, directories of them, or zip archives as
+                published by osv.dev (e.g. ``PyPI/all.zip``)
+                
+        Returns:
+            LoadStats with the number of advisories and rows imported
+        """
+        stats = LoadStats()
+        batch: List[Dict[str, Any]] = []
+        for advisory in _iter_documents(paths, stats):
+            batch.append(advisory)
+            if len(batch) >= LOAD_BATCH_SIZE:
+                self._store(batch, stats)
+                batch = []
+        self._store(batch, stats)
+        
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO advisory_meta (key, value) VALUES ('loaded_at', ?)",
+                (datetime.now(timezone.utc).isoformat(timespec="seconds"),)
+            )
+        return stats
+    
+    def _store(self, batch: List[Dict[str, Any]], stats: LoadStats) -> None:
+        advisories, ranges, versions = [], [], []
+        for advisory in batch:
+            if advisory.get("withdrawn"):
+                stats.withdrawn += 1
+                continue
+            advisory_id = advisory["id"]
+            severity = (advisory.get("database_specific") or {}).get("severity")
+            advisories.append((
+                advisory_id,
+                advisory.get("summary") or advisory.get("details", "").split("\n", 1)[0],
+                str(severity).upper() if severity else None,
+                json.dumps(advisory.get("aliases") or []),
+                advisory.get("modified")
+            ))
+            for affected in advisory.get("affected") or []:
+                package = affected.get("package") or {}
+                if not package.get("ecosystem") or not package.get("name"):
+                    continue
+                ecosystem = normalize_ecosystem(package["ecosystem"])
+                name = normalize_package(ecosystem, package["name"])
+                for version_range in affected.get("ranges") or []:
+                    if version_range.get("type") not in ("ECOSYSTEM", "SEMVER"):
+                        continue
+                    intervals = _intervals(ecosystem, version_range.get("events") or [])
+                    if intervals is None:
+                        stats.skipped += 1
+                        continue
+                    ranges.extend((advisory_id, ecosystem, name, *interval) for interval in intervals)
+                versions.extend(
+                    (advisory_id, ecosystem, name, _exact_key(ecosystem, str(version)))
+                    for version in affected.get("versions") or []
+                )
+        
+        ids = [(advisory["id"],) for advisory in batch]
+        with self._conn:
+            for table, column in (
+                ("advisories", "id"),
+                ("affected_ranges", "advisory_id"),
+                ("affected_versions", "advisory_id"),
+            ):
+                self._conn.executemany(f"DELETE FROM {table} WHERE {column} = ?", ids)
+            self._conn.executemany(
+                "INSERT INTO advisories (id, summary, severity, aliases, modified) "
+                "VALUES (?, ?, ?, ?, ?)",
+                advisories
+            )
+            self._conn.executemany(
+                "INSERT INTO affected_ranges "
+                "(advisory_id, ecosystem, package, introduced, fixed, last_affected, fixed_version) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                ranges
+            )
+            self._conn.executemany(
+                "INSERT INTO affected_versions (advisory_id, ecosystem, package, version) "
+                "VALUES (?, ?, ?, ?)",
+                versions
+            )
+        stats.advisories += len(advisories)
+        stats.ranges += len(ranges)
+        stats.versions += len(versions)
+    
+    def check(self, pins: Iterable[Tuple[str, str, str]]) -> List[Vulnerability]:
+        """
+        Find advisories affecting pinned dependencies.
+        
+        All pins are checked in one query: they are written to a temporary
+        table and joined against the indexed ranges, so the cost per pin is
+        an index lookup plus the range comparisons.
+        
+        Args:
+            pins: ``(ecosystem, package, version)`` tuples
+            
+        Returns:
+            One Vulnerability per affected pin and advisory, in pin order
+        """
+        rows = []
+        pinned = []
+        for index, (ecosystem, package, version) in enumerate(pins):
+            ecosystem = normalize_ecosystem(ecosystem)
+            rows.append((index, ecosystem, normalize_package(ecosystem, package), _exact_key(ecosystem, version)))
+            pinned.append((ecosystem, package, version))
+        if not rows:
+            return []
+        
+        self._conn.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS pins "
+            "(idx INTEGER PRIMARY KEY, ecosystem TEXT, package TEXT, version TEXT)"
+        )
+        with self._conn:
+            self._conn.execute("DELETE FROM temp.pins")
+            self._conn.executemany("INSERT INTO temp.pins VALUES (?, ?, ?, ?)", rows)
+            matches = self._conn.execute(
+                """
+                SELECT p.idx, r.advisory_id, r.fixed_version
+                FROM temp.pins p JOIN affected_ranges r
+                    ON r.ecosystem = p.ecosystem AND r.package = p.package
+                WHERE p.version >= r.introduced
+                    AND (r.fixed IS NULL OR p.version < r.fixed)
+                    AND (r.last_affected IS NULL OR p.version <= r.last_affected)
+                    AND p.version NOT LIKE '=%'
+                UNION
+                SELECT p.idx, v.advisory_id, NULL
+                FROM temp.pins p JOIN affected_versions v
+                    ON v.ecosystem = p.ecosystem AND v.package = p.package AND v.version = p.version
+                ORDER BY 1, 2
+                """
+            ).fetchall()
+            self._conn.execute("DELETE FROM temp.pins")
+        
+        details = self._advisories({advisory_id for _, advisory_id, _ in matches})
+        findings: Dict[Tuple[int, str], Vulnerability] = {}
+        for index, advisory_id, fixed_version in matches:
+            previous = findings.get((index, advisory_id))
+            if previous is not None and (previous.fixed_version or fixed_version is None):
+                continue
+            summary, severity, aliases = details.get(advisory_id, ("", None, ()))
+            findings[index, advisory_id] = Vulnerability(
+                *pinned[index], advisory_id, summary, severity, aliases, fixed_version
+            )
+        return list(findings.values())
+    
+    def _advisories(self, ids: Iterable[str]) -> Dict[str, Tuple[str, Optional[str], Tuple[str, ...]]]:
+        id_list = sorted(ids)
+        details = {}
+        for start in range(0, len(id_list), 500):
+            batch = id_list[start:start + 500]
+            placeholders = ", ".join("?" * len(batch))
+            for advisory_id, summary, severity, aliases in self._conn.execute(
+                f"SELECT id, summary, severity, aliases FROM advisories WHERE id IN ({placeholders})",
+                batch
+            ):
+                details[advisory_id] = (summary, severity, tuple(json.loads(aliases)))
+        return details
+    
+    def info(self) -> Dict[str, Any]:
+        """Return advisory counts per ecosystem and the time of the last load."""
+        ecosystems = dict(self._conn.execute(
+            "SELECT ecosystem, COUNT(DISTINCT advisory_id) FROM ("
+            "SELECT ecosystem, advisory_id FROM affected_ranges "
+            "UNION SELECT ecosystem, advisory_id FROM affected_versions"
+            ") GROUP BY ecosystem ORDER BY ecosystem"
+        ).fetchall())
+        loaded_at = self._conn.execute(
+            "SELECT value FROM advisory_meta WHERE key = 'loaded_at'"
+        ).fetchone()
+        return {
+            "path": str(self.db_path),
+            "advisories": self._conn.execute("SELECT COUNT(*) FROM advisories").fetchone()[0],
+            "ecosystems": ecosystems,
+            "loaded_at": loaded_at[0] if loaded_at else None
+        }
+    
+    def clear(self) -> None:
+        """Remove every stored advisory."""
+        with self._conn:
+            for table in ("advisories", "affected_ranges", "affected_versions", "advisory_meta"):
+                self._conn.execute(f"DELETE FROM {table}")
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+    
+    def __enter__(self) -> "AdvisoryDatabase":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
\ No newline at end of file
@@ -0,0 +1,753 @@
+"""
+Persistent per-file analysis cache.
+
+Stores serialized FileAnalysis results in the local SQLite database so that
+unchanged files are skipped on repeated runs. Entries are keyed by file path
+and validated against file size, modification time and content hash, and
+are invalidated automatically when the analyzer code or the analysis
+configuration changes. The size, time and hash stored with a result are
+those of the bytes the analyzer read (``FileStamp``), so an edit made
+while a file is being analyzed is never recorded as analyzed.
+
+BlobCache stores the same results keyed by git blob SHA instead, for
+analyzing historical commits straight from the object database: a blob's
+SHA identifies its content, so no validation is needed.
+
+LockfileCache stores parsed lockfile dependency graphs keyed by the hash
+of the lockfile and its manifest, so unchanged lockfiles (including copies
+in other checkouts) are not parsed again.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from ..analyzers import lockfiles
+from ..analyzers.base import BaseAnalyzer, FileAnalysis
+from ..analyzers.lockfiles import LockfileGraph, lockfile_inputs, parse_lockfile
+from ..utils.file_access import FileStamp, content_hash, get_max_file_size, stamp_file
+
+
+DEFAULT_DATABASE_PATH = Path.home() / ".repo-analyzer" / "analysis.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS file_analysis_cache (
+    analyzer TEXT NOT NULL,
+    file_path TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (analyzer, file_path)
+) WITHOUT ROWID
+"""
+
+_BLOB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blob_analysis_cache (
+    analyzer TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    blob_sha TEXT NOT NULL,
+    language TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (analyzer, fingerprint, blob_sha, language)
+) WITHOUT ROWID
+"""
+
+_LOCKFILE_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS lockfile_graph_cache (
+        content_hash TEXT NOT NULL,
+        fingerprint TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        PRIMARY KEY (content_hash, fingerprint)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS lockfile_stat_cache (
+        file_path TEXT PRIMARY KEY,
+        stamp TEXT NOT NULL,
+        content_hash TEXT NOT NULL
+    ) WITHOUT ROWID
+    """,
+)
+
+#: ``(blob SHA, language)``; the language comes from the file name, so a
+#: renamed blob can need a different analysis.
+BlobKey = Tuple[str, str]
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a single cache session."""
+    hits: int = 0
+    misses: int = 0
+    invalidated: int = 0
+    stores: int = 0
+    
+    @property
+    def lookups(self) -> int:
+        """Total number of cache lookups."""
+        return self.hits + self.misses
+    
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        return self.hits / self.lookups if self.lookups else 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidated": self.invalidated,
+            "stores": self.stores,
+            "hit_rate": self.hit_rate
+        }
+
+
+def hash_content(data: bytes) -> str:
+    """Return the content hash used to validate cache entries."""
+    return content_hash(data)
+
+
+def hash_files(paths: Iterable[Path], chunk_size: int = 1 << 20) -> str:
+    """
+    Hash several files in chunks, without reading any of them whole.
+    
+    Missing files hash differently from empty ones, so adding a manifest
+    changes the result.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        try:
+            with open(path, "rb") as handle:
+                digest.update(b"\x01")
+                for chunk in iter(lambda: handle.read(chunk_size), b""):
+                    digest.update(chunk)
+        except OSError:
+            digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _hash_source_file(source_file: str) -> str:
+    try:
+        return hash_content(Path(source_file).read_bytes())
+    except OSError:
+        return ""
+
+
+#: Packages holding the code analyzers build on (parsing, scanning, metrics)
+_ANALYSIS_PACKAGES = ("analyzers", "utils")
+
+
+@lru_cache(maxsize=None)
+def _analysis_code_hash() -> str:
+    """Hash every module of the analysis packages, in a stable order."""
+    package_root = Path(__file__).resolve().parents[1]
+    digest = hashlib.blake2b(digest_size=16)
+    for package in _ANALYSIS_PACKAGES:
+        for source_file in sorted((package_root / package).glob("*.py")):
+            digest.update(f"{package}/{source_file.name}".encode())
+            digest.update(_hash_source_file(str(source_file)).encode())
+    return digest.hexdigest()
+
+
+def analyzer_fingerprint(analyzer: BaseAnalyzer) -> str:
+    """
+    Compute a fingerprint that changes whenever the analyzer changes.
+    
+    Combines the declared analyzer ``version`` with a hash of the source
+    files of every class in the analyzer's MRO and of every module in the
+    ``analyzers`` and ``utils`` packages, so editing analyzer code or a
+    helper it calls (parsing, complexity scanning, metrics) invalidates
+    its cached results even without a version bump.
+    
+    Args:
+        analyzer: Analyzer instance producing the cached results
+        
+    Returns:
+        Hex digest identifying the analyzer implementation
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(getattr(analyzer, "version", "")).encode())
+    digest.update(_analysis_code_hash().encode())
+    for klass in type(analyzer).__mro__:
+        if klass.__module__ in ("builtins", "abc"):
+            continue
+        try:
+            source_file = inspect.getsourcefile(klass)
+        except TypeError:
+            source_file = None
+        digest.update(klass.__qualname__.encode())
+        if source_file:
+            digest.update(_hash_source_file(source_file).encode())
+    return digest.hexdigest()
+
+
+def config_fingerprint(config: Optional[Mapping[str, Any]]) -> str:
+    """
+    Compute a stable fingerprint of the configuration that affects results.
+    
+    Args:
+        config: Analysis options such as thresholds; order-insensitive
+        
+    Returns:
+        Hex digest identifying the configuration
+    """
+    encoded = json.dumps(config or {}, sort_keys=True, default=str)
+    return hash_content(encoded.encode())
+
+
+def analysis_cache_options(
+    config: Mapping[str, Any],
+    complexity_threshold: int
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Return the cache options of the complexity and quality analyzers.
+    
+    Every command that caches their per-file results builds the options
+    here, so runs with the same configuration share cache entries.
+    
+    Args:
+        config: Loaded configuration (``include_tests`` is read from
+            ``analysis.complexity``)
+        complexity_threshold: Complexity threshold of the run
+        
+    Returns:
+        Options keyed by analyzer name (``complexity``, ``quality``)
+    """
+    analysis = config.get("analysis", {})
+    return {
+        "complexity": {
+            "complexity_threshold": complexity_threshold,
+            "include_tests": bool(analysis.get("complexity", {}).get("include_tests", False)),
+        },
+        "quality": analysis.get("quality", {}),
+    }
+
+
+def _cache_identity(
+    analyzer: BaseAnalyzer,
+    config: Optional[Mapping[str, Any]],
+    routes: Optional[Mapping[str, BaseAnalyzer]] = None
+) -> Tuple[str, str]:
+    """
+    Return the ``(namespace, fingerprint)`` of an analyzer's cache entries.
+    
+    Routed languages are part of the namespace, so runs with and without
+    routes keep separate entries instead of evicting each other's.
+    """
+    klass = type(analyzer)
+    namespace = f"{klass.__module__}.{klass.__qualname__}"
+    identity = analyzer_fingerprint(analyzer)
+    if routes:
+        routed = sorted(routes.items())
+        namespace += "[" + ",".join(
+            f"{language}:{type(target).__qualname__}" for language, target in routed
+        ) + "]"
+        identity += "".join(analyzer_fingerprint(target) for _, target in routed)
+    # The size limit decides which files are skipped, so it is part of the key
+    options = {**(config or {}), "max_file_size": get_max_file_size()}
+    fingerprint = hash_content((identity + config_fingerprint(options)).encode())
+    return namespace, fingerprint
+
+
+class AnalysisCache:
+    """
+    SQLite-backed cache of FileAnalysis results for one analyzer.
+    
+    A lookup first compares size and modification time, which answers the
+    common case without reading the file. When only the modification time
+    differs (e.g. after a fresh checkout) the content hash decides, and a
+    matching hash refreshes the stored timestamp.
+    
+    Example:
+        with AnalysisCache.for_analyzer(db_path, analyzer, {"threshold": 10}) as cache:
+            analysis = cache.fetch(path, analyzer.analyze_file)
+    """
+    
+    def __init__(self, db_path: Path, analyzer_name: str, fingerprint: str):
+        """
+        Open (and create if needed) the cache database.
+        
+        Args:
+            db_path: Path to the SQLite database file
+            analyzer_name: Namespace for entries, one per analyzer type
+            fingerprint: Analyzer version and configuration fingerprint
+        """
+        self.db_path = Path(db_path)
+        self.analyzer_name = analyzer_name
+        self.fingerprint = fingerprint
+        self.stats = CacheStats()
+        
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._pending: Dict[str, Tuple[Any, ...]] = {}
+    
+    @classmethod
+    def for_analyzer(
+        cls,
+        db_path: Path,
+        analyzer: BaseAnalyzer,
+        config: Optional[Mapping[str, Any]] = None,
+        routes: Optional[Mapping[str, BaseAnalyzer]] = None
+    ) -> "AnalysisCache":
+        """
+        Open a cache namespaced and fingerprinted for the given analyzer.
+        
+        Args:
+            db_path: Path to the SQLite database file
+            analyzer: Analyzer whose results are cached
+            config: Options that influence the analyzer's results
+            routes: Analyzers by language the results also come from (see
+                ``executor.analyze_files``)
+            
+        Returns:
+            AnalysisCache ready for lookups
+        """
+        return cls(db_path, *_cache_identity(analyzer, config, routes))
+    
+    def get(self, file_path: Path) -> Optional[FileAnalysis]:
+        """
+        Return the cached analysis for a file if it is still valid.
+        
+        Args:
+            file_path: Path to the analyzed file
+            
+        Returns:
+            Cached FileAnalysis, or None on a miss
+        """
+        path = file_path if isinstance(file_path, Path) else Path(file_path)
+        key = str(path.resolve())
+        try:
+            # Not path.stat(): a ScannedFile would answer with its scan-time stat
+            stat = os.stat(path)
+        except OSError:
+            self.stats.misses += 1
+            return None
+        
+        row = self._conn.execute(
+            "SELECT fingerprint, size, mtime_ns, content_hash, payload "
+            "FROM file_analysis_cache WHERE analyzer = ? AND file_path = ?",
+            (self.analyzer_name, key)
+        ).fetchone()
+        if row is None:
+            self.stats.misses += 1
+            return None
+        
+        fingerprint, size, mtime_ns, stored_hash, payload = row
+        if fingerprint != self.fingerprint:
+            self.stats.invalidated += 1
+            self.stats.misses += 1
+            return None
+        if size != stat.st_size:
+            self.stats.misses += 1
+            return None
+        if mtime_ns != stat.st_mtime_ns:
+            try:
+                current_hash = hash_content(path.read_bytes())
+            except OSError:
+                current_hash = ""
+            if current_hash != stored_hash:
+                self.stats.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE file_analysis_cache SET mtime_ns = ? "
+                "WHERE analyzer = ? AND file_path = ?",
+                (stat.st_mtime_ns, self.analyzer_name, key)
+            )
+        
+        self.stats.hits += 1
+        analysis = FileAnalysis.from_dict(json.loads(payload))
+        analysis.file_path = path
+        return analysis
+    
+    def load_baseline(self, file_paths: Iterable[Path]) -> Dict[Path, FileAnalysis]:
+        """
+        Load valid cached results for many files at once.
+        
+        Used by ``--changed-since`` runs for the files git reports as
+        unchanged. Entries are read in batched queries and validated like
+        ``get``: size and modification time must match, and when only the
+        time differs the content hash decides. Git alone cannot vouch for
+        an entry, since it may have been stored from another branch or from
+        uncommitted edits. Entries of a different analyzer version or
+        configuration are ignored.
+        
+        Args:
+            file_paths: Files to look up
+            
+        Returns:
+            Mapping from the given paths to their cached results
+        """
+        keys = {str(Path(p).resolve()): p for p in file_paths}
+        baseline: Dict[Path, FileAnalysis] = {}
+        touched: List[Tuple[int, str, str]] = []
+        key_list = list(keys)
+        for start in range(0, len(key_list), 500):
+            batch = key_list[start:start + 500]
+            placeholders = ", ".join("?" * len(batch))
+            rows = self._conn.execute(
+                "SELECT file_path, size, mtime_ns, content_hash, payload FROM file_analysis_cache "
+                f"WHERE analyzer = ? AND fingerprint = ? AND file_path IN ({placeholders})",
+                (self.analyzer_name, self.fingerprint, *batch)
+            ).fetchall()
+            for key, size, mtime_ns, stored_hash, payload in rows:
+                try:
+                    stat = os.stat(key)
+                    if stat.st_size != size:
+                        continue
+                    if stat.st_mtime_ns != mtime_ns:
+                        if hash_content(Path(key).read_bytes()) != stored_hash:
+                            continue
+                        touched.append((stat.st_mtime_ns, self.analyzer_name, key))
+                except OSError:
+                    continue
+                analysis = FileAnalysis.from_dict(json.loads(payload))
+                analysis.file_path = Path(keys[key])
+                baseline[keys[key]] = analysis
+        if touched:
+            self._conn.executemany(
+                "UPDATE file_analysis_cache SET mtime_ns = ? WHERE analyzer = ? AND file_path = ?",
+                touched
+            )
+        
+        self.stats.hits += len(baseline)
+        self.stats.misses += len(keys) - len(baseline)
+        return baseline
+    
+    def put(self, file_path: Path, analysis: FileAnalysis, stamp: Optional[FileStamp]) -> None:
+        """
+        Record the analysis of a file; written on the next ``flush``.
+        
+        Args:
+            file_path: Path to the analyzed file
+            analysis: Result produced by the analyzer
+            stamp: Stamp of the bytes the analyzer read (``ParsedFile.stamp``);
+                results without one (binary files) are not stored
+        """
+        if stamp is None:
+            return
+        path = file_path if isinstance(file_path, Path) else Path(file_path)
+        key = str(path.resolve())
+        self._pending[key] = (
+            self.analyzer_name,
+            key,
+            self.fingerprint,
+            stamp.size,
+            stamp.mtime_ns,
+            stamp.content_hash,
+            json.dumps(analysis.to_dict(), default=str)
+        )
+        self.stats.stores += 1
+    
+    def fetch(
+        self,
+        file_path: Path,
+        analyze: Callable[[Path], FileAnalysis]
+    ) -> FileAnalysis:
+        """
+        Return the cached analysis for a file, computing it on a miss.
+        
+        Args:
+            file_path: Path to the file to analyze
+            analyze: Callable producing a fresh FileAnalysis, usually
+                ``analyzer.analyze_file``
+                
+        Returns:
+            FileAnalysis for the file
+        """
+        analysis = self.get(file_path)
+        if analysis is None:
+            try:
+                # Stamped before analysis, so edits made meanwhile are not covered
+                stamp: Optional[FileStamp] = stamp_file(Path(file_path))
+            except OSError:
+                stamp = None
+            analysis = analyze(file_path)
+            self.put(file_path, analysis, stamp)
+        return analysis
+    
+    def flush(self) -> None:
+        """Write pending entries in a single transaction."""
+        with self._conn:
+            if self._pending:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO file_analysis_cache "
+                    "(analyzer, file_path, fingerprint, size, mtime_ns, content_hash, payload) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    list(self._pending.values())
+                )
+                self._pending.clear()
+    
+    def clear(self) -> None:
+        """Remove every entry belonging to this analyzer."""
+        self._pending.clear()
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM file_analysis_cache WHERE analyzer = ?",
+                (self.analyzer_name,)
+            )
+    
+    def close(self) -> None:
+        """Flush pending entries and close the database connection."""
+        self.flush()
+        self._conn.close()
+    
+    def __enter__(self) -> "AnalysisCache":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class BlobCache:
+    """
+    SQLite-backed cache of FileAnalysis results keyed by git blob SHA.
+    
+    Entries are stored per analyzer fingerprint, so results for other
+    analyzer versions or configurations are kept side by side rather than
+    invalidated. Cached results carry no meaningful path; callers set it.
+    
+    Example:
+        with BlobCache.for_analyzer(db_path, analyzer) as cache:
+            known = cache.get_many(keys)
+    """
+    
+    def __init__(self, db_path: Path, analyzer_name: str, fingerprint: str):
+        """
+        Open (and create if needed) the cache database.
+        
+        Args:
+            db_path: Path to the SQLite database file
+            analyzer_name: Namespace for entries, one per analyzer type
+            fingerprint: Analyzer version and configuration fingerprint
+        """
+        self.db_path = Path(db_path)
+        self.analyzer_name = analyzer_name
+        self.fingerprint = fingerprint
+        self.stats = CacheStats()
+        
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_BLOB_SCHEMA)
+        self._pending: List[Tuple[str, str, str, str, str]] = []
+    
+    @classmethod
+    def for_analyzer(
+        cls,
+        db_path: Path,
+        analyzer: BaseAnalyzer,
+        config: Optional[Mapping[str, Any]] = None
+    ) -> "BlobCache":
+        """
+        Open a blob cache namespaced and fingerprinted for the given analyzer.
+        
+        Args:
+            db_path: Path to the SQLite database file
+            analyzer: Analyzer whose results are cached
+            config: Options that influence the analyzer's results
+            
+        Returns:
+            BlobCache ready for lookups
+        """
+        return cls(db_path, *_cache_identity(analyzer, config))
+    
+    def get_many(self, keys: Iterable[BlobKey]) -> Dict[BlobKey, FileAnalysis]:
+        """
+        Look up several blobs at once.
+        
+        Args:
+            keys: ``(blob SHA, language)`` pairs
+            
+        Returns:
+            Cached results for the keys that were found
+        """
+        wanted = set(keys)
+        shas = sorted({sha for sha, _ in wanted})
+        found: Dict[BlobKey, FileAnalysis] = {}
+        for start in range(0, len(shas), 500):
+            batch = shas[start:start + 500]
+            placeholders = ", ".join("?" * len(batch))
+            rows = self._conn.execute(
+                "SELECT blob_sha, language, payload FROM blob_analysis_cache "
+                f"WHERE analyzer = ? AND fingerprint = ? AND blob_sha IN ({placeholders})",
+                (self.analyzer_name, self.fingerprint, *batch)
+            )
+            for sha, language, payload in rows:
+                if (sha, language) in wanted:
+                    found[sha, language] = FileAnalysis.from_dict(json.loads(payload))
+        
+        self.stats.hits += len(found)
+        self.stats.misses += len(wanted) - len(found)
+        return found
+    
+    def put(self, key: BlobKey, analysis: FileAnalysis) -> None:
+        """
+        Record the analysis of a blob; written on the next ``flush``.
+        
+        Args:
+            key: ``(blob SHA, language)`` of the analyzed blob
+            analysis: Result produced by the analyzer
+        """
+        sha, language = key
+        self._pending.append((
+            self.analyzer_name,
+            self.fingerprint,
+            sha,
+            language,
+            json.dumps(analysis.to_dict(), default=str)
+        ))
+        self.stats.stores += 1
+    
+    def flush(self) -> None:
+        """Write pending entries in a single transaction."""
+        with self._conn:
+            if self._pending:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO blob_analysis_cache "
+                    "(analyzer, fingerprint, blob_sha, language, payload) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    self._pending
+                )
+                self._pending.clear()
+    
+    def clear(self) -> None:
+        """Remove every entry belonging to this analyzer, for any fingerprint."""
+        self._pending.clear()
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM blob_analysis_cache WHERE analyzer = ?",
+                (self.analyzer_name,)
+            )
+    
+    def close(self) -> None:
+        """Flush pending entries and close the database connection."""
+        self.flush()
+        self._conn.close()
+    
+    def __enter__(self) -> "BlobCache":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _stat_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class LockfileCache:
+    """
+    SQLite-backed cache of parsed lockfile dependency graphs.
+    
+    Graphs are stored by the content hash of the lockfile and its manifest,
+    and by a fingerprint of the parser code. A lookup first compares file
+    sizes and modification times with the last run, which answers the
+    common case without reading the lockfile at all.
+    
+    Example:
+        with LockfileCache(db_path) as cache:
+            graph = cache.fetch(repository / "package-lock.json")
+    """
+    
+    def __init__(self, db_path: Path):
+        """
+        Open (and create if needed) the cache database.
+        
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.fingerprint = _hash_source_file(inspect.getsourcefile(lockfiles) or "")
+        self.stats = CacheStats()
+        
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in _LOCKFILE_SCHEMA:
+            self._conn.execute(statement)
+    
+    def fetch(self, lockfile: Path) -> Optional[LockfileGraph]:
+        """
+        Return the dependency graph of a lockfile, parsing it on a miss.
+        
+        Args:
+            lockfile: Path to a lockfile recognized by ``parse_lockfile``
+            
+        Returns:
+            LockfileGraph, or None if the lockfile cannot be parsed
+        """
+        inputs = lockfile_inputs(lockfile)
+        stamp = json.dumps([_stat_stamp(path) for path in inputs])
+        key = str(Path(lockfile).resolve())
+        
+        row = self._conn.execute(
+            "SELECT stamp, content_hash FROM lockfile_stat_cache WHERE file_path = ?",
+            (key,)
+        ).fetchone()
+        if row is not None and row[0] == stamp:
+            content_hash = row[1]
+        else:
+            content_hash = hash_files(inputs)
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO lockfile_stat_cache (file_path, stamp, content_hash) "
+                    "VALUES (?, ?, ?)",
+                    (key, stamp, content_hash)
+                )
+        
+        row = self._conn.execute(
+            "SELECT payload FROM lockfile_graph_cache WHERE content_hash = ? AND fingerprint = ?",
+            (content_hash, self.fingerprint)
+        ).fetchone()
+        if row is not None:
+            self.stats.hits += 1
+            return LockfileGraph.from_dict(json.loads(row[0]))
+        
+        self.stats.misses += 1
+        graph = parse_lockfile(lockfile)
+        if graph is not None:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO lockfile_graph_cache (content_hash, fingerprint, payload) "
+                    "VALUES (?, ?, ?)",
+                    (content_hash, self.fingerprint, json.dumps(graph.to_dict(), separators=(",", ":")))
+                )
+            self.stats.stores += 1
+        return graph
+    
+    def clear(self) -> None:
+        """Remove every cached graph."""
+        with self._conn:
+            self._conn.execute("DELETE FROM lockfile_graph_cache")
+            self._conn.execute("DELETE FROM lockfile_stat_cache")
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+    
+    def __enter__(self) -> "LockfileCache":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
\ No newline at end of file
@@ -0,0 +1,580 @@
+"""
+SQLite database operations for analysis history.
+
+Runs are written in a single transaction: file and function rows are
+streamed as plain tuples into batched driver-level ``executemany`` calls,
+one prepared statement per table, with primary keys assigned up front so
+function rows can reference their files without a round trip per file.
+The database runs in WAL mode with pragmas tuned for bulk writes; reads go
+through SQLAlchemy Core queries.
+
+Each run also gets a summary row with its aggregate metrics, computed at
+write time. Listing, trend and comparison queries read only the indexed
+run and summary tables, so they stay fast however many per-file rows the
+history holds. ``compact`` downsamples old history to one run per period.
+
+The per-file result caches (``storage.cache``) live in the same database
+file but keep their own ``sqlite3`` connection rather than going through
+this manager: their lookups run once per file on the analysis hot path,
+and they must not pull SQLAlchemy into commands that only read the cache.
+"""
+
+from dataclasses import dataclass, field
+from itertools import islice
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import create_engine, event, exists, func, insert, select
+from sqlalchemy.engine import Connection, Engine
+
+from ..analyzers.base import FileAnalysis
+from ..analyzers.results import ResultStore
+from .cache import DEFAULT_DATABASE_PATH
+from .models import AnalysisRun, Base, FileAnalysisRecord, FunctionAnalysisRecord, RunSummary
+
+
+#: Rows per executemany call; bounds memory for the parameter lists.
+BATCH_SIZE = 5000
+
+#: Maximum ids per ``IN (...)`` clause, well below SQLite's variable limit.
+ID_BATCH_SIZE = 500
+
+#: Periods ``compact`` can downsample old runs to.
+RETENTION_PERIODS = ("day", "week", "month")
+
+#: Applied to every new connection.
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
+_runs = AnalysisRun.__table__
+_files = FileAnalysisRecord.__table__
+_functions = FunctionAnalysisRecord.__table__
+_summaries = RunSummary.__table__
+
+
+@dataclass
+class RunInfo:
+    """Summary of one stored analysis run."""
+    id: int
+    repository_path: str
+    timestamp: datetime
+    commit_hash: Optional[str]
+    file_count: int
+    total_lines: int
+    function_count: int = 0
+    total_issues: int = 0
+    average_complexity: float = 0.0
+    max_complexity: int = 0
+    maintainability_index: float = 100.0
+    technical_debt_ratio: float = 0.0
+    overall_score: float = 0.0
+    languages: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    has_details: bool = True
+    runs: int = 1
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "id": self.id,
+            "repository_path": self.repository_path,
+            "timestamp": self.timestamp.isoformat(),
+            "commit_hash": self.commit_hash,
+            "file_count": self.file_count,
+            "total_lines": self.total_lines,
+            "function_count": self.function_count,
+            "total_issues": self.total_issues,
+            "average_complexity": self.average_complexity,
+            "max_complexity": self.max_complexity,
+            "maintainability_index": self.maintainability_index,
+            "technical_debt_ratio": self.technical_debt_ratio,
+            "overall_score": self.overall_score,
+            "languages": self.languages,
+            "has_details": self.has_details,
+            "runs": self.runs
+        }
+
+
+@dataclass
+class RetentionPolicy:
+    """
+    How ``compact`` thins out old history.
+    
+    Runs newer than ``keep_days`` are left alone. Older runs are reduced to
+    the newest run of each ``period``, whose summary absorbs the run count
+    of the others; with ``drop_details`` its per-file rows are removed too,
+    leaving only the summary for trend queries.
+    """
+    keep_days: int = 30
+    period: str = "week"
+    drop_details: bool = True
+    
+    def __post_init__(self):
+        if self.period not in RETENTION_PERIODS:
+            raise ValueError(f"Unknown retention period: {self.period}")
+        if self.keep_days < 0:
+            raise ValueError("keep_days must not be negative")
+
+
+@dataclass
+class CompactionResult:
+    """Outcome of ``compact``."""
+    runs_examined: int = 0
+    runs_deleted: int = 0
+    details_dropped: int = 0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "runs_examined": self.runs_examined,
+            "runs_deleted": self.runs_deleted,
+            "details_dropped": self.details_dropped
+        }
+
+
+_RUN_COLUMNS = (
+    _runs.c.id,
+    _runs.c.repository_path,
+    _runs.c.timestamp,
+    _runs.c.commit_hash,
+    _summaries.c.file_count,
+    _summaries.c.total_lines,
+    _summaries.c.function_count,
+    _summaries.c.total_issues,
+    _summaries.c.average_complexity,
+    _summaries.c.max_complexity,
+    _summaries.c.maintainability_index,
+    _summaries.c.technical_debt_ratio,
+    _summaries.c.overall_score,
+    _summaries.c.languages,
+    _summaries.c.has_details,
+    _summaries.c.runs,
+)
+
+
+def _summary_row(store: ResultStore, complexity_threshold: int) -> Dict[str, Any]:
+    # NumPy is only needed when writing runs, not for history queries
+    from ..utils.metrics import MetricArrays, aggregate
+    
+    metrics = aggregate(MetricArrays.from_store(store), complexity_threshold, percentiles=())
+    return {
+        "file_count": metrics.file_count,
+        "function_count": metrics.function_count,
+        "total_lines": metrics.total_lines,
+        "total_issues": metrics.total_issues,
+        "average_complexity": metrics.average_complexity,
+        "max_complexity": metrics.max_complexity,
+        "maintainability_index": metrics.maintainability_index,
+        "technical_debt_ratio": metrics.technical_debt_ratio,
+        "overall_score": metrics.overall_score,
+        "languages": store.language_totals(),
+    }
+
+
+def _period_key(timestamp: datetime, period: str) -> Tuple[int, ...]:
+    if period == "day":
+        return timestamp.timetuple()[:3]
+    if period == "week":
+        return tuple(timestamp.isocalendar()[:2])
+    return (timestamp.year, timestamp.month)
+
+
+def _insert_sql(table: Any, columns: Sequence[str]) -> str:
+    placeholders = ", ".join("?" * len(columns))
+    return f"INSERT INTO {table.name} ({', '.join(columns)}) VALUES ({placeholders})"
+
+
+_INSERT_FILE = _insert_sql(_files, (
+    "id", "analysis_run_id", "file_path", "language", "lines_of_code",
+    "complexity_score", "quality_score", "issue_count",
+))
+_INSERT_FUNCTION = _insert_sql(_functions, ("file_analysis_id", "name", "line", "complexity"))
+
+
+def _batches(rows: Iterable[Tuple[Any, ...]], size: int) -> Iterator[List[Tuple[Any, ...]]]:
+    iterator = iter(rows)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+class DatabaseManager:
+    """
+    Stores and queries analysis history in the local SQLite database.
+    
+    Example:
+        db = DatabaseManager(db_path)
+        run_id = db.save_run(repo, analyses, commit_hash=head)
+        recent = db.list_runs(repository_path=repo, limit=10)
+    """
+    
+    def __init__(self, db_path: Path = DEFAULT_DATABASE_PATH, echo: bool = False):
+        """
+        Open (and create if needed) the history database.
+        
+        Args:
+            db_path: Path to the SQLite database file
+            echo: Log emitted SQL (for debugging)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.engine: Engine = create_engine(
+            f"sqlite:///{self.db_path}",
+            echo=echo,
+            connect_args={"cached_statements": 256}
+        )
+        event.listen(self.engine, "connect", self._configure_connection)
+        event.listen(self.engine, "begin", self._begin)
+        Base.metadata.create_all(self.engine)
+        self._upgrade_schema()
+    
+    @staticmethod
+    def _configure_connection(dbapi_connection: Any, _record: Any) -> None:
+        # Let SQLAlchemy's "begin" event issue BEGIN instead of pysqlite
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        for pragma in PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+    
+    @staticmethod
+    def _begin(connection: Connection) -> None:
+        connection.exec_driver_sql("BEGIN")
+    
+    def _upgrade_schema(self) -> None:
+        # Databases written before summaries existed get the newer indexes
+        # and one summary per run, computed from the stored per-file rows
+        with self.engine.begin() as conn:
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(conn, checkfirst=True)
+            missing = conn.execute(
+                select(_runs.c.id, _runs.c.configuration).where(
+                    ~exists().where(_summaries.c.analysis_run_id == _runs.c.id)
+                )
+            ).all()
+        
+        for run_id, configuration in missing:
+            threshold = (configuration or {}).get("complexity_threshold", 10)
+            row = _summary_row(self.load_run(run_id), threshold)
+            with self.engine.begin() as conn:
+                row["total_issues"] = conn.execute(
+                    select(func.coalesce(func.sum(_files.c.issue_count), 0))
+                    .where(_files.c.analysis_run_id == run_id)
+                ).scalar()
+                conn.execute(insert(_summaries).values(analysis_run_id=run_id, **row))
+    
+    def save_run(
+        self,
+        repository_path: Path,
+        analyses: Iterable[FileAnalysis],
+        commit_hash: Optional[str] = None,
+        configuration: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[datetime] = None,
+        complexity_threshold: int = 10
+    ) -> int:
+        """
+        Store one analysis run with all its file and function results.
+        
+        Everything, including the run's summary row, is written in one
+        transaction; a failure leaves no partial run behind.
+        
+        Args:
+            repository_path: Analyzed repository
+            analyses: Per-file results (a ResultStore is used as-is)
+            commit_hash: Analyzed commit, if known
+            configuration: Analysis configuration to record with the run
+            timestamp: Run time (default: now, UTC)
+            complexity_threshold: Threshold for the summary's technical
+                debt ratio
+                
+        Returns:
+            ID of the new run
+        """
+        if isinstance(analyses, ResultStore):
+            store = analyses
+        else:
+            store = ResultStore.from_analyses(analyses)
+        summary = _summary_row(store, complexity_threshold)
+        
+        with self.engine.begin() as conn:
+            run_id = conn.execute(
+                insert(_runs).values(
+                    repository_path=str(repository_path),
+                    timestamp=timestamp or datetime.utcnow(),
+                    commit_hash=commit_hash,
+                    configuration=configuration
+                )
+            ).inserted_primary_key[0]
+            conn.execute(insert(_summaries).values(analysis_run_id=run_id, **summary))
+            
+            # The run insert holds the write lock, so these ids cannot collide
+            first_file_id = (conn.execute(select(func.max(_files.c.id))).scalar() or 0) + 1
+            file_rows = (
+                (first_file_id + index, run_id) + row
+                for index, row in enumerate(store.iter_file_rows())
+            )
+            self._insert_many(conn, _INSERT_FILE, file_rows)
+            
+            function_rows = (
+                (first_file_id + index, name, line, complexity)
+                for index, name, line, complexity in store.iter_function_rows()
+            )
+            self._insert_many(conn, _INSERT_FUNCTION, function_rows)
+        
+        return run_id
+    
+    @staticmethod
+    def _insert_many(conn: Connection, sql: str, rows: Iterable[Tuple[Any, ...]]) -> None:
+        # Plain tuples straight to the driver's executemany: one prepared
+        # statement per batch and no per-row parameter processing
+        for batch in _batches(rows, BATCH_SIZE):
+            conn.exec_driver_sql(sql, batch)
+    
+    def list_runs(
+        self,
+        repository_path: Optional[Path] = None,
+        limit: Optional[int] = 20,
+        since: Optional[datetime] = None
+    ) -> List[RunInfo]:
+        """
+        List stored runs with their summaries, newest first.
+        
+        Reads only the run and summary tables; per-file rows are not
+        touched, so this stays fast for long histories.
+        
+        Args:
+            repository_path: Only list runs of this repository
+            limit: Maximum number of runs (None for all)
+            since: Only list runs at or after this time
+            
+        Returns:
+            RunInfo summaries
+        """
+        query = (
+            select(*_RUN_COLUMNS)
+            .join(_summaries, _summaries.c.analysis_run_id == _runs.c.id)
+            .order_by(_runs.c.timestamp.desc(), _runs.c.id.desc())
+            .limit(limit)
+        )
+        if repository_path is not None:
+            query = query.where(_runs.c.repository_path == str(repository_path))
+        if since is not None:
+            query = query.where(_runs.c.timestamp >= since)
+        
+        with self.engine.connect() as conn:
+            return [RunInfo(*row) for row in conn.execute(query)]
+    
+    def trend(
+        self,
+        repository_path: Path,
+        since: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> List[RunInfo]:
+        """
+        Return the run summaries of a repository in chronological order.
+        
+        Args:
+            repository_path: Repository to chart
+            since: Only include runs at or after this time
+            limit: Keep only the most recent runs (None for all)
+        """
+        runs = self.list_runs(repository_path, limit=limit, since=since)
+        runs.reverse()
+        return runs
+    
+    def find_run(self, repository_path: Path, commit: str) -> Optional[RunInfo]:
+        """
+        Find the latest run of a repository for a commit.
+        
+        Args:
+            repository_path: Analyzed repository
+            commit: Full or abbreviated commit hash
+            
+        Returns:
+            The most recent matching run, or None
+        """
+        # A range on the (repository, commit) index; "~" sorts after every
+        # hex digit, so this matches abbreviated hashes as well
+        query = (
+            select(*_RUN_COLUMNS)
+            .join(_summaries, _summaries.c.analysis_run_id == _runs.c.id)
+            .where(
+                _runs.c.repository_path == str(repository_path),
+                _runs.c.commit_hash >= commit,
+                _runs.c.commit_hash < commit + "~"
+            )
+            .order_by(_runs.c.timestamp.desc(), _runs.c.id.desc())
+            .limit(1)
+        )
+        with self.engine.connect() as conn:
+            row = conn.execute(query).first()
+        return RunInfo(*row) if row is not None else None
+    
+    def load_run(self, run_id: int) -> ResultStore:
+        """
+        Load the per-file and per-function results of a run.
+        
+        Args:
+            run_id: ID returned by ``save_run``
+            
+        Returns:
+            ResultStore with the run's results in insertion order
+        """
+        files_query = (
+            select(
+                _files.c.id,
+                _files.c.file_path,
+                _files.c.language,
+                _files.c.lines_of_code,
+                _files.c.complexity_score,
+                _files.c.quality_score
+            )
+            .where(_files.c.analysis_run_id == run_id)
+            .order_by(_files.c.id)
+        )
+        functions_query = (
+            select(
+                _functions.c.file_analysis_id,
+                _functions.c.name,
+                _functions.c.line,
+                _functions.c.complexity
+            )
+            .join(_files, _files.c.id == _functions.c.file_analysis_id)
+            .where(_files.c.analysis_run_id == run_id)
+            .order_by(_functions.c.file_analysis_id, _functions.c.id)
+        )
+        
+        with self.engine.connect() as conn:
+            functions: Dict[int, List[Dict[str, Any]]] = {}
+            for file_id, name, line, complexity in conn.execute(functions_query):
+                functions.setdefault(file_id, []).append(
+                    {"name": name, "line": line, "complexity": complexity}
+                )
+            store = ResultStore()
+            for file_id, path, language, lines, complexity, quality in conn.execute(files_query):
+                store.add(FileAnalysis(
+                    file_path=Path(path),
+                    language=language or "unknown",
+                    lines_of_code=lines or 0,
+                    complexity_score=complexity or 0.0,
+                    quality_score=quality or 0.0,
+                    functions=functions.pop(file_id, [])
+                ))
+        return store
+    
+    def delete_runs(self, run_ids: Sequence[int]) -> int:
+        """
+        Delete runs and their results.
+        
+        Returns:
+            Number of runs deleted
+        """
+        with self.engine.begin() as conn:
+            return self._delete_runs(conn, run_ids)
+    
+    @staticmethod
+    def _delete_runs(conn: Connection, run_ids: Iterable[int]) -> int:
+        deleted = 0
+        for batch in _batches(run_ids, ID_BATCH_SIZE):
+            deleted += conn.execute(_runs.delete().where(_runs.c.id.in_(batch))).rowcount
+        return deleted
+    
+    def compact(
+        self,
+        policy: Optional[RetentionPolicy] = None,
+        repository_path: Optional[Path] = None,
+        now: Optional[datetime] = None,
+        dry_run: bool = False
+    ) -> CompactionResult:
+        """
+        Downsample old history according to a retention policy.
+        
+        Old runs are grouped per repository and period; the newest run of
+        each group is kept and its summary's ``runs`` count absorbs the
+        rest, which are deleted. Trend queries therefore keep one point per
+        period instead of losing old history altogether.
+        
+        Args:
+            policy: What to keep (default: RetentionPolicy())
+            repository_path: Only compact runs of this repository
+            now: Reference time for ``keep_days`` (default: now, UTC)
+            dry_run: Report what would change without changing anything
+            
+        Returns:
+            CompactionResult with the number of runs examined, deleted and
+            stripped of their per-file rows
+        """
+        policy = policy or RetentionPolicy()
+        cutoff = (now or datetime.utcnow()) - timedelta(days=policy.keep_days)
+        query = (
+            select(
+                _runs.c.id,
+                _runs.c.repository_path,
+                _runs.c.timestamp,
+                _summaries.c.runs,
+                _summaries.c.has_details
+            )
+            .join(_summaries, _summaries.c.analysis_run_id == _runs.c.id)
+            .where(_runs.c.timestamp < cutoff)
+            .order_by(_runs.c.repository_path, _runs.c.timestamp.desc(), _runs.c.id.desc())
+        )
+        if repository_path is not None:
+            query = query.where(_runs.c.repository_path == str(repository_path))
+        
+        kept: Dict[Tuple[Any, ...], List[int]] = {}
+        deleted: List[int] = []
+        result = CompactionResult()
+        with self.engine.connect() as conn:
+            for run_id, repository, timestamp, runs, has_details in conn.execute(query):
+                result.runs_examined += 1
+                key = (repository, _period_key(timestamp, policy.period))
+                if key in kept:
+                    kept[key][1] += runs
+                    deleted.append(run_id)
+                else:
+                    kept[key] = [run_id, runs, has_details]
+        
+        stripped = [
+            run_id for run_id, _, has_details in kept.values()
+            if policy.drop_details and has_details
+        ]
+        result.runs_deleted = len(deleted)
+        result.details_dropped = len(stripped)
+        if dry_run or not (deleted or stripped):
+            return result
+        
+        with self.engine.begin() as conn:
+            self._delete_runs(conn, deleted)
+            for batch in _batches(stripped, ID_BATCH_SIZE):
+                conn.execute(_files.delete().where(_files.c.analysis_run_id.in_(batch)))
+                conn.execute(
+                    _summaries.update()
+                    .where(_summaries.c.analysis_run_id.in_(batch))
+                    .values(has_details=False)
+                )
+            for run_id, runs, _ in kept.values():
+                conn.execute(
+                    _summaries.update()
+                    .where(_summaries.c.analysis_run_id == run_id, _summaries.c.runs != runs)
+                    .values(runs=runs)
+                )
+        return result
+    
+    def close(self) -> None:
+        """Dispose of pooled connections."""
+        self.engine.dispose()
+    
+    def __enter__(self) -> "DatabaseManager":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
\ No newline at end of file
@@ -0,0 +1,107 @@
+"""
+SQLAlchemy models for analysis history.
+
+One AnalysisRun row per stored analysis, with its per-file and
+per-function results in child tables, and a RunSummary row holding the
+run's aggregate metrics so history and trend queries never scan per-file
+rows. Rows are written in bulk through the Core tables
+(``Model.__table__``) by DatabaseManager; the ORM classes are used for
+reading.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import JSON, Boolean, Column, DateTime, Float, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import DeclarativeBase, relationship
+
+
+class Base(DeclarativeBase):
+    """Declarative base for history models."""
+
+
+class AnalysisRun(Base):
+    """One stored analysis of a repository."""
+    __tablename__ = "analysis_runs"
+    __table_args__ = (
+        Index("ix_analysis_runs_repository_timestamp", "repository_path", "timestamp"),
+        Index("ix_analysis_runs_repository_commit", "repository_path", "commit_hash"),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    repository_path = Column(String, nullable=False)
+    timestamp = Column(DateTime, default=datetime.utcnow)
+    commit_hash = Column(String)
+    configuration = Column(JSON)
+    
+    file_analyses = relationship(
+        "FileAnalysisRecord", back_populates="analysis_run", passive_deletes=True
+    )
+    summary = relationship(
+        "RunSummary", back_populates="analysis_run", uselist=False, passive_deletes=True
+    )
+
+
+class RunSummary(Base):
+    """
+    Aggregate metrics of one run, written together with the run.
+    
+    ``runs`` counts the runs this row stands for: compaction folds old runs
+    into one representative per period and keeps only its summary.
+    """
+    __tablename__ = "run_summaries"
+    
+    analysis_run_id = Column(
+        Integer, ForeignKey("analysis_runs.id", ondelete="CASCADE"), primary_key=True
+    )
+    file_count = Column(Integer, nullable=False, default=0)
+    function_count = Column(Integer, nullable=False, default=0)
+    total_lines = Column(Integer, nullable=False, default=0)
+    total_issues = Column(Integer, nullable=False, default=0)
+    average_complexity = Column(Float, nullable=False, default=0.0)
+    max_complexity = Column(Integer, nullable=False, default=0)
+    maintainability_index = Column(Float, nullable=False, default=100.0)
+    technical_debt_ratio = Column(Float, nullable=False, default=0.0)
+    overall_score = Column(Float, nullable=False, default=0.0)
+    languages = Column(JSON)
+    has_details = Column(Boolean, nullable=False, default=True)
+    runs = Column(Integer, nullable=False, default=1)
+    
+    analysis_run = relationship("AnalysisRun", back_populates="summary")
+
+
+class FileAnalysisRecord(Base):
+    """Stored results for one file in a run."""
+    __tablename__ = "file_analyses"
+    __table_args__ = (Index("ix_file_analyses_run", "analysis_run_id"),)
+    
+    id = Column(Integer, primary_key=True)
+    analysis_run_id = Column(
+        Integer, ForeignKey("analysis_runs.id", ondelete="CASCADE"), nullable=False
+    )
+    file_path = Column(String, nullable=False)
+    language = Column(String)
+    lines_of_code = Column(Integer)
+    complexity_score = Column(Float)
+    quality_score = Column(Float)
+    issue_count = Column(Integer, default=0)
+    
+    analysis_run = relationship("AnalysisRun", back_populates="file_analyses")
+    functions = relationship(
+        "FunctionAnalysisRecord", back_populates="file_analysis", passive_deletes=True
+    )
+
+
+class FunctionAnalysisRecord(Base):
+    """Stored results for one function in a file."""
+    __tablename__ = "function_analyses"
+    __table_args__ = (Index("ix_function_analyses_file", "file_analysis_id"),)
+    
+    id = Column(Integer, primary_key=True)
+    file_analysis_id = Column(
+        Integer, ForeignKey("file_analyses.id", ondelete="CASCADE"), nullable=False
+    )
+    name = Column(String, nullable=False)
+    line = Column(Integer)
+    complexity = Column(Integer)
+    
+    file_analysis = relationship("FileAnalysisRecord", back_populates="functions")
\ No newline at end of file
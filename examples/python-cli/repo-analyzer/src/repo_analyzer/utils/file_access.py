@@ -0,0 +1,213 @@
+"""
+File access layer for analysis: size limits, binary sniffing and mmap reads.
+
+``read_file`` looks at the first ``SNIFF_BYTES`` of a file before reading
+the rest, so binaries are skipped without being loaded, and files above
+the configured maximum size are never decoded. Large files are mapped
+with ``mmap`` and decoded straight from the mapping, which avoids an
+intermediate copy of the raw bytes. Line counts are always taken from the
+raw bytes (``count_lines``), so skipped text files still contribute their
+lines to repository totals.
+
+Every fully read file is also stamped with the size, modification time
+and content hash of the bytes that were read (``FileStamp``), which is
+what the result cache records for the analysis of those bytes.
+"""
+
+import hashlib
+import mmap
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import NamedTuple, Optional, Union
+
+
+#: Bytes inspected to decide whether a file is binary.
+SNIFF_BYTES = 8192
+
+#: Files at least this large are read through ``mmap``.
+MMAP_THRESHOLD = 1 << 20
+
+#: Default maximum size of an analyzed file (generated bundles, data dumps).
+DEFAULT_MAX_FILE_SIZE = 10 << 20
+
+#: ``FileContent.skipped`` reasons.
+SKIPPED_BINARY = "binary"
+SKIPPED_TOO_LARGE = "too-large"
+
+_COUNT_CHUNK = 1 << 20
+
+_SIZE_UNITS = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+
+# Bytes that occur in text files: printable ASCII, common whitespace and
+# escapes, and everything >= 0x80 (UTF-8 and legacy encodings)
+_TEXT_BYTES = bytes({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7F})
+
+Buffer = Union[bytes, mmap.mmap]
+
+_max_file_size = DEFAULT_MAX_FILE_SIZE
+
+
+def get_max_file_size() -> int:
+    """Return the current maximum size in bytes of an analyzed file."""
+    return _max_file_size
+
+
+def set_max_file_size(size: Optional[int]) -> int:
+    """Replace the maximum analyzed file size (None restores the default)."""
+    global _max_file_size
+    if size is not None and size < 1:
+        raise ValueError("max file size must be positive")
+    _max_file_size = DEFAULT_MAX_FILE_SIZE if size is None else size
+    return _max_file_size
+
+
+def parse_size(value: str) -> int:
+    """
+    Parse a size such as ``"512K"``, ``"10M"`` or ``"1048576"`` into bytes.
+    
+    Raises:
+        ValueError: If the value is not a positive size
+    """
+    text = value.strip().upper().rstrip("B").rstrip("I")
+    unit = text[-1:] if text[-1:] in _SIZE_UNITS else ""
+    number = text[:len(text) - len(unit)]
+    try:
+        size = int(float(number) * _SIZE_UNITS[unit])
+    except ValueError:
+        raise ValueError(f"Invalid size: {value!r}") from None
+    if size < 1:
+        raise ValueError(f"Size must be positive: {value!r}")
+    return size
+
+
+def looks_binary(head: bytes) -> bool:
+    """
+    Guess whether a file is binary from its first bytes.
+    
+    A NUL byte (as git checks) or more than 30% bytes that never occur in
+    text marks the file as binary. UTF-16 text counts as binary.
+    """
+    if not head:
+        return False
+    if b"\0" in head:
+        return True
+    return len(head.translate(None, _TEXT_BYTES)) / len(head) > 0.3
+
+
+def count_lines(buffer: Buffer) -> int:
+    """
+    Count lines in raw bytes the way ``bytes.splitlines`` does.
+    
+    ``\\n``, ``\\r\\n`` and lone ``\\r`` end a line, and a final line
+    without a terminator still counts. Mappings are scanned in chunks, so
+    memory use does not grow with the file.
+    
+    Args:
+        buffer: File contents as bytes or a read-only ``mmap``
+    """
+    size = len(buffer)
+    if not size:
+        return 0
+    breaks = 0
+    for start in range(0, size, _COUNT_CHUNK):
+        # One byte of overlap so a \r\n split across chunks is paired once
+        chunk = buffer[start:start + _COUNT_CHUNK + 1]
+        body = chunk[:_COUNT_CHUNK]
+        breaks += body.count(b"\n") + body.count(b"\r") - chunk.count(b"\r\n")
+    if buffer[size - 1:size] not in (b"\n", b"\r"):
+        breaks += 1
+    return breaks
+
+
+def content_hash(buffer: Buffer) -> str:
+    """Return the hash identifying a file's contents (used to validate cache entries)."""
+    return hashlib.blake2b(buffer, digest_size=16).hexdigest()
+
+
+class FileStamp(NamedTuple):
+    """Size, modification time and content hash of the bytes read from a file."""
+    size: int
+    mtime_ns: int
+    content_hash: str
+
+
+def stamp_file(path: Path) -> FileStamp:
+    """
+    Read a file only to stamp it, for results computed from the file itself.
+    
+    Raises:
+        OSError: If the file cannot be read
+    """
+    with open(path, "rb") as handle:
+        mtime_ns = os.fstat(handle.fileno()).st_mtime_ns
+        data = handle.read()
+    return FileStamp(len(data), mtime_ns, content_hash(data))
+
+
+@dataclass
+class FileContent:
+    """
+    A file's decoded text and raw line count, or why it was skipped.
+    
+    ``head`` is the sniffed prefix. ``stamp`` describes the bytes that were
+    read; it is None for binaries, which are not read past the sniff, and
+    for contents that did not come from a file.
+    """
+    text: str
+    line_count: int
+    size: int
+    skipped: Optional[str] = None
+    head: bytes = b""
+    stamp: Optional[FileStamp] = None
+    
+    @classmethod
+    def from_bytes(cls, data: bytes, max_file_size: Optional[int] = None) -> "FileContent":
+        """Apply the binary and size checks to contents already in memory."""
+        limit = _max_file_size if max_file_size is None else max_file_size
+        head = data[:SNIFF_BYTES]
+        if looks_binary(head):
+            return cls("", 0, len(data), SKIPPED_BINARY, head)
+        if len(data) > limit:
+            return cls("", count_lines(data), len(data), SKIPPED_TOO_LARGE, head)
+        return cls(data.decode("utf-8", errors="replace"), count_lines(data), len(data), head=head)
+
+
+def read_file(path: Path, max_file_size: Optional[int] = None) -> FileContent:
+    """
+    Read a file for analysis, skipping binaries and oversized files.
+    
+    Small files are read with a single ``read`` after the sniff; files of
+    ``MMAP_THRESHOLD`` bytes or more are mapped and decoded from the
+    mapping. Oversized text files are mapped only to count their lines.
+    
+    Args:
+        path: File to read
+        max_file_size: Largest file to decode (default: ``get_max_file_size()``)
+        
+    Returns:
+        FileContent; ``text`` is empty when ``skipped`` is set
+    """
+    limit = _max_file_size if max_file_size is None else max_file_size
+    with open(path, "rb") as handle:
+        # Stat before reading: a change made during the read leaves a newer
+        # mtime behind, so the stamp can only be too old, never too new
+        stat = os.fstat(handle.fileno())
+        size = stat.st_size
+        head = handle.read(SNIFF_BYTES)
+        if looks_binary(head):
+            return FileContent("", 0, size, SKIPPED_BINARY, head)
+        if size < MMAP_THRESHOLD or len(head) < SNIFF_BYTES:
+            # Also covers files that report no size (procfs, pipes)
+            data = head + handle.read()
+            content = FileContent.from_bytes(data, limit)
+            content.stamp = FileStamp(len(data), stat.st_mtime_ns, content_hash(data))
+            return content
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mapped, "madvise"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            line_count = count_lines(mapped)
+            stamp = FileStamp(len(mapped), stat.st_mtime_ns, content_hash(mapped))
+            if size > limit:
+                return FileContent("", line_count, size, SKIPPED_TOO_LARGE, head, stamp)
+            return FileContent(str(mapped, "utf-8", "replace"), line_count, size, head=head, stamp=stamp)
\ No newline at end of file
@@ -0,0 +1,261 @@
+"""
+File system utilities for repository scanning.
+
+Provides a streaming, gitignore-aware repository walker built on
+``os.scandir``. Excluded directories are pruned before they are entered,
+and every yielded path carries the stat data already fetched by the walk.
+"""
+
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import pathspec
+
+
+logger = logging.getLogger(__name__)
+
+#: Directories that are never worth descending into.
+ALWAYS_EXCLUDED = [".git/", ".hg/", ".svn/"]
+
+#: File extensions mapped to the language names used by the analyzers.
+LANGUAGE_EXTENSIONS = {
+    ".py": "python",
+    ".pyi": "python",
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".mjs": "javascript",
+    ".cjs": "javascript",
+    ".ts": "typescript",
+    ".tsx": "typescript",
+    ".java": "java",
+    ".go": "go",
+    ".rs": "rust",
+    ".c": "c",
+    ".h": "c",
+    ".cc": "cpp",
+    ".cpp": "cpp",
+    ".cxx": "cpp",
+    ".hpp": "cpp",
+    ".md": "markdown",
+}
+
+#: Extensionless file names with a known language.
+LANGUAGE_FILENAMES = {
+    "SConstruct": "python",
+    "SConscript": "python",
+    "wscript": "python",
+    "Jakefile": "javascript",
+}
+
+#: Shebang interpreters (version suffixes stripped) mapped to languages.
+SHEBANG_INTERPRETERS = {
+    "python": "python",
+    "pypy": "python",
+    "node": "javascript",
+    "nodejs": "javascript",
+    "deno": "typescript",
+    "ts-node": "typescript",
+}
+
+_SHEBANG = re.compile(rb"#![ \t]*(\S+)(?:[ \t]+(\S+))?")
+
+_BasePath = type(Path())
+
+
+class ScannedFile(_BasePath):  # type: ignore[valid-type, misc]
+    """
+    Path yielded by ``scan_repository`` with cached stat data.
+    
+    Behaves exactly like ``pathlib.Path``; ``stat()`` without arguments
+    returns the result captured from the directory entry during the scan
+    instead of issuing another system call.
+    """
+    
+    __slots__ = ("_scan_stat",)
+    
+    @classmethod
+    def from_entry(cls, entry: "os.DirEntry[str]") -> "ScannedFile":
+        """Build a ScannedFile from a directory entry, caching its stat."""
+        scanned = cls(entry.path)
+        scanned._scan_stat = entry.stat()
+        return scanned
+    
+    def stat(self, *args, **kwargs) -> os.stat_result:  # type: ignore[no-untyped-def]
+        cached = getattr(self, "_scan_stat", None)
+        if cached is not None and not args and not kwargs:
+            return cached
+        return super().stat(*args, **kwargs)
+    
+    @property
+    def size(self) -> int:
+        """File size in bytes."""
+        return self.stat().st_size
+    
+    @property
+    def mtime_ns(self) -> int:
+        """Modification time in nanoseconds."""
+        return self.stat().st_mtime_ns
+
+
+class IgnoreRules:
+    """
+    Compiled gitignore-style patterns anchored at one directory.
+    
+    Patterns from several directories are evaluated outermost first and
+    the last matching pattern wins, mirroring git's handling of nested
+    ``.gitignore`` files and ``!`` negations.
+    """
+    
+    __slots__ = ("prefix", "patterns")
+    
+    def __init__(self, prefix: str, lines: Iterable[str]):
+        """
+        Compile ignore patterns.
+        
+        Args:
+            prefix: Repository-relative directory the patterns apply to,
+                empty or ending in "/"
+            lines: Pattern lines in gitignore syntax
+        """
+        self.prefix = prefix
+        spec = pathspec.PathSpec.from_lines("gitwildmatch", lines)
+        self.patterns = [p for p in spec.patterns if p.include is not None]
+    
+    @classmethod
+    def from_file(cls, prefix: str, ignore_file: Path) -> Optional["IgnoreRules"]:
+        """Load rules from an ignore file, or None if it is unreadable or empty."""
+        try:
+            lines = ignore_file.read_text(encoding="utf-8", errors="replace").splitlines()
+        except OSError:
+            return None
+        rules = cls(prefix, lines)
+        return rules if rules.patterns else None
+    
+    def decide(self, relative_path: str) -> Optional[bool]:
+        """
+        Return True (ignored), False (re-included) or None (no match).
+        
+        Args:
+            relative_path: Repository-relative path, directories ending in "/"
+        """
+        if not relative_path.startswith(self.prefix):
+            return None
+        local_path = relative_path[len(self.prefix):]
+        decision = None
+        for pattern in self.patterns:
+            if pattern.match_file(local_path) is not None:
+                decision = pattern.include
+        return decision
+
+
+def _is_excluded(relative_path: str, rules: Sequence[IgnoreRules]) -> bool:
+    excluded = False
+    for rule in rules:
+        decision = rule.decide(relative_path)
+        if decision is not None:
+            excluded = decision
+    return excluded
+
+
+def scan_repository(
+    repository_path: Path,
+    exclude_patterns: Optional[List[str]] = None,
+    respect_gitignore: bool = True
+) -> Iterator[ScannedFile]:
+    """
+    Walk a repository lazily, yielding files that are not excluded.
+    
+    Directories matching an exclude pattern (``node_modules/``, ``.git/``,
+    entries in any ``.gitignore``) are pruned without being entered.
+    Entries are visited in sorted order so results are deterministic, and
+    analysis can start on the first file while the walk continues.
+    
+    Args:
+        repository_path: Root directory to scan
+        exclude_patterns: Additional gitignore-style patterns to exclude
+        respect_gitignore: Honour ``.gitignore`` files found during the walk
+        
+    Yields:
+        ScannedFile paths with cached stat data
+    """
+    root = Path(repository_path)
+    base_rules = (IgnoreRules("", ALWAYS_EXCLUDED + list(exclude_patterns or [])),)
+    stack: List[Tuple[str, str, Tuple[IgnoreRules, ...]]] = [(str(root), "", base_rules)]
+    
+    while stack:
+        dir_path, relative_dir, rules = stack.pop()
+        
+        if respect_gitignore:
+            gitignore = IgnoreRules.from_file(
+                relative_dir, Path(dir_path) / ".gitignore"
+            )
+            if gitignore is not None:
+                rules = rules + (gitignore,)
+        
+        try:
+            with os.scandir(dir_path) as iterator:
+                entries = sorted(iterator, key=lambda e: e.name)
+        except OSError as e:
+            logger.debug("Skipping unreadable directory %s: %s", dir_path, e)
+            continue
+        
+        subdirectories = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    relative = f"{relative_dir}{entry.name}/"
+                    if not _is_excluded(relative, rules):
+                        subdirectories.append((entry.path, relative, rules))
+                elif entry.is_file():
+                    if not _is_excluded(relative_dir + entry.name, rules):
+                        yield ScannedFile.from_entry(entry)
+            except OSError as e:
+                logger.debug("Skipping unreadable entry %s: %s", entry.path, e)
+        
+        stack.extend(reversed(subdirectories))
+
+
+def detect_language(file_path: Path, head: Optional[bytes] = None) -> str:
+    """
+    Detect a file's language from its extension, name or shebang line.
+    
+    Args:
+        file_path: File to classify
+        head: First bytes of the file, consulted for a shebang when the
+            name alone does not decide
+            
+    Returns:
+        Language name, or ``"unknown"``
+    """
+    return language_for_name(file_path.name, head)
+
+
+def language_for_name(name: str, head: Optional[bytes] = None) -> str:
+    """``detect_language`` for a bare file name, avoiding Path overhead."""
+    dot = name.rfind(".")
+    if dot > 0:
+        language = LANGUAGE_EXTENSIONS.get(name[dot:].lower())
+        if language is not None:
+            return language
+    language = LANGUAGE_FILENAMES.get(name)
+    if language is None and head and head.startswith(b"#!"):
+        language = shebang_language(head)
+    return language or "unknown"
+
+
+def shebang_language(head: bytes) -> Optional[str]:
+    """
+    Return the language named by a ``#!`` line, if it is a known one.
+    
+    Handles ``#!/usr/bin/python3`` as well as ``#!/usr/bin/env node``.
+    """
+    match = _SHEBANG.match(head)
+    if match is None:
+        return None
+    interpreter = os.path.basename(match.group(1)).decode("ascii", errors="replace")
+    if interpreter == "env" and match.group(2) and not match.group(2).startswith(b"-"):
+        interpreter = match.group(2).decode("ascii", errors="replace")
+    return SHEBANG_INTERPRETERS.get(interpreter.rstrip("0123456789."))
\ No newline at end of file
@@ -0,0 +1,212 @@
+"""
+Git repository integration utilities.
+
+Computes the set of files changed since a reference commit so that
+analysis can be limited to the files touched by a branch or pull request,
+and walks the trees of historical commits straight from the object
+database, without checking them out.
+"""
+
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Sequence, Set, Tuple
+
+import git
+
+from .file_utils import ALWAYS_EXCLUDED, IgnoreRules
+
+
+#: Tree entry modes of regular files; symlinks and submodules are skipped.
+_FILE_MODES = (0o100644, 0o100755)
+
+
+class GitReferenceError(Exception):
+    """Raised when a repository or git reference cannot be resolved."""
+
+
+@dataclass
+class ChangeSet:
+    """Files changed between a base reference and the working tree."""
+    base_ref: str
+    base_commit: str
+    added: List[Path] = field(default_factory=list)
+    modified: List[Path] = field(default_factory=list)
+    deleted: List[Path] = field(default_factory=list)
+    renamed: List[Tuple[Path, Path]] = field(default_factory=list)
+    
+    @property
+    def changed(self) -> List[Path]:
+        """Files that exist now and differ from the base (need analysis)."""
+        return sorted(set(self.added + self.modified + [new for _, new in self.renamed]))
+    
+    @property
+    def removed(self) -> List[Path]:
+        """Paths that no longer exist, including rename sources."""
+        return sorted(set(self.deleted + [old for old, _ in self.renamed]))
+    
+    @cached_property
+    def _changed_lookup(self) -> Set[Path]:
+        return set(self.changed)
+    
+    def contains(self, file_path: Path) -> bool:
+        """Check whether a file needs re-analysis (call once fully built)."""
+        return Path(file_path).resolve() in self._changed_lookup
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "base_ref": self.base_ref,
+            "base_commit": self.base_commit,
+            "added": [str(p) for p in self.added],
+            "modified": [str(p) for p in self.modified],
+            "deleted": [str(p) for p in self.deleted],
+            "renamed": [[str(old), str(new)] for old, new in self.renamed]
+        }
+
+
+def open_repository(repository_path: Path) -> git.Repo:
+    """
+    Open the git repository containing a path.
+    
+    Args:
+        repository_path: Repository root or any directory inside it
+        
+    Returns:
+        GitPython Repo object
+        
+    Raises:
+        GitReferenceError: If the path is not inside a git repository
+    """
+    try:
+        return git.Repo(repository_path, search_parent_directories=True)
+    except (git.InvalidGitRepositoryError, git.NoSuchPathError) as e:
+        raise GitReferenceError(f"Not a git repository: {repository_path}") from e
+
+
+def resolve_commit(repository_path: Path, ref: str) -> str:
+    """
+    Resolve a branch, tag, hash or expression like ``HEAD~3`` to a commit hash.
+    
+    Raises:
+        GitReferenceError: If the repository or reference cannot be resolved
+    """
+    repo = open_repository(repository_path)
+    try:
+        return repo.commit(ref).hexsha
+    except (git.BadName, ValueError) as e:
+        raise GitReferenceError(f"Unknown git reference: {ref}") from e
+
+
+def changed_files(
+    repository_path: Path,
+    base_ref: str,
+    include_untracked: bool = True
+) -> ChangeSet:
+    """
+    Compute the files changed between a reference and the working tree.
+    
+    Committed, staged and unstaged changes since ``base_ref`` are included,
+    with renames detected by git. Results are limited to files below
+    ``repository_path`` so a subdirectory of a larger repository can be
+    analyzed on its own.
+    
+    Args:
+        repository_path: Directory being analyzed
+        base_ref: Commit, branch or tag to compare against (e.g. ``origin/main``)
+        include_untracked: Treat untracked, non-ignored files as added
+        
+    Returns:
+        ChangeSet with absolute paths
+        
+    Raises:
+        GitReferenceError: If the repository or reference cannot be resolved
+    """
+    repo = open_repository(repository_path)
+    try:
+        base_commit = repo.commit(base_ref)
+    except (git.BadName, ValueError) as e:
+        raise GitReferenceError(f"Unknown git reference: {base_ref}") from e
+    
+    work_tree = Path(repo.working_tree_dir).resolve()
+    scope = Path(repository_path).resolve()
+    
+    def in_scope(relative_path: str) -> Tuple[bool, Path]:
+        absolute = work_tree / relative_path
+        return (absolute == scope or scope in absolute.parents), absolute
+    
+    change_set = ChangeSet(base_ref=base_ref, base_commit=base_commit.hexsha)
+    
+    for diff in base_commit.diff(None):
+        if diff.change_type == "R":
+            old_in, old_path = in_scope(diff.rename_from)
+            new_in, new_path = in_scope(diff.rename_to)
+            if old_in and new_in:
+                change_set.renamed.append((old_path, new_path))
+            elif new_in:
+                change_set.added.append(new_path)
+            elif old_in:
+                change_set.deleted.append(old_path)
+        elif diff.change_type == "A":
+            included, path = in_scope(diff.b_path)
+            if included:
+                change_set.added.append(path)
+        elif diff.change_type == "D":
+            included, path = in_scope(diff.a_path)
+            if included:
+                change_set.deleted.append(path)
+        else:
+            included, path = in_scope(diff.b_path or diff.a_path)
+            if included:
+                change_set.modified.append(path)
+    
+    if include_untracked:
+        for relative_path in repo.untracked_files:
+            included, path = in_scope(relative_path)
+            if included:
+                change_set.added.append(path)
+    
+    return change_set
+
+
+def iter_tree_files(
+    commit: git.Commit,
+    scope: str = "",
+    exclude_patterns: Sequence[str] = ()
+) -> Iterator[Tuple[str, git.Blob]]:
+    """
+    Walk the files of a commit without checking it out.
+    
+    Excluded directories are pruned as in ``scan_repository``; entries are
+    visited in sorted order.
+    
+    Args:
+        commit: Commit whose tree to walk
+        scope: Work-tree-relative POSIX directory to restrict the walk to
+        exclude_patterns: Gitignore-style patterns, relative to ``scope``
+        
+    Yields:
+        ``(path relative to scope, blob)`` pairs
+    """
+    tree = commit.tree
+    if scope:
+        try:
+            tree = tree / scope
+        except KeyError:
+            return
+    
+    rules = IgnoreRules("", ALWAYS_EXCLUDED + list(exclude_patterns))
+    stack = [(tree, "")]
+    while stack:
+        current, relative_dir = stack.pop()
+        subtrees = []
+        for item in sorted(current, key=lambda entry: entry.name):
+            if item.type == "tree":
+                relative = f"{relative_dir}{item.name}/"
+                if not rules.decide(relative):
+                    subtrees.append((item, relative))
+            elif item.type == "blob" and item.mode in _FILE_MODES:
+                relative = relative_dir + item.name
+                if not rules.decide(relative):
+                    yield relative, item
+        stack.extend(reversed(subtrees))
\ No newline at end of file
@@ -0,0 +1,364 @@
+"""
+Vectorized metric aggregation utilities.
+
+Repository-level metrics (averages, percentiles, histograms, per-directory
+rollups, maintainability index and technical debt ratio) are computed in
+bulk over NumPy arrays extracted once from the analysis results. The
+arrays can be saved and reloaded, so reports can be re-aggregated under
+different thresholds without re-running the analysis.
+"""
+
+import math
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Sequence, Union
+
+import numpy as np
+
+from ..analyzers.base import FileAnalysis, MetricsResult
+from ..analyzers.results import ResultStore
+
+
+DEFAULT_PERCENTILES = (50, 90, 99)
+
+#: Upper edges of the default complexity histogram buckets (last is open-ended).
+DEFAULT_COMPLEXITY_BINS = (1, 5, 10, 20, 50)
+
+
+@dataclass
+class MetricArrays:
+    """
+    Per-file and per-function metric columns as NumPy arrays.
+    
+    File rows share an index with ``paths``; ``function_file`` maps each
+    function row to its file row and ``directory`` maps each file row to
+    an entry of ``directories``.
+    """
+    paths: List[str]
+    directories: List[str]
+    directory: np.ndarray
+    lines_of_code: np.ndarray
+    complexity_score: np.ndarray
+    quality_score: np.ndarray
+    issue_count: np.ndarray
+    function_complexity: np.ndarray
+    function_file: np.ndarray
+    
+    @classmethod
+    def from_store(cls, store: ResultStore) -> "MetricArrays":
+        """
+        Build arrays from a ResultStore.
+        
+        Columns are copied in one bulk conversion each rather than viewed:
+        a NumPy view would pin the store's ``array`` buffers, so adding rows
+        to the store while the arrays are alive would raise BufferError.
+        """
+        offsets = np.array(store.column("function_offsets"), dtype=np.int32)
+        paths = list(store.paths)
+        directories, directory = np.unique(
+            np.array([os.path.dirname(p) for p in paths], dtype=str), return_inverse=True
+        )
+        return cls(
+            paths=paths,
+            directories=directories.tolist(),
+            directory=directory.astype(np.int32),
+            lines_of_code=np.array(store.column("lines_of_code"), dtype=np.int64),
+            complexity_score=np.array(store.column("complexity_score"), dtype=np.float64),
+            quality_score=np.array(store.column("quality_score"), dtype=np.float64),
+            issue_count=np.frombuffer(store.issue_counts(), dtype=np.int32),
+            function_complexity=np.array(store.column("function_complexity"), dtype=np.int32),
+            function_file=np.repeat(np.arange(len(paths), dtype=np.int32), np.diff(offsets))
+        )
+    
+    @classmethod
+    def from_analyses(cls, analyses: Union[ResultStore, Iterable[FileAnalysis]]) -> "MetricArrays":
+        """Build arrays from FileAnalysis results or a ResultStore."""
+        if not isinstance(analyses, ResultStore):
+            analyses = ResultStore.from_analyses(analyses)
+        return cls.from_store(analyses)
+    
+    def __len__(self) -> int:
+        return len(self.paths)
+    
+    def save(self, output: Path) -> None:
+        """Save the arrays to a compressed ``.npz`` file."""
+        np.savez_compressed(
+            output,
+            paths=np.array(self.paths, dtype=str),
+            directories=np.array(self.directories, dtype=str),
+            directory=self.directory,
+            lines_of_code=self.lines_of_code,
+            complexity_score=self.complexity_score,
+            quality_score=self.quality_score,
+            issue_count=self.issue_count,
+            function_complexity=self.function_complexity,
+            function_file=self.function_file
+        )
+    
+    @classmethod
+    def load(cls, source: Path) -> "MetricArrays":
+        """Load arrays saved with ``save``."""
+        with np.load(source) as data:
+            return cls(
+                paths=data["paths"].tolist(),
+                directories=data["directories"].tolist(),
+                directory=data["directory"],
+                lines_of_code=data["lines_of_code"],
+                complexity_score=data["complexity_score"],
+                quality_score=data["quality_score"],
+                issue_count=data["issue_count"],
+                function_complexity=data["function_complexity"],
+                function_file=data["function_file"]
+            )
+
+
+@dataclass
+class DirectoryMetrics:
+    """Rolled-up metrics for the files directly inside one directory."""
+    directory: str
+    files: int
+    functions: int
+    lines_of_code: int
+    average_complexity: float
+    max_complexity: int
+    issues: int
+    functions_over_threshold: int
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "directory": self.directory,
+            "files": self.files,
+            "functions": self.functions,
+            "lines_of_code": self.lines_of_code,
+            "average_complexity": self.average_complexity,
+            "max_complexity": self.max_complexity,
+            "issues": self.issues,
+            "functions_over_threshold": self.functions_over_threshold
+        }
+
+
+@dataclass
+class AggregateMetrics:
+    """Repository-level metrics computed from MetricArrays."""
+    file_count: int
+    function_count: int
+    total_lines: int
+    total_issues: int
+    average_complexity: float
+    max_complexity: int
+    complexity_threshold: int
+    functions_over_threshold: int
+    maintainability_index: float
+    technical_debt_ratio: float
+    overall_score: float
+    percentiles: Dict[str, float] = field(default_factory=dict)
+    histogram: Dict[str, int] = field(default_factory=dict)
+    directories: List[DirectoryMetrics] = field(default_factory=list)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "file_count": self.file_count,
+            "function_count": self.function_count,
+            "total_lines": self.total_lines,
+            "total_issues": self.total_issues,
+            "average_complexity": self.average_complexity,
+            "max_complexity": self.max_complexity,
+            "complexity_threshold": self.complexity_threshold,
+            "functions_over_threshold": self.functions_over_threshold,
+            "maintainability_index": self.maintainability_index,
+            "technical_debt_ratio": self.technical_debt_ratio,
+            "overall_score": self.overall_score,
+            "percentiles": self.percentiles,
+            "histogram": self.histogram,
+            "directories": [d.to_dict() for d in self.directories]
+        }
+    
+    def to_metrics_result(self) -> MetricsResult:
+        """Convert to the MetricsResult returned by ``calculate_metrics``."""
+        recommendations = []
+        if self.functions_over_threshold:
+            recommendations.append(
+                f"Refactor {self.functions_over_threshold:,} functions with complexity "
+                f"above {self.complexity_threshold}"
+            )
+        if self.maintainability_index < 65:
+            recommendations.append("Maintainability index is low; split large, complex files")
+        return MetricsResult(
+            average_complexity=self.average_complexity,
+            max_complexity=self.max_complexity,
+            maintainability_index=self.maintainability_index,
+            technical_debt_ratio=self.technical_debt_ratio,
+            overall_score=self.overall_score,
+            recommendations=recommendations
+        )
+
+
+def _histogram_labels(bins: Sequence[int]) -> List[str]:
+    labels = []
+    lower = 1
+    for upper in bins:
+        labels.append(f"{lower}" if lower == upper else f"{lower}-{upper}")
+        lower = upper + 1
+    labels.append(f"{lower}+")
+    return labels
+
+
+def maintainability_index(lines_of_code: np.ndarray, complexity: np.ndarray) -> np.ndarray:
+    """
+    Per-file maintainability index on a 0-100 scale.
+    
+    Uses the Halstead-free variant ``171 - 0.23 * CC - 16.2 * ln(LOC)``,
+    rescaled to 0-100 and clipped.
+    
+    Args:
+        lines_of_code: Lines of code per file
+        complexity: Complexity score per file
+        
+    Returns:
+        Maintainability index per file
+    """
+    loc = np.maximum(lines_of_code, 1).astype(np.float64)
+    raw = 171.0 - 0.23 * complexity - 16.2 * np.log(loc)
+    return np.clip(raw * 100.0 / 171.0, 0.0, 100.0)
+
+
+def aggregate(
+    arrays: MetricArrays,
+    complexity_threshold: int = 10,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    bins: Sequence[int] = DEFAULT_COMPLEXITY_BINS
+) -> AggregateMetrics:
+    """
+    Aggregate repository-level metrics in bulk.
+    
+    Complexity statistics are taken over functions, falling back to file
+    complexity scores when no function data is available. Calling this
+    again with another threshold only repeats the array arithmetic.
+    
+    Args:
+        arrays: Metric columns to aggregate
+        complexity_threshold: Function complexity above which code counts
+            as technical debt
+        percentiles: Complexity percentiles to report
+        bins: Upper edges of the complexity histogram buckets
+        
+    Returns:
+        AggregateMetrics for the whole repository and per directory
+    """
+    complexity = arrays.function_complexity
+    if not complexity.size:
+        complexity = arrays.complexity_score
+    
+    over = arrays.function_complexity > complexity_threshold
+    function_count = int(arrays.function_complexity.size)
+    total_lines = int(arrays.lines_of_code.sum())
+    
+    if complexity.size:
+        values = np.percentile(complexity, percentiles)
+        percentile_map = {f"p{p:g}": float(v) for p, v in zip(percentiles, values)}
+        average_complexity = float(complexity.mean())
+        max_complexity = int(math.ceil(complexity.max()))
+    else:
+        percentile_map = {f"p{p:g}": 0.0 for p in percentiles}
+        average_complexity = 0.0
+        max_complexity = 0
+    
+    edges = np.array(list(bins), dtype=np.float64)
+    bucket = np.searchsorted(edges, complexity, side="left")
+    counts = np.bincount(bucket, minlength=len(edges) + 1)
+    histogram = dict(zip(_histogram_labels(bins), counts.tolist()))
+    
+    if len(arrays):
+        mi = maintainability_index(arrays.lines_of_code, arrays.complexity_score)
+        weights = np.maximum(arrays.lines_of_code, 1)
+        maintainability = float(np.average(mi, weights=weights))
+        overall_score = float(arrays.quality_score.mean())
+    else:
+        maintainability = 100.0
+        overall_score = 0.0
+    debt_ratio = float(over.mean()) if function_count else 0.0
+    
+    return AggregateMetrics(
+        file_count=len(arrays),
+        function_count=function_count,
+        total_lines=total_lines,
+        total_issues=int(arrays.issue_count.sum()),
+        average_complexity=average_complexity,
+        max_complexity=max_complexity,
+        complexity_threshold=complexity_threshold,
+        functions_over_threshold=int(over.sum()),
+        maintainability_index=maintainability,
+        technical_debt_ratio=debt_ratio,
+        overall_score=overall_score,
+        percentiles=percentile_map,
+        histogram=histogram,
+        directories=directory_rollups(arrays, complexity_threshold)
+    )
+
+
+def directory_rollups(arrays: MetricArrays, complexity_threshold: int = 10) -> List[DirectoryMetrics]:
+    """
+    Roll file and function metrics up to their directories.
+    
+    Args:
+        arrays: Metric columns to aggregate
+        complexity_threshold: Function complexity above which a function is
+            counted in ``functions_over_threshold``
+            
+    Returns:
+        One DirectoryMetrics per directory, sorted by directory name
+    """
+    size = len(arrays.directories)
+    if not size:
+        return []
+    
+    files = np.bincount(arrays.directory, minlength=size)
+    lines = np.bincount(arrays.directory, weights=arrays.lines_of_code, minlength=size)
+    issues = np.bincount(arrays.directory, weights=arrays.issue_count, minlength=size)
+    
+    function_directory = arrays.directory[arrays.function_file]
+    complexity = arrays.function_complexity
+    functions = np.bincount(function_directory, minlength=size)
+    complexity_sum = np.bincount(function_directory, weights=complexity, minlength=size)
+    over = np.bincount(function_directory, weights=complexity > complexity_threshold, minlength=size)
+    max_complexity = np.zeros(size, dtype=np.int64)
+    np.maximum.at(max_complexity, function_directory, complexity)
+    average = np.divide(
+        complexity_sum, functions, out=np.zeros(size, dtype=np.float64), where=functions > 0
+    )
+    
+    return [
+        DirectoryMetrics(
+            directory=name,
+            files=int(files[i]),
+            functions=int(functions[i]),
+            lines_of_code=int(lines[i]),
+            average_complexity=float(average[i]),
+            max_complexity=int(max_complexity[i]),
+            issues=int(issues[i]),
+            functions_over_threshold=int(over[i])
+        )
+        for i, name in enumerate(arrays.directories)
+    ]
+
+
+def calculate_metrics(
+    analyses: Union[ResultStore, Iterable[FileAnalysis]],
+    complexity_threshold: int = 10
+) -> MetricsResult:
+    """
+    Aggregate FileAnalysis results into a MetricsResult.
+    
+    Args:
+        analyses: File analysis results (or a ResultStore)
+        complexity_threshold: Function complexity above which code counts
+            as technical debt
+            
+    Returns:
+        MetricsResult with the repository-level metrics
+    """
+    arrays = MetricArrays.from_analyses(analyses)
+    return aggregate(arrays, complexity_threshold).to_metrics_result()
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""
+Streaming NDJSON output for the analyze commands.
+
+With ``--format ndjson`` every analyze subcommand writes one JSON object
+per line as results arrive: a ``file`` record per analyzed file, a
+``function`` record per function found in it, and finally one ``summary``
+record per analysis holding the repository-level result. Records go
+straight to stdout, bypassing Rich, so nothing is buffered beyond the
+current line and downstream tools (``jq``, log shippers) can start
+consuming before the analysis finishes.
+
+Record shapes:
+    ``{"type": "file", "analysis": ..., "file_path": ..., "language": ..., ...}``
+    ``{"type": "function", "analysis": ..., "file_path": ..., "name": ..., ...}``
+    ``{"type": "summary", "analysis": ..., "files": ..., "result": {...}}``
+    ``{"type": "vulnerability", "analysis": "dependencies", "package": ..., ...}``
+    (after the summary, with ``dependencies --check-vulnerabilities``)
+"""
+
+import json
+import sys
+import time
+from typing import IO, Any, Dict, Iterable, Iterator, Optional
+
+from ..analyzers.base import FileAnalysis
+
+
+class NdjsonWriter:
+    """
+    Writes records as newline-delimited JSON.
+    
+    Output is flushed at most every ``flush_interval`` seconds (and on
+    close), which keeps the stream live for consumers without a system
+    call per record.
+    
+    Example:
+        with NdjsonWriter() as writer:
+            writer.write({"type": "file", "file_path": "src/app.py"})
+    """
+    
+    def __init__(self, stream: Optional[IO[str]] = None, flush_interval: float = 0.1):
+        """
+        Create a writer.
+        
+        Args:
+            stream: Text stream to write to (default: ``sys.stdout`` at call time)
+            flush_interval: Maximum seconds between flushes
+        """
+        self.stream = stream if stream is not None else sys.stdout
+        self.flush_interval = flush_interval
+        self.records = 0
+        self._encode = json.JSONEncoder(separators=(",", ":"), default=str).encode
+        self._last_flush = time.monotonic()
+    
+    def write(self, record: Dict[str, Any]) -> None:
+        """Write one record as a line."""
+        self.stream.write(self._encode(record) + "\n")
+        self.records += 1
+        now = time.monotonic()
+        if now - self._last_flush >= self.flush_interval:
+            self.stream.flush()
+            self._last_flush = now
+    
+    def write_all(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Write several records."""
+        for record in records:
+            self.write(record)
+    
+    def close(self) -> None:
+        """Flush remaining output (the stream itself is left open)."""
+        self.stream.flush()
+    
+    def __enter__(self) -> "NdjsonWriter":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def analysis_records(analysis_name: str, analysis: FileAnalysis) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the ``file`` record of one file's result, then its ``function`` records.
+    
+    The file record carries every FileAnalysis field except ``functions``,
+    which are emitted as separate records tagged with the file path.
+    """
+    data = analysis.to_dict()
+    functions = data.pop("functions")
+    yield {"type": "file", "analysis": analysis_name, **data}
+    for function in functions:
+        record = {"type": "function", "analysis": analysis_name, "file_path": data["file_path"]}
+        record.update((key, value) for key, value in function.items() if key not in record)
+        yield record
+
+
+def summary_record(analysis_name: str, files: int, result: Any) -> Dict[str, Any]:
+    """Build the final ``summary`` record from a repository-level result."""
+    return {"type": "summary", "analysis": analysis_name, "files": files, "result": result.to_dict()}
\ No newline at end of file
@@ -0,0 +1,241 @@
+"""
+Profiling and phase-timing instrumentation.
+
+A single process-wide Profiler collects per-phase wall/CPU time, per-file
+timings (aggregated per analyzer and per language, plus the slowest
+files) and statistics from registered sources such as the result cache.
+Instrumented code always goes through ``get_profiler()``; when profiling
+is off it returns a disabled profiler whose hooks are no-ops.
+"""
+
+import cProfile
+import heapq
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+@dataclass
+class PhaseTiming:
+    """Accumulated timing for one named phase."""
+    wall: float = 0.0
+    cpu: float = 0.0
+    calls: int = 0
+
+
+@dataclass
+class Throughput:
+    """Accumulated per-file work for one analyzer or language."""
+    files: int = 0
+    lines: int = 0
+    seconds: float = 0.0
+    
+    @property
+    def files_per_second(self) -> float:
+        return self.files / self.seconds if self.seconds else 0.0
+    
+    @property
+    def lines_per_second(self) -> float:
+        return self.lines / self.seconds if self.seconds else 0.0
+
+
+class Profiler:
+    """
+    Collects timing and throughput data for one CLI invocation.
+    
+    Example:
+        profiler = get_profiler()
+        with profiler.phase("scan"):
+            files = list(scan_repository(path))
+        profiler.register("cache", cache.stats.to_dict)
+    """
+    
+    def __init__(self, enabled: bool = True, slowest: int = 10, cprofile: bool = False):
+        """
+        Create a profiler.
+        
+        Args:
+            enabled: Record data; a disabled profiler ignores every hook
+            slowest: Number of slowest files to keep
+            cprofile: Also run cProfile for a pstats dump
+        """
+        self.enabled = enabled
+        self.slowest = slowest
+        self.phases: Dict[str, PhaseTiming] = defaultdict(PhaseTiming)
+        self.by_analyzer: Dict[str, Throughput] = defaultdict(Throughput)
+        self.by_language: Dict[str, Throughput] = defaultdict(Throughput)
+        self._slowest_files: List[Tuple[float, str]] = []
+        self._sources: Dict[str, Callable[[], Dict[str, Any]]] = {}
+        self._cprofile = cProfile.Profile() if enabled and cprofile else None
+    
+    def start(self) -> None:
+        """Start cProfile collection, if requested."""
+        if self._cprofile is not None:
+            self._cprofile.enable()
+    
+    def stop(self) -> None:
+        """Stop cProfile collection, if running."""
+        if self._cprofile is not None:
+            self._cprofile.disable()
+    
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a block of work under a phase name (nested phases allowed)."""
+        if not self.enabled:
+            yield
+            return
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            timing = self.phases[name]
+            timing.wall += time.perf_counter() - wall_start
+            timing.cpu += time.process_time() - cpu_start
+            timing.calls += 1
+    
+    def record_file(
+        self,
+        analyzer: str,
+        language: str,
+        file_path: Path,
+        lines: int,
+        seconds: float
+    ) -> None:
+        """
+        Record the analysis time of one file.
+        
+        Args:
+            analyzer: Analyzer name
+            language: Detected language of the file
+            file_path: Analyzed file
+            lines: Lines of code in the file
+            seconds: Wall time spent analyzing it
+        """
+        if not self.enabled:
+            return
+        for bucket in (self.by_analyzer[analyzer], self.by_language[language]):
+            bucket.files += 1
+            bucket.lines += lines
+            bucket.seconds += seconds
+        entry = (seconds, str(file_path))
+        if len(self._slowest_files) < self.slowest:
+            heapq.heappush(self._slowest_files, entry)
+        elif entry > self._slowest_files[0]:
+            heapq.heapreplace(self._slowest_files, entry)
+    
+    def register(self, name: str, source: Callable[[], Dict[str, Any]]) -> None:
+        """
+        Register a statistics source, read when the report is produced.
+        
+        Args:
+            name: Section name in the report (e.g. ``cache:ComplexityAnalyzer``)
+            source: Callable returning a JSON-serializable dict
+        """
+        if self.enabled:
+            self._sources[name] = source
+    
+    def slowest_files(self) -> List[Tuple[str, float]]:
+        """Return the slowest files, slowest first."""
+        return [(path, seconds) for seconds, path in sorted(self._slowest_files, reverse=True)]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        def throughput(buckets: Dict[str, Throughput]) -> Dict[str, Any]:
+            return {
+                name: {
+                    "files": t.files,
+                    "lines": t.lines,
+                    "seconds": t.seconds,
+                    "files_per_second": t.files_per_second,
+                    "lines_per_second": t.lines_per_second,
+                }
+                for name, t in sorted(buckets.items())
+            }
+        
+        return {
+            "phases": {
+                name: {"wall": t.wall, "cpu": t.cpu, "calls": t.calls}
+                for name, t in self.phases.items()
+            },
+            "analyzers": throughput(self.by_analyzer),
+            "languages": throughput(self.by_language),
+            "slowest_files": [
+                {"file": path, "seconds": seconds} for path, seconds in self.slowest_files()
+            ],
+            "stats": {name: source() for name, source in self._sources.items()},
+        }
+    
+    def dump_stats(self, output: Path) -> None:
+        """Write cProfile data in pstats format."""
+        if self._cprofile is not None:
+            self._cprofile.dump_stats(str(output))
+    
+    def render(self, console: Any) -> None:
+        """Print the report as Rich tables."""
+        from rich.table import Table
+        
+        phases = Table(title="⏱️  Phase Timings", show_header=True)
+        phases.add_column("Phase", style="cyan")
+        phases.add_column("Wall (s)", style="green", justify="right")
+        phases.add_column("CPU (s)", style="yellow", justify="right")
+        phases.add_column("Calls", justify="right")
+        for name, timing in self.phases.items():
+            phases.add_row(name, f"{timing.wall:.3f}", f"{timing.cpu:.3f}", str(timing.calls))
+        console.print(phases)
+        
+        for title, buckets in (("Analyzer", self.by_analyzer), ("Language", self.by_language)):
+            if not buckets:
+                continue
+            table = Table(title=f"{title} Throughput", show_header=True)
+            table.add_column(title, style="cyan")
+            table.add_column("Files", justify="right")
+            table.add_column("Files/s", style="green", justify="right")
+            table.add_column("Lines/s", style="green", justify="right")
+            for name, t in sorted(buckets.items()):
+                table.add_row(
+                    name, f"{t.files:,}", f"{t.files_per_second:,.0f}", f"{t.lines_per_second:,.0f}"
+                )
+            console.print(table)
+        
+        if self._slowest_files:
+            slow = Table(title=f"Slowest {len(self._slowest_files)} Files", show_header=True)
+            slow.add_column("File", style="cyan")
+            slow.add_column("Seconds", style="red", justify="right")
+            for path, seconds in self.slowest_files():
+                slow.add_row(path, f"{seconds:.4f}")
+            console.print(slow)
+        
+        for name, source in self._sources.items():
+            stats = Table(title=name, show_header=True)
+            stats.add_column("Metric", style="cyan")
+            stats.add_column("Value", style="green")
+            for key, value in source().items():
+                stats.add_row(key, f"{value:.1%}" if key.endswith("rate") else str(value))
+            console.print(stats)
+
+
+_profiler = Profiler(enabled=False)
+
+
+def get_profiler() -> Profiler:
+    """Return the active profiler (disabled unless profiling was requested)."""
+    return _profiler
+
+
+def set_profiler(profiler: Optional[Profiler]) -> Profiler:
+    """
+    Install the process-wide profiler.
+    
+    Args:
+        profiler: Profiler to activate, or None to disable profiling
+        
+    Returns:
+        The installed profiler
+    """
+    global _profiler
+    _profiler = profiler if profiler is not None else Profiler(enabled=False)
+    return _profiler
\ No newline at end of file
@@ -0,0 +1,241 @@
+"""
+File system change watchers for the analysis daemon.
+
+InotifyWatcher uses Linux inotify through ctypes and reports changes as
+they happen; its file descriptor can be waited on with ``selectors``.
+PollingWatcher works everywhere: it only asks for a rescan every
+``interval`` seconds and leaves the comparison of file stats to the
+caller. Watchers report paths, not analysis scope: deciding whether a
+changed path is part of the repository (ignore rules, new directories)
+is up to the consumer, which rescans when in doubt.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import struct
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set
+
+from .file_utils import ALWAYS_EXCLUDED
+
+
+logger = logging.getLogger(__name__)
+
+WATCHER_KINDS = ("auto", "inotify", "poll")
+
+# inotify(7) event flags
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+_WATCH_MASK = (
+    IN_CLOSE_WRITE | IN_ATTRIB | IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+)
+
+#: ``struct inotify_event`` header: wd, mask, cookie, name length.
+_EVENT_HEADER = struct.Struct("iIII")
+
+_SKIPPED_DIRECTORIES = {pattern.rstrip("/") for pattern in ALWAYS_EXCLUDED}
+
+
+class WatcherError(Exception):
+    """Raised when a file system watcher cannot be set up."""
+
+
+@dataclass
+class FileChanges:
+    """Paths reported changed since the last read, or a request to rescan."""
+    paths: Set[Path] = field(default_factory=set)
+    rescan: bool = False
+    
+    def __bool__(self) -> bool:
+        return self.rescan or bool(self.paths)
+    
+    def update(self, other: "FileChanges") -> None:
+        """Merge changes read later into these."""
+        self.paths |= other.paths
+        self.rescan = self.rescan or other.rescan
+
+
+class PollingWatcher:
+    """
+    Portable watcher that requests a rescan at a fixed interval.
+    
+    Has no file descriptor; the caller waits at most ``timeout`` seconds
+    between reads.
+    """
+    
+    kind = "poll"
+    
+    def __init__(self, interval: float = 1.0):
+        self.interval = interval
+        self._next_scan = time.monotonic() + interval
+    
+    @property
+    def timeout(self) -> float:
+        """Seconds until the next rescan is due."""
+        return max(0.0, self._next_scan - time.monotonic())
+    
+    def fileno(self) -> Optional[int]:
+        return None
+    
+    def watch(self, directories: Iterable[Path]) -> None:
+        """Polling covers every directory the rescan visits."""
+    
+    def read(self) -> FileChanges:
+        """Request a rescan if the interval has elapsed."""
+        if time.monotonic() < self._next_scan:
+            return FileChanges()
+        self._next_scan = time.monotonic() + self.interval
+        return FileChanges(rescan=True)
+    
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """
+    Linux inotify watcher, one watch per directory.
+    
+    Directories are added with ``watch``; a directory created inside a
+    watched one is watched automatically (unless it is ``.git`` or
+    similar) and reported as a changed path so the consumer rescans it.
+    A kernel queue overflow is reported as a rescan request.
+    """
+    
+    kind = "inotify"
+    timeout: Optional[float] = None
+    
+    def __init__(self):
+        if not sys.platform.startswith("linux"):
+            raise WatcherError("inotify is only available on Linux")
+        try:
+            self._libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+            self._libc.inotify_init1
+        except (OSError, AttributeError) as e:
+            raise WatcherError(f"inotify is not available: {e}") from e
+        
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise WatcherError(f"inotify_init1 failed: {os.strerror(ctypes.get_errno())}")
+        self._paths: Dict[int, Path] = {}
+        self._watched: Set[Path] = set()
+    
+    def fileno(self) -> Optional[int]:
+        return self._fd
+    
+    def watch(self, directories: Iterable[Path]) -> None:
+        """Add watches for directories that are not watched yet."""
+        for directory in directories:
+            if directory not in self._watched:
+                self._add_watch(directory)
+    
+    def _add_watch(self, directory: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            error = ctypes.get_errno()
+            if error == errno.ENOSPC:
+                logger.warning(
+                    "inotify watch limit reached at %s; raise fs.inotify.max_user_watches "
+                    "or use the polling watcher", directory
+                )
+            elif error not in (errno.ENOENT, errno.ENOTDIR):
+                logger.debug("Cannot watch %s: %s", directory, os.strerror(error))
+            return
+        self._paths[wd] = directory
+        self._watched.add(directory)
+    
+    def read(self) -> FileChanges:
+        """Drain pending events without blocking."""
+        changes = FileChanges()
+        while True:
+            try:
+                buffer = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return changes
+            if not buffer:
+                return changes
+            self._parse(buffer, changes)
+    
+    def _parse(self, buffer: bytes, changes: FileChanges) -> None:
+        offset = 0
+        while offset < len(buffer):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(buffer, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(buffer[offset:offset + length].rstrip(b"\0"))
+            offset += length
+            
+            if mask & IN_Q_OVERFLOW:
+                changes.rescan = True
+                continue
+            directory = self._paths.get(wd)
+            if directory is None:
+                continue
+            if mask & IN_IGNORED:
+                # Watch removed by the kernel (directory deleted or moved)
+                del self._paths[wd]
+                self._watched.discard(directory)
+                continue
+            if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                if mask & IN_MOVE_SELF:
+                    # The watch would follow the directory to its new name
+                    self._libc.inotify_rm_watch(self._fd, wd)
+                changes.paths.add(directory)
+                continue
+            
+            path = directory / name
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                if name not in _SKIPPED_DIRECTORIES:
+                    self._add_watch(path)
+            changes.paths.add(path)
+    
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+            self._paths.clear()
+            self._watched.clear()
+
+
+def create_watcher(kind: str = "auto", interval: float = 1.0):
+    """
+    Create a file system watcher.
+    
+    Args:
+        kind: ``"inotify"``, ``"poll"``, or ``"auto"`` for inotify where
+            available and polling otherwise
+        interval: Rescan interval of the polling watcher in seconds
+        
+    Returns:
+        InotifyWatcher or PollingWatcher
+        
+    Raises:
+        WatcherError: If ``"inotify"`` is requested but unavailable
+    """
+    if kind not in WATCHER_KINDS:
+        raise ValueError(f"kind must be one of {', '.join(WATCHER_KINDS)}")
+    if kind == "poll":
+        return PollingWatcher(interval)
+    try:
+        return InotifyWatcher()
+    except WatcherError as e:
+        if kind == "inotify":
+            raise
+        logger.info("Falling back to polling: %s", e)
+        return PollingWatcher(interval)
\ No newline at end of file
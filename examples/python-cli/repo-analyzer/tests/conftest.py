@@ -0,0 +1,82 @@
+"""
+Shared test fixtures and helpers.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from repo_analyzer.analyzers.base import (
+    BaseAnalyzer,
+    DirectoryAnalysis,
+    FileAnalysis,
+    MetricsResult,
+)
+from repo_analyzer.analyzers.pipeline import ParsedFile
+
+
+class LineTotals:
+    """Repository result of StubAnalyzer: total lines over the analyzed files."""
+    
+    def __init__(self, lines: int):
+        self.lines = lines
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {"lines": self.lines}
+
+
+class StubAnalyzer(BaseAnalyzer):
+    """
+    Minimal analyzer that counts lines and records which files it analyzed.
+    
+    Each result carries the file's language and line count plus any extra
+    FileAnalysis ``fields``; override ``describe`` to compute more. With
+    ``from_source=False`` it behaves like an analyzer that only implements
+    ``analyze_file``, so the base class reads the file again.
+    """
+    
+    def __init__(
+        self,
+        languages: Sequence[str] = ("python",),
+        from_source: bool = True,
+        **fields: Any
+    ):
+        self.languages = list(languages)
+        self.from_source = from_source
+        self.fields = fields
+        self.analyzed: List[Path] = []
+    
+    @property
+    def calls(self) -> int:
+        """Number of files analyzed so far."""
+        return len(self.analyzed)
+    
+    def describe(self, parsed: ParsedFile) -> FileAnalysis:
+        return FileAnalysis(parsed.path, parsed.language, parsed.lines_of_code, **self.fields)
+    
+    def analyze_file(self, file_path: Path) -> FileAnalysis:
+        self.analyzed.append(Path(file_path))
+        return self.describe(ParsedFile.read(Path(file_path)))
+    
+    def analyze_source(self, parsed: ParsedFile) -> FileAnalysis:
+        if not self.from_source:
+            return super().analyze_source(parsed)
+        self.analyzed.append(parsed.path)
+        return self.describe(parsed)
+    
+    def analyze_repository(
+        self,
+        repository_path: Path,
+        files: Optional[List[Path]] = None,
+        analyses: Sequence[FileAnalysis] = (),
+        **options: Any
+    ) -> LineTotals:
+        return LineTotals(sum(a.lines_of_code for a in analyses))
+    
+    def analyze_directory(self, dir_path: Path, files: List[Path]) -> DirectoryAnalysis:
+        return DirectoryAnalysis(dir_path, len(files), 0, 0)
+    
+    def calculate_metrics(self, analyses: List[FileAnalysis]) -> MetricsResult:
+        return MetricsResult(0.0, 0, 0.0, 0.0, 0.0)
+    
+    def get_supported_languages(self) -> List[str]:
+        return self.languages
\ No newline at end of file
@@ -0,0 +1,125 @@
+"""
+Tests for historical backfill from the git object database.
+"""
+
+from pathlib import Path
+
+import git
+import pytest
+
+from conftest import StubAnalyzer
+from repo_analyzer.analyzers.backfill import backfill, list_commits
+from repo_analyzer.analyzers.base import FileAnalysis
+from repo_analyzer.analyzers.pipeline import ParsedFile
+from repo_analyzer.storage.cache import BlobCache
+from repo_analyzer.storage.database import DatabaseManager
+from repo_analyzer.utils.git_utils import GitReferenceError
+
+
+class SourceAnalyzer(StubAnalyzer):
+    """Analyzer that only looks at decoded sources and counts its calls."""
+    
+    def __init__(self, quality: float = 5.0):
+        super().__init__(quality_score=quality)
+    
+    def analyze_file(self, file_path: Path) -> FileAnalysis:
+        raise AssertionError("backfill must not read the working tree")
+    
+    def describe(self, parsed: ParsedFile) -> FileAnalysis:
+        analysis = super().describe(parsed)
+        analysis.functions = [{"name": "f", "line": 1, "complexity": analysis.lines_of_code}]
+        return analysis
+
+
+@pytest.fixture
+def history_repo(tmp_path):
+    root = tmp_path / "repo"
+    repo = git.Repo.init(root)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "Test")
+        config.set_value("user", "email", "test@example.com")
+    
+    (root / "src").mkdir()
+    (root / "vendor").mkdir()
+    for i in range(10):
+        (root / "src" / f"m{i}.py").write_text("x = 1\n" * (i + 1))
+    (root / "vendor" / "lib.py").write_text("v = 1\n")
+    repo.index.add([f"src/m{i}.py" for i in range(10)] + ["vendor/lib.py"])
+    repo.index.commit("base")
+    for i in range(5):
+        (root / "src" / f"m{i}.py").write_text("y = 2\n" * 20)
+        repo.index.add([f"src/m{i}.py"])
+        repo.index.commit(f"change {i}")
+    return repo
+
+
+@pytest.fixture
+def db(tmp_path):
+    with DatabaseManager(tmp_path / "history.db") as manager:
+        yield manager
+
+
+class TestBackfill:
+    """Test suite for backfill."""
+    
+    def test_cost_scales_with_distinct_blobs(self, history_repo, db):
+        """Test each distinct blob is analyzed once across all commits."""
+        root = Path(history_repo.working_tree_dir)
+        analyzer = SourceAnalyzer()
+        
+        stats = backfill(root, list_commits(root, "HEAD"), {"complexity": analyzer}, db, jobs=1)
+        
+        # 11 blobs in the first commit; m0..m4 all change to the same content
+        assert (stats.commits, stats.files) == (6, 66)
+        assert stats.distinct_blobs == analyzer.calls == 12
+        runs = db.trend(root.resolve())
+        assert [run.commit_hash for run in runs] == [c.hexsha for c in history_repo.iter_commits(reverse=True)]
+        assert runs[-1].total_lines == 5 * 20 + sum(range(6, 11)) + 1
+    
+    def test_reads_committed_content_not_working_tree(self, history_repo, db):
+        """Test uncommitted edits do not leak into historical runs."""
+        root = Path(history_repo.working_tree_dir)
+        (root / "src" / "m9.py").write_text("dirty = 1\n" * 100)
+        
+        backfill(root, list_commits(root, "HEAD", max_count=1), {"complexity": SourceAnalyzer()}, db, jobs=1)
+        
+        assert db.list_runs()[0].total_lines == 5 * 20 + sum(range(6, 11)) + 1
+    
+    def test_blob_cache_reused_across_calls(self, history_repo, tmp_path, db):
+        """Test a second backfill serves every blob from the blob cache."""
+        root = Path(history_repo.working_tree_dir)
+        commits = list_commits(root, "HEAD")
+        
+        for expected_calls in (12, 0):
+            analyzers = {"complexity": SourceAnalyzer(), "quality": SourceAnalyzer(quality=9.0)}
+            caches = {
+                name: BlobCache.for_analyzer(tmp_path / "cache.db", analyzer)
+                for name, analyzer in analyzers.items()
+            }
+            stats = backfill(root, commits, analyzers, db, caches=caches, jobs=1, force=True)
+            for cache in caches.values():
+                cache.close()
+            
+            assert analyzers["complexity"].calls == analyzers["quality"].calls == expected_calls
+        
+        assert stats.cached_blobs == 12
+        assert db.list_runs()[0].overall_score == 9.0
+    
+    def test_skips_stored_commits_and_honours_scope(self, history_repo, db):
+        """Test already stored commits are skipped and excluded paths ignored."""
+        root = Path(history_repo.working_tree_dir)
+        commits = list_commits(root, "HEAD~2..HEAD")
+        analyzer = SourceAnalyzer()
+        
+        first = backfill(root, commits, {"complexity": analyzer}, db, exclude_patterns=["vendor/"], jobs=1)
+        second = backfill(root, commits, {"complexity": analyzer}, db, jobs=1)
+        scoped = backfill(root / "src", commits[-1:], {"complexity": analyzer}, db, jobs=1)
+        
+        assert (first.commits, first.files, second.commits, second.skipped) == (2, 20, 0, 2)
+        assert scoped.files == 10
+        assert db.list_runs(repository_path=(root / "src").resolve())[0].file_count == 10
+    
+    def test_unknown_range_raises(self, history_repo):
+        """Test an unresolvable revision range raises GitReferenceError."""
+        with pytest.raises(GitReferenceError):
+            list_commits(Path(history_repo.working_tree_dir), "no-such-branch..HEAD")
\ No newline at end of file
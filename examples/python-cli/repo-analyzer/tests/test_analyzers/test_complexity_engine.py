@@ -0,0 +1,238 @@
+"""
+Tests for the token-scan complexity engine and its AST reference.
+"""
+
+import ast
+import sysconfig
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from conftest import StubAnalyzer
+from repo_analyzer.analyzers.complexity_engine import (
+    FunctionComplexity,
+    ScanComplexityAnalyzer,
+    ast_complexity,
+    function_complexity,
+    scan_js_complexity,
+    scan_python_complexity,
+)
+from repo_analyzer.analyzers.pipeline import ParsedFile
+
+SRC_ROOT = Path(__file__).resolve().parents[2] / "src"
+STDLIB = Path(sysconfig.get_paths()["stdlib"])
+
+
+def _summary(functions):
+    return [(f.name, f.line, f.complexity) for f in functions]
+
+
+def _reference(source):
+    return _summary(ast_complexity(ast.parse(source)))
+
+
+def _python_corpus(step):
+    paths = sorted(SRC_ROOT.rglob("*.py"))
+    stdlib = sorted(path for path in STDLIB.glob("**/*.py") if "site-packages" not in path.parts)
+    return paths + stdlib[::step]
+
+
+def _assert_scan_matches_ast(paths):
+    declined = 0
+    for path in paths:
+        source = path.read_text(encoding="utf-8", errors="replace")
+        try:
+            expected = _reference(source)
+        except (SyntaxError, ValueError):
+            continue
+        scanned = scan_python_complexity(source)
+        if scanned is None:
+            declined += 1
+            continue
+        assert _summary(scanned) == expected, path
+    # The fast path must handle nearly everything, not just stay correct
+    assert declined <= len(paths) // 20
+
+
+class TestAstComplexity:
+    """Test suite for the AST reference path."""
+    
+    def test_decision_points(self):
+        """Test branches, boolean operands, comprehensions and nesting."""
+        source = textwrap.dedent("""
+            @decorate(a if b else c)
+            def outer(x, y=lambda z: z or 1):
+                if x and y and not x:
+                    return [i for i in x if i if not i]
+                def inner():
+                    try:
+                        pass
+                    except ValueError:
+                        while True:
+                            break
+                return inner
+            class Model:
+                async def run(self):
+                    async for _ in self:
+                        pass
+        """)
+        
+        assert _reference(source) == [("outer", 3, 7), ("inner", 6, 3), ("run", 14, 2)]
+    
+    def test_detailed_metrics(self):
+        """Test nesting depth and cognitive complexity."""
+        source = textwrap.dedent("""
+            def f(items):
+                for item in items:
+                    if item and ready:
+                        continue
+                    elif item:
+                        pass
+                    else:
+                        pass
+                return 0
+        """)
+        
+        (result,) = ast_complexity(ast.parse(source), detailed=True)
+        
+        assert result == FunctionComplexity("f", 2, 5, 2, 6)
+        assert result.to_dict() == {
+            "name": "f", "line": 2, "complexity": 5, "nesting_depth": 2, "cognitive_complexity": 6
+        }
+        assert FunctionComplexity("g", 1, 1).to_dict() == {"name": "g", "line": 1, "complexity": 1}
+
+
+class TestScanPython:
+    """Test suite for the Python token scan."""
+    
+    @pytest.mark.parametrize("source", [
+        "def f(): return a or b\ndef g(x): pass\nif x: y = 1\n",
+        "def f(\n    a=1 if b else 2,\n):\n    pass\nx = 1 and 2\n",
+        "class A:\n    def f(self):\n        s = '''\nif not dedented or really:\n'''\n        for x in s: pass\n    def g(self): pass\n",
+        "def f():\n    x = 'def g(): if' # and or\n    return x \\\n        or f'{x!r:>10}'\n",
+        "def f():\n    match = re.match(p, s)\n    match.group(1)\n    return [match for match in s if match]\n",
+        "def f():\n\tif x:\n\t\treturn rb'\\'' or Rb\"\"\n\telse:\n\t    pass\n",
+        "@app.route('/', methods=['GET'] if debug else [])\nasync def index(): return 1\n",
+        "def f(): pass\nx = [\n    lambda: a or b,\n]\n",
+    ])
+    def test_matches_ast(self, source):
+        """Test tricky layouts report the same functions as the AST."""
+        assert _summary(scan_python_complexity(source)) == _reference(source)
+    
+    @pytest.mark.parametrize("source", [
+        "def f(x):\n    match x:\n        case 1 if x: pass\n",
+        "def f(x):\n    return f'{x if x else 0}'\n",
+        "def f(x):\n    return (x\n",
+        "def f(x):\n    return 'open\n",
+        "def f(x):\n    return 1if x else 2\n",
+    ])
+    def test_declines_uncertain_source(self, source):
+        """Test source the scan cannot count with certainty is left to the AST."""
+        assert scan_python_complexity(source) is None
+    
+    def test_matches_ast_on_sample(self):
+        """Test the scan agrees with the AST over this package and part of the stdlib."""
+        _assert_scan_matches_ast(_python_corpus(step=15))
+    
+    @pytest.mark.slow
+    def test_matches_ast_on_stdlib(self):
+        """Test the scan agrees with the AST over the whole stdlib."""
+        _assert_scan_matches_ast(_python_corpus(step=1))
+
+
+class TestScanJavaScript:
+    """Test suite for the JavaScript and TypeScript lexer."""
+    
+    def test_functions_and_decisions(self):
+        """Test methods, arrows, templates, regular expressions and types."""
+        source = textwrap.dedent("""
+            class Store {
+              get(key) { return this.map[key] ?? null; }
+              async *[Symbol.iterator]() { for (const x of y) yield x; }
+              static #hidden(a, b) { if (a && b) return 1; }
+            }
+            const handler = async (req, res) => {
+              const re = /}{/g; // } comment {
+              const t = `a ${req.ok ? `b ${ {x: 1}.x }` : "c"} }`;
+              return fetch(url).then(r => r.json()).catch(err => { if (err) throw err; });
+            };
+            function outer(opt?: number): Promise<{a: number}> {
+              function inner() { while (x) { switch (y) { case 1: case 2: break; } } }
+              return opt || 0;
+            }
+        """)
+        
+        assert _summary(scan_js_complexity(source)) == [
+            ("get", 3, 2),
+            ("[Symbol.iterator]", 4, 2),
+            ("#hidden", 5, 3),
+            ("handler", 7, 2),
+            ("<anonymous>", 10, 2),
+            ("outer", 12, 2),
+            ("inner", 13, 4),
+        ]
+    
+    def test_object_keys_and_members_are_not_decisions(self):
+        """Test keywords used as property names add nothing."""
+        source = "function f(p) { return {if: 1, for: p.catch, case: p?.while}; }"
+        
+        assert _summary(scan_js_complexity(source)) == [("f", 1, 1)]
+
+
+class TestFunctionComplexity:
+    """Test suite for function_complexity dispatch."""
+    
+    def test_scan_skips_parse(self, tmp_path):
+        """Test plain cyclomatic complexity never builds the AST."""
+        path = tmp_path / "module.py"
+        path.write_text("def f(x):\n    return x or 1\n")
+        parsed = ParsedFile.read(path)
+        
+        assert _summary(function_complexity(parsed)) == [("f", 1, 2)]
+        assert "tree" not in parsed.__dict__
+    
+    def test_detailed_and_declined_use_ast(self, tmp_path):
+        """Test detailed metrics and declined files go through the AST."""
+        path = tmp_path / "module.py"
+        path.write_text("def f(x):\n    match x:\n        case 1:\n            return 1\n")
+        parsed = ParsedFile.read(path)
+        
+        assert _summary(function_complexity(parsed)) == [("f", 1, 2)]
+        assert function_complexity(parsed, detailed=True)[0].nesting_depth == 1
+    
+    def test_other_languages(self, tmp_path):
+        """Test JavaScript is scanned and unsupported languages report nothing."""
+        (tmp_path / "app.ts").write_text("export const f = (a?: string) => { return a ?? ''; };\n")
+        (tmp_path / "main.c").write_text("int main() { if (1) return 0; }\n")
+        
+        assert _summary(function_complexity(ParsedFile.read(tmp_path / "app.ts"))) == [("f", 1, 2)]
+        assert function_complexity(ParsedFile.read(tmp_path / "main.c")) == []
+
+
+class TestScanComplexityAnalyzer:
+    """Test suite for the scanning complexity analyzer."""
+    
+    def test_scanned_languages_skip_fallback(self, tmp_path):
+        """Test Python files are counted by the scan alone."""
+        path = tmp_path / "module.py"
+        path.write_text("def f(x):\n    return x or 1\n\ndef g():\n    pass\n")
+        fallback = StubAnalyzer()
+        
+        analysis = ScanComplexityAnalyzer(fallback).analyze_source(ParsedFile.read(path))
+        
+        assert [(f["name"], f["complexity"]) for f in analysis.functions] == [("f", 2), ("g", 1)]
+        assert analysis.complexity_score == 3.0
+        assert fallback.calls == 0
+    
+    def test_other_languages_use_fallback(self, tmp_path):
+        """Test unscanned languages and repository summaries go to the fallback."""
+        path = tmp_path / "main.c"
+        path.write_text("int main() { return 0; }\n")
+        fallback = StubAnalyzer(languages=("c",))
+        analyzer = ScanComplexityAnalyzer(fallback)
+        
+        analysis = analyzer.analyze_source(ParsedFile.read(path))
+        
+        assert fallback.analyzed == [path]
+        assert analyzer.analyze_repository(tmp_path, analyses=[analysis]).lines == 1
\ No newline at end of file
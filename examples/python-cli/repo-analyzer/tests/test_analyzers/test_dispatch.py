@@ -0,0 +1,118 @@
+"""
+Tests for language-grouped batch dispatch.
+"""
+
+from typing import Iterator, List, Sequence
+
+import pytest
+
+from conftest import StubAnalyzer
+from repo_analyzer.analyzers import executor, pipeline
+from repo_analyzer.analyzers.base import FileAnalysis
+from repo_analyzer.analyzers.dispatch import analyze_grouped, analyzers_by_language
+from repo_analyzer.analyzers.pipeline import ParsedFile
+
+
+class BatchAnalyzer(StubAnalyzer):
+    """Analyzer recording the batches it receives."""
+    
+    def __init__(self, drop_last: bool = False, languages: Sequence[str] = ("python",)):
+        super().__init__(languages)
+        self.batches: List[List[str]] = []
+        self.drop_last = drop_last
+    
+    def analyze_batch(self, files: Sequence[ParsedFile]) -> Iterator[FileAnalysis]:
+        self.batches.append([parsed.path.name for parsed in files])
+        for parsed in files[:-1] if self.drop_last else files:
+            yield FileAnalysis(parsed.path, parsed.language, 0, complexity_score=len(self.batches))
+
+
+@pytest.fixture
+def mixed_files(tmp_path):
+    names = ["a.py", "b.js", "c.py", "d.md", "e.py", "tool", "f.js", "g.png"]
+    for name in names:
+        (tmp_path / name).write_text("#!/usr/bin/env python3\n" if name == "tool" else "x\ny\n")
+    (tmp_path / "g.png").write_bytes(b"\x89PNG\r\n\x1a\n\x00\x00")
+    return [tmp_path / name for name in names]
+
+
+def _parsed(paths):
+    return [(index, ParsedFile.read(path)) for index, path in enumerate(paths)]
+
+
+def test_default_adapter_runs_file_by_file(mixed_files):
+    """Test analyzers without a batch implementation run file by file."""
+    analyzer = StubAnalyzer(from_source=False)
+    
+    results = list(analyzer.analyze_batch([parsed for _, parsed in _parsed(mixed_files[:3])]))
+    
+    assert [r.file_path for r in results] == mixed_files[:3]
+    assert analyzer.calls == 3
+
+
+def test_groups_by_language(mixed_files):
+    """Test each language in a batch is one analyze_batch call and skipped files bypass it."""
+    analyzer = BatchAnalyzer()
+    
+    rows = analyze_grouped(analyzer, _parsed(mixed_files))
+    
+    assert analyzer.batches == [["a.py", "c.py", "e.py", "tool"], ["b.js", "f.js"], ["d.md"]]
+    assert sorted(index for index, _, _ in rows) == list(range(len(mixed_files)))
+    skipped = [analysis for index, analysis, _ in rows if index == 7]
+    assert skipped[0].issues[0]["type"] == "skipped"
+
+
+def test_routes_groups_to_their_language(mixed_files):
+    """Test routed languages reach their analyzer and the rest the default one."""
+    default, scripts = BatchAnalyzer(), BatchAnalyzer(languages=("javascript", "Python"))
+    routes = analyzers_by_language([scripts, BatchAnalyzer(languages=("python",))])
+    
+    rows = analyze_grouped(default, _parsed(mixed_files), routes)
+    
+    assert routes == {"javascript": scripts, "python": scripts}
+    assert scripts.batches == [["a.py", "c.py", "e.py", "tool"], ["b.js", "f.js"]]
+    assert default.batches == [["d.md"]]
+    assert len(rows) == len(mixed_files)
+
+
+def test_short_batch_raises(mixed_files):
+    """Test an analyzer yielding too few results is reported, not silently misaligned."""
+    with pytest.raises(RuntimeError, match="fewer results"):
+        analyze_grouped(BatchAnalyzer(drop_last=True), _parsed(mixed_files))
+
+
+def test_executor_and_pipeline_batch_each_chunk(mixed_files):
+    """Test executor and pipeline chunks reach the analyzer grouped by language, in order."""
+    analyzer = BatchAnalyzer()
+    
+    results = executor.analyze_files(analyzer, mixed_files, jobs=1, chunk_size=4)
+    
+    assert [r.file_path for r in results] == mixed_files
+    assert analyzer.batches == [["a.py", "c.py"], ["b.js"], ["d.md"], ["e.py", "tool"], ["f.js"]]
+    
+    analyzers = {"batch": BatchAnalyzer(), "single": StubAnalyzer()}
+    combined = pipeline.analyze_all(analyzers, mixed_files, jobs=1, chunk_size=4)
+    
+    assert analyzers["batch"].batches == analyzer.batches
+    assert [r.file_path for r in combined["single"]] == mixed_files
+    assert analyzers["single"].calls == 7
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_executor_and_pipeline_route(tmp_path, jobs):
+    """Test routes reach the executor and pipeline, in-process and in workers."""
+    files = []
+    for index in range(80):
+        files.append(tmp_path / f"f{index}.{'py' if index % 2 else 'js'}")
+        files[-1].write_text("x\n")
+    default, routed = StubAnalyzer(), StubAnalyzer(languages=("javascript",), complexity_score=5.0)
+    routes = analyzers_by_language([routed])
+    
+    results = executor.analyze_files(default, files, jobs=jobs, chunk_size=8, routes=routes)
+    combined = pipeline.analyze_all(
+        {"complexity": default}, files, jobs=jobs, chunk_size=8, routes={"complexity": routes}
+    )
+    
+    for analyses in (results, combined["complexity"]):
+        assert [r.file_path for r in analyses] == files
+        assert [r.complexity_score for r in analyses] == [5.0, 0.0] * 40
\ No newline at end of file
@@ -0,0 +1,101 @@
+"""
+Tests for the parallel file analysis engine.
+"""
+
+import os
+
+import pytest
+
+from conftest import StubAnalyzer
+from repo_analyzer.analyzers import executor
+from repo_analyzer.analyzers.base import FileAnalysis
+from repo_analyzer.analyzers.executor import analyze_changes, analyze_files
+from repo_analyzer.analyzers.pipeline import ParsedFile
+from repo_analyzer.utils.git_utils import ChangeSet
+
+
+class LineAnalyzer(StubAnalyzer):
+    """Analyzer reporting line counts and the process that produced them."""
+    
+    def describe(self, parsed: ParsedFile) -> FileAnalysis:
+        analysis = super().describe(parsed)
+        analysis.issues = [{"pid": os.getpid()}]
+        return analysis
+
+
+@pytest.fixture
+def sample_files(tmp_path):
+    files = []
+    for i in range(40):
+        path = tmp_path / f"module_{i:02d}.py"
+        path.write_text("x = 1\n" * (i + 1))
+        files.append(path)
+    return files
+
+
+class TestAnalyzeFiles:
+    """Test suite for analyze_files."""
+    
+    def test_parallel_matches_serial(self, sample_files, monkeypatch):
+        """Test parallel results are identical and in input order."""
+        monkeypatch.setattr(executor, "PARALLEL_THRESHOLD", 0)
+        analyzer = LineAnalyzer()
+        
+        serial = analyze_files(analyzer, sample_files, jobs=1)
+        parallel = analyze_files(analyzer, sample_files, jobs=4, chunk_size=3)
+        
+        assert [a.file_path for a in parallel] == sample_files
+        assert [a.lines_of_code for a in parallel] == [a.lines_of_code for a in serial]
+        assert {a.issues[0]["pid"] for a in parallel} != {os.getpid()}
+    
+    def test_small_workloads_run_in_process(self, sample_files):
+        """Test workloads under the threshold skip the process pool."""
+        analyses = analyze_files(LineAnalyzer(), sample_files[:5], jobs=8)
+        
+        assert len(analyses) == 5
+        assert {a.issues[0]["pid"] for a in analyses} == {os.getpid()}
+
+class TestAnalyzeChanges:
+    """Test suite for analyze_changes."""
+    
+    def test_reuses_baseline_for_unchanged_files(self, tmp_path, sample_files):
+        """Test only changed files are analyzed and aggregates cover all files."""
+        from repo_analyzer.storage.cache import AnalysisCache
+        
+        analyzer = LineAnalyzer()
+        db_path = tmp_path / "analysis.db"
+        with AnalysisCache.for_analyzer(db_path, analyzer) as cache:
+            analyze_files(analyzer, sample_files, jobs=1, cache=cache)
+        
+        change_set = ChangeSet(base_ref="HEAD", base_commit="0" * 40)
+        change_set.modified.append(sample_files[3].resolve())
+        sample_files[3].write_text("x = 1\n" * 100)
+        
+        with AnalysisCache.for_analyzer(db_path, analyzer) as cache:
+            result = analyze_changes(analyzer, sample_files, change_set, jobs=1, cache=cache)
+        
+        assert [a.file_path for a in result.changed] == [sample_files[3]]
+        assert result.changed[0].lines_of_code == 100
+        assert result.baseline_hits == len(sample_files) - 1
+        assert [a.file_path for a in result.combined] == sample_files
+    
+    def test_stale_baseline_entry_is_reanalyzed(self, tmp_path, sample_files):
+        """Test an unchanged file whose cached result no longer matches is analyzed again."""
+        from repo_analyzer.storage.cache import AnalysisCache
+        
+        analyzer = LineAnalyzer()
+        db_path = tmp_path / "analysis.db"
+        with AnalysisCache.for_analyzer(db_path, analyzer) as cache:
+            analyze_files(analyzer, sample_files, jobs=1, cache=cache)
+        
+        # Edited, e.g. on another branch, without git reporting a change
+        sample_files[5].write_text("x = 1\n" * 50)
+        os.utime(sample_files[6], ns=(0, 0))
+        change_set = ChangeSet(base_ref="HEAD", base_commit="0" * 40)
+        
+        with AnalysisCache.for_analyzer(db_path, analyzer) as cache:
+            result = analyze_changes(analyzer, sample_files, change_set, jobs=1, cache=cache)
+        
+        assert result.combined[5].lines_of_code == 50
+        assert result.combined[6].lines_of_code == 7
+        assert result.baseline_hits == len(sample_files) - 1
\ No newline at end of file
@@ -0,0 +1,167 @@
+"""
+Tests for the import graph.
+"""
+
+import random
+
+import pytest
+
+from repo_analyzer.analyzers.base import FileAnalysis
+from repo_analyzer.analyzers.import_graph import ImportGraph, ModuleResolver
+
+
+def _graph(edges):
+    graph = ImportGraph()
+    for source, targets in edges.items():
+        graph.set_imports(source, targets)
+    return graph
+
+
+def _reachable(edges, start):
+    seen, stack = set(), [start]
+    while stack:
+        for target in edges.get(stack.pop(), ()):
+            if target not in seen:
+                seen.add(target)
+                stack.append(target)
+    return seen
+
+
+class TestModuleResolver:
+    """Test suite for ModuleResolver."""
+    
+    @pytest.fixture
+    def resolver(self):
+        return ModuleResolver([
+            "setup.py",
+            "src/pkg/__init__.py",
+            "src/pkg/models.py",
+            "src/pkg/sub/__init__.py",
+            "src/pkg/sub/views.py",
+            "web/app.ts",
+            "web/lib/index.ts",
+            "web/lib/util.ts",
+        ])
+    
+    @pytest.mark.parametrize("path, module", [
+        ("setup.py", "setup"),
+        ("src/pkg/__init__.py", "pkg"),
+        ("src/pkg/models.py", "pkg.models"),
+        ("src/pkg/sub/views.py", "pkg.sub.views"),
+        ("web/lib/util.ts", "web/lib/util"),
+    ])
+    def test_module_names(self, resolver, path, module):
+        """Test modules are named below the outermost package directory."""
+        assert resolver.module_for(path) == module
+    
+    @pytest.mark.parametrize("path, name, expected", [
+        ("src/pkg/sub/views.py", "pkg.models", "pkg.models"),
+        ("src/pkg/sub/views.py", "pkg.models.User", "pkg.models"),
+        ("src/pkg/sub/views.py", "..models", "pkg.models"),
+        ("src/pkg/sub/views.py", ".", "pkg.sub"),
+        ("src/pkg/sub/__init__.py", ".views", "pkg.sub.views"),
+        ("src/pkg/sub/views.py", "....too.far", None),
+        ("src/pkg/models.py", "os.path", "os"),
+        ("web/app.ts", "./lib", "web/lib/index"),
+        ("web/app.ts", "./lib/util.js", "web/lib/util"),
+        ("web/lib/util.ts", "../app", "web/app"),
+        ("web/app.ts", "./missing", None),
+        ("web/app.ts", "@scope/pkg/deep", "@scope/pkg"),
+        ("web/app.ts", "react-dom/client", "react-dom"),
+    ])
+    def test_resolve(self, resolver, path, name, expected):
+        """Test absolute, relative and external imports resolve to node names."""
+        language = "python" if path.endswith(".py") else "typescript"
+        assert resolver.resolve(path, language, name) == expected
+
+
+class TestImportGraph:
+    """Test suite for ImportGraph."""
+    
+    def test_components_and_shortest_cycles(self):
+        """Test each strongly connected component is reported once with a shortest cycle."""
+        graph = _graph({
+            "a": ["b"], "b": ["c"], "c": ["a", "d"], "d": ["b"],  # one component
+            "x": ["y"], "y": ["x"],
+            "leaf": ["a"],
+        })
+        
+        assert graph.cycles() == [
+            (["a", "b", "c", "d"], ["a", "b", "c", "a"]),
+            (["x", "y"], ["x", "y", "x"]),
+        ]
+    
+    def test_self_imports_are_ignored(self):
+        """Test a module importing itself is not a cycle."""
+        assert _graph({"a": ["a", "b"]}).cycles() == []
+    
+    def test_components_match_reachability(self):
+        """Test components equal mutual reachability on random graphs."""
+        rng = random.Random(7)
+        for _ in range(20):
+            names = [f"m{i}" for i in range(30)]
+            edges = {name: rng.sample(names, rng.randint(0, 3)) for name in names}
+            graph = _graph(edges)
+            reach = {name: _reachable(edges, name) for name in names}
+            
+            expected = set()
+            for name in names:
+                members = frozenset(
+                    other for other in names if other in reach[name] and name in reach[other]
+                ) | {name}
+                if len(members) > 1:
+                    expected.add(members)
+            
+            assert {frozenset(modules) for modules, _ in graph.cycles()} == expected
+            for modules, cycle in graph.cycles():
+                assert cycle[0] == cycle[-1] == modules[0]
+                assert all(b in edges[a] for a, b in zip(cycle, cycle[1:]))
+    
+    def test_deep_chain_does_not_recurse(self):
+        """Test a cycle far deeper than the recursion limit is found."""
+        size = 50_000
+        graph = _graph({f"m{i}": [f"m{(i + 1) % size}"] for i in range(size)})
+        
+        ((modules, cycle),) = graph.cycles()
+        
+        assert len(modules) == size and len(cycle) == size + 1
+    
+    def test_importers_and_imports(self):
+        """Test direct and transitive queries in both directions."""
+        graph = _graph({"app": ["views"], "views": ["models", "os"], "cli": ["models"]})
+        
+        assert graph.importers_of("models") == ["app", "cli", "views"]
+        assert graph.importers_of("models", transitive=False) == ["cli", "views"]
+        assert graph.imports_of("app") == ["models", "os", "views"]
+        assert graph.importers_of("unknown") == []
+    
+    def test_set_imports_updates_queries(self):
+        """Test replacing one module's edges refreshes cycles and reverse queries."""
+        graph = _graph({"a": ["b"], "b": []})
+        assert graph.cycles() == [] and graph.importers_of("a") == []
+        
+        graph.set_imports("b", ["a"])
+        
+        assert graph.cycles() == [(["a", "b"], ["a", "b", "a"])]
+        assert graph.importers_of("a") == ["b"]
+        
+        graph.set_imports("b", [])
+        assert graph.cycles() == []
+    
+    def test_from_analyses(self, tmp_path):
+        """Test building from per-file results resolves imports between files."""
+        analyses = [
+            FileAnalysis(tmp_path / "pkg" / "__init__.py", "python", 1, imports=[".a"]),
+            FileAnalysis(tmp_path / "pkg" / "a.py", "python", 1, imports=["pkg.b", "json"]),
+            FileAnalysis(tmp_path / "pkg" / "b.py", "python", 1, imports=["pkg.a.helper"]),
+        ]
+        
+        graph = ImportGraph.from_analyses(tmp_path, analyses)
+        
+        assert graph.cycles() == [(["pkg.a", "pkg.b"], ["pkg.a", "pkg.b", "pkg.a"])]
+        assert graph.importers_of("json") == ["pkg", "pkg.a", "pkg.b"]
+        assert graph.to_dict()["modules"] == len(graph) == 4
+        assert graph.edge_count == 4
+        assert graph.to_dict()["cycles"] == [
+            {"modules": ["pkg.a", "pkg.b"], "cycle": ["pkg.a", "pkg.b", "pkg.a"]}
+        ]
\ No newline at end of file
@@ -0,0 +1,306 @@
+"""
+Tests for lockfile parsing and transitive dependency graphs.
+"""
+
+import io
+import json
+import random
+
+import pytest
+
+from repo_analyzer.analyzers import lockfiles
+from repo_analyzer.analyzers.lockfiles import (
+    LockfileGraph,
+    _JsonStream,
+    parse_lockfile,
+    summarize_lockfiles,
+)
+
+
+def _counts(graph):
+    return len(graph.direct()), len(graph.transitive())
+
+
+def _names(graph, ids):
+    return sorted(f"{graph.names[i]}@{graph.versions[i]}" for i in ids)
+
+
+class TestJsonStream:
+    """Test suite for the incremental JSON reader."""
+    
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+    def test_members_match_json_load(self, chunk_size):
+        """Test walking members in small chunks decodes the same values as json.loads."""
+        rng = random.Random(3)
+        document = {
+            f"key{i}": rng.choice([12345678901234, -1.5e10, "a \"quoted\" } string", [1, {"x": None}], {}, True])
+            for i in range(50)
+        }
+        stream = _JsonStream(io.StringIO(json.dumps(document, indent=2)), chunk_size=chunk_size)
+        
+        assert {key: stream.value() for key in stream.members()} == document
+        assert stream.peek() == ""
+    
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+    def test_skip_passes_over_values(self, chunk_size):
+        """Test skipped values leave the stream at the next member, whatever they contain."""
+        document = {
+            "nested": {"a": [1, {"b": "} ] \\\" {"}], "c": {}},
+            "text": "[{\\",
+            "number": -1.5e10,
+            "list": [[], [[True, None]], "]"],
+            "last": 42,
+        }
+        stream = _JsonStream(io.StringIO(json.dumps(document, indent=2)), chunk_size=chunk_size)
+        
+        values = {}
+        for key in stream.members():
+            if key == "last":
+                values[key] = stream.value()
+            else:
+                stream.skip()
+        
+        assert values == {"last": 42}
+        assert stream.peek() == ""
+        with pytest.raises(ValueError):
+            _JsonStream(io.StringIO('{"a": [1, "x'), chunk_size=chunk_size).skip()
+    
+    def test_malformed(self):
+        """Test malformed input raises ValueError."""
+        stream = _JsonStream(io.StringIO('{"a": 1 "b": 2}'))
+        with pytest.raises(ValueError):
+            for _ in stream.members():
+                stream.value()
+
+
+class TestNpm:
+    """Test suite for package-lock.json parsing."""
+    
+    def test_v3_nested_and_workspaces(self, tmp_path):
+        """Test node_modules lookup, workspace links and dev dependencies."""
+        lock = {
+            "name": "app",
+            "lockfileVersion": 3,
+            "packages": {
+                "": {"name": "app", "dependencies": {"a": "^1"}, "devDependencies": {"d": "*"},
+                     "workspaces": ["packages/*"]},
+                "node_modules/a": {"version": "1.0.0", "dependencies": {"b": "^2"}},
+                "node_modules/a/node_modules/b": {"version": "2.0.0", "dependencies": {"c": "*"}},
+                "node_modules/b": {"version": "1.0.0"},
+                "node_modules/c": {"version": "3.0.0"},
+                "node_modules/d": {"version": "4.0.0", "dev": True},
+                "node_modules/unused": {"version": "9.9.9", "extraneous": True},
+                "node_modules/ws": {"resolved": "packages/ws", "link": True},
+                "packages/ws": {"name": "ws", "version": "0.1.0", "dependencies": {"b": "^1"}},
+            },
+            # Legacy section of version 2 files: skipped
+            "dependencies": {"bogus": {"version": "0.0.1"}},
+        }
+        path = tmp_path / "package-lock.json"
+        path.write_text(json.dumps(lock, indent=2))
+        
+        graph = parse_lockfile(path)
+        
+        assert _names(graph, graph.direct()) == ["a@1.0.0", "b@1.0.0", "d@4.0.0"]
+        assert _names(graph, graph.transitive()) == ["a@1.0.0", "b@1.0.0", "b@2.0.0", "c@3.0.0", "d@4.0.0"]
+        assert "bogus" not in graph.names
+        assert ("unused", "9.9.9") in set(graph.packages())
+    
+    def test_v2_legacy_section_is_not_decoded(self, tmp_path, monkeypatch):
+        """Test version 2 files are read from packages and the legacy section is only skipped."""
+        packages = {
+            "": {"name": "app", "dependencies": {"a": "^1"}},
+            "node_modules/a": {"version": "1.0.0", "dependencies": {"b": "^2"}},
+            "node_modules/b": {"version": "2.0.0"},
+        }
+        lock = {
+            "name": "app",
+            "lockfileVersion": 2,
+            "requires": True,
+            "packages": packages,
+            "dependencies": {
+                "a": {"version": "1.0.0", "requires": {"b": "^2"}},
+                "b": {"version": "2.0.0", "integrity": "sha512-\"{["},
+            },
+        }
+        path = tmp_path / "package-lock.json"
+        path.write_text(json.dumps(lock, indent=2))
+        decoded = []
+        value = _JsonStream.value
+        
+        def recording_value(stream):
+            decoded.append(value(stream))
+            return decoded[-1]
+        
+        monkeypatch.setattr(_JsonStream, "value", recording_value)
+        
+        graph = parse_lockfile(path)
+        
+        assert _names(graph, graph.transitive()) == ["a@1.0.0", "b@2.0.0"]
+        assert not any(isinstance(v, dict) and "requires" in v for v in decoded)
+        assert "app" not in decoded
+    
+    def test_v1_uses_package_json(self, tmp_path):
+        """Test version 1 lockfiles take direct dependencies from package.json."""
+        lock = {
+            "lockfileVersion": 1,
+            "dependencies": {
+                "a": {"version": "1.0.0", "requires": {"b": "^2"},
+                      "dependencies": {"b": {"version": "2.0.0"}}},
+                "b": {"version": "1.0.0"},
+                "dev": {"version": "1.0.0", "dev": True},
+            },
+        }
+        (tmp_path / "package-lock.json").write_text(json.dumps(lock))
+        (tmp_path / "package.json").write_text(json.dumps({"dependencies": {"a": "1"}}))
+        
+        graph = parse_lockfile(tmp_path / "package-lock.json")
+        
+        assert _names(graph, graph.transitive()) == ["a@1.0.0", "b@2.0.0"]
+    
+    def test_malformed_lockfile(self, tmp_path):
+        """Test unparsable lockfiles yield None instead of raising."""
+        (tmp_path / "package-lock.json").write_text('{"packages": {"": ')
+        assert parse_lockfile(tmp_path / "package-lock.json") is None
+        assert parse_lockfile(tmp_path / "missing" / "poetry.lock") is None
+
+
+class TestLineParsers:
+    """Test suite for poetry.lock, Cargo.lock and go.sum parsing."""
+    
+    def test_poetry(self, tmp_path):
+        """Test packages, dependency tables and pyproject direct dependencies."""
+        (tmp_path / "poetry.lock").write_text("\n".join([
+            "[[package]]",
+            'name = "requests"',
+            'version = "2.31.0"',
+            'files = [',
+            '    {file = "requests-2.31.0.tar.gz", hash = "sha256:00"},',
+            ']',
+            "",
+            "[package.dependencies]",
+            'charset-normalizer = ">=2,<4"',
+            'urllib3 = {version = ">=1.21.1,<3", optional = true}',
+            "",
+            "[package.extras]",
+            'socks = ["PySocks"]',
+            "",
+            "[[package]]",
+            'name = "charset-normalizer"',
+            'version = "3.3.2"',
+            "",
+            "[[package]]",
+            'name = "urllib3"',
+            'version = "2.1.0"',
+            "",
+            "[[package]]",
+            'name = "pytest"',
+            'version = "8.0.0"',
+            "",
+            "[metadata]",
+            'lock-version = "2.0"',
+        ]))
+        (tmp_path / "pyproject.toml").write_text("\n".join([
+            "[tool.poetry.dependencies]",
+            'python = "^3.11"',
+            'Requests = "^2.31"',
+            "[tool.poetry.group.dev.dependencies]",
+            'pytest = "*"',
+        ]))
+        
+        graph = parse_lockfile(tmp_path / "poetry.lock")
+        
+        assert graph.ecosystem == "PyPI"
+        assert _names(graph, graph.direct()) == ["pytest@8.0.0", "requests@2.31.0"]
+        assert _counts(graph) == (2, 4)
+    
+    def test_cargo_workspace(self, tmp_path):
+        """Test workspace crates are local and dependency versions disambiguate."""
+        (tmp_path / "Cargo.lock").write_text("\n".join([
+            "version = 3",
+            "",
+            "[[package]]",
+            'name = "app"',
+            'version = "0.1.0"',
+            "dependencies = [",
+            ' "serde 1.0.190",',
+            ' "util",',
+            "]",
+            "",
+            "[[package]]",
+            'name = "util"',
+            'version = "0.1.0"',
+            'dependencies = ["syn 1.0.109"]',
+            "",
+            "[[package]]",
+            'name = "serde"',
+            'version = "1.0.190"',
+            'source = "registry+https://github.com/rust-lang/crates.io-index"',
+            'dependencies = ["syn 2.0.39 (registry+https://github.com/rust-lang/crates.io-index)"]',
+            "",
+            "[[package]]",
+            'name = "syn"',
+            'version = "1.0.109"',
+            'source = "registry+https://github.com/rust-lang/crates.io-index"',
+            "",
+            "[[package]]",
+            'name = "syn"',
+            'version = "2.0.39"',
+            'source = "registry+https://github.com/rust-lang/crates.io-index"',
+        ]))
+        
+        graph = parse_lockfile(tmp_path / "Cargo.lock")
+        
+        assert _names(graph, graph.direct()) == ["serde@1.0.190", "syn@1.0.109"]
+        assert _names(graph, graph.transitive()) == ["serde@1.0.190", "syn@1.0.109", "syn@2.0.39"]
+    
+    def test_go_sum(self, tmp_path):
+        """Test go.sum modules with direct requirements from go.mod."""
+        (tmp_path / "go.sum").write_text("\n".join([
+            "github.com/a/x v1.2.0 h1:aaa=",
+            "github.com/a/x v1.2.0/go.mod h1:bbb=",
+            "github.com/b/y v0.3.1 h1:ccc=",
+            "github.com/b/y v0.3.1/go.mod h1:ddd=",
+            "github.com/c/z v0.0.1/go.mod h1:eee=",
+        ]))
+        (tmp_path / "go.mod").write_text("\n".join([
+            "module example.com/app",
+            "",
+            "require github.com/a/x v1.2.0",
+            "require (",
+            "\tgithub.com/b/y v0.3.1 // indirect",
+            ")",
+        ]))
+        
+        graph = parse_lockfile(tmp_path / "go.sum")
+        
+        assert _counts(graph) == (1, 2)
+        assert sorted(graph.packages()) == [("github.com/a/x", "v1.2.0"), ("github.com/b/y", "v0.3.1")]
+
+
+class TestLockfileGraph:
+    """Test suite for LockfileGraph."""
+    
+    def test_without_manifest_roots_are_unrequired_packages(self):
+        """Test packages nothing depends on are direct when no project is known."""
+        graph = LockfileGraph("npm")
+        a, b, c = graph.add("a", "1"), graph.add("b", "1"), graph.add("c", "1")
+        graph.dependencies[a].append(b)
+        
+        assert graph.direct() == {a, c}
+        assert graph.transitive() == {a, b, c}
+    
+    def test_round_trip_and_summary(self):
+        """Test graphs survive to_dict and are summarized per manager."""
+        first = LockfileGraph("npm")
+        project = first.add("app", "", local=True)
+        first.dependencies[project] = [first.add("a", "1.0.0"), first.add("b", "1.0.0")]
+        second = LockfileGraph.from_dict(json.loads(json.dumps(first.to_dict())))
+        second.versions[2] = "2.0.0"
+        
+        assert summarize_lockfiles([first, second]) == {
+            "npm": {"direct": 2, "total": 3, "lockfiles": 2}
+        }
+        assert lockfiles.lockfile_inputs(first_path := lockfiles.Path("x/go.sum")) == [
+            first_path, lockfiles.Path("x/go.mod")
+        ]
\ No newline at end of file
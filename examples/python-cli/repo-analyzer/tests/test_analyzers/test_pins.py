@@ -0,0 +1,55 @@
+"""
+Tests for reading pinned dependency versions.
+"""
+
+from repo_analyzer.analyzers.lockfiles import LockfileGraph
+from repo_analyzer.analyzers.pins import Pin, parse_requirements, read_pins
+
+
+class TestPins:
+    """Test suite for pinned dependency parsing."""
+    
+    def test_parse_requirements(self):
+        """Test only exact pins are kept, with extras, markers and comments stripped."""
+        text = "\n".join([
+            "# comment",
+            "requests==2.19.0",
+            "Flask[async] == 2.0.1 ; python_version >= '3.8'",
+            "urllib3===1.26.5  # pinned",
+            "click>=8.0",
+            "django==4.*",
+            "-r base.txt",
+            "-e git+https://example.invalid/repo.git#egg=pkg",
+            "numpy==1.26.4 \\",
+            "    --hash=sha256:abc",
+        ])
+        
+        assert parse_requirements(text, "requirements.txt") == [
+            Pin("PyPI", "requests", "2.19.0", "requirements.txt"),
+            Pin("PyPI", "Flask", "2.0.1", "requirements.txt"),
+            Pin("PyPI", "urllib3", "1.26.5", "requirements.txt"),
+            Pin("PyPI", "numpy", "1.26.4", "requirements.txt"),
+        ]
+    
+    def test_read_pins(self, tmp_path):
+        """Test requirements and constraints files are read, other files ignored."""
+        (tmp_path / "requirements").mkdir()
+        (tmp_path / "requirements" / "requirements-dev.txt").write_text("pytest==8.0.0\n")
+        (tmp_path / "constraints.txt").write_text("idna==3.6\n")
+        (tmp_path / "notes.txt").write_text("fake==1.0\n")
+        files = [p for p in tmp_path.rglob("*") if p.is_file()]
+        
+        assert read_pins(tmp_path, files) == [
+            Pin("PyPI", "idna", "3.6", "constraints.txt"),
+            Pin("PyPI", "pytest", "8.0.0", "requirements/requirements-dev.txt"),
+        ]
+    
+    def test_lockfile_pins(self, tmp_path):
+        """Test every non-local lockfile package becomes a pin of its ecosystem."""
+        graph = LockfileGraph("cargo")
+        graph.add("app", "0.1.0", local=True)
+        graph.add("serde", "1.0.190")
+        
+        assert read_pins(tmp_path, [], {"Cargo.lock": graph}) == [
+            Pin("crates.io", "serde", "1.0.190", "Cargo.lock")
+        ]
\ No newline at end of file
@@ -0,0 +1,182 @@
+"""
+Tests for the single-pass combined analysis pipeline.
+"""
+
+import ast
+
+import pytest
+
+from conftest import StubAnalyzer
+from repo_analyzer.analyzers import executor, pipeline
+from repo_analyzer.analyzers.base import FileAnalysis
+from repo_analyzer.analyzers.pipeline import ParsedFile, analyze_all, iter_all
+from repo_analyzer.storage.cache import AnalysisCache
+from repo_analyzer.utils import file_access
+
+
+class FunctionCounter(StubAnalyzer):
+    """Analyzer that counts functions from the shared AST."""
+    
+    def describe(self, parsed: ParsedFile) -> FileAnalysis:
+        functions = [
+            {"name": node.name, "line": node.lineno}
+            for node in ast.walk(parsed.tree)
+            if isinstance(node, ast.FunctionDef)
+        ]
+        return FileAnalysis(parsed.path, parsed.language, len(parsed.lines), functions=functions)
+
+
+class ImportCollector(StubAnalyzer):
+    """Analyzer that collects imports from the shared AST."""
+    
+    def describe(self, parsed: ParsedFile) -> FileAnalysis:
+        imports = [
+            alias.name
+            for node in ast.walk(parsed.tree)
+            if isinstance(node, ast.Import)
+            for alias in node.names
+        ]
+        return FileAnalysis(parsed.path, parsed.language, len(parsed.lines), imports=imports)
+
+
+@pytest.fixture
+def sample_files(tmp_path):
+    files = []
+    for i in range(12):
+        path = tmp_path / f"module_{i:02d}.py"
+        path.write_text("import os\n" + "".join(f"def f{j}():\n    return {j}\n" for j in range(i)))
+        files.append(path)
+    return files
+
+
+@pytest.fixture
+def analyzers():
+    return {
+        "functions": FunctionCounter(),
+        "imports": ImportCollector(),
+        "legacy": StubAnalyzer(from_source=False),
+    }
+
+
+class TestAnalyzeAll:
+    """Test suite for analyze_all."""
+    
+    def test_matches_individual_analyzers(self, sample_files, analyzers):
+        """Test each analyzer's results equal running it on its own."""
+        results = analyze_all(analyzers, sample_files, jobs=1)
+        
+        for name, analyzer in analyzers.items():
+            assert results[name] == [analyzer.analyze_file(p) for p in sample_files]
+    
+    def test_reads_and_parses_each_file_once(self, sample_files, analyzers, monkeypatch):
+        """Test files are read and parsed once no matter how many analyzers use them."""
+        reads, parses = [], []
+        real_read, real_parse = ParsedFile.read.__func__, ast.parse
+        monkeypatch.setattr(
+            ParsedFile, "read", classmethod(lambda cls, p: reads.append(p) or real_read(cls, p))
+        )
+        monkeypatch.setattr(
+            pipeline.ast, "parse", lambda *a, **kw: parses.append(1) or real_parse(*a, **kw)
+        )
+        
+        analyze_all({"functions": analyzers["functions"], "imports": analyzers["imports"]}, sample_files, jobs=1)
+        
+        # Reader threads may finish out of order; each file is still read once
+        assert sorted(reads) == sample_files
+        assert len(parses) == len(sample_files)
+    
+    def test_parallel_matches_serial(self, sample_files, analyzers, monkeypatch):
+        """Test parallel results are identical and in input order."""
+        serial = analyze_all(analyzers, sample_files, jobs=1)
+        monkeypatch.setattr(executor, "PARALLEL_THRESHOLD", 0)
+        
+        assert analyze_all(analyzers, sample_files, jobs=3, chunk_size=2) == serial
+    
+    def test_fully_cached_files_are_not_read(self, sample_files, analyzers, tmp_path, monkeypatch):
+        """Test a file cached for every analyzer is skipped entirely."""
+        db_path = tmp_path / "cache.db"
+        caches = {name: AnalysisCache.for_analyzer(db_path, a, {}) for name, a in analyzers.items()}
+        first = analyze_all(analyzers, sample_files, jobs=1, caches=caches)
+        for cache in caches.values():
+            cache.flush()
+        
+        reads = []
+        monkeypatch.setattr(ParsedFile, "read", classmethod(lambda cls, p: reads.append(p)))
+        second = analyze_all(analyzers, sample_files, jobs=1, caches=caches)
+        for cache in caches.values():
+            cache.close()
+        
+        assert second == first
+        assert reads == []
+    
+    def test_binary_and_oversized_files_are_skipped(self, sample_files, analyzers, tmp_path, monkeypatch):
+        """Test skipped files get a skipped issue and their raw line count, not analyzer results."""
+        monkeypatch.setattr(file_access, "_max_file_size", 64)
+        (tmp_path / "logo.png").write_bytes(b"\x89PNG\r\n\x1a\n\0\0\0\rIHDR")
+        (tmp_path / "generated.py").write_text("x = 1\n" * 20)
+        files = [tmp_path / "logo.png", tmp_path / "generated.py", sample_files[0]]
+        
+        results = analyze_all(analyzers, files, jobs=1)
+        
+        for column in results.values():
+            binary, large, regular = column
+            assert binary.issues == [{"type": "skipped", "reason": "binary", "message": "Binary file not analyzed"}]
+            assert binary.lines_of_code == 0
+            assert large.issues[0]["reason"] == "too-large"
+            assert large.lines_of_code == 20 and large.functions == [] and large.imports == []
+            assert regular.issues == []
+
+
+class TestIterAll:
+    """Test suite for iter_all."""
+    
+    def test_matches_analyze_all(self, sample_files, analyzers, monkeypatch):
+        """Test streamed results are in input order and equal analyze_all."""
+        expected = analyze_all(analyzers, sample_files, jobs=1)
+        monkeypatch.setattr(executor, "PARALLEL_THRESHOLD", 0)
+        
+        streamed = list(iter_all(analyzers, sample_files, jobs=3, chunk_size=2))
+        
+        assert [path for path, _ in streamed] == sample_files
+        for name in analyzers:
+            assert [results[name] for _, results in streamed] == expected[name]
+    
+    def test_yields_before_later_files_are_analyzed(self, sample_files, monkeypatch):
+        """Test the first file's results arrive while later files are still pending."""
+        analyzed = []
+        real_analyze = FunctionCounter.analyze_source
+        monkeypatch.setattr(
+            FunctionCounter, "analyze_source", lambda self, parsed: analyzed.append(parsed.path) or real_analyze(self, parsed)
+        )
+        
+        stream = iter_all({"functions": FunctionCounter()}, sample_files, jobs=1, chunk_size=2)
+        first_path, first = next(stream)
+        
+        assert first_path == sample_files[0]
+        assert first["functions"].functions == []
+        assert len(analyzed) < len(sample_files)
+        stream.close()
+
+
+class TestParsedFile:
+    """Test suite for ParsedFile."""
+    
+    def test_syntax_error_yields_no_tree(self, tmp_path):
+        """Test broken Python files parse to None and record the error."""
+        path = tmp_path / "broken.py"
+        path.write_text("def broken(:\n")
+        parsed = ParsedFile.read(path)
+        
+        assert parsed.tree is None
+        assert parsed.syntax_error
+        assert parsed.lines == ["def broken(:"]
+    
+    def test_non_python_has_no_tree(self, tmp_path):
+        """Test non-Python files are decoded but not parsed."""
+        path = tmp_path / "app.js"
+        path.write_bytes(b"let x = '\xff';\n")
+        parsed = ParsedFile.read(path)
+        
+        assert parsed.language == "javascript"
+        assert parsed.tree is None and parsed.tokens is None
+        assert "�" in parsed.source
\ No newline at end of file
@@ -0,0 +1,89 @@
+"""
+Tests for function ranking in complexity reports.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from repo_analyzer.analyzers.base import FileAnalysis
+from repo_analyzer.analyzers.ranking import FunctionRow, iter_function_rows, rank_functions
+from repo_analyzer.analyzers.results import ResultStore
+
+
+@pytest.fixture
+def analyses():
+    return [
+        FileAnalysis(
+            file_path=Path(f"pkg/module_{i}.py"),
+            language="python",
+            lines_of_code=100,
+            functions=[
+                {"name": f"f{i}_{j}", "line": j * 10 + 1, "complexity": (i * 7 + j * 3) % 20}
+                for j in range(6)
+            ]
+        )
+        for i in range(8)
+    ]
+
+
+@pytest.fixture
+def rows(analyses):
+    return list(iter_function_rows(analyses))
+
+
+class TestIterFunctionRows:
+    """Test suite for iter_function_rows."""
+    
+    def test_store_matches_analyses(self, analyses, rows):
+        """Test a ResultStore yields the same rows as the FileAnalysis list."""
+        assert list(iter_function_rows(ResultStore.from_analyses(analyses))) == rows
+        assert rows[0] == FunctionRow("pkg/module_0.py", "f0_0", 1, 0)
+
+
+class TestRankFunctions:
+    """Test suite for rank_functions."""
+    
+    @pytest.mark.parametrize("sort, key, reverse", [
+        ("complexity", lambda row: row.complexity, True),
+        ("name", lambda row: (row.name, row.file_path, row.line), False),
+        ("file", lambda row: (row.file_path, row.line), False),
+    ])
+    @pytest.mark.parametrize("limit", [None, 1, 5, 1000])
+    def test_matches_full_sort(self, rows, sort, key, reverse, limit):
+        """Test the bounded selection equals sorting everything and slicing."""
+        ranking = rank_functions(iter(rows), threshold=10, limit=limit, sort=sort)
+        
+        assert ranking.rows == sorted(rows, key=key, reverse=reverse)[:limit]
+        assert ranking.total == ranking.matched == len(rows)
+        assert ranking.hidden == len(rows) - len(ranking.rows)
+    
+    def test_only_over_threshold(self, rows):
+        """Test filtering keeps only high-complexity functions but counts all."""
+        ranking = rank_functions(rows, threshold=10, only_over_threshold=True)
+        high = [row for row in rows if row.complexity > 10]
+        
+        assert sorted(ranking.rows) == sorted(high)
+        assert ranking.over_threshold == ranking.matched == len(high)
+        assert ranking.total == len(rows)
+    
+    def test_zero_limit_still_counts(self, rows):
+        """Test a zero limit selects nothing but still counts every function."""
+        ranking = rank_functions(rows, threshold=10, limit=0)
+        
+        assert ranking.rows == []
+        assert ranking.total == len(rows)
+        assert ranking.over_threshold == sum(row.complexity > 10 for row in rows)
+    
+    def test_ties_keep_input_order(self):
+        """Test functions of equal complexity stay in input order."""
+        rows = [FunctionRow("a.py", name, 1, 5) for name in "cab"]
+        
+        assert [row.name for row in rank_functions(rows, 10, limit=2).rows] == ["c", "a"]
+    
+    def test_rejects_bad_arguments(self, rows):
+        """Test unknown sort orders and negative limits raise ValueError."""
+        with pytest.raises(ValueError):
+            rank_functions(rows, 10, sort="size")
+        with pytest.raises(ValueError):
+            rank_functions(rows, 10, limit=-1)
\ No newline at end of file
@@ -0,0 +1,93 @@
+"""
+Tests for the prefetching reader stage.
+"""
+
+import threading
+import time
+
+import pytest
+
+from repo_analyzer.analyzers.reader import (
+    ReaderSettings,
+    get_reader_settings,
+    prefetch,
+    set_reader_settings,
+)
+
+
+class TrackingLoader:
+    """Loader that records concurrency and how far it runs ahead."""
+    
+    def __init__(self, delays=None):
+        self.delays = delays or {}
+        self.loaded = []
+        self.threads = set()
+        self._lock = threading.Lock()
+    
+    def __call__(self, item):
+        time.sleep(self.delays.get(item, 0.0))
+        with self._lock:
+            self.loaded.append(item)
+            self.threads.add(threading.current_thread().name)
+        if item == "boom":
+            raise OSError("unreadable")
+        return item * 2
+    
+    def ahead_of(self, consumed):
+        with self._lock:
+            return len(self.loaded) - consumed
+
+
+class TestPrefetch:
+    """Test suite for prefetch."""
+    
+    def test_results_keep_input_order(self):
+        """Test slow and fast loads are yielded in input order."""
+        loader = TrackingLoader(delays={0: 0.05, 3: 0.02})
+        
+        results = list(prefetch(range(10), loader, readers=4, read_ahead=4))
+        
+        assert results == [(i, i * 2) for i in range(10)]
+        assert all(name.startswith("reader") for name in loader.threads)
+    
+    def test_read_ahead_is_bounded(self):
+        """Test loads never get more than ``read_ahead`` items ahead of the consumer."""
+        loader = TrackingLoader()
+        furthest = 0
+        
+        for consumed, _ in enumerate(prefetch(range(50), loader, readers=4, read_ahead=5), 1):
+            time.sleep(0.002)
+            furthest = max(furthest, loader.ahead_of(consumed))
+        
+        assert furthest <= 5
+    
+    def test_errors_surface_at_their_item(self):
+        """Test a failed load is raised when its item is reached, not before."""
+        items = prefetch(["a", "b", "boom", "c"], TrackingLoader(), readers=2, read_ahead=4)
+        
+        assert next(items) == ("a", "aa")
+        assert next(items) == ("b", "bb")
+        with pytest.raises(OSError, match="unreadable"):
+            next(items)
+    
+    def test_zero_readers_load_inline(self):
+        """Test ``readers=0`` loads in the consumer thread, one item at a time."""
+        loader = TrackingLoader()
+        
+        for consumed, _ in enumerate(prefetch(range(5), loader, readers=0), 1):
+            assert loader.ahead_of(consumed) == 0
+        assert loader.threads == {threading.current_thread().name}
+    
+    def test_settings_provide_defaults(self):
+        """Test the process-wide settings apply when no arguments are given."""
+        loader = TrackingLoader()
+        set_reader_settings(ReaderSettings(readers=0, read_ahead=1))
+        try:
+            list(prefetch(range(3), loader))
+        finally:
+            set_reader_settings(None)
+        
+        assert loader.threads == {threading.current_thread().name}
+        assert get_reader_settings() == ReaderSettings()
+        with pytest.raises(ValueError):
+            ReaderSettings(read_ahead=0)
\ No newline at end of file
@@ -0,0 +1,100 @@
+"""
+Tests for the columnar result store.
+"""
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from repo_analyzer.analyzers.base import FileAnalysis
+from repo_analyzer.analyzers.results import ResultStore
+
+
+@pytest.fixture
+def analyses():
+    return [
+        FileAnalysis(
+            file_path=Path("src/a.py"),
+            language="python",
+            lines_of_code=40,
+            complexity_score=3.5,
+            functions=[
+                {"name": "parse", "line": 3, "complexity": 7},
+                {"name": "render", "line": 20, "complexity": 2},
+            ],
+            classes=[{"name": "Parser", "line": 1}],
+            imports=["os", "json"],
+            issues=[{"type": "long-function", "line": 3}]
+        ),
+        FileAnalysis(file_path=Path("src/empty.py"), language="python", lines_of_code=0),
+        FileAnalysis(
+            file_path=Path("web/app.js"),
+            language="javascript",
+            lines_of_code=12,
+            functions=[{"name": "parse", "line": 1, "complexity": 4}],
+            imports=["react"]
+        ),
+    ]
+
+
+class TestResultStore:
+    """Test suite for ResultStore."""
+    
+    def test_round_trip_preserves_results(self, analyses):
+        """Test materialized analyses match the stored input."""
+        store = ResultStore.from_analyses(analyses)
+        
+        assert len(store) == 3
+        assert store.function_count == 3
+        assert list(store.iter_analyses()) == analyses
+    
+    def test_views_match_renderer_interface(self, analyses):
+        """Test file and function views expose attribute access."""
+        store = ResultStore.from_analyses(analyses)
+        
+        rows = [
+            (record.file_path.name, func.name, func.complexity)
+            for record in store
+            for func in record.functions
+        ]
+        
+        assert rows == [("a.py", "parse", 7), ("a.py", "render", 2), ("app.js", "parse", 4)]
+    
+    def test_columns_support_bulk_aggregation(self, analyses):
+        """Test raw columns expose per-function and per-file values."""
+        store = ResultStore.from_analyses(analyses)
+        
+        assert list(store.column("function_complexity")) == [7, 2, 4]
+        assert list(store.column("function_offsets")) == [0, 2, 2, 3]
+        assert list(store.issue_counts()) == [1, 0, 0]
+    
+    def test_write_json_streams_valid_document(self, analyses):
+        """Test JSON export produces the same data as FileAnalysis.to_dict."""
+        store = ResultStore.from_analyses(analyses)
+        buffer = io.StringIO()
+        
+        store.write_json(buffer)
+        
+        assert json.loads(buffer.getvalue()) == [a.to_dict() for a in analyses]
+    
+    def test_detailed_and_unknown_keys_are_kept(self):
+        """Test detailed metrics and analyzer-specific keys survive storage."""
+        analysis = FileAnalysis(
+            file_path=Path("src/b.py"),
+            language="python",
+            lines_of_code=9,
+            functions=[
+                {"name": "f", "line": 1, "complexity": 5, "nesting_depth": 2, "cognitive_complexity": 6},
+                {"name": "g", "line": 7, "complexity": 1, "parameters": ["self"], "async": True},
+            ],
+            classes=[{"name": "Model", "line": 5, "bases": ["Base"]}]
+        )
+        store = ResultStore.from_analyses([analysis])
+        
+        assert list(store.iter_analyses()) == [analysis]
+        detailed, plain = store.iter_functions()
+        assert (detailed.nesting_depth, detailed.cognitive_complexity) == (2, 6)
+        assert plain.nesting_depth is None and plain.extra == {"parameters": ["self"], "async": True}
+        assert list(store.column("function_cognitive_complexity")) == [6, -1]
\ No newline at end of file
@@ -0,0 +1,123 @@
+"""
+Tests for hierarchical directory rollups.
+"""
+
+from pathlib import Path
+
+import git
+import pytest
+
+from repo_analyzer.analyzers.base import FileAnalysis
+from repo_analyzer.analyzers.rollup import RollupTree, attach_git_base, refresh_from_git
+
+
+def count_lines(path: Path) -> FileAnalysis:
+    language = "python" if path.suffix == ".py" else "markdown"
+    return FileAnalysis(path, language, len(path.read_text().splitlines()))
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    repo = git.Repo.init(tmp_path)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "Test")
+        config.set_value("user", "email", "test@example.com")
+    
+    files = {
+        "README.md": "# Project\n",
+        "src/app.py": "a = 1\nb = 2\n",
+        "src/core/model.py": "x = 1\n" * 5,
+        "src/core/view.py": "y = 2\n" * 3,
+        "docs/guide.md": "text\n" * 4,
+    }
+    for name, content in files.items():
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text(content)
+    repo.index.add(list(files))
+    repo.index.commit("base")
+    return tmp_path
+
+
+def build(root: Path) -> RollupTree:
+    analyses = [count_lines(p) for p in sorted(root.rglob("*")) if p.is_file() and ".git" not in p.parts]
+    return RollupTree.from_analyses(root, analyses)
+
+
+class TestRollupTree:
+    """Test suite for RollupTree."""
+    
+    def test_rollups_per_directory(self, git_repo):
+        """Test totals at the root and for subtrees."""
+        tree = build(git_repo)
+        
+        assert (tree.root.files, tree.root.lines) == (5, 15)
+        src = tree.to_directory_analysis(git_repo, "src")
+        assert (src.total_files, src.total_lines, src.total_directories) == (3, 10, 1)
+        assert src.languages == {"python": {"files": 3, "lines": 10}}
+        assert tree.node("src/core").lines == 8
+        assert tree.to_directory_analysis(git_repo, "missing") is None
+    
+    def test_update_touches_only_ancestors_and_prunes(self, git_repo):
+        """Test updates and removals keep every level consistent."""
+        tree = build(git_repo)
+        docs = tree.node("docs")
+        
+        tree.set_file("src/core/model.py", 50, "python")
+        assert tree.node("src/core").lines == 53
+        assert tree.node("src").lines == 55
+        assert tree.node("docs") is docs and docs.lines == 4
+        
+        tree.remove_file("docs/guide.md")
+        assert tree.node("docs") is None
+        assert tree.root.languages["markdown"] == {"files": 1, "lines": 1}
+    
+    def test_walk_depth(self, git_repo):
+        """Test depth-limited traversal in sorted order."""
+        tree = build(git_repo)
+        
+        assert [(level, node.path) for level, node in tree.walk(depth=1)] == [
+            (0, ""), (1, "docs"), (1, "src")
+        ]
+        assert [node.path for _, node in tree.walk("src")] == ["src", "src/core"]
+    
+    def test_save_and_load_round_trip(self, git_repo, tmp_path_factory):
+        """Test a saved tree reloads with identical rollups."""
+        tree = build(git_repo)
+        output = tmp_path_factory.mktemp("rollups") / "tree.json"
+        tree.save(output)
+        
+        assert RollupTree.load(output).root.to_dict() == tree.root.to_dict()
+        assert RollupTree.load(output.with_name("missing.json")) is None
+
+
+class TestRefreshFromGit:
+    """Test suite for refresh_from_git."""
+    
+    def test_refresh_matches_rebuild(self, git_repo):
+        """Test only changed files are re-analyzed and the result matches a rebuild."""
+        tree = build(git_repo)
+        attach_git_base(tree, git_repo)
+        
+        (git_repo / "src/app.py").write_text("a = 1\n" * 10)
+        (git_repo / "src/new.py").write_text("n = 1\n")
+        (git_repo / "docs/guide.md").unlink()
+        analyzed = []
+        
+        updated = refresh_from_git(tree, git_repo, lambda p: analyzed.append(p) or count_lines(p))
+        
+        assert updated == 3
+        assert sorted(p.name for p in analyzed) == ["app.py", "new.py"]
+        assert tree.root.to_dict() == build(git_repo).root.to_dict()
+    
+    def test_reverted_dirty_file_is_refreshed(self, git_repo):
+        """Test a file dirty at save time is re-read after being reverted."""
+        (git_repo / "src/app.py").write_text("dirty = 1\n" * 7)
+        tree = build(git_repo)
+        attach_git_base(tree, git_repo)
+        assert tree.dirty == {"src/app.py"}
+        
+        (git_repo / "src/app.py").write_text("a = 1\nb = 2\n")
+        refresh_from_git(tree, git_repo, count_lines)
+        
+        assert tree.node("src").lines == 10
+        assert tree.dirty == set()
\ No newline at end of file
@@ -0,0 +1,85 @@
+"""
+Tests for the dedicated structure engine.
+"""
+
+import pytest
+
+from conftest import StubAnalyzer
+from repo_analyzer.analyzers import structure_engine
+from repo_analyzer.analyzers.pipeline import analyze_all
+from repo_analyzer.analyzers.rollup import RollupTree
+from repo_analyzer.analyzers.structure_engine import classify_lines, summarize_structure
+from repo_analyzer.utils import file_access
+from repo_analyzer.utils.file_utils import scan_repository
+
+
+@pytest.fixture
+def sample_repo(tmp_path):
+    files = {
+        "README.md": b"# Project\n\n<!-- note\nmore -->\ntext",
+        "setup.py": b"#!/usr/bin/env python\n# setup\n\nimport os\r\n",
+        "bin/serve": b"#!/usr/bin/env node\nconsole.log(1)\n",
+        "src/app.js": b"/* header\n * lines\n */\nlet a = 1; // tail\n\n// comment\n",
+        "src/core/model.py": b"x = 1\n" * 50,
+        "src/core/legacy.c": b"int x;\r\n/* one */\r\n\r\nint y;\r",
+        "assets/logo.png": b"\x89PNG\r\n\x1a\n\0\0\0\rIHDR" * 10,
+        "Makefile": b"all:\n\techo ok\n",
+    }
+    for name, content in files.items():
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_bytes(content)
+    return tmp_path
+
+
+class TestClassifyLines:
+    """Test suite for classify_lines."""
+    
+    @pytest.mark.parametrize("data, language, expected", [
+        (b"# c\n\nx = 1\n  # d\n   \n", "python", (2, 2)),
+        (b"a\r\n\r\n  \r#x", "python", (2, 1)),
+        (b"x\n   ", "python", (1, 0)),
+        (b"/* a\n b\n\n */\nint x; // y\n// z\nint y; /* open\nstill\n*/ int z;\n", "c", (1, 6)),
+        (b"// only line comments\nint x;\n", "c", (0, 1)),
+        (b"# not a comment\n", "markdown", (0, 0)),
+        (b"", "python", (0, 0)),
+    ])
+    def test_counts_blank_and_comment_lines(self, data, language, expected):
+        """Test blank and comment lines per language, with and without block comments."""
+        assert classify_lines(data, language) == expected
+
+
+class TestSummarizeStructure:
+    """Test suite for summarize_structure."""
+    
+    def test_matches_general_analysis_path(self, sample_repo, monkeypatch):
+        """Test the engine's DirectoryAnalysis equals the one built from FileAnalysis results."""
+        monkeypatch.setattr(file_access, "_max_file_size", 200)
+        files = list(scan_repository(sample_repo))
+        analyses = analyze_all({"structure": StubAnalyzer()}, files, jobs=1)["structure"]
+        expected = RollupTree.from_analyses(sample_repo, analyses).to_directory_analysis(sample_repo)
+        
+        summary = summarize_structure(sample_repo, files, jobs=1)
+        
+        assert summary.to_directory_analysis(sample_repo).to_dict() == expected.to_dict()
+        assert summary.tree.to_dict() == RollupTree.from_analyses(sample_repo, analyses).to_dict()
+    
+    def test_detects_languages_from_names_and_shebangs(self, sample_repo):
+        """Test extension, file name and shebang lookups, and binary files counting no lines."""
+        summary = summarize_structure(sample_repo, scan_repository(sample_repo), jobs=1)
+        languages = summary.to_directory_analysis(sample_repo).languages
+        
+        assert languages["python"] == {"files": 2, "lines": 54}
+        assert languages["javascript"] == {"files": 2, "lines": 8}
+        assert languages["unknown"] == {"files": 2, "lines": 2}
+        assert summary.breakdown["javascript"].to_dict() == {"code": 3, "comment": 4, "blank": 1}
+        assert summary.breakdown["markdown"].to_dict() == {"code": 2, "comment": 2, "blank": 1}
+    
+    def test_parallel_matches_serial(self, sample_repo, monkeypatch):
+        """Test counting on a process pool gives identical results."""
+        files = list(scan_repository(sample_repo))
+        serial = summarize_structure(sample_repo, files, jobs=1)
+        monkeypatch.setattr(structure_engine, "PARALLEL_THRESHOLD", 0)
+        parallel = summarize_structure(sample_repo, files, jobs=3)
+        
+        assert parallel.tree.to_dict() == serial.tree.to_dict()
+        assert parallel.breakdown == serial.breakdown
\ No newline at end of file
@@ -0,0 +1,132 @@
+"""
+Tests for the resident analysis workspace.
+"""
+
+import os
+import re
+from pathlib import Path
+
+import pytest
+
+from conftest import StubAnalyzer
+from repo_analyzer.analyzers.base import FileAnalysis
+from repo_analyzer.analyzers.pipeline import ParsedFile
+from repo_analyzer.analyzers.workspace import Workspace
+from repo_analyzer.utils.watcher import FileChanges
+
+
+class ImportCollector(StubAnalyzer):
+    """StubAnalyzer that also records ``import`` statements."""
+    
+    def describe(self, parsed: ParsedFile) -> FileAnalysis:
+        analysis = super().describe(parsed)
+        analysis.imports = re.findall(r"^import (\S+)", parsed.source, re.MULTILINE)
+        return analysis
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    # Distinct modification times even on coarse-grained file systems
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def repo(tmp_path):
+    root = tmp_path / "repo"
+    _write(root / "a.py", "a = 1\n")
+    _write(root / "pkg" / "b.py", "b = 1\nb = 2\n")
+    _write(root / "build" / "out.py", "generated = 1\n")
+    _write(root / ".gitignore", "build/\n")
+    return root.resolve()
+
+
+@pytest.fixture
+def workspace(repo):
+    workspace = Workspace(repo, {"lines": StubAnalyzer()}, jobs=1)
+    workspace.load()
+    workspace.analyzers["lines"].analyzed.clear()
+    return workspace
+
+
+class TestWorkspace:
+    """Test suite for Workspace."""
+    
+    def test_load_analyzes_scanned_files(self, workspace, repo):
+        """Test loading analyzes every file the scanner yields."""
+        assert set(workspace.files) == {repo / ".gitignore", repo / "a.py", repo / "pkg" / "b.py"}
+        assert workspace.result("lines").lines == 1 + 1 + 2
+        assert workspace.directories() == {repo, repo / "pkg"}
+    
+    def test_modified_file_is_reanalyzed_alone(self, workspace, repo):
+        """Test a change to a known file re-analyzes only that file."""
+        _write(repo / "a.py", "a = 1\na = 2\na = 3\n")
+        
+        update = workspace.apply(FileChanges({repo / "a.py"}))
+        
+        assert update.analyzed == 1 and not update.rescanned
+        assert workspace.analyzers["lines"].analyzed == [repo / "a.py"]
+        assert workspace.result("lines").lines == 1 + 3 + 2
+    
+    def test_unchanged_file_is_not_reanalyzed(self, workspace, repo):
+        """Test an event without a content change does no work."""
+        generation = workspace.generation
+        
+        assert not workspace.apply(FileChanges({repo / "a.py"}))
+        assert workspace.analyzers["lines"].analyzed == []
+        assert workspace.generation == generation
+    
+    def test_new_and_removed_files_trigger_rescan(self, workspace, repo):
+        """Test unknown paths rescan, respecting ignore rules."""
+        _write(repo / "pkg" / "c.py", "c = 1\n")
+        _write(repo / "build" / "more.py", "ignored = 1\n")
+        (repo / "pkg" / "b.py").unlink()
+        
+        update = workspace.apply(FileChanges({repo / "pkg" / "c.py", repo / "build" / "more.py"}))
+        
+        assert update.rescanned
+        assert (update.analyzed, update.removed) == (1, 1)
+        assert workspace.analyzers["lines"].analyzed == [repo / "pkg" / "c.py"]
+        assert repo / "pkg" / "b.py" not in workspace.files
+        assert workspace.files == sorted(workspace.files, key=lambda p: p.relative_to(repo).parts)
+    
+    def test_deleted_known_file_is_removed(self, workspace, repo):
+        """Test deleting a known file drops its results without a rescan."""
+        (repo / "a.py").unlink()
+        
+        update = workspace.apply(FileChanges({repo / "a.py"}))
+        
+        assert not update.rescanned and update.removed == 1
+        assert workspace.result("lines").lines == 1 + 2
+    
+    def test_results_are_memoized_per_generation(self, workspace, repo):
+        """Test repository results are reused until the next change."""
+        first = workspace.result("lines", complexity_threshold=5)
+        assert workspace.result("lines", complexity_threshold=5) is first
+        assert workspace.result("lines", complexity_threshold=8) is not first
+        
+        _write(repo / "a.py", "changed = 1\nchanged = 2\n")
+        workspace.apply(FileChanges(rescan=True))
+        
+        assert workspace.result("lines", complexity_threshold=5) is not first
+    
+    def test_import_graph_is_updated_incrementally(self, repo):
+        """Test edits replace one module's edges while new files rebuild the graph."""
+        workspace = Workspace(repo, {"dependencies": ImportCollector()}, jobs=1)
+        workspace.load()
+        graph = workspace.import_graph()
+        assert graph.cycles() == []
+        
+        _write(repo / "a.py", "import b\n")
+        _write(repo / "pkg" / "b.py", "import a\n")
+        workspace.apply(FileChanges({repo / "a.py", repo / "pkg" / "b.py"}))
+        
+        assert workspace.import_graph() is graph
+        assert graph.cycles() == [(["a", "b"], ["a", "b", "a"])]
+        
+        _write(repo / "c.py", "import a\n")
+        workspace.apply(FileChanges({repo / "c.py"}))
+        
+        assert workspace.import_graph() is not graph
+        assert workspace.import_graph().importers_of("a") == ["b", "c"]
\ No newline at end of file
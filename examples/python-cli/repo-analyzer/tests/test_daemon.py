@@ -0,0 +1,128 @@
+"""
+Tests for the analysis daemon and its socket protocol.
+"""
+
+import json
+import tempfile
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from conftest import LineTotals, StubAnalyzer
+from repo_analyzer.analyzers.base import FileAnalysis
+from repo_analyzer.analyzers.results import ResultStore
+from repo_analyzer.analyzers.workspace import Workspace
+from repo_analyzer.daemon import AnalysisServer, DaemonError, render, send_request, socket_path
+from repo_analyzer.utils.watcher import PollingWatcher
+
+@pytest.fixture
+def short_tmp():
+    # Unix socket paths are limited to ~100 bytes; pytest's tmp_path can be longer
+    with tempfile.TemporaryDirectory(prefix="ra-") as tmp:
+        yield Path(tmp)
+
+
+@pytest.fixture
+def server(short_tmp):
+    repo = short_tmp / "repo"
+    repo.mkdir()
+    (repo / "a.py").write_text("a = 1\nb = 2\n")
+    
+    workspace = Workspace(repo, {"structure": StubAnalyzer()}, jobs=1)
+    server = AnalysisServer(
+        workspace,
+        PollingWatcher(interval=0.05),
+        socket_path(repo, short_tmp / "analysis.db"),
+        debounce=0.0
+    )
+    server.bind()
+    workspace.load()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    if thread.is_alive():
+        try:
+            send_request(server.path, {"action": "stop"})
+        except DaemonError:
+            pass
+    thread.join(timeout=5)
+
+
+class TestAnalysisServer:
+    """Test suite for AnalysisServer."""
+    
+    def test_socket_path_is_per_repository(self, tmp_path):
+        """Test each repository gets its own socket next to the database."""
+        first = socket_path(tmp_path / "one", tmp_path / "analysis.db")
+        second = socket_path(tmp_path / "two", tmp_path / "analysis.db")
+        
+        assert first != second
+        assert first.parent == tmp_path / "daemon"
+    
+    def test_status(self, server):
+        """Test status reports the workspace."""
+        response = send_request(server.path, {"action": "status"})
+        
+        assert response["ok"]
+        assert response["workspace"]["files"] == 1
+        assert response["watcher"] == "poll"
+    
+    def test_analyze_reflects_file_changes(self, server):
+        """Test answers include changes made after startup."""
+        request = {"action": "analyze", "analysis": "structure", "format": "json"}
+        assert json.loads(send_request(server.path, request)["output"]) == {"lines": 2}
+        
+        (server.workspace.root / "b.py").write_text("c = 3\n")
+        
+        response = send_request(server.path, request)
+        assert response["ok"] and response["exit_code"] == 0
+        assert json.loads(response["output"]) == {"lines": 3}
+    
+    def test_errors_are_reported(self, server):
+        """Test bad requests get an error response instead of a dropped connection."""
+        assert "Unknown action" in send_request(server.path, {"action": "reboot"})["error"]
+        response = send_request(server.path, {"action": "analyze", "analysis": "quality"})
+        assert not response["ok"]
+    
+    def test_second_daemon_is_refused(self, server):
+        """Test a second daemon cannot take over a live socket."""
+        duplicate = AnalysisServer(server.workspace, PollingWatcher(), server.path)
+        with pytest.raises(DaemonError):
+            duplicate.bind()
+    
+    def test_stop_removes_socket(self, server):
+        """Test stopping the daemon removes its socket."""
+        send_request(server.path, {"action": "stop"})
+        
+        with pytest.raises(DaemonError):
+            for _ in range(100):
+                send_request(server.path, {"action": "status"}, timeout=1.0)
+        assert not server.path.exists()
+
+
+class TestRender:
+    """Test suite for render."""
+    
+    def test_json_includes_import_graph(self):
+        """Test dependency JSON carries the import graph next to the analyzer results."""
+        graph = LineTotals(0)
+        results = {"dependencies": LineTotals(5), "structure": LineTotals(7)}
+        
+        output = render(results, 10, "json", import_graph=graph)
+        
+        assert json.loads(output) == {
+            "dependencies": {"lines": 5, "import_graph": {"lines": 0}},
+            "structure": {"lines": 7},
+        }
+    
+    def test_json_matches_analyze_serializer(self):
+        """Test values JSON cannot represent are written as the analyze commands write them."""
+        store = ResultStore.from_analyses([FileAnalysis(Path("a.py"), "python", 3)])
+        result = SimpleNamespace(to_dict=lambda: {"root": Path("repo"), "files": store})
+        
+        output = json.loads(render({"structure": result}, 10, "json"))
+        
+        assert output["root"] == "repo"
+        assert output["files"][0]["lines_of_code"] == 3
\ No newline at end of file
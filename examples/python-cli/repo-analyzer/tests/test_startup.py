@@ -0,0 +1,79 @@
+"""
+Startup tests for repo-analyzer.
+
+Runs the CLI in a fresh interpreter, since modules already imported by the
+test session would hide imports that happen at startup.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from repo_analyzer.cli import LAZY_COMMANDS, LazyGroup, cli
+
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+#: Modules that must not be imported to answer ``--help``.
+HEAVY_MODULES = ("rich", "sqlalchemy", "git", "numpy", "jinja2", "jsonschema", "yaml")
+
+HELP_SCRIPT = """
+import json, sys
+from repo_analyzer.cli import cli
+try:
+    cli(["--help"])
+except SystemExit:
+    pass
+print(json.dumps(sorted(sys.modules)), file=sys.stderr)
+"""
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC), env.get("PYTHONPATH")]))
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, env=env, check=True
+    )
+
+
+class TestStartup:
+    """Test suite for CLI startup cost."""
+    
+    def test_help_does_not_import_commands(self):
+        """Test that --help lists every command without importing it."""
+        result = _run_python("-c", HELP_SCRIPT)
+        modules = json.loads(result.stderr.splitlines()[-1])
+        
+        for name in LAZY_COMMANDS:
+            assert name in result.stdout
+        assert not [name for name in modules if name.startswith("repo_analyzer.commands")]
+        loaded = {name.split(".")[0] for name in modules}
+        assert not loaded & set(HEAVY_MODULES)
+    
+    def test_lazy_command_loaded_on_first_use(self):
+        """Test that a lazy command is imported only when it is looked up."""
+        group = LazyGroup(lazy_commands={"report": LAZY_COMMANDS["report"]})
+        assert group.list_commands(None) == ["report"]
+        assert "report" not in group.commands
+        
+        command = group.get_command(None, "report")
+        assert isinstance(command, click.Group)
+        assert group.commands["report"] is command
+    
+    def test_lazy_command_must_be_click_command(self):
+        """Test that a lazy entry pointing at a non-command is rejected."""
+        group = LazyGroup(lazy_commands={"dump": ("json:dumps", "Dump JSON.")})
+        with pytest.raises(TypeError):
+            group.get_command(None, "dump")
+    
+    def test_help_shows_lazy_short_help(self):
+        """Test that --help shows the registered help of unloaded commands."""
+        result = CliRunner().invoke(cli, ["--help"])
+        assert result.exit_code == 0
+        assert "Analysis history management." in result.output
\ No newline at end of file
@@ -0,0 +1,162 @@
+"""
+Tests for the offline vulnerability advisory database.
+"""
+
+import json
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from repo_analyzer.storage.advisories import AdvisoryDatabase, normalize_package, version_key
+
+
+FIXTURES = Path(__file__).parent.parent / "fixtures" / "osv"
+
+
+@pytest.fixture
+def advisories(tmp_path):
+    """Advisory database loaded with the bundled OSV fixtures."""
+    with AdvisoryDatabase(tmp_path / "advisories.db") as db:
+        db.load([FIXTURES])
+        yield db
+
+
+def _ids(findings):
+    return [(f.package, f.version, f.advisory_id) for f in findings]
+
+
+class TestVersionKey:
+    """Test suite for version_key."""
+    
+    @pytest.mark.parametrize("ecosystem, versions", [
+        ("PyPI", [
+            "1.0.dev1", "1.0a1.dev1", "1.0a1", "1.0a2", "1.0b1", "1.0rc1", "1.0",
+            "1.0.post1.dev1", "1.0.post1", "1.0.1", "1.2", "1.10", "1!0.1",
+        ]),
+        ("npm", [
+            "1.0.0-alpha", "1.0.0-alpha.1", "1.0.0-alpha.beta", "1.0.0-beta",
+            "1.0.0-beta.2", "1.0.0-beta.11", "1.0.0-rc.1", "1.0.0", "1.0.1", "1.10.0", "20191109.0.0",
+        ]),
+    ])
+    def test_key_order_is_version_order(self, ecosystem, versions):
+        """Test sorting keys as strings gives the ecosystem's version order."""
+        keys = [version_key(ecosystem, version) for version in versions]
+        
+        assert None not in keys
+        assert sorted(keys) == keys
+        assert len(set(keys)) == len(keys)
+    
+    def test_equivalent_spellings(self):
+        """Test equivalent versions share a key and unparsable ones have none."""
+        assert version_key("PyPI", "1.0") == version_key("PyPI", "1.0.0") == version_key("PyPI", "v1.0")
+        assert version_key("PyPI", "1.0RC1") == version_key("PyPI", "1.0-rc.1")
+        assert version_key("PyPI", "1.0-1") == version_key("PyPI", "1.0.post1")
+        assert version_key("PyPI", "not a version") is None
+    
+    def test_package_names(self):
+        """Test PyPI names are compared per PEP 503."""
+        assert normalize_package("PyPI", "Example_Lib") == normalize_package("PyPI", "example.lib")
+        assert normalize_package("Go", "github.com/Foo/bar") == "github.com/Foo/bar"
+
+
+class TestAdvisoryDatabase:
+    """Test suite for AdvisoryDatabase."""
+    
+    def test_load_counts(self, tmp_path):
+        """Test loading skips withdrawn advisories and GIT ranges."""
+        with AdvisoryDatabase(tmp_path / "advisories.db") as db:
+            stats = db.load([FIXTURES])
+            info = db.info()
+        
+        assert (stats.advisories, stats.withdrawn, stats.errors) == (4, 1, [])
+        assert stats.ranges == 5 and stats.versions == 1
+        assert info["ecosystems"] == {"PyPI": 2, "crates.io": 1, "npm": 1}
+        assert info["loaded_at"] is not None
+    
+    @pytest.mark.parametrize("version, affected", [
+        ("0.1", True),
+        ("1.4.1", True),
+        ("1.4.2", False),
+        ("1.9", False),
+        ("2.0.0b3", False),
+        ("2.0.0rc1", True),
+        ("2.1", True),
+        ("2.1.post1", False),
+        ("3.0", False),
+    ])
+    def test_ecosystem_ranges(self, advisories, version, affected):
+        """Test fixed bounds are exclusive and ranges use PEP 440 order."""
+        findings = advisories.check([("pypi", "examplelib", version)])
+        
+        assert bool(findings) is affected
+        if affected:
+            assert findings[0].advisory_id == "TEST-2024-0001"
+            assert findings[0].severity == "HIGH"
+            assert findings[0].aliases == ("CVE-2024-00001",)
+    
+    def test_last_affected_and_open_ranges(self, advisories):
+        """Test last_affected is inclusive and a range without a fix stays open."""
+        findings = advisories.check([
+            ("npm", "left-padder", "3.0.0-beta.1"),
+            ("npm", "left-padder", "3.0.0-beta.10"),
+            ("npm", "left-padder", "3.2.0"),
+            ("npm", "left-padder", "3.2.1"),
+            ("PyPI", "tomlish", "0.8.1"),
+            ("PyPI", "tomlish", "0.8.2"),
+            ("PyPI", "tomlish", "99.0"),
+            ("crates.io", "cratey", "0.5.2"),
+        ])
+        
+        assert _ids(findings) == [
+            ("left-padder", "3.0.0-beta.10", "TEST-2024-0002"),
+            ("left-padder", "3.2.0", "TEST-2024-0002"),
+            ("tomlish", "0.8.1", "TEST-2024-0003"),
+            ("tomlish", "99.0", "TEST-2024-0003"),
+            ("cratey", "0.5.2", "TEST-2024-0005"),
+        ]
+        assert findings[2].summary == "Unbounded recursion when parsing nested tables."
+        assert findings[-1].fixed_version == "0.5.3"
+    
+    def test_reload_replaces_advisory(self, advisories, tmp_path):
+        """Test loading an advisory again replaces its ranges, and withdrawal removes it."""
+        advisory = json.loads((FIXTURES / "TEST-2024-0001.json").read_text())
+        advisory["affected"][0]["ranges"][0]["events"] = [{"introduced": "0"}, {"fixed": "1.0"}]
+        updated = tmp_path / "updated.json"
+        updated.write_text(json.dumps(advisory))
+        
+        advisories.load([updated])
+        assert advisories.check([("PyPI", "examplelib", "1.4.1")]) == []
+        assert len(advisories.check([("PyPI", "examplelib", "0.9")])) == 1
+        
+        advisory["withdrawn"] = "2024-07-01T00:00:00Z"
+        updated.write_text(json.dumps(advisory))
+        advisories.load([updated])
+        assert advisories.check([("PyPI", "examplelib", "0.9")]) == []
+    
+    def test_load_zip_and_bad_files(self, tmp_path):
+        """Test zip archives load like directories and broken files are reported."""
+        archive = tmp_path / "all.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            for path in FIXTURES.glob("*.json"):
+                zf.write(path, path.name)
+        broken = tmp_path / "broken.json"
+        broken.write_text("{")
+        
+        with AdvisoryDatabase(tmp_path / "advisories.db") as db:
+            stats = db.load([archive, broken])
+        
+        assert stats.advisories == 4
+        assert len(stats.errors) == 1 and "broken.json" in stats.errors[0]
+    
+    def test_batch_check_many_pins(self, advisories):
+        """Test one check call handles thousands of pins and keeps pin order."""
+        pins = [("PyPI", f"package-{i}", "1.0") for i in range(5000)]
+        pins[1234] = ("PyPI", "examplelib", "1.0")
+        pins[4321] = ("PyPI", "tomlish", "1.0")
+        
+        assert _ids(advisories.check(pins)) == [
+            ("examplelib", "1.0", "TEST-2024-0001"),
+            ("tomlish", "1.0", "TEST-2024-0003"),
+        ]
+        assert advisories.check([]) == []
\ No newline at end of file
@@ -0,0 +1,233 @@
+"""
+Tests for the persistent per-file analysis cache.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from conftest import StubAnalyzer
+from repo_analyzer.analyzers.base import FileAnalysis
+from repo_analyzer.analyzers.pipeline import ParsedFile
+from repo_analyzer.storage import cache as cache_module
+from repo_analyzer.storage.cache import (
+    AnalysisCache,
+    BlobCache,
+    LockfileCache,
+    analyzer_fingerprint,
+)
+
+
+def _counting_analyzer() -> StubAnalyzer:
+    """Stub analyzer reporting one function per file, for cache round trips."""
+    return StubAnalyzer(functions=[{"name": "f", "line": 1, "complexity": 2}])
+
+
+class TestAnalysisCache:
+    """Test suite for AnalysisCache."""
+    
+    @pytest.fixture
+    def source_file(self, tmp_path):
+        path = tmp_path / "module.py"
+        path.write_text("a = 1\nb = 2\n")
+        return path
+    
+    def test_second_lookup_is_a_hit(self, tmp_path, source_file):
+        """Test unchanged files are served from the cache across sessions."""
+        analyzer = _counting_analyzer()
+        db_path = tmp_path / "analysis.db"
+        
+        with AnalysisCache.for_analyzer(db_path, analyzer) as cache:
+            first = cache.fetch(source_file, analyzer.analyze_file)
+            assert cache.stats.misses == 1
+        
+        with AnalysisCache.for_analyzer(db_path, analyzer) as cache:
+            second = cache.fetch(source_file, analyzer.analyze_file)
+            assert cache.stats.hits == 1
+            assert cache.stats.hit_rate == 1.0
+        
+        assert analyzer.calls == 1
+        assert second == first
+    
+    def test_content_change_is_a_miss(self, tmp_path, source_file):
+        """Test modified files are re-analyzed."""
+        analyzer = _counting_analyzer()
+        db_path = tmp_path / "analysis.db"
+        
+        with AnalysisCache.for_analyzer(db_path, analyzer) as cache:
+            cache.fetch(source_file, analyzer.analyze_file)
+        
+        source_file.write_text("a = 1\nb = 2\nc = 3\n")
+        
+        with AnalysisCache.for_analyzer(db_path, analyzer) as cache:
+            analysis = cache.fetch(source_file, analyzer.analyze_file)
+            assert cache.stats.misses == 1
+        
+        assert analysis.lines_of_code == 3
+        assert analyzer.calls == 2
+    
+    def test_touched_file_with_same_content_is_a_hit(self, tmp_path, source_file):
+        """Test a changed mtime alone falls back to the content hash."""
+        analyzer = _counting_analyzer()
+        db_path = tmp_path / "analysis.db"
+        
+        with AnalysisCache.for_analyzer(db_path, analyzer) as cache:
+            cache.fetch(source_file, analyzer.analyze_file)
+        
+        stat = source_file.stat()
+        os.utime(source_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        
+        with AnalysisCache.for_analyzer(db_path, analyzer) as cache:
+            cache.fetch(source_file, analyzer.analyze_file)
+            assert cache.stats.hits == 1
+        
+        assert analyzer.calls == 1
+    
+    def test_config_change_invalidates(self, tmp_path, source_file):
+        """Test changing thresholds invalidates cached results."""
+        analyzer = _counting_analyzer()
+        db_path = tmp_path / "analysis.db"
+        
+        with AnalysisCache.for_analyzer(db_path, analyzer, {"threshold": 10}) as cache:
+            cache.fetch(source_file, analyzer.analyze_file)
+        
+        with AnalysisCache.for_analyzer(db_path, analyzer, {"threshold": 5}) as cache:
+            cache.fetch(source_file, analyzer.analyze_file)
+            assert cache.stats.invalidated == 1
+        
+        assert analyzer.calls == 2
+    
+    def test_analyzer_version_change_invalidates(self, tmp_path, source_file):
+        """Test bumping the analyzer version invalidates cached results."""
+        analyzer = _counting_analyzer()
+        db_path = tmp_path / "analysis.db"
+        
+        with AnalysisCache.for_analyzer(db_path, analyzer) as cache:
+            cache.fetch(source_file, analyzer.analyze_file)
+        
+        analyzer.version = "2"
+        
+        with AnalysisCache.for_analyzer(db_path, analyzer) as cache:
+            assert cache.get(source_file) is None
+            assert cache.stats.invalidated == 1
+    
+    def test_routed_results_are_kept_apart(self, tmp_path, source_file):
+        """Test results of a routed run neither hit nor evict the unrouted entries."""
+        analyzer = _counting_analyzer()
+        routes = {"python": StubAnalyzer()}
+        db_path = tmp_path / "analysis.db"
+        
+        with AnalysisCache.for_analyzer(db_path, analyzer) as cache:
+            cache.fetch(source_file, analyzer.analyze_file)
+        
+        with AnalysisCache.for_analyzer(db_path, analyzer, routes=routes) as cache:
+            assert cache.get(source_file) is None
+            assert cache.stats.invalidated == 0
+            cache.fetch(source_file, routes["python"].analyze_file)
+        
+        with AnalysisCache.for_analyzer(db_path, analyzer) as cache:
+            assert cache.get(source_file).functions
+    
+    def test_helper_module_change_invalidates(self, monkeypatch):
+        """Test editing a module the analyzer only calls into changes its fingerprint."""
+        analyzer = _counting_analyzer()
+        before = analyzer_fingerprint(analyzer)
+        real_hash = cache_module._hash_source_file
+        monkeypatch.setattr(
+            cache_module,
+            "_hash_source_file",
+            lambda path: real_hash(path) + ("edited" if path.endswith("file_access.py") else "")
+        )
+        cache_module._analysis_code_hash.cache_clear()
+        try:
+            assert analyzer_fingerprint(analyzer) != before
+        finally:
+            cache_module._analysis_code_hash.cache_clear()
+    
+    def test_edit_during_analysis_is_not_recorded(self, tmp_path, source_file):
+        """Test results are stored against the bytes analyzed, not the file at put time."""
+        analyzer = _counting_analyzer()
+        db_path = tmp_path / "analysis.db"
+        parsed = ParsedFile.read(source_file)
+        stat = source_file.stat()
+        source_file.write_text("a = 9\nb = 2\n")
+        os.utime(source_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        
+        with AnalysisCache.for_analyzer(db_path, analyzer) as cache:
+            cache.put(source_file, FileAnalysis(source_file, "python", 2), parsed.stamp)
+            cache.put(source_file.with_name("binary.dat"), FileAnalysis(source_file, "unknown", 0), None)
+            assert cache.stats.stores == 1
+        
+        with AnalysisCache.for_analyzer(db_path, analyzer) as cache:
+            assert cache.get(source_file) is None
+
+class TestBlobCache:
+    """Test suite for BlobCache."""
+    
+    def test_results_keyed_by_blob_language_and_config(self, tmp_path):
+        """Test lookups match blob SHA and language, per configuration."""
+        analyzer = _counting_analyzer()
+        db_path = tmp_path / "analysis.db"
+        analysis = FileAnalysis(Path("a.py"), "python", 3, functions=[{"name": "f", "line": 1, "complexity": 4}])
+        
+        with BlobCache.for_analyzer(db_path, analyzer, {"threshold": 10}) as cache:
+            cache.put(("abc", "python"), analysis)
+        
+        with BlobCache.for_analyzer(db_path, analyzer, {"threshold": 10}) as cache:
+            found = cache.get_many([("abc", "python"), ("abc", "text"), ("def", "python")])
+            assert list(found) == [("abc", "python")]
+            assert found["abc", "python"].functions == analysis.functions
+            assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+        
+        with BlobCache.for_analyzer(db_path, analyzer, {"threshold": 5}) as cache:
+            assert cache.get_many([("abc", "python")]) == {}
+
+
+class TestLockfileCache:
+    """Test suite for LockfileCache."""
+    
+    @pytest.fixture
+    def lockfile(self, tmp_path):
+        path = tmp_path / "project" / "go.sum"
+        path.parent.mkdir()
+        path.write_text("example.com/a v1.0.0 h1:x=\nexample.com/b v2.0.0 h1:y=\n")
+        (path.parent / "go.mod").write_text("module app\nrequire example.com/a v1.0.0\n")
+        return path
+    
+    def test_unchanged_lockfile_is_a_hit(self, tmp_path, lockfile, monkeypatch):
+        """Test a second fetch neither parses nor hashes the lockfile."""
+        db_path = tmp_path / "analysis.db"
+        with LockfileCache(db_path) as cache:
+            graph = cache.fetch(lockfile)
+            assert (cache.stats.hits, cache.stats.misses) == (0, 1)
+        
+        monkeypatch.setattr("repo_analyzer.storage.cache.parse_lockfile", None)
+        monkeypatch.setattr("repo_analyzer.storage.cache.hash_files", None)
+        with LockfileCache(db_path) as cache:
+            assert cache.fetch(lockfile) == graph
+            assert cache.stats.hits == 1
+    
+    def test_copy_with_same_content_is_a_hit(self, tmp_path, lockfile):
+        """Test graphs are keyed by content, so another checkout reuses them."""
+        db_path = tmp_path / "analysis.db"
+        copy = tmp_path / "checkout" / "go.sum"
+        copy.parent.mkdir()
+        copy.write_bytes(lockfile.read_bytes())
+        (copy.parent / "go.mod").write_bytes((lockfile.parent / "go.mod").read_bytes())
+        
+        with LockfileCache(db_path) as cache:
+            cache.fetch(lockfile)
+            assert cache.fetch(copy).names == cache.fetch(lockfile).names
+            assert (cache.stats.hits, cache.stats.misses) == (2, 1)
+    
+    def test_manifest_change_is_a_miss(self, tmp_path, lockfile):
+        """Test editing the manifest next to the lockfile re-parses it."""
+        db_path = tmp_path / "analysis.db"
+        with LockfileCache(db_path) as cache:
+            assert len(cache.fetch(lockfile).direct()) == 1
+        
+        (lockfile.parent / "go.mod").write_text("module app\n")
+        with LockfileCache(db_path) as cache:
+            assert cache.fetch(lockfile).direct() == set()
+            assert cache.stats.misses == 1
\ No newline at end of file
@@ -0,0 +1,182 @@
+"""
+Tests for the analysis history database.
+"""
+
+from dataclasses import replace
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+
+from repo_analyzer.analyzers.base import FileAnalysis
+from repo_analyzer.storage.database import DatabaseManager, RetentionPolicy
+
+
+def make_analyses(count: int, functions_per_file: int = 3):
+    return [
+        FileAnalysis(
+            file_path=Path(f"src/module_{i}.py"),
+            language="python",
+            lines_of_code=10 * (i + 1),
+            complexity_score=float(i),
+            quality_score=8.0,
+            functions=[
+                {"name": f"f{j}", "line": j * 5 + 1, "complexity": i + j}
+                for j in range(functions_per_file)
+            ],
+            issues=[{"type": "style"}] * (i % 2)
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def db(tmp_path):
+    with DatabaseManager(tmp_path / "history.db") as manager:
+        yield manager
+
+
+class TestDatabaseManager:
+    """Test suite for DatabaseManager."""
+    
+    def test_save_and_load_round_trip(self, db):
+        """Test a run's file and function rows are stored and reloaded in order."""
+        analyses = make_analyses(25)
+        run_id = db.save_run(Path("/repo"), analyses, commit_hash="abc123")
+        
+        loaded = list(db.load_run(run_id).iter_analyses())
+        
+        assert [a.file_path for a in loaded] == [a.file_path for a in analyses]
+        assert [a.functions for a in loaded] == [a.functions for a in analyses]
+        assert loaded[3].lines_of_code == 40
+    
+    def test_function_rows_reference_their_files_across_runs(self, db):
+        """Test preassigned file ids stay correct when runs accumulate."""
+        db.save_run(Path("/repo"), make_analyses(4))
+        second = db.save_run(Path("/repo"), make_analyses(6, functions_per_file=1))
+        
+        loaded = list(db.load_run(second).iter_analyses())
+        
+        assert [f["complexity"] for a in loaded for f in a.functions] == list(range(6))
+    
+    def test_list_runs_newest_first(self, db):
+        """Test run listing, per-run totals and repository filtering."""
+        start = datetime(2024, 1, 1)
+        for day in range(3):
+            db.save_run(Path("/repo"), make_analyses(day + 1), timestamp=start + timedelta(days=day))
+        db.save_run(Path("/other"), make_analyses(1), timestamp=start)
+        
+        runs = db.list_runs(repository_path=Path("/repo"))
+        
+        assert [run.file_count for run in runs] == [3, 2, 1]
+        assert runs[0].total_lines == 60
+        assert len(db.list_runs(limit=2)) == 2
+    
+    def test_failed_save_leaves_no_partial_run(self, db, monkeypatch):
+        """Test a failure mid-write rolls the whole run back."""
+        def fail(*args, **kwargs):
+            raise RuntimeError("disk full")
+        
+        monkeypatch.setattr(DatabaseManager, "_insert_many", staticmethod(fail))
+        with pytest.raises(RuntimeError):
+            db.save_run(Path("/repo"), make_analyses(5))
+        
+        assert db.list_runs() == []
+    
+    def test_wal_mode_and_cascading_delete(self, db):
+        """Test WAL journaling is enabled and deleting a run removes its rows."""
+        run_id = db.save_run(Path("/repo"), make_analyses(5))
+        
+        assert db.delete_runs([run_id]) == 1
+        with db.engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("SELECT COUNT(*) FROM file_analyses")).scalar() == 0
+            assert conn.execute(text("SELECT COUNT(*) FROM function_analyses")).scalar() == 0    
+    def test_summary_written_with_run(self, db):
+        """Test each run gets aggregate metrics and a language mix at write time."""
+        analyses = make_analyses(4)
+        analyses[0] = replace(analyses[0], language="javascript")
+        db.save_run(Path("/repo"), analyses, complexity_threshold=3)
+        
+        run = db.list_runs()[0]
+        
+        assert run.function_count == 12
+        assert run.total_issues == 2
+        assert run.max_complexity == 5
+        assert run.technical_debt_ratio == pytest.approx(3 / 12)
+        assert run.languages == {
+            "javascript": {"files": 1, "lines": 10},
+            "python": {"files": 3, "lines": 90},
+        }
+    
+    def test_find_run_by_abbreviated_commit_and_since(self, db):
+        """Test commit lookups use the latest run and listing honours since."""
+        start = datetime(2024, 1, 1)
+        db.save_run(Path("/repo"), make_analyses(1), commit_hash="abc123", timestamp=start)
+        latest = db.save_run(
+            Path("/repo"), make_analyses(2), commit_hash="abc123", timestamp=start + timedelta(days=1)
+        )
+        db.save_run(Path("/repo"), make_analyses(3), commit_hash="abd999", timestamp=start)
+        
+        assert db.find_run(Path("/repo"), "abc").id == latest
+        assert db.find_run(Path("/repo"), "abc1234") is None
+        assert db.find_run(Path("/other"), "abc123") is None
+        assert [run.id for run in db.list_runs(since=start + timedelta(hours=1))] == [latest]
+    
+    def test_history_queries_use_indexes(self, db):
+        """Test listing by repository is served by the (repository, timestamp) index."""
+        query = (
+            "EXPLAIN QUERY PLAN SELECT id FROM analysis_runs WHERE repository_path = '/repo' "
+            "ORDER BY timestamp DESC, id DESC LIMIT 20"
+        )
+        with db.engine.connect() as conn:
+            plan = " ".join(row[-1] for row in conn.exec_driver_sql(query))
+        
+        assert "ix_analysis_runs_repository_timestamp" in plan
+        assert "TEMP B-TREE" not in plan
+    
+    def test_compact_downsamples_old_runs(self, db):
+        """Test old runs shrink to one per week while recent runs stay intact."""
+        now = datetime(2024, 6, 30)
+        old = [
+            db.save_run(Path("/repo"), make_analyses(2), timestamp=datetime(2024, 1, day))
+            for day in (1, 2, 3, 9)
+        ]
+        recent = db.save_run(Path("/repo"), make_analyses(2), timestamp=now - timedelta(days=1))
+        
+        result = db.compact(RetentionPolicy(keep_days=30, period="week"), now=now)
+        
+        assert (result.runs_examined, result.runs_deleted, result.details_dropped) == (4, 2, 2)
+        runs = {run.id: run for run in db.list_runs()}
+        assert sorted(runs) == [old[2], old[3], recent]
+        assert runs[old[2]].runs == 3 and not runs[old[2]].has_details
+        assert runs[old[2]].file_count == 2
+        assert len(db.load_run(old[2])) == 0
+        assert len(db.load_run(recent)) == 2
+    
+    def test_compact_dry_run_changes_nothing(self, db):
+        """Test a dry run reports the plan without deleting anything."""
+        for day in (1, 2):
+            db.save_run(Path("/repo"), make_analyses(1), timestamp=datetime(2024, 1, day))
+        
+        result = db.compact(RetentionPolicy(keep_days=0), dry_run=True)
+        
+        assert result.runs_deleted == 1
+        assert len(db.list_runs()) == 2
+    
+    def test_summaries_backfilled_for_older_databases(self, tmp_path):
+        """Test runs stored without a summary row get one when the database is opened."""
+        with DatabaseManager(tmp_path / "history.db") as manager:
+            run_id = manager.save_run(Path("/repo"), make_analyses(3))
+            with manager.engine.begin() as conn:
+                conn.execute(text("DELETE FROM run_summaries"))
+                conn.execute(text("DROP INDEX ix_file_analyses_run"))
+        
+        with DatabaseManager(tmp_path / "history.db") as manager:
+            run = manager.list_runs()[0]
+            with manager.engine.connect() as conn:
+                indexes = conn.execute(text("PRAGMA index_list(file_analyses)")).all()
+        
+        assert (run.id, run.file_count, run.total_lines, run.total_issues) == (run_id, 3, 60, 1)
+        assert "ix_file_analyses_run" in {row[1] for row in indexes}
\ No newline at end of file
@@ -0,0 +1,89 @@
+"""
+Tests for the file access layer.
+"""
+
+import pytest
+
+from repo_analyzer.utils import file_access
+from repo_analyzer.utils.file_access import (
+    SKIPPED_BINARY,
+    SKIPPED_TOO_LARGE,
+    count_lines,
+    looks_binary,
+    parse_size,
+    read_file,
+)
+
+
+class TestCountLines:
+    """Test suite for count_lines."""
+    
+    @pytest.mark.parametrize("data", [
+        b"",
+        b"one",
+        b"one\n",
+        b"one\ntwo",
+        b"one\r\ntwo\r\n",
+        b"one\rtwo\r",
+        b"\n\n\r\r\n",
+        b"mixed\r\n\rends\n\r",
+    ])
+    def test_matches_splitlines(self, data):
+        """Test line counts agree with bytes.splitlines for every line ending."""
+        assert count_lines(data) == len(data.splitlines())
+    
+    def test_crlf_split_across_chunks(self, monkeypatch):
+        """Test a \\r\\n straddling two scan chunks is one line break."""
+        monkeypatch.setattr(file_access, "_COUNT_CHUNK", 4)
+        data = b"abc\r\nde\r\nf\r\r\n"
+        
+        assert count_lines(data) == len(data.splitlines())
+
+
+class TestReadFile:
+    """Test suite for read_file."""
+    
+    def test_decodes_text_and_counts_lines(self, tmp_path):
+        """Test text files are decoded with replacement and counted from raw bytes."""
+        path = tmp_path / "app.py"
+        path.write_bytes(b"x = '\xff'\r\ny = 2\n")
+        content = read_file(path)
+        
+        assert content.skipped is None
+        assert content.text == "x = '�'\r\ny = 2\n"
+        assert content.line_count == 2
+    
+    def test_binary_is_skipped(self, tmp_path):
+        """Test files with NUL bytes or mostly control bytes are not decoded."""
+        path = tmp_path / "data.bin"
+        path.write_bytes(bytes(range(256)) * 100)
+        content = read_file(path)
+        
+        assert content.skipped == SKIPPED_BINARY
+        assert content.text == "" and content.line_count == 0
+        assert looks_binary(bytes(range(1, 32)) * 4)
+        assert not looks_binary("naïve café\n".encode())
+    
+    def test_oversized_file_is_counted_not_decoded(self, tmp_path, monkeypatch):
+        """Test large files go through mmap and oversized ones keep only their line count."""
+        monkeypatch.setattr(file_access, "MMAP_THRESHOLD", file_access.SNIFF_BYTES)
+        path = tmp_path / "bundle.js"
+        path.write_text("var a = 1;\n" * 5000)
+        
+        mapped = read_file(path)
+        skipped = read_file(path, max_file_size=1024)
+        
+        assert mapped.skipped is None and mapped.text == path.read_text()
+        assert mapped.line_count == 5000
+        assert skipped.skipped == SKIPPED_TOO_LARGE
+        assert skipped.text == "" and skipped.line_count == 5000
+    
+    def test_parse_size(self):
+        """Test human-readable sizes and rejection of invalid ones."""
+        assert parse_size("512") == 512
+        assert parse_size("64K") == 64 * 1024
+        assert parse_size("1.5MiB") == 3 * 2**19
+        with pytest.raises(ValueError):
+            parse_size("0")
+        with pytest.raises(ValueError):
+            parse_size("big")
\ No newline at end of file
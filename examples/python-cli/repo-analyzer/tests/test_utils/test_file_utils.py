@@ -0,0 +1,117 @@
+"""
+Tests for the streaming repository scanner.
+"""
+
+import os
+import types
+from pathlib import Path
+
+import pytest
+
+from repo_analyzer.utils import file_utils
+from repo_analyzer.utils.file_utils import ScannedFile, detect_language, scan_repository
+
+
+@pytest.fixture
+def sample_repo(tmp_path):
+    for relative in [
+        "src/app.py",
+        "src/app.pyc",
+        "src/__pycache__/app.cpython-311.pyc",
+        "node_modules/left-pad/index.js",
+        "docs/build/index.html",
+        "docs/guide.md",
+        "vendor/lib.py",
+        "vendor/keep.py",
+        ".git/HEAD",
+    ]:
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("content\n")
+    
+    (tmp_path / ".gitignore").write_text("node_modules/\n*.pyc\n__pycache__/\n")
+    (tmp_path / "docs" / ".gitignore").write_text("build/\n")
+    (tmp_path / "vendor" / ".gitignore").write_text("*.py\n!keep.py\n")
+    return tmp_path
+
+
+def _relative(root, files):
+    return [f.relative_to(root).as_posix() for f in files]
+
+
+class TestScanRepository:
+    """Test suite for scan_repository."""
+    
+    def test_is_lazy_generator(self, sample_repo):
+        """Test the scanner streams results instead of building a list."""
+        result = scan_repository(sample_repo)
+        
+        assert isinstance(result, types.GeneratorType)
+        assert isinstance(next(result), ScannedFile)
+    
+    def test_honours_nested_gitignore_files(self, sample_repo):
+        """Test root and nested .gitignore rules, including negation."""
+        files = _relative(sample_repo, scan_repository(sample_repo))
+        
+        assert files == [
+            ".gitignore",
+            "docs/.gitignore",
+            "docs/guide.md",
+            "src/app.py",
+            "vendor/.gitignore",
+            "vendor/keep.py",
+        ]
+    
+    def test_excluded_directories_are_never_entered(self, sample_repo, monkeypatch):
+        """Test excluded subtrees are pruned before scandir is called on them."""
+        visited = []
+        real_scandir = os.scandir
+        
+        def recording_scandir(path):
+            visited.append(Path(path).relative_to(sample_repo).as_posix())
+            return real_scandir(path)
+        
+        monkeypatch.setattr(file_utils.os, "scandir", recording_scandir)
+        list(scan_repository(sample_repo, exclude_patterns=["docs/"]))
+        
+        assert "node_modules" not in visited
+        assert ".git" not in visited
+        assert "docs" not in visited
+        assert "src/__pycache__" not in visited
+    
+    def test_gitignore_can_be_disabled(self, sample_repo):
+        """Test respect_gitignore=False only applies explicit excludes."""
+        files = _relative(
+            sample_repo,
+            scan_repository(sample_repo, exclude_patterns=["*.md"], respect_gitignore=False)
+        )
+        
+        assert "node_modules/left-pad/index.js" in files
+        assert "docs/guide.md" not in files
+        assert ".git/HEAD" not in files
+    
+    def test_scanned_files_carry_cached_stat(self, sample_repo):
+        """Test yielded paths reuse the stat data captured during the walk."""
+        scanned = next(f for f in scan_repository(sample_repo) if f.name == "app.py")
+        
+        assert scanned.size == len("content\n")
+        assert scanned.stat() is scanned.stat()
+        assert scanned.read_text() == "content\n"
+
+
+class TestDetectLanguage:
+    """Test suite for detect_language."""
+    
+    @pytest.mark.parametrize("name, head, expected", [
+        ("app.PY", None, "python"),
+        ("index.d.ts", None, "typescript"),
+        ("SConstruct", None, "python"),
+        ("serve", b"#!/usr/bin/env node\n", "javascript"),
+        ("manage", b"#!/usr/bin/python3.11 -u\n", "python"),
+        ("run", b"#!/bin/sh\n", "unknown"),
+        ("tool.py", b"#!/usr/bin/env node\n", "python"),
+        (".bashrc", None, "unknown"),
+    ])
+    def test_extension_name_and_shebang(self, name, head, expected):
+        """Test the extension wins, then the file name, then the shebang line."""
+        assert detect_language(Path(name), head) == expected
\ No newline at end of file
@@ -0,0 +1,67 @@
+"""
+Tests for git change-set computation.
+"""
+
+from pathlib import Path
+
+import git
+import pytest
+
+from repo_analyzer.utils.git_utils import GitReferenceError, changed_files
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    repo = git.Repo.init(tmp_path)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "Test")
+        config.set_value("user", "email", "test@example.com")
+    
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "keep.py").write_text("a = 1\n")
+    (tmp_path / "src" / "edit.py").write_text("b = 2\n")
+    (tmp_path / "src" / "gone.py").write_text("c = 3\n")
+    (tmp_path / "src" / "old_name.py").write_text("def moved():\n    return 'same body'\n" * 5)
+    (tmp_path / "docs.md").write_text("# Docs\n")
+    repo.index.add(["src/keep.py", "src/edit.py", "src/gone.py", "src/old_name.py", "docs.md"])
+    repo.index.commit("base")
+    return repo
+
+
+class TestChangedFiles:
+    """Test suite for changed_files."""
+    
+    def test_detects_all_change_types(self, git_repo):
+        """Test additions, edits, deletions, renames and untracked files."""
+        root = Path(git_repo.working_tree_dir).resolve()
+        (root / "src" / "edit.py").write_text("b = 20\n")
+        git_repo.index.remove(["src/gone.py"], working_tree=True)
+        git_repo.git.mv("src/old_name.py", "src/new_name.py")
+        (root / "src" / "added.py").write_text("d = 4\n")
+        git_repo.index.add(["src/edit.py"])
+        git_repo.index.commit("feature")
+        (root / "src" / "untracked.py").write_text("e = 5\n")
+        
+        change_set = changed_files(root, "HEAD~1")
+        
+        assert change_set.modified == [root / "src" / "edit.py"]
+        assert change_set.deleted == [root / "src" / "gone.py"]
+        assert change_set.renamed == [(root / "src" / "old_name.py", root / "src" / "new_name.py")]
+        assert set(change_set.added) == {root / "src" / "added.py", root / "src" / "untracked.py"}
+        assert change_set.contains(root / "src" / "new_name.py")
+        assert not change_set.contains(root / "src" / "keep.py")
+    
+    def test_limits_results_to_subdirectory(self, git_repo):
+        """Test changes outside the analyzed directory are ignored."""
+        root = Path(git_repo.working_tree_dir).resolve()
+        (root / "docs.md").write_text("# Changed\n")
+        (root / "src" / "edit.py").write_text("b = 20\n")
+        
+        change_set = changed_files(root / "src", "HEAD")
+        
+        assert change_set.changed == [root / "src" / "edit.py"]
+    
+    def test_unknown_reference_raises(self, git_repo):
+        """Test unresolvable references raise GitReferenceError."""
+        with pytest.raises(GitReferenceError):
+            changed_files(Path(git_repo.working_tree_dir), "no-such-branch")
\ No newline at end of file
@@ -0,0 +1,88 @@
+"""
+Tests for vectorized metric aggregation.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from repo_analyzer.analyzers.base import FileAnalysis
+from repo_analyzer.analyzers.results import ResultStore
+from repo_analyzer.utils.metrics import MetricArrays, aggregate, calculate_metrics
+
+
+@pytest.fixture
+def analyses():
+    def functions(*complexities):
+        return [{"name": f"f{i}", "line": i, "complexity": c} for i, c in enumerate(complexities)]
+    
+    return [
+        FileAnalysis(Path("src/a.py"), "python", 100, 3.0, 8.0, functions=functions(1, 4, 12)),
+        FileAnalysis(Path("src/b.py"), "python", 50, 2.0, 6.0, functions=functions(2),
+                     issues=[{"type": "style"}]),
+        FileAnalysis(Path("src/pkg/c.py"), "python", 10, 25.0, 4.0, functions=functions(30, 5)),
+        FileAnalysis(Path("README.md"), "markdown", 20),
+    ]
+
+
+class TestAggregate:
+    """Test suite for aggregate."""
+    
+    def test_repository_metrics(self, analyses):
+        """Test totals, percentiles, histogram and debt ratio."""
+        metrics = aggregate(MetricArrays.from_analyses(analyses), complexity_threshold=10)
+        
+        assert metrics.file_count == 4
+        assert metrics.function_count == 6
+        assert metrics.total_lines == 180
+        assert metrics.total_issues == 1
+        assert metrics.average_complexity == pytest.approx(54 / 6)
+        assert metrics.max_complexity == 30
+        assert metrics.percentiles["p50"] == pytest.approx(4.5)
+        assert metrics.histogram == {"1": 1, "2-5": 3, "6-10": 0, "11-20": 1, "21-50": 1, "51+": 0}
+        assert metrics.functions_over_threshold == 2
+        assert metrics.technical_debt_ratio == pytest.approx(2 / 6)
+        assert metrics.overall_score == pytest.approx(18 / 4)
+        assert 0 < metrics.maintainability_index <= 100
+    
+    def test_directory_rollups(self, analyses):
+        """Test per-directory file, line, function and issue totals."""
+        rollups = {d.directory: d for d in aggregate(MetricArrays.from_analyses(analyses)).directories}
+        
+        assert sorted(rollups) == ["", "src", "src/pkg"]
+        assert rollups["src"].files == 2
+        assert rollups["src"].lines_of_code == 150
+        assert rollups["src"].functions == 4
+        assert rollups["src"].max_complexity == 12
+        assert rollups["src"].average_complexity == pytest.approx(19 / 4)
+        assert rollups["src"].issues == 1
+        assert rollups["src/pkg"].functions_over_threshold == 1
+        assert rollups[""].functions == 0
+    
+    def test_reaggregate_from_saved_arrays(self, analyses, tmp_path):
+        """Test saved arrays re-aggregate under a new threshold without re-analysis."""
+        MetricArrays.from_analyses(analyses).save(tmp_path / "metrics.npz")
+        arrays = MetricArrays.load(tmp_path / "metrics.npz")
+        
+        assert arrays.paths[2] == str(Path("src/pkg/c.py"))
+        assert aggregate(arrays, complexity_threshold=3).functions_over_threshold == 4
+        assert aggregate(arrays, complexity_threshold=50).technical_debt_ratio == 0.0
+    
+    def test_store_keeps_growing(self, analyses):
+        """Test a store can take more rows while arrays built from it are alive."""
+        store = ResultStore.from_analyses(analyses[:2])
+        arrays = MetricArrays.from_store(store)
+        
+        for analysis in analyses[2:]:
+            store.add(analysis)
+        
+        assert len(arrays) == 2
+        assert aggregate(MetricArrays.from_store(store)).function_count == 6
+    
+    def test_empty_results(self):
+        """Test aggregation of an empty repository."""
+        result = calculate_metrics([])
+        
+        assert result.average_complexity == 0.0
+        assert result.max_complexity == 0
+        assert result.technical_debt_ratio == 0.0
\ No newline at end of file
@@ -0,0 +1,92 @@
+"""
+Tests for streaming NDJSON output.
+"""
+
+import io
+import json
+from pathlib import Path
+
+from repo_analyzer.analyzers.base import FileAnalysis
+from repo_analyzer.utils.ndjson import NdjsonWriter, analysis_records, summary_record
+
+
+class _Result:
+    def to_dict(self):
+        return {"total_files": 2}
+
+
+def _analysis():
+    return FileAnalysis(
+        file_path=Path("src/app.py"),
+        language="python",
+        lines_of_code=12,
+        functions=[
+            {"name": "main", "complexity": 3},
+            {"name": "helper", "type": "method", "file_path": "elsewhere.py"},
+        ],
+    )
+
+
+class TestNdjsonWriter:
+    """Test suite for NdjsonWriter."""
+    
+    def test_writes_one_compact_record_per_line(self):
+        """Test each record is a single line of JSON."""
+        stream = io.StringIO()
+        with NdjsonWriter(stream) as writer:
+            writer.write({"type": "file", "file_path": "a b.py", "text": "line\nbreak"})
+            writer.write_all([{"n": 1}, {"path": Path("x.py")}])
+        
+        lines = stream.getvalue().splitlines()
+        
+        assert [json.loads(line) for line in lines] == [
+            {"type": "file", "file_path": "a b.py", "text": "line\nbreak"},
+            {"n": 1},
+            {"path": "x.py"},
+        ]
+        assert " " not in lines[1]
+        assert writer.records == 3
+    
+    def test_flushes_on_interval_and_close(self):
+        """Test output is flushed once the interval passes and when the writer closes."""
+        flushes = []
+        stream = io.StringIO()
+        stream.flush = lambda: flushes.append(stream.tell())
+        
+        writer = NdjsonWriter(stream, flush_interval=3600)
+        writer.write({"n": 1})
+        assert flushes == []
+        
+        writer.flush_interval = 0
+        writer.write({"n": 2})
+        assert len(flushes) == 1
+        
+        writer.close()
+        assert flushes[-1] == len(stream.getvalue())
+
+
+class TestRecords:
+    """Test suite for the record builders."""
+    
+    def test_file_record_then_function_records(self):
+        """Test a file record without functions, followed by one record per function."""
+        file_record, *function_records = analysis_records("complexity", _analysis())
+        
+        assert file_record["type"] == "file"
+        assert file_record["analysis"] == "complexity"
+        assert file_record["file_path"] == "src/app.py"
+        assert file_record["lines_of_code"] == 12
+        assert "functions" not in file_record
+        assert function_records == [
+            {"type": "function", "analysis": "complexity", "file_path": "src/app.py", "name": "main", "complexity": 3},
+            {"type": "function", "analysis": "complexity", "file_path": "src/app.py", "name": "helper"},
+        ]
+    
+    def test_summary_record(self):
+        """Test the summary record wraps the repository-level result."""
+        assert summary_record("structure", 2, _Result()) == {
+            "type": "summary",
+            "analysis": "structure",
+            "files": 2,
+            "result": {"total_files": 2},
+        }
\ No newline at end of file
@@ -0,0 +1,53 @@
+"""
+Tests for profiling instrumentation.
+"""
+
+import json
+from pathlib import Path
+
+from repo_analyzer.utils.profiling import Profiler, get_profiler, set_profiler
+
+
+class TestProfiler:
+    """Test suite for Profiler."""
+    
+    def test_phases_throughput_and_slowest_files(self):
+        """Test phase timings, per-language throughput and the slowest-file heap."""
+        profiler = Profiler(slowest=2)
+        with profiler.phase("analyze"):
+            for index, seconds in enumerate([0.1, 0.4, 0.2, 0.3]):
+                profiler.record_file("ComplexityAnalyzer", "python", Path(f"f{index}.py"), 100, seconds)
+        profiler.register("cache", lambda: {"hits": 3, "hit_rate": 0.75})
+        
+        report = json.loads(json.dumps(profiler.to_dict()))
+        
+        assert report["phases"]["analyze"]["calls"] == 1
+        assert report["languages"]["python"]["files"] == 4
+        assert report["languages"]["python"]["lines_per_second"] == 400 / 1.0
+        assert [entry["file"] for entry in report["slowest_files"]] == ["f1.py", "f3.py"]
+        assert report["stats"]["cache"]["hits"] == 3
+    
+    def test_disabled_profiler_records_nothing(self):
+        """Test that hooks are no-ops unless profiling was requested."""
+        assert not get_profiler().enabled
+        profiler = get_profiler()
+        with profiler.phase("analyze"):
+            profiler.record_file("QualityAnalyzer", "python", Path("a.py"), 10, 1.0)
+        
+        assert profiler.to_dict()["phases"] == {}
+        assert profiler.slowest_files() == []
+    
+    def test_set_profiler_installs_and_resets(self, tmp_path):
+        """Test installing a cProfile-backed profiler and dumping pstats."""
+        profiler = set_profiler(Profiler(cprofile=True))
+        try:
+            assert get_profiler() is profiler
+            profiler.start()
+            sum(range(1000))
+            profiler.stop()
+            profiler.dump_stats(tmp_path / "out.pstats")
+        finally:
+            set_profiler(None)
+        
+        assert (tmp_path / "out.pstats").stat().st_size > 0
+        assert not get_profiler().enabled
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""
+Tests for the file system change watchers.
+"""
+
+import sys
+import time
+
+import pytest
+
+from repo_analyzer.utils.watcher import (
+    FileChanges,
+    InotifyWatcher,
+    PollingWatcher,
+    WatcherError,
+    create_watcher,
+)
+
+
+def _read_until(watcher, predicate, timeout=2.0):
+    changes = FileChanges()
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        changes.update(watcher.read())
+        if predicate(changes):
+            break
+        time.sleep(0.01)
+    return changes
+
+
+class TestPollingWatcher:
+    """Test suite for PollingWatcher."""
+    
+    def test_requests_rescan_each_interval(self, monkeypatch):
+        """Test a rescan is requested once per elapsed interval."""
+        now = [100.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        watcher = PollingWatcher(interval=1.0)
+        
+        assert not watcher.read()
+        assert watcher.timeout == pytest.approx(1.0)
+        now[0] += 1.0
+        assert watcher.read().rescan
+        assert not watcher.read()
+        assert watcher.fileno() is None
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+class TestInotifyWatcher:
+    """Test suite for InotifyWatcher."""
+    
+    @pytest.fixture
+    def watcher(self):
+        watcher = InotifyWatcher()
+        yield watcher
+        watcher.close()
+    
+    def test_reports_written_and_deleted_files(self, watcher, tmp_path):
+        """Test writes, creations and deletions in watched directories are reported."""
+        existing = tmp_path / "existing.py"
+        existing.write_text("x = 1\n")
+        watcher.watch([tmp_path])
+        
+        existing.write_text("x = 2\n")
+        (tmp_path / "new.py").write_text("y = 1\n")
+        changes = _read_until(watcher, lambda c: tmp_path / "new.py" in c.paths)
+        assert {existing, tmp_path / "new.py"} <= changes.paths
+        
+        existing.unlink()
+        assert existing in _read_until(watcher, lambda c: existing in c.paths).paths
+    
+    def test_watches_new_directories(self, watcher, tmp_path):
+        """Test files in a directory created after startup are reported."""
+        watcher.watch([tmp_path])
+        package = tmp_path / "package"
+        package.mkdir()
+        assert package in _read_until(watcher, lambda c: package in c.paths).paths
+        
+        (package / "module.py").write_text("z = 1\n")
+        changes = _read_until(watcher, lambda c: package / "module.py" in c.paths)
+        assert package / "module.py" in changes.paths
+    
+    def test_unwatched_directories_are_silent(self, watcher, tmp_path):
+        """Test only directories passed to ``watch`` report changes."""
+        (tmp_path / "other").mkdir()
+        watcher.watch([tmp_path])
+        (tmp_path / "other" / "file.py").write_text("")
+        
+        time.sleep(0.05)
+        assert tmp_path / "other" / "file.py" not in watcher.read().paths
+
+
+def test_create_watcher_falls_back_to_polling(monkeypatch):
+    """Test ``auto`` falls back to polling when inotify is unavailable."""
+    monkeypatch.setattr(sys, "platform", "darwin")
+    
+    assert isinstance(create_watcher("auto", interval=0.5), PollingWatcher)
+    with pytest.raises(WatcherError):
+        create_watcher("inotify")
\ No newline at end of file